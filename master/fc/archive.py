@@ -61,6 +61,17 @@ PINOUTS = {
     "S117" : "VUXWTSQONMLKJIHGFDCBA vutsrqponmlkjihfedcba"
 }
 
+# Communications engines:
+ENGINE_THREADED = "THREADED" # ........................... One thread per slave
+ENGINE_SELECTOR = "SELECTOR" # ........ One selectors event loop for all slaves
+ENGINE_ASYNCIO = "ASYNCIO" # ......... Whole back-end on one asyncio event loop
+ENGINES = (ENGINE_THREADED, ENGINE_SELECTOR, ENGINE_ASYNCIO)
+
+# Wire formats:
+FORMAT_ASCII = "ASCII" # ............................. MkII ASCII messages only
+FORMAT_BINARY = "BINARY" # ............ Offer binary frames, fall back to ASCII
+FORMATS = (FORMAT_ASCII, FORMAT_BINARY)
+
 # Supported I-P Comms. Messages:
 # Message -------- | Arguments
 DEFAULT = 5001  #  | N/A
@@ -114,6 +125,19 @@ externalListenerAutoStart = 121
 externalBroadcastAutoStart = 122
 externalIndexDelta = 123
 
+# Back-end:
+commsEngine = 124
+commsWorkers = 125
+commsFormat = 126
+mosiCopies = 127
+mosiRefresh = 128
+mosiBurst = 129
+diagnosticsPeriodMS = 130
+flashWave = 131
+flashConcurrency = 132
+hskLimit = 133
+hskBackoffMS = 134
+
 # For each Slave .........
 SV_name = 216
 SV_mac = 217
@@ -458,6 +482,61 @@ META = {
 		TYPE_PRIMITIVE,
 		True,
         v_nonnegative_int),
+    commsEngine : ("commsEngine",
+		4,
+		TYPE_PRIMITIVE,
+		True,
+        make_in_validator(*ENGINES)),
+    commsWorkers : ("commsWorkers",
+		4,
+		TYPE_PRIMITIVE,
+		True,
+        v_positive_int),
+    commsFormat : ("commsFormat",
+		4,
+		TYPE_PRIMITIVE,
+		True,
+        make_in_validator(*FORMATS)),
+    mosiCopies : ("mosiCopies",
+		4,
+		TYPE_PRIMITIVE,
+		True,
+        v_positive_int),
+    mosiRefresh : ("mosiRefresh",
+		4,
+		TYPE_PRIMITIVE,
+		True,
+        v_nonnegative_int),
+    mosiBurst : ("mosiBurst",
+		4,
+		TYPE_PRIMITIVE,
+		True,
+        v_bool),
+    diagnosticsPeriodMS : ("diagnosticsPeriodMS",
+		4,
+		TYPE_PRIMITIVE,
+		True,
+        v_positive_int),
+    flashWave : ("flashWave",
+		4,
+		TYPE_PRIMITIVE,
+		True,
+        v_positive_int),
+    flashConcurrency : ("flashConcurrency",
+		4,
+		TYPE_PRIMITIVE,
+		True,
+        v_positive_int),
+    hskLimit : ("hskLimit",
+		4,
+		TYPE_PRIMITIVE,
+		True,
+        v_positive_int),
+    hskBackoffMS : ("hskBackoffMS",
+		4,
+		TYPE_PRIMITIVE,
+		True,
+        v_positive_int),
     defaultSlave : ("defaultSlave",
 		5,
 		TYPE_SUB,
@@ -692,6 +771,18 @@ class FCArchive(pt.PrintClient):
         externalListenerAutoStart: True,
         externalIndexDelta: 10,
 
+        commsEngine : ENGINE_THREADED,
+        commsWorkers : 1,
+        commsFormat : FORMAT_BINARY,
+        mosiCopies : 2,
+        mosiRefresh : 10,
+        mosiBurst : True,
+        diagnosticsPeriodMS : 1000,
+        flashWave : 32,
+        flashConcurrency : 8,
+        hskLimit : 32,
+        hskBackoffMS : 100,
+
         defaultSlave :
             {
                 SV_name : "FAWT Module",
@@ -779,6 +870,7 @@ class FCArchive(pt.PrintClient):
         """
         if new is not None:
             self.P = cp.deepcopy(new)
+            self._fill()
             self.P.update(self.runtime)
             self.isModified = False
         if self.P is not None:
@@ -834,6 +926,7 @@ class FCArchive(pt.PrintClient):
             new = pk.load(open(name, 'rb'))
             # TODO: Validate?
             self.P = new
+            self._fill()
             self.P.update(self.runtime)
             self.isModified = False
         except IOError as e:
@@ -870,6 +963,17 @@ class FCArchive(pt.PrintClient):
         """
         return self.P.keys()
 
+    def _fill(self):
+        """
+        Add to the current profile any top-level attributes it is missing,
+        taken from the built-in default profile. This keeps profiles written
+        before an attribute existed usable by the back-end, which receives a
+        plain dictionary rather than this instance.
+        """
+        for key, value in self.DEFAULT.items():
+            if key not in self.P:
+                self.P[key] = cp.deepcopy(value)
+
     def __getitem__(self, key):
         """
         Fetch a value from the current profile, indexed by KEY. Here KEY must
@@ -28,9 +28,12 @@
 ## IMPORTS #####################################################################
 import multiprocessing as mp
 import threading as mt
+import time as tm
 
-from fc import standards as s, printer as pt
-from fc.backend.mkiii import FCCommunicator as fcc
+from fc import standards as s, printer as pt, archive as ac
+from fc.backend import shards as sh, feedback as fb, control as ct
+# NOTE: The back-end engines (fc.backend.mkiii) are imported by the back-end
+# process itself (see _b_routine), so that the front-end starts faster.
 
 ## HELPER CLASSES ##############################################################
 class FCCommunicator(pt.PrintClient):
@@ -41,17 +44,27 @@ class FCCommunicator(pt.PrintClient):
     SYMBOL = "[NW]"
 
     def __init__(self, feedbackPipeSend, slavePipeSend, networkPipeSend,
-        archive, pqueue):
+        archive, pqueue, diagnosticsPipeSend = None):
         """
+        DIAGNOSTICSPIPESEND is the pipe through which to send diagnostics
+        arrays (see fc.standards), or None not to have the back-end compute
+        them.
         """
         pt.PrintClient.__init__(self, pqueue)
 
         self.feedbackPipeSend = feedbackPipeSend
         self.slavePipeSend = slavePipeSend
         self.networkPipeSend = networkPipeSend
+        self.diagnosticsPipeSend = diagnosticsPipeSend
         self.archive = archive
         self.process = None
+        self.workers = []
         self.watchdog = None
+        self.feedback = None
+        self.feedbackLock = mt.Lock()
+        self.control = None
+        self.controlLock = mt.Lock()
+        self.workerControls = []
 
         self.commandPipeRecv, self.commandPipeSend = mp.Pipe(False)
         self.controlPipeRecv, self.controlPipeSend = mp.Pipe(False)
@@ -67,18 +80,33 @@ class FCCommunicator(pt.PrintClient):
         try:
             if not self.active():
                 self.printr("Starting CM back-end")
-                self.process = mp.Process(
-                    name = "FC_Comms_Backend",
-                    target = self._b_routine,
-                    args = (self.archive.profile(),
-                            self.commandPipeRecv,
-                            self.controlPipeRecv,
-                            self.feedbackPipeSend,
-                            self.slavePipeSend,
-                            self.networkPipeSend,
-                            self.pqueue),
-                    daemon = True)
-                self.process.start()
+                profile = self.archive.profile()
+                self._shareFeedback(profile)
+                notice = self._shareControl(profile)
+                if profile[ac.commsWorkers] > 1:
+                    self._startShards(profile, profile[ac.commsWorkers])
+                else:
+                    self.process = mp.Process(
+                        name = "FC_Comms_Backend",
+                        target = self._b_routine,
+                        args = (profile,
+                                self.commandPipeRecv,
+                                self.controlPipeRecv,
+                                self.feedbackPipeSend,
+                                self.slavePipeSend,
+                                self.networkPipeSend,
+                                self.pqueue,
+                                None,
+                                self.feedback.name,
+                                self.control.name,
+                                self.diagnosticsPipeSend),
+                        daemon = True)
+                    self.process.start()
+
+                # Have the new back-end apply the DCs it inherits, if any:
+                if notice is not None:
+                    self.controlPipeSend.send((tm.monotonic(),
+                        (s.CTL_DC_SHARED, s.TGT_ALL, notice)))
 
                 self.watchdog = mt.Thread(
                     name = "FC BE Watchdog",
@@ -102,18 +130,52 @@ class FCCommunicator(pt.PrintClient):
                 self.process.join(timeout)
                 if self.process.is_alive():
                     self.process.terminate()
+                self._joinWorkers(timeout)
+                # Let the watchdog report the disconnection before returning:
+                if self.watchdog is not mt.current_thread():
+                    self.watchdog.join(timeout)
                 self.process = None
             else:
                 self.printw("Tried to stop already inactive back-end")
         except Exception as e:
             self.printx(e, "Exception when stopping back-end")
 
+    def release(self):
+        """
+        Free the resources shared with the back-end. To be called once done
+        with this instance.
+        """
+        with self.feedbackLock:
+            if self.feedback is not None:
+                self.feedback.close()
+                self.feedback.unlink()
+                self.feedback = None
+        with self.controlLock:
+            if self.control is not None:
+                self.control.close()
+                self.control.unlink()
+                self.control = None
+        self._releaseWorkerControls()
+
     def active(self):
         """
         Return whether this instance is running its communications daemon.
         """
         return self.process is not None and self.process.is_alive()
 
+    def readFeedback(self, message):
+        """
+        Return the feedback vector announced by MESSAGE, as received from the
+        feedback pipe, or None if there is none to process. Messages other than
+        shared-memory notices (see fc.backend.feedback) are returned as-is.
+        """
+        if not fb.isNotice(message):
+            return message
+        with self.feedbackLock:
+            if self.feedback is None:
+                return None
+            return self.feedback.read(message)
+
     def commandIn(self, command, target = s.TGT_ALL, rest = ()):
         """
         Send a general command with command code COMMAND with target code
@@ -130,9 +192,18 @@ class FCCommunicator(pt.PrintClient):
         """
         Process the control vector C.
         """
-        # FIXME: performance
         if self.active():
-            self.controlPipeSend.send((s.CTL_DC_VECTOR, s.TGT_ALL) + tuple(C))
+            with self.controlLock:
+                if self.control is not None and self.control.fits(C):
+                    # Write C to shared memory and notify the back-end if
+                    # needed (see fc.backend.control):
+                    notice = self.control.write(C)
+                    if notice is not None:
+                        self.controlPipeSend.send((tm.monotonic(),
+                            (s.CTL_DC_SHARED, s.TGT_ALL, notice)))
+                    return
+            self.controlPipeSend.send((tm.monotonic(),
+                (s.CTL_DC_VECTOR, s.TGT_ALL) + tuple(C)))
 
     def connect(self):
         """
@@ -175,29 +246,166 @@ class FCCommunicator(pt.PrintClient):
         self.commandIn(s.CMD_BIP, ip)
 
     # Internal methods .........................................................
+    def _shareFeedback(self, profile):
+        """
+        Set up a shared FeedbackBuffer for a back-end running PROFILE, unless
+        the current one can be reused.
+        """
+        fans, slaves = profile[ac.maxFans], fb.capacity(profile)
+        with self.feedbackLock:
+            if self.feedback is not None and self.feedback.fans == fans \
+                and self.feedback.slaves >= slaves:
+                return
+        self.release()
+        with self.feedbackLock:
+            self.feedback = fb.FeedbackBuffer(fans, slaves)
+
+    def _shareControl(self, profile):
+        """
+        Set up a shared ControlBuffer for a back-end running PROFILE, unless
+        the current one can be reused. In that case, the new back-end is to get
+        the DCs last written to it: returns the notice to send it once started
+        (see ControlBuffer.rearm), or None if there is none.
+        """
+        fans, slaves = profile[ac.maxFans], ct.capacity(profile)
+        with self.controlLock:
+            if self.control is not None and self.control.fans == fans \
+                and self.control.slaves >= slaves:
+                return self.control.rearm()
+            if self.control is not None:
+                self.control.close()
+                self.control.unlink()
+            self.control = ct.ControlBuffer(fans, slaves)
+        return None
+
+    def _releaseWorkerControls(self):
+        """
+        Free the ControlBuffers of the workers of a sharded back-end, if any.
+        """
+        for control in self.workerControls:
+            control.close()
+            control.unlink()
+        self.workerControls = []
+
+    def _startShards(self, profile, workers):
+        """
+        Start a sharded back-end: WORKERS worker processes, each with its share
+        of the slaves in PROFILE, and a coordinator process between them and
+        the front-end. See fc.backend.shards.
+        """
+        ends = []
+        self.workers = []
+        self._releaseWorkerControls()
+        for number, (P, indices) in enumerate(sh.split(profile, workers)):
+            commandRecv, commandSend = mp.Pipe(False)
+            controlRecv, controlSend = mp.Pipe(False)
+            feedbackRecv, feedbackSend = mp.Pipe(False)
+            slaveRecv, slaveSend = mp.Pipe(False)
+            networkRecv, networkSend = mp.Pipe(False)
+            diagnosticsRecv, diagnosticsSend = mp.Pipe(False) \
+                if self.diagnosticsPipeSend is not None else (None, None)
+            control = ct.ControlBuffer(P[ac.maxFans], ct.capacity(P))
+            self.workerControls.append(control)
+            self.workers.append(mp.Process(
+                name = "FC_Comms_Worker_{}".format(number),
+                target = self._b_routine,
+                args = (P, commandRecv, controlRecv, feedbackSend, slaveSend,
+                    networkSend, self.pqueue, (number, workers), None,
+                    control.name, diagnosticsSend),
+                daemon = True))
+            ends.append((indices, commandSend, controlSend, feedbackRecv,
+                slaveRecv, networkRecv, control.name, diagnosticsRecv))
+
+        self.process = mp.Process(
+            name = "FC_Comms_Coordinator",
+            target = self._c_routine,
+            args = (profile,
+                    self.commandPipeRecv,
+                    self.controlPipeRecv,
+                    self.feedbackPipeSend,
+                    self.slavePipeSend,
+                    self.networkPipeSend,
+                    ends,
+                    self.pqueue,
+                    self.feedback.name,
+                    self.control.name,
+                    self.diagnosticsPipeSend),
+            daemon = True)
+
+        for worker in self.workers:
+            worker.start()
+        self.process.start()
+
+    def _joinWorkers(self, timeout):
+        """
+        Wait for the worker processes of a sharded back-end, if any, to end,
+        and terminate those that do not do so within TIMEOUT seconds.
+        """
+        for worker in self.workers:
+            worker.join(timeout)
+            if worker.is_alive():
+                worker.terminate()
+
     @staticmethod
     def _b_routine(profile, commandPipeRecv, controlPipeRecv, feedbackPipeSend,
-        slavePipeSend, networkPipeSend, pqueue):
+        slavePipeSend, networkPipeSend, pqueue, shard = None, feedback = None,
+        control = None, diagnosticsPipeSend = None):
         """
-        Back-end routine. To be executed by the B.E. process.
+        Back-end routine. To be executed by the B.E. process (or by each worker
+        process of a sharded back-end, in which case SHARD is the
+        (index, count) of the worker). FEEDBACK and CONTROL are the names of
+        the shared FeedbackBuffer and ControlBuffer to use, if any.
+        DIAGNOSTICSPIPESEND is where to send diagnostics arrays, if anywhere.
         """
         P = pt.printers(pqueue, "[CR]")
         P[pt.R]("Comms. backend process started")
         try:
-            comms = fcc.FCCommunicator(profile, commandPipeRecv,
+            if profile[ac.commsEngine] == ac.ENGINE_ASYNCIO:
+                from fc.backend.mkiii import FCAsync as fca
+                Communicator = fca.FCAsyncCommunicator
+            else:
+                from fc.backend.mkiii import FCCommunicator as fcc
+                Communicator = fcc.FCCommunicator
+            comms = Communicator(profile, commandPipeRecv,
                 controlPipeRecv, feedbackPipeSend, slavePipeSend,
-                networkPipeSend, pqueue)
+                networkPipeSend, pqueue, shard, feedback, control,
+                diagnosticsPipeSend)
             comms.join()
         except Exception as e:
             P[pt.X](e, "Fatal error in comms. backend process")
         P[pt.W]("Comms. backend process terminated")
 
+    @staticmethod
+    def _c_routine(profile, commandPipeRecv, controlPipeRecv, feedbackPipeSend,
+        slavePipeSend, networkPipeSend, ends, pqueue, feedback, control,
+        diagnosticsPipeSend = None):
+        """
+        Coordinator routine of a sharded back-end. To be executed by the
+        coordinator process. ENDS holds, for each worker, its slave indices,
+        the coordinator's ends of its pipes (see sh.Worker) and the name of its
+        ControlBuffer. FEEDBACK and CONTROL are the names of the shared
+        FeedbackBuffer and ControlBuffer to use. DIAGNOSTICSPIPESEND is where
+        to forward the diagnostics arrays of the workers, if anywhere.
+        """
+        P = pt.printers(pqueue, "[CR]")
+        P[pt.R]("Comms. coordinator process started")
+        try:
+            workers = [sh.Worker(number, *end)
+                for number, end in enumerate(ends)]
+            sh.FCShards(profile, commandPipeRecv, controlPipeRecv,
+                feedbackPipeSend, slavePipeSend, networkPipeSend, workers,
+                pqueue, feedback, control, diagnosticsPipeSend).run()
+        except Exception as e:
+            P[pt.X](e, "Fatal error in comms. coordinator process")
+        P[pt.W]("Comms. coordinator process terminated")
+
     def _w_routine(self):
         """
         Watchdog routine. Tracks whether the back-end process is active.
         """
         self.printd("Back-end watchdog routine started")
         self.process.join()
+        self._joinWorkers(s.MP_STOP_TIMEOUT_S)
         self._stopped()
         self.printd("Back-end watchdog routine ended")
 
@@ -0,0 +1,192 @@
+################################################################################
+##----------------------------------------------------------------------------##
+## CALIFORNIA INSTITUTE OF TECHNOLOGY ## GRADUATE AEROSPACE LABORATORY ##     ##
+## CENTER FOR AUTONOMOUS SYSTEMS AND TECHNOLOGIES                      ##     ##
+##----------------------------------------------------------------------------##
+##      ____      __      __  __      _____      __      __    __    ____     ##
+##     / __/|   _/ /|    / / / /|  _- __ __\    / /|    / /|  / /|  / _  \    ##
+##    / /_ |/  / /  /|  /  // /|/ / /|__| _|   / /|    / /|  / /|/ /   --||   ##
+##   / __/|/ _/    /|/ /   / /|/ / /|    __   / /|    / /|  / /|/ / _  \|/    ##
+##  / /|_|/ /  /  /|/ / // //|/ / /|__- / /  / /___  / -|_ - /|/ /     /|     ##
+## /_/|/   /_/ /_/|/ /_/ /_/|/ |\ ___--|_|  /_____/| |-___-_|/  /____-/|/     ##
+## |_|/    |_|/|_|/  |_|/|_|/   \|___|-    |_____|/   |___|     |____|/       ##
+##                   _ _    _    ___   _  _      __  __   __                  ##
+##                  | | |  | |  | T_| | || |    |  ||_ | | _|                 ##
+##                  | _ |  |T|  |  |  |  _|      ||   \\_//                   ##
+##                  || || |_ _| |_|_| |_| _|    |__|  |___|                   ##
+##                                                                            ##
+##----------------------------------------------------------------------------##
+## Alejandro A. Stefan Zavala ## <astefanz@berkeley.edu>   ##                 ##
+## Chris J. Dougherty         ## <cdougher@caltech.edu>    ##                 ##
+## Marcel Veismann            ## <mveisman@caltech.edu>    ##                 ##
+################################################################################
+
+""" ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+ + Shared-memory transport for DC vectors from the front-end to the
+ + communications back-end. The counterpart of fc.backend.feedback.
+ +
+ + The front-end creates a ControlBuffer sized for the loaded profile and
+ + hands its name to the back-end. Each DC vector is written into a float32
+ + matrix with one row of maxFans duty cycles per slave, in place, instead of
+ + being pickled through the control pipe. Only the rows that differ from the
+ + current ones are written, and each is stamped with the sequence number of
+ + the write that changed it, so the back-end can tell which slaves to send a
+ + new command to without comparing anything itself. Writes are guarded by a
+ + sequence lock, as in fc.backend.feedback.
+ +
+ + The control pipe is still used to wake the back-end up, with a short
+ + CTL_DC_SHARED control vector (see fc.standards), and at most one such
+ + notice is in flight at a time. Vectors that do not fit in the buffer are
+ + sent through the pipe as before.
+ +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
+
+## IMPORTS #####################################################################
+from multiprocessing import shared_memory as sm
+import time as tm
+
+import numpy as np
+
+import fc.backend.feedback as fb
+
+## CONSTANTS ###################################################################
+RETRIES = 1000      # Attempts at reading a consistent frame before giving up
+DC_DECIMALS = 4     # Decimals of normalized duty cycles
+
+# Header layout (int64 fields):
+H_SEQ, H_ACK, H_COUNT, H_FANS, H_CAPACITY = range(5)
+HEADER_FIELDS = 8
+HEADER_BYTES = HEADER_FIELDS*8
+
+## AUXILIARY FUNCTIONS #########################################################
+def capacity(profile):
+    """
+    Return the number of slaves a control buffer for PROFILE should hold.
+    """
+    return fb.capacity(profile)
+
+## CLASSES #####################################################################
+class ControlBuffer:
+    """
+    DC matrix in shared memory. See the module's description.
+    """
+
+    def __init__(self, fans = None, slaves = None, name = None):
+        """
+        Create a new buffer for up to SLAVES slaves of FANS fans each or, if
+        NAME is given, attach to the existing buffer of that name.
+        """
+        if name is None:
+            self.memory = sm.SharedMemory(create = True,
+                size = HEADER_BYTES + slaves*8 + slaves*fans*4)
+        else:
+            self.memory = sm.SharedMemory(name)
+        self.header = np.ndarray((HEADER_FIELDS,), np.int64, self.memory.buf)
+        if name is None:
+            self.header[:] = 0
+            self.header[H_FANS] = fans
+            self.header[H_CAPACITY] = slaves
+
+        self.name = self.memory.name
+        self.fans = int(self.header[H_FANS])
+        self.slaves = int(self.header[H_CAPACITY])
+        # Sequence number of the last write that changed each row:
+        self.V = np.ndarray((self.slaves,), np.int64, self.memory.buf,
+            HEADER_BYTES)
+        self.D = np.ndarray((self.slaves, self.fans), np.float32,
+            self.memory.buf, HEADER_BYTES + self.slaves*8)
+        if name is None:
+            self.V[:] = 0
+            self.D[:] = 0
+
+        self.notified = int(self.header[H_ACK])
+        self.seen = 0
+
+    # Writer side ..............................................................
+    def fits(self, C):
+        """
+        Return whether the DC vector C (maxFans DCs per slave) fits in this
+        buffer.
+        """
+        return len(C) % self.fans == 0 and len(C)//self.fans <= self.slaves
+
+    def write(self, C):
+        """
+        Write the DC vector C (see fits). Returns the sequence number to send
+        the reader as a notice, or None if there is no need to (nothing
+        changed, or an earlier notice is still unacknowledged).
+        """
+        new = np.asarray(C, np.float32).reshape(-1, self.fans)
+        N = len(new)
+        indices = np.flatnonzero((self.D[:N] != new).any(axis = 1))
+        return self.update(indices, new[indices], N)
+
+    def rearm(self):
+        """
+        Forget about any unacknowledged notice and mark every row written so
+        far as changed. To be called when the reader is replaced (e.g. the
+        back-end is restarted), as the new one will not acknowledge notices
+        sent to its predecessor and has yet to apply any DCs. Returns the
+        notice to send the new reader, or None if nothing was written.
+        """
+        self.notified = int(self.header[H_ACK])
+        N = int(self.header[H_COUNT])
+        if not N:
+            return None
+        return self.update(np.arange(N), self.D[:N].copy(), N)
+
+    def update(self, indices, rows, count):
+        """
+        Set the rows at INDICES (array of slave indices) to ROWS, and the
+        number of slaves to at least COUNT. Returns as write does.
+        """
+        if not len(indices) and count <= self.header[H_COUNT]:
+            return None
+        seq = int(self.header[H_SEQ]) + 2
+        self.header[H_SEQ] += 1
+        self.D[indices] = rows
+        self.V[indices] = seq
+        self.header[H_COUNT] = max(count, int(self.header[H_COUNT]))
+        self.header[H_SEQ] = seq
+        if self.header[H_ACK] >= self.notified:
+            self.notified = seq
+            return seq
+        return None
+
+    # Reader side ..............................................................
+    def read(self, notice):
+        """
+        Acknowledge NOTICE and return a tuple (indices, rows) with the indices
+        of the slaves whose DCs changed since the last call, as a list, and
+        their new DCs, as a list of lists. Returns None if nothing changed or
+        the buffer could not be read consistently.
+        """
+        self.header[H_ACK] = notice
+        for _ in range(RETRIES):
+            seq = int(self.header[H_SEQ])
+            if seq & 1:
+                tm.sleep(0)
+                continue
+            if seq == self.seen:
+                return None
+            N = int(self.header[H_COUNT])
+            indices = np.flatnonzero(self.V[:N] > self.seen)
+            rows = self.D[indices].astype(np.float64)
+            if int(self.header[H_SEQ]) == seq:
+                self.seen = seq
+                return indices.tolist(), rows.round(DC_DECIMALS).tolist()
+        return None
+
+    # Clean-up .................................................................
+    def close(self):
+        """
+        Detach from the shared memory.
+        """
+        self.header = self.V = self.D = None
+        self.memory.close()
+
+    def unlink(self):
+        """
+        Destroy the shared memory once every process has detached from it.
+        Call from the process that created the buffer.
+        """
+        self.memory.unlink()
@@ -74,6 +74,7 @@ to 0.
 import socket as sk
 import threading as mt
 from fc import printer as pt, standards as s, archive as ac
+from fc.backend import states as st
 
 # CONSTANT DEFINITIONS #########################################################
 RECV_SIZE = 32768
@@ -148,6 +149,7 @@ class ExternalControl(pt.PrintClient):
                 self.indices[key][index] = 0
 
         self.F, self.N, self.S = [], [], []
+        self.slaves = st.Table()
 
         if self.archive[ac.externalListenerAutoStart]:
             self.activateListener(self.defaultListenerPort, self.defaultRepeat)
@@ -311,9 +313,11 @@ class ExternalControl(pt.PrintClient):
 
     def slavesIn(self, S):
         """
-        Process the slave status vector S.
+        Process the slave status vector S, which may hold only the slaves that
+        changed.
         """
-        self.S = S
+        if self.slaves.update(S):
+            self.S = self.slaves.vector()
 
     def setCallbacks(self, setFEBroadcastStatus = NOTHING,
         setFEBroadcastOut = NOTHING, setFEListenerStatus = NOTHING,
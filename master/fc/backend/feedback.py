@@ -0,0 +1,171 @@
+################################################################################
+##----------------------------------------------------------------------------##
+## CALIFORNIA INSTITUTE OF TECHNOLOGY ## GRADUATE AEROSPACE LABORATORY ##     ##
+## CENTER FOR AUTONOMOUS SYSTEMS AND TECHNOLOGIES                      ##     ##
+##----------------------------------------------------------------------------##
+##      ____      __      __  __      _____      __      __    __    ____     ##
+##     / __/|   _/ /|    / / / /|  _- __ __\    / /|    / /|  / /|  / _  \    ##
+##    / /_ |/  / /  /|  /  // /|/ / /|__| _|   / /|    / /|  / /|/ /   --||   ##
+##   / __/|/ _/    /|/ /   / /|/ / /|    __   / /|    / /|  / /|/ / _  \|/    ##
+##  / /|_|/ /  /  /|/ / // //|/ / /|__- / /  / /___  / -|_ - /|/ /     /|     ##
+## /_/|/   /_/ /_/|/ /_/ /_/|/ |\ ___--|_|  /_____/| |-___-_|/  /____-/|/     ##
+## |_|/    |_|/|_|/  |_|/|_|/   \|___|-    |_____|/   |___|     |____|/       ##
+##                   _ _    _    ___   _  _      __  __   __                  ##
+##                  | | |  | |  | T_| | || |    |  ||_ | | _|                 ##
+##                  | _ |  |T|  |  |  |  _|      ||   \\_//                   ##
+##                  || || |_ _| |_|_| |_| _|    |__|  |___|                   ##
+##                                                                            ##
+##----------------------------------------------------------------------------##
+## Alejandro A. Stefan Zavala ## <astefanz@berkeley.edu>   ##                 ##
+## Chris J. Dougherty         ## <cdougher@caltech.edu>    ##                 ##
+## Marcel Veismann            ## <mveisman@caltech.edu>    ##                 ##
+################################################################################
+
+""" ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+ + Shared-memory transport for feedback vectors between the communications
+ + back-end and the front-end.
+ +
+ + The front-end creates a FeedbackBuffer sized for the loaded profile and
+ + hands its name to the back-end, which writes each new feedback vector into
+ + it in place (RPMs as int32, DCs as float32) instead of pickling a list
+ + through the feedback pipe. Writes are guarded by a sequence lock: the
+ + sequence number is odd while a frame is being written, and readers retry
+ + if it changed while they read. Readers therefore always get the latest
+ + complete frame, and the writer never waits for them.
+ +
+ + The feedback pipe is still used to wake the reader up, but only with the
+ + (positive) sequence number of the new frame, and only once the reader has
+ + acknowledged the previous notice. At most one notice is ever in flight, so
+ + a slow front-end cannot fill the pipe and block the back-end; it just skips
+ + the frames it was too slow to see. Vectors that do not fit in the buffer
+ + are sent through the pipe as before.
+ +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
+
+## IMPORTS #####################################################################
+from multiprocessing import shared_memory as sm
+import time as tm
+
+import numpy as np
+
+import fc.archive as ac
+
+## CONSTANTS ###################################################################
+SPARE_SLAVES = 1024 # Room for slaves found at run time, besides saved ones
+RETRIES = 1000      # Attempts at reading a consistent frame before giving up
+DC_DECIMALS = 4     # Decimals in the DCs reported by slaves
+
+# Header layout (int64 fields):
+H_SEQ, H_ACK, H_COUNT, H_FANS, H_CAPACITY = range(5)
+HEADER_FIELDS = 8
+HEADER_BYTES = HEADER_FIELDS*8
+
+## AUXILIARY FUNCTIONS #########################################################
+def capacity(profile):
+    """
+    Return the number of slaves a feedback buffer for PROFILE should hold.
+    """
+    return len(profile[ac.savedSlaves]) + SPARE_SLAVES
+
+def isNotice(message):
+    """
+    Return whether MESSAGE, as received from a feedback pipe, is the notice of
+    a new frame in a FeedbackBuffer rather than a vector or control value.
+    """
+    return type(message) is int and message > 0
+
+## CLASSES #####################################################################
+class FeedbackBuffer:
+    """
+    Feedback vectors in shared memory. See the module's description.
+    """
+
+    def __init__(self, fans = None, slaves = None, name = None):
+        """
+        Create a new buffer for up to SLAVES slaves of FANS fans each or, if
+        NAME is given, attach to the existing buffer of that name.
+        """
+        if name is None:
+            self.memory = sm.SharedMemory(create = True,
+                size = HEADER_BYTES + slaves*fans*8)
+        else:
+            self.memory = sm.SharedMemory(name)
+        self.header = np.ndarray((HEADER_FIELDS,), np.int64, self.memory.buf)
+        if name is None:
+            self.header[:] = 0
+            self.header[H_FANS] = fans
+            self.header[H_CAPACITY] = slaves
+
+        self.name = self.memory.name
+        self.fans = int(self.header[H_FANS])
+        self.slaves = int(self.header[H_CAPACITY])
+        size = self.fans*self.slaves
+        self.R = np.ndarray((size,), np.int32, self.memory.buf, HEADER_BYTES)
+        self.D = np.ndarray((size,), np.float32, self.memory.buf,
+            HEADER_BYTES + 4*size)
+
+        self.notified = int(self.header[H_ACK])
+        self.last = 0
+
+    # Writer side ..............................................................
+    def fits(self, slaves):
+        """
+        Return whether a frame of SLAVES slaves fits in this buffer.
+        """
+        return slaves <= self.slaves
+
+    def begin(self):
+        """
+        Start writing a new frame. Returns the RPM and DC arrays to fill in,
+        one block of FANS values per slave. Call commit when done.
+        """
+        self.header[H_SEQ] += 1
+        return self.R, self.D
+
+    def commit(self, slaves, pipe):
+        """
+        Finish writing a frame of SLAVES slaves and notify the reader at the
+        other end of PIPE, unless an earlier notice is still unacknowledged.
+        """
+        self.header[H_COUNT] = slaves
+        self.header[H_SEQ] += 1
+        if self.header[H_ACK] >= self.notified:
+            self.notified = int(self.header[H_SEQ])
+            pipe.send(self.notified)
+
+    # Reader side ..............................................................
+    def read(self, notice):
+        """
+        Acknowledge NOTICE and return the latest complete frame as a feedback
+        vector (all RPMs followed by all DCs), or None if it has already been
+        read or could not be read consistently.
+        """
+        self.header[H_ACK] = notice
+        for _ in range(RETRIES):
+            seq = int(self.header[H_SEQ])
+            if seq & 1:
+                tm.sleep(0)
+                continue
+            if seq == self.last:
+                return None
+            size = int(self.header[H_COUNT])*self.fans
+            R = self.R[:size].tolist()
+            D = self.D[:size].astype(np.float64).round(DC_DECIMALS).tolist()
+            if int(self.header[H_SEQ]) == seq:
+                self.last = seq
+                return R + D
+        return None
+
+    # Clean-up .................................................................
+    def close(self):
+        """
+        Detach from the shared memory.
+        """
+        self.header = self.R = self.D = None
+        self.memory.close()
+
+    def unlink(self):
+        """
+        Destroy the shared memory once every process has detached from it.
+        Call from the process that created the buffer.
+        """
+        self.memory.unlink()
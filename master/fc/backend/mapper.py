@@ -133,6 +133,9 @@ class Mapper:
             nrows_slave = slave[ac.MD_rows]
             ncolumns_slave = slave[ac.MD_columns]
             mapping = slave[ac.MD_mapping]
+            if not mapping:
+                # Not placed on the grid (e.g. saved as the default slave):
+                continue
 
             base_KG = s*self.maxFans
             base_GK = column_base + row_base*self.C
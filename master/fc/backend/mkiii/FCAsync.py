@@ -0,0 +1,324 @@
+################################################################################
+##----------------------------------------------------------------------------##
+## CALIFORNIA INSTITUTE OF TECHNOLOGY ## GRADUATE AEROSPACE LABORATORY ##     ##
+## CENTER FOR AUTONOMOUS SYSTEMS AND TECHNOLOGIES                      ##     ##
+##----------------------------------------------------------------------------##
+##      ____      __      __  __      _____      __      __    __    ____     ##
+##     / __/|   _/ /|    / / / /|  _- __ __\    / /|    / /|  / /|  / _  \    ##
+##    / /_ |/  / /  /|  /  // /|/ / /|__| _|   / /|    / /|  / /|/ /   --||   ##
+##   / __/|/ _/    /|/ /   / /|/ / /|    __   / /|    / /|  / /|/ / _  \|/    ##
+##  / /|_|/ /  /  /|/ / // //|/ / /|__- / /  / /___  / -|_ - /|/ /     /|     ##
+## /_/|/   /_/ /_/|/ /_/ /_/|/ |\ ___--|_|  /_____/| |-___-_|/  /____-/|/     ##
+## |_|/    |_|/|_|/  |_|/|_|/   \|___|-    |_____|/   |___|     |____|/       ##
+##                   _ _    _    ___   _  _      __  __   __                  ##
+##                  | | |  | |  | T_| | || |    |  ||_ | | _|                 ##
+##                  | _ |  |T|  |  |  |  _|      ||   \\_//                   ##
+##                  || || |_ _| |_|_| |_| _|    |__|  |___|                   ##
+##                                                                            ##
+##----------------------------------------------------------------------------##
+## Alejandro A. Stefan Zavala ## <astefanz@berkeley.edu>   ##                 ##
+## Chris J. Dougherty         ## <cdougher@caltech.edu>    ##                 ##
+## Marcel Veismann            ## <mveisman@caltech.edu>    ##                 ##
+################################################################################
+
+""" ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+ + asyncio implementation of the MkIII back-end. The listener, broadcast and
+ + per-Slave MISO and MOSI sockets are asyncio datagram endpoints, and every
+ + periodic task (broadcasts, state vectors, handshake retries and the
+ + timeout / ping / reconnect sequence) is a timer on a single event loop.
+ + Runs behind the same pipes as FCCommunicator; see
+ + fc.backend.communicator.FCCommunicator._b_routine.
+ +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
+
+## DEPENDENCIES ################################################################
+import asyncio
+import threading as mt
+
+import fc.backend.mkiii.FCCommunicator as fcc
+import fc.backend.mkiii.FCSelector as fs
+import fc.archive as ac
+import fc.standards as s
+import fc.printer as pt
+
+## CLASS DEFINITIONS ###########################################################
+class Endpoint(asyncio.DatagramProtocol):
+    """
+    Datagram protocol that hands every datagram received to a callback.
+    """
+
+    def __init__(self, callback, printx):
+        """
+        - callback := called with (data, address) for each datagram
+        - printx := exception printer of the owner (see fc.printer)
+        """
+        self.callback = callback
+        self.printx = printx
+
+    def datagram_received(self, data, address):
+        try:
+            self.callback(data, address)
+        except Exception as e:
+            self.printx(e, "[CA] Exception in datagram callback:")
+
+    def error_received(self, exc):
+        # NOTE: ICMP errors (e.g. port unreachable after a Slave reboots) are
+        # expected with UDP; lost Slaves are handled by the timeout logic.
+        pass
+
+class AsyncMachine(fs.SlaveMachine):
+    """
+    SlaveMachine with the asyncio handles of its Slave.
+    """
+
+    def __init__(self, slave):
+        fs.SlaveMachine.__init__(self, slave)
+        self.timer = None           # asyncio.TimerHandle of the deadline
+        self.misoTransport = None
+        self.mosiTransport = None
+
+class AsyncEngine(fs.SlaveEngine):
+    """
+    Slave engine for FCAsyncCommunicator. Keeps each Slave's deadline as an
+    asyncio timer and feeds it every datagram received on its MISO endpoint.
+    All methods but register are to be called from the event loop.
+    """
+    SYMBOL = "[AE]"
+
+    def __init__(self, communicator, loop, pqueue):
+        """
+        - communicator := FCCommunicator instance whose Slaves to handle.
+        - loop := asyncio event loop on which to run.
+        - pqueue := mp Queue() instance for I-P printing (see fc.printer)
+        """
+        fs.SlaveEngine.__init__(self, communicator, pqueue)
+        self.loop = loop
+        self.machines = {}          # Slave index -> AsyncMachine
+
+    # API ......................................................................
+    def register(self, slave):
+        """
+        Hand SLAVE (FCSlave) to the event loop. Thread-safe.
+        """
+        self.loop.call_soon_threadsafe(self._admit, slave)
+
+    def transport(self, slave):
+        """
+        Return the MOSI transport of SLAVE, or None if it is not yet open.
+        """
+        machine = self.machines.get(slave.getIndex())
+        return None if machine is None else machine.mosiTransport
+
+    # Internal methods .........................................................
+    def _admit(self, slave):
+        """
+        Open the endpoints of SLAVE and start its state machine.
+        """
+        self.loop.create_task(self._open(slave))
+
+    async def _open(self, slave):
+        try:
+            misoS, mosiS = self.comms._makeSockets(blocking = False)
+            slave.setSockets(newMISOS = misoS, newMOSIS = mosiS)
+            slave.resetIndices()
+
+            machine = AsyncMachine(slave)
+            machine.misoTransport, _ = \
+                await self.loop.create_datagram_endpoint(
+                    lambda: Endpoint(
+                        lambda data, _: self._onDatagram(machine, data),
+                        self.printx),
+                    sock = misoS)
+            machine.mosiTransport, _ = \
+                await self.loop.create_datagram_endpoint(
+                    lambda: Endpoint(lambda *_: None, self.printx),
+                    sock = mosiS)
+
+            self.machines[machine.index] = machine
+            self._schedule(machine, self._now())
+
+            self.printr("[SV] ({:3d}) Slave sockets connected: "\
+             " MMISO: {} MMOSI:{} (IP: {})".format(machine.index + 1,
+                misoS.getsockname()[1], mosiS.getsockname()[1],
+                slave.getIP()))
+
+        except Exception as e:
+            self.printx(e, "[AE] Exception when opening Slave endpoints:")
+
+    def _onDatagram(self, machine, data):
+        """
+        Process a datagram received on MACHINE's MISO endpoint.
+        """
+        reply = self.comms._parseMISO(machine.slave, data)
+        if reply is not None:
+            self._onReplies(machine, (reply,))
+
+    def _schedule(self, machine, deadline):
+        machine.deadline = deadline
+        if machine.timer is not None:
+            machine.timer.cancel()
+        machine.timer = self.loop.call_at(deadline, self._onTimer, machine)
+
+    def _onTimer(self, machine):
+        machine.timer = None
+        try:
+            self._onDeadline(machine, self._now())
+        except Exception as e:
+            self.printx(e, "[AE] Exception in Slave timer:")
+            self._schedule(machine, self._now() + self.periodS)
+
+    def _now(self):
+        return self.loop.time()
+
+class FCAsyncCommunicator(fcc.FCCommunicator):
+    """
+    FCCommunicator whose master threads and Slave engine are replaced by one
+    asyncio event loop, run by a single thread. Selected with the
+    ac.commsEngine profile attribute (ac.ENGINE_ASYNCIO).
+    """
+    SYMBOL = "[CA]"
+
+    # Engine set-up ............................................................
+    def _setUpEngine(self, pqueue):
+        """
+        Create the event loop and the Slave engine. See
+        FCCommunicator._setUpEngine.
+        """
+        self.broadcastSwitch = True
+        self.broadcastMessage = bytearray("N|{}|{}".format(
+            self.passcode, self.listenerPort), 'ascii')
+        self.selector = None
+
+        self.loop = asyncio.new_event_loop()
+        self.asyncEngine = AsyncEngine(self, self.loop, pqueue)
+        self.listenerTransport = None
+        self.broadcastTransport = None
+
+        self.loopThread = mt.Thread(name = "FCMkII_asyncio",
+            target = self._loopRoutine, daemon = True)
+
+    def _startEngine(self):
+        """
+        Start the event loop and hand it every listed Slave.
+        """
+        self.loopThread.start()
+        for slave in self.slaves:
+            self._startSlave(slave)
+
+    def _startSlave(self, slave):
+        self.asyncEngine.register(slave)
+
+    def _sendRaw(self, slave, data, address):
+        transport = self.asyncEngine.transport(slave)
+        if transport is None:
+            slave._mosiSocket().sendto(data, address)
+        else:
+            transport.sendto(data, address)
+
+    def stop(self):
+        """
+        Clean up to terminate.
+        """
+        fcc.FCCommunicator.stop(self)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+    # Event loop ...............................................................
+    def _loopRoutine(self):
+        """
+        Run the event loop. To be executed by this instance's loop thread.
+        """
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_until_complete(self._open())
+            self.prints("[CA] asyncio back-end started")
+            self.loop.run_forever()
+        except Exception as e:
+            self.printx(e, "[CA] Fatal error in asyncio back-end:")
+            self.stopped.set()
+
+    async def _open(self):
+        """
+        Open the master endpoints, attach the input pipes and start the
+        periodic tasks.
+        """
+        self.listenerTransport, _ = await self.loop.create_datagram_endpoint(
+            lambda: Endpoint(self._processListener, self.printx),
+            sock = self.listenerSocket)
+        self.broadcastTransport, _ = await self.loop.create_datagram_endpoint(
+            lambda: Endpoint(lambda *_: None, self.printx),
+            sock = self.broadcastSocket)
+
+        inputs = ((self.commandPipeRecv, self._applyCommands),
+            (self.controlPipeRecv, self._applyControl))
+        if self.profile[ac.platform] != ac.WINDOWS:
+            for pipe, apply in inputs:
+                self.loop.add_reader(pipe.fileno(), self._onPipe, pipe, apply)
+        else:
+            # NOTE: Windows event loops cannot wait on pipes. Forward their
+            # vectors to the loop from threads instead.
+            for pipe, apply in inputs:
+                mt.Thread(name = "FCMkII_input", target = self._pipeRoutine,
+                    args = (pipe, apply), daemon = True).start()
+
+        tasks = [(self.schedule.task("broadcast", self.broadcastPeriodS),
+                self._broadcast),
+            (self.schedule.task("output", self.periodS), self._output)]
+        if self.diagnosticsPipeSend is not None:
+            tasks.append((self.schedule.task("diagnostics",
+                self.diagnosticsPeriodS), self._sendDiagnostics))
+        for task, routine in tasks:
+            task.delay()
+            self.loop.call_at(task.deadline, self._every, task, routine)
+
+    def _every(self, task, routine):
+        """
+        Call ROUTINE at each deadline of TASK (FCSchedule.Task), which advance
+        by whole periods to avoid drift; periods missed because the loop was
+        busy are skipped. (The default event loop keeps time with
+        time.monotonic, as do tasks.)
+        """
+        task.woke()
+        try:
+            routine()
+        except Exception as e:
+            self.printx(e, "[CA] Exception in periodic task:")
+
+        task.delay()
+        self.loop.call_at(task.deadline, self._every, task, routine)
+
+    def _broadcast(self):
+        """
+        Send a broadcast message, if enabled.
+        """
+        if self.broadcastSwitch:
+            self.broadcastTransport.sendto(self.broadcastMessage,
+                (self.broadcastIP, self.broadcastPort))
+
+    def _output(self):
+        """
+        Send network, slave, and fan array state vectors to the front-end.
+        """
+        self._sendNetwork()
+        self._sendSlaves()
+        self._sendFeedback()
+
+    def _onPipe(self, pipe, apply):
+        """
+        Process the vectors waiting on PIPE, all at once, with APPLY (see
+        FCCommunicator._applyCommands and _applyControl).
+        """
+        try:
+            apply(self._drain(pipe))
+        except (EOFError, OSError):
+            self.loop.remove_reader(pipe.fileno())
+            self.printw("[CA] Input pipe closed")
+
+    def _pipeRoutine(self, pipe, apply):
+        """
+        Forward the vectors received on PIPE to the event loop, to be processed
+        with APPLY. To be run by a thread where the loop cannot wait on pipes.
+        """
+        try:
+            while True:
+                self.loop.call_soon_threadsafe(apply, self._drain(pipe))
+        except (EOFError, OSError):
+            self.printw("[CA] Input pipe closed")
@@ -29,8 +29,6 @@
 
 # Network:
 import socket       # Networking
-import http.server  # For bootloader
-import socketserver # For bootloader
 
 # System:
 import sys          # Exception handling
@@ -38,22 +36,35 @@ import traceback    # More exception handling
 import threading as mt  # Multitasking
 import _thread      # thread.error
 import multiprocessing as mp # The big guns
+import multiprocessing.connection as mpc
 
 import platform # Check OS and Python version
 
 # Data:
 import time         # Timing
 import queue
+import collections # Latency samples
 import numpy as np  # Fast arrays and matrices
 import random as rd # For random names
+import re           # Discovery replies
 
 # FCMkIII:
 import fc.backend.mkiii.FCSlave as sv
 import fc.backend.mkiii.hardcoded as hc
 import fc.backend.mkiii.names as nm
+import fc.backend.mkiii.FCSelector as fs
+import fc.backend.mkiii.FCMISO as mm
+import fc.backend.mkiii.FCWire as fw
+import fc.backend.mkiii.FCSchedule as sc
+import fc.backend.mkiii.FCFlash as fl
+import fc.backend.mkiii.FCHandshake as hs
 
 # FCMkIV:
 import fc.archive as ac
+import fc.backend.shards as sh
+import fc.backend.feedback as fb
+import fc.backend.control as ct
+import fc.backend.states as st
 import fc.standards as s
 import fc.printer as pt
 
@@ -137,6 +148,30 @@ MOSI_DISCONNECT = 25
 MOSI_REBOOT = 26
 MOSI_DC_MULTI = 27
 
+# Standard MkII broadcast reply (A|PCODE|MAC|N|SMISO|SMOSI|VERSION), parsed in
+# one pass by the listener (see FCCommunicator._processListener):
+MKII_REPLY = re.compile(
+    r"A\|([^|]*)\|([^|]{17})\|N\|(\d+)\|(\d+)\|([^|]*)(?:\|.*)?", re.DOTALL)
+
+# Control latencies and burst spreads kept for statistics (see
+# FCCommunicator.controlLatency and FCCommunicator.burstSpread):
+CONTROL_SAMPLES = 1000
+
+# Weight of each new round trip sample in a Slave's smoothed RTT (see
+# FCCommunicator._processReply):
+RTT_GAIN = 1/8
+
+# Communication periods between round trip probes sent to each Slave (see
+# FCCommunicator._sendMOSI):
+RTT_PROBE_PERIODS = 10
+
+# MOSI commands that are sent in bursts (see FCCommunicator._burst):
+BURST_COMMANDS = (MOSI_DC, MOSI_DC_MULTI)
+
+# Receive buffer requested for the listener socket, in bytes (enough for the
+# replies of a few thousand slaves to a single broadcast):
+LISTENER_BUFFER_B = 4*1024*1024
+
 ## CLASS DEFINITION ############################################################
 
 # DONE:
@@ -169,7 +204,11 @@ class FCCommunicator(pt.PrintClient):
             feedbackPipeSend,
             slavePipeSend,
             networkPipeSend,
-            pqueue
+            pqueue,
+            shard = None,
+            feedback = None,
+            control = None,
+            diagnosticsPipeSend = None
         ): # ===================================================================
         """
         Constructor for FCCommunicator. This class encompasses the back-end
@@ -184,6 +223,15 @@ class FCCommunicator(pt.PrintClient):
             slavePipeSend := send slave vectors to FE (mp Pipe())
             networkPipeSend := send network vectors to FE (mp Pipe())
             pqueue := mp Queue() instance for I-P printing  (see fc.utils)
+            shard := (index, count) of this back-end among the workers of a
+                sharded back-end, or None (see fc.backend.shards)
+            feedback := name of the shared FeedbackBuffer to write feedback
+                vectors into, or None to send them through feedbackPipeSend
+                (see fc.backend.feedback)
+            control := name of the shared ControlBuffer to read DC vectors
+                from, or None (see fc.backend.control)
+            diagnosticsPipeSend := send diagnostics arrays to FE (mp Pipe()),
+                or None not to compute them
 
         """
         pt.PrintClient.__init__(self, pqueue)
@@ -206,6 +254,20 @@ class FCCommunicator(pt.PrintClient):
             self.targetVersion = None
             self.flashMessage = None
             self.broadcastMode = s.BMODE_BROADCAST
+            self.engine = profile[ac.commsEngine]
+            self.wireFormat = profile[ac.commsFormat]
+            self.mosiCopies = profile[ac.mosiCopies]
+            self.mosiRefresh = profile[ac.mosiRefresh]
+            self.mosiBurst = profile[ac.mosiBurst]
+            self.diagnosticsPeriodS = profile[ac.diagnosticsPeriodMS]/1000
+            self.controlLatencies = collections.deque(maxlen = CONTROL_SAMPLES)
+            self.controlCoalesced = 0
+            self.burstSpreads = collections.deque(maxlen = CONTROL_SAMPLES)
+            self.schedule = sc.Schedule()
+            self.handshakes = hs.Handshakes(profile[ac.hskLimit],
+                profile[ac.hskBackoffMS]/1000)
+            self.networkLock = mt.Lock()
+            self.shard = shard
 
             # Fan array:
             # FIXME usage of default slave data is a provisional choice
@@ -235,8 +297,16 @@ class FCCommunicator(pt.PrintClient):
             self.commandPipeRecv = commandPipeRecv
             self.controlPipeRecv = controlPipeRecv
             self.feedbackPipeSend = feedbackPipeSend
+            self.feedback = fb.FeedbackBuffer(name = feedback) \
+                if feedback is not None else None
+            self.control = ct.ControlBuffer(name = control) \
+                if control is not None else None
+            self.feedbackMatrix = mm.FeedbackMatrix(self.maxFans)
             self.slavePipeSend = slavePipeSend
+            self.slaveStates = st.Publisher(slavePipeSend)
             self.networkPipeSend = networkPipeSend
+            self.networkState = None
+            self.diagnosticsPipeSend = diagnosticsPipeSend
             self.stopped = mt.Event()
 
             # Output queues:
@@ -259,19 +329,27 @@ class FCCommunicator(pt.PrintClient):
                 s.CMD_BIP : self.__handle_input_CMD_BIP,
                 s.CMD_N : self.__handle_input_CMD_N,
                 s.CMD_S : self.__handle_input_CMD_S,
+                s.CMD_TIMING : self.__handle_input_CMD_TIMING,
             }
 
             self.controlHandlers = {
                 s.CTL_DC_SINGLE : self.__handle_input_CTL_DC_SINGLE,
                 s.CTL_DC_VECTOR : self.__handle_input_CTL_DC_VECTOR,
+                s.CTL_DC_SHARED : self.__handle_input_CTL_DC_SHARED,
             }
 
             if self.profile[ac.platform] != ac.WINDOWS:
                 self.printd("\tNOTE: Increasing socket limit w/ \"resource\"")
                 # Use resource library to get OS to give extra sockets:
+                # NOTE: Never lower the limit (large arrays need two sockets
+                # per slave).
                 import resource
-                resource.setrlimit(resource.RLIMIT_NOFILE,
-                    (1024, resource.getrlimit(resource.RLIMIT_NOFILE)[1]))
+                soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+                if soft != resource.RLIM_INFINITY:
+                    limit = max(soft, self.profile[ac.socketLimit])
+                    if hard != resource.RLIM_INFINITY:
+                        limit = min(limit, hard)
+                    resource.setrlimit(resource.RLIMIT_NOFILE, (limit, hard))
 
             # INITIALIZE MASTER SOCKETS ========================================
 
@@ -286,6 +364,11 @@ class FCCommunicator(pt.PrintClient):
             self.listenerSocket.setsockopt(
                 socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
 
+            # Make room for the burst of replies that follows each broadcast
+            # (the OS caps this at its own maximum):
+            self.listenerSocket.setsockopt(
+                socket.SOL_SOCKET, socket.SO_RCVBUF, LISTENER_BUFFER_B)
+
             # Bind socket to "nothing" (Broadcast on all interfaces and let OS
             # assign port number):
             self.listenerSocket.bind(("", 0))
@@ -368,85 +451,34 @@ class FCCommunicator(pt.PrintClient):
                 str(self.disconnectSocket.getsockname()))
 
             # Reset any lingering connections:
-            self.sendDisconnect()
+            # NOTE: When sharded, only the first worker does this, lest it
+            # undo the connections of the others.
+            if self.shard is None or self.shard[0] == 0:
+                self.sendDisconnect()
 
             # SET UP FLASHING HTTP SERVER --------------------------------------
-            self.flashHTTPHandler = http.server.SimpleHTTPRequestHandler
-            if self.profile[ac.platform] != ac.WINDOWS:
-                TCPServerType = socketserver.ForkingTCPServer
-            else:
-                TCPServerType = socketserver.ThreadingTCPServer
-            self.httpd = TCPServerType(
-                ("", 0),
-                self.flashHTTPHandler
-            )
-
-            self.httpd.socket.setsockopt(
-                socket.SOL_SOCKET,
-                socket.SO_REUSEADDR,
-                1
-            )
-            self.httpd.timeout = 5
-
-            self.flashServerThread = mt.Thread(
-                target = self.httpd.serve_forever
-            )
-            self.flashServerThread.setDaemon(True)
-            self.flashServerThread.start()
-            self.httpPort = self.httpd.socket.getsockname()[1]
+            # NOTE: See fc.backend.mkiii.FCFlash.
+            self.flashServer = fl.FlashServer(pqueue, profile[ac.flashWave],
+                profile[ac.flashConcurrency])
+            self.flashServer.start()
+            self.httpPort = self.flashServer.port
             self.printr("\tHTTP Server initialized on {}".format(
-                self.httpd.socket.getsockname()))
-
-            # SET UP MASTER THREADS ============================================
-
-            # INITIALIZE BROADCAST THREAD --------------------------------------
-            # Configure sentinel value for broadcasts:
-            self.broadcastSwitch = True
-                # ABOUT: UDP broadcasts will be sent only when this is True
-            self.broadcastSwitchLock = mt.Lock() # thread-safe access
+                self.flashServer.server.socket.getsockname()))
 
-            self.broadcastThread = mt.Thread(
-                name = "FCMkII_broadcast",
-                target = self._broadcastRoutine,
-                args = [bytearray("N|{}|{}".format(
-                            self.passcode,
-                            self.listenerPort),'ascii'),
-                        self.broadcastPeriodS]
-                )
-
-
-            # Set thread as daemon (background task for automatic closure):
-            self.broadcastThread.setDaemon(True)
-
-            # INITIALIZE LISTENER THREAD ---------------------------------------
-            self.listenerThread = mt.Thread(
-                name = "FCMkII_listener",
-                target = self._listenerRoutine)
-
-            # Set thread as daemon (background task for automatic closure):
-            self.listenerThread.setDaemon(True)
-
-            # INITIALIZE INPUT AND OUTPUT THREADS ------------------------------
-            self.outputThread  = mt.Thread(
-                name = "FCMkII_output",
-                target = self._outputRoutine)
-            self.outputThread.setDaemon(True)
-
-            self.inputThread = mt.Thread(
-                name = "FCMkII_input",
-                target = self._inputRoutine)
-            self.inputThread.setDaemon(True)
+            # SET UP MASTER THREADS AND SLAVE ENGINE ===========================
+            self._setUpEngine(pqueue)
 
             # SET UP LIST OF KNOWN SLAVES  =====================================
 
             # instantiate any saved Slaves:
             saved = self.profile[ac.savedSlaves]
-            self.slaves = [None]*len(saved)
+            self.slaves = []
+            self.macIndices = {}    # MAC -> index in self.slaves
+            self.ipIndices = {}     # IP -> index in self.slaves
             # TODO: get rid of FCSlaves
 
-            update = False
             for index, slave in enumerate(saved):
-                self.slaves[index] = \
+                self._addSlave(
                     sv.FCSlave(
                     name = slave[ac.SV_name],
                     mac = slave[ac.SV_mac],
@@ -457,26 +489,13 @@ class FCCommunicator(pt.PrintClient):
                     routineArgs = (index,),
                     misoQueueSize = self.misoQueueSize,
                     index = index,
-                    )
-
-                update = True
+                    ))
 
-            if update:
-                self._sendSlaves()
+            # Initial snapshot:
+            self._sendSlaves()
 
             # START THREADS:
-
-            # Start inter-process threads:
-            self.outputThread.start()
-            self.inputThread.start()
-
-            # Start Master threads:
-            self.listenerThread.start()
-            self.broadcastThread.start()
-
-            # Start Slave threads:
-            for slave in self.slaves:
-                slave.start()
+            self._startEngine()
 
             self.printw("NOTE: Reporting back-end listener IP as whole IP")
             self._sendNetwork()
@@ -494,19 +513,24 @@ class FCCommunicator(pt.PrintClient):
     # Input handling ...........................................................
     def _inputRoutine(self): # =================================================
         """
-        Receive command and control vectors from the front-end.
+        Receive command and control vectors from the front-end. Sleeps until
+        either arrives.
         """
         SYM = self.SYMBOL_IR
+        pipes = (self.commandPipeRecv, self.controlPipeRecv)
         try:
             self.prints(SYM + " Prototype input routine started")
             while True:
+                ready = mpc.wait(pipes)
                 try:
-                    if self.commandPipeRecv.poll():
-                        D = self.commandPipeRecv.recv()
-                        self.commandHandlers[D[s.CMD_I_CODE]](D)
-                    if self.controlPipeRecv.poll():
-                        C = self.controlPipeRecv.recv()
-                        self.controlHandlers[C[s.CTL_I_CODE]](C)
+                    if self.commandPipeRecv in ready:
+                        self._applyCommands(self._drain(self.commandPipeRecv))
+                    if self.controlPipeRecv in ready:
+                        self._applyControl(self._drain(self.controlPipeRecv))
+
+                except (EOFError, OSError):
+                    self.printw(SYM + " Input pipe closed")
+                    break
 
                 except Exception as e: # Print uncaught exceptions
                     self.printx(e, SYM + " Exception in back-end input thread:")
@@ -516,6 +540,108 @@ class FCCommunicator(pt.PrintClient):
                 + "(LOOP BROKEN):")
         # End _inputRoutine ====================================================
 
+    def _drain(self, pipe):
+        """
+        Return a list of the vectors waiting on PIPE, in order. Blocks until
+        there is at least one.
+        """
+        vectors = [pipe.recv()]
+        while pipe.poll():
+            vectors.append(pipe.recv())
+        return vectors
+
+    def _applyCommands(self, vectors):
+        """
+        Process the command vectors in VECTORS, in order.
+        """
+        for D in vectors:
+            try:
+                self.commandHandlers[D[s.CMD_I_CODE]](D)
+            except Exception as e:
+                self.printx(e, "Exception processing command vector:")
+
+    def _applyControl(self, messages):
+        """
+        Process the control pipe messages in MESSAGES (tuples (STAMP, C), see
+        fc.standards), in order. A DC vector followed by another one is
+        superseded by it, and skipped. Records the time from each message's
+        STAMP until its vector was set on the Slaves' MOSI slots. The new
+        commands are then sent in one burst if the profile says so (see
+        _burst).
+        """
+        last = len(messages) - 1
+        applied = False
+        for i, (stamp, C) in enumerate(messages):
+            if C[s.CTL_I_CODE] == s.CTL_DC_VECTOR and i < last and \
+                messages[i + 1][1][s.CTL_I_CODE] == s.CTL_DC_VECTOR:
+                self.controlCoalesced += 1
+                continue
+            try:
+                self.controlHandlers[C[s.CTL_I_CODE]](C)
+                self.controlLatencies.append(time.monotonic() - stamp)
+                applied = True
+            except Exception as e:
+                self.printx(e, "Exception processing control vector:")
+        if applied and self.mosiBurst:
+            self._dispatch()
+
+    def _dispatch(self):
+        """
+        Have the new commands on the Slaves' MOSI slots sent in one burst, by
+        the thread that may do so for the engine in use.
+        """
+        if self.selector is not None:
+            self.selector.burst()
+        else:
+            self._burst()
+
+    def _burst(self):
+        """
+        Send the new DC command on the MOSI slot of every CONNECTED Slave back
+        to back, so that a control frame reaches the whole array at once
+        instead of at each Slave's phase within the period. Records the spread
+        between the first and last sends (see burstSpread).
+
+        Slaves whose lock is held (i.e. that are being sent something by their
+        own thread right now) are left to it.
+        """
+        first = last = None
+        for slave in tuple(self.slaves):
+            try:
+                if slave.status != sv.CONNECTED or \
+                    slave.mosiSlot[-1][0] not in BURST_COMMANDS:
+                    continue
+            except IndexError:
+                continue
+            if not slave.acquire(False):
+                continue
+            try:
+                last = time.perf_counter()
+                self._sendMOSI(slave)
+            except Exception as e:
+                self.printx(e, "Exception in MOSI burst:")
+            finally:
+                slave.release()
+            if first is None:
+                first = last
+        if first is not None:
+            self.burstSpreads.append(last - first)
+
+    def controlLatency(self):
+        """
+        Return a tuple (p50, p99, max), in seconds, of the latest control
+        latencies recorded (see _applyControl), or None if there are none.
+        """
+        return sc.quantiles(self.controlLatencies)
+
+    def burstSpread(self):
+        """
+        Return a tuple (p50, p99, max), in seconds, of the time between the
+        first and last sends of the latest MOSI bursts (see _burst), or None if
+        there are none.
+        """
+        return sc.quantiles(self.burstSpreads)
+
     def __handle_input_CMD_ADD(self, D):
         """
         Process the command vector D with the corresponding command.
@@ -583,12 +709,17 @@ class FCCommunicator(pt.PrintClient):
                 "\n\tVersion: {} \n\tFile: \"{}\"\n\tSize: {} bytes)".format(
                 self.targetVersion, filename, filesize))
 
-            self.flashFlag = True
+            image = self.flashServer.load(filename)
+            if image.size != filesize:
+                self.printw("File \"{}\" is {} bytes long, not {}".format(
+                    filename, image.size, filesize))
 
             # FIXME: Why is the passcode "CT" hard-coded? Is it because it is
             # also hard-coded in the bootloader?
             self.flashMessage = "U|CT|{}|{}|{}|{}".format(
-                self.listenerPort, self.httpPort, filename, filesize)
+                self.listenerPort, self.httpPort, image.name, image.size)
+
+            self.flashFlag = True
 
             self.prints("Firmware update setup complete.")
 
@@ -604,6 +735,7 @@ class FCCommunicator(pt.PrintClient):
         """
         self.printr("Received command to stop firmware update.")
         self.flashFlag = False
+        self.flashServer.unload()
 
     def __handle_input_CMD_STOP(self, D):
         """
@@ -638,13 +770,21 @@ class FCCommunicator(pt.PrintClient):
         """
         Process a request for an updated network state vector.
         """
-        self._sendNetwork()
+        self._sendNetwork(force = True)
 
     def __handle_input_CMD_S(self, *_):
         """
-        Process a request for an updated slave state vector.
+        Process a request for an updated slave state vector (sent as a
+        snapshot of all slaves, see fc.backend.states).
         """
-        self._sendSlaves()
+        self._sendSlaves(snapshot = True)
+
+    def __handle_input_CMD_TIMING(self, *_):
+        """
+        Process a request for a timing vector (sent through the network pipe,
+        see fc.standards).
+        """
+        self._sendTiming()
 
     def _validBIP(self, ip):
         """
@@ -708,12 +848,32 @@ class FCCommunicator(pt.PrintClient):
         while i < L:
             if self.slaves[index].getStatus() == sv.CONNECTED:
                 self.slaves[index].setMOSI((
-                    MOSI_DC_MULTI,
-                    self.dcTemplate.format(*(C[i:i+self.maxFans]))))
+                    MOSI_DC_MULTI, C[i:i+self.maxFans]))
             index += 1
             i += self.maxFans
 
 
+    def __handle_input_CTL_DC_SHARED(self, C):
+        """
+        Process the control vector C with the corresponding command: send the
+        DCs that changed in the shared ControlBuffer to their Slaves.
+        See fc.standards for the expected form of C.
+        """
+        if self.control is None:
+            raise ValueError("Received {} without a control buffer".format(
+                s.CONTROL_CODES[C[s.CTL_I_CODE]]))
+
+        changes = self.control.read(C[s.CTL_I_SHARED_SEQ])
+        if changes is None:
+            return
+
+        # NOTE: Slaves that are not CONNECTED get the command as soon as they
+        # are, as their MOSI slot keeps it until then:
+        slaves = self.slaves
+        for index, dcs in zip(*changes):
+            if index < len(slaves):
+                slaves[index].setMOSI((MOSI_DC_MULTI, tuple(dcs)))
+
     def _outputRoutine(self): # ================================================
         """
         Send network, slave, and fan array state vectors to the front-end.
@@ -721,8 +881,9 @@ class FCCommunicator(pt.PrintClient):
         SYM = "[OT]"
         try:
             self.prints(SYM + " Prototype output routine started")
+            task = self.schedule.task("output", self.periodS)
             while True:
-                time.sleep(self.periodS)
+                task.wait()
                 try:
 
                     # Network status:
@@ -732,14 +893,7 @@ class FCCommunicator(pt.PrintClient):
                     self._sendSlaves()
 
                     # Feedback vector:
-                    # FIXME performance with this format
-                    F_r = []
-                    F_d = []
-                    for slave in self.slaves:
-                        rpms, dcs = slave.getMISO()
-                        F_r += rpms
-                        F_d += dcs
-                    self.feedbackPipeSend.send(F_r + F_d)
+                    self._sendFeedback()
 
                 except Exception as e: # Print uncaught exceptions
                     self.printx(e, SYM + "Exception in back-end output thread:")
@@ -758,11 +912,12 @@ class FCCommunicator(pt.PrintClient):
                 "on port {}".format(broadcastPeriod, self.broadcastPort))
 
             count = 0
+            task = self.schedule.task("broadcast", broadcastPeriod)
             while(True):
                 # Increment counter:
                 count += 1
                 # Wait designated period:
-                time.sleep(broadcastPeriod)
+                task.wait()
                 if self.broadcastSwitch:
                     # Broadcast message:
                     self.broadcastSocket.sendto(broadcastMessage,
@@ -772,6 +927,24 @@ class FCCommunicator(pt.PrintClient):
             self.stop()
         # End _broadcastRoutine ================================================
 
+    def _diagnosticsRoutine(self): # ===========================================
+        """
+        Send a diagnostics array to the front-end every diagnosticsPeriodS.
+        """
+        try:
+            task = self.schedule.task("diagnostics", self.diagnosticsPeriodS)
+            while True:
+                task.wait()
+                try:
+                    self._sendDiagnostics()
+                except Exception as e:
+                    self.printx(e, "[DG] Exception in diagnostics thread:")
+
+        except Exception as e:
+            self.printx(e, "[DG] Exception in diagnostics thread "\
+                + "(LOOP BROKEN): ")
+        # End _diagnosticsRoutine ==============================================
+
     def _listenerRoutine(self): # ==============================================
         """ ABOUT: This method is meant to run within an instance's listener-
             Thread. It will wait indefinitely for messages to be received by
@@ -780,258 +953,257 @@ class FCCommunicator(pt.PrintClient):
 
         self.prints("[LR] Listener thread started. Waiting.")
 
-        # Get standard replies:
-        launchMessage = "L|{}".format(self.passcode)
-
         while(True):
             try:
                 # Wait for a message to arrive:
                 messageReceived, senderAddress = \
                     self.listenerSocket.recvfrom(256)
 
-                # DEBUG: print("Message received")
+                self._processListener(messageReceived, senderAddress)
 
-                """ NOTE: The message received from Slave, at this point,
-                    should have one of the following forms:
+            except Exception as e: # Print uncaught exceptions
+                self.printx(e, "Exception in listener thread")
+        # End _listenerRoutine =================================================
 
-                    - STD from MkII:
-                        A|PCODE|SV:MA:CA:DD:RE:SS|N|SMISO|SMOSI|VERSION
-                        0     1         2 3 4     5 6
-                    - STD from Bootloader:
-                        B|PCODE|SV:MA:CA:DD:RE:SS|N|[BOOTLOADER_VERSION]
-                        0     1                 2 3                 4
+    def _processListener(self, messageReceived, senderAddress): # =============
+        """ ABOUT: Act upon a message received by the listenerSocket. Shared
+            by the listener thread and the asyncio back-end (see FCAsync).
+            - messageReceived := bytes received
+            - senderAddress := (IP, port) of the sender
+        """
+        # Get standard replies:
+        launchMessage = "L|{}".format(self.passcode)
 
-                    - Error from MkII:
-                        A|PCODE|SV:MA:CA:DD:RE:SS|E|ERRMESSAGE
+        # DEBUG: print("Message received")
 
-                    - Error from Bootloader:
-                        B|PCODE|SV:MA:CA:DD:RE:SS|E|ERRMESSAGE
+        """ NOTE: The message received from Slave, at this point,
+            should have one of the following forms:
 
-                    Where SMISO and SMOSI are the Slave's MISO and MOSI
-                    port numbers, respectively. Notice separators.
-                """
-                messageSplitted = messageReceived.decode('ascii').split("|")
-                    # NOTE: messageSplitted is a list of strings, each of which
-                    # is expected to contain a string as defined in the comment
-                    # above.
+            - STD from MkII:
+                A|PCODE|SV:MA:CA:DD:RE:SS|N|SMISO|SMOSI|VERSION
+                0     1         2 3 4     5 6
+            - STD from Bootloader:
+                B|PCODE|SV:MA:CA:DD:RE:SS|N|[BOOTLOADER_VERSION]
+                0     1                 2 3                 4
 
-                # Verify passcode:
-                if messageSplitted[1] != self.passcode:
-                    self.printw("Wrong passcode received (\"{}\") "\
-                        "from {}".format(messageSplitted[1],
-                        senderAddress[0]))
+            - Error from MkII:
+                A|PCODE|SV:MA:CA:DD:RE:SS|E|ERRMESSAGE
 
-                    #print "Wrong passcode"
+            - Error from Bootloader:
+                B|PCODE|SV:MA:CA:DD:RE:SS|E|ERRMESSAGE
 
-                    continue
+            Where SMISO and SMOSI are the Slave's MISO and MOSI
+            port numbers, respectively. Notice separators.
+        """
+        message = messageReceived.decode('ascii')
 
-                # Check who's is sending the message
-                if messageSplitted[0][0] == 'A':
-                    # This message comes from the MkII
+        # Fast path for standard MkII replies, which arrive in bursts after
+        # each broadcast:
+        reply = MKII_REPLY.fullmatch(message)
+        if reply is not None and reply.group(1) == self.passcode:
+            if self._owns(reply.group(2)):
+                self._onMkIIReply(*reply.groups()[1:], senderAddress)
+            return
 
-                    try:
-                        mac = messageSplitted[2]
-
-                        # Check message type:
-                        if messageSplitted[3] == 'N':
-                            # Standard broadcast reply
-
-                            misoPort = int(messageSplitted[4])
-                            mosiPort = int(messageSplitted[5])
-                            version = messageSplitted[6]
-
-                            # Verify converted values:
-                            if (misoPort <= 0 or misoPort > 65535):
-                                # Raise a ValueError if a port number is invalid:
-                                self.printw(
-                                    "Bad SMISO ({}). Need [1, 65535]".format(
-                                        miso))
-
-                            if (mosiPort <= 0 or mosiPort > 65535):
-                                # Raise a ValueError if a port number is invalid:
-                                raise ValueError(
-                                    "Bad SMOSI ({}). Need [1, 65535]".\
-                                    format(mosi))
-
-                            if (len(mac) != 17):
-                                # Raise a ValueError if the given MAC address is
-                                # not 17 characters long.
-                                raise ValueError("MAC ({}) not 17 chars".\
-                                    format(mac))
-
-                            # Search for Slave in self.slaves
-                            index = None
-                            for slave in self.slaves:
-                                if slave.getMAC() == mac:
-                                    index = slave.getIndex()
-                                    break
+        messageSplitted = message.split("|")
+            # NOTE: messageSplitted is a list of strings, each of which
+            # is expected to contain a string as defined in the comment
+            # above.
 
-                            # Check if the Slave is known:
-                            if index is not None :
-                                # Slave already recorded
-
-                                # Check flashing case:
-                                if self.flashFlag and version != \
-                                    self.targetVersion:
-                                    # Version mismatch. Send reboot message
-
-                                    # Send reboot message
-                                    self.listenerSocket.sendto(
-                                        bytearray("R|{}".\
-                                            format(self.passcode),'ascii'),
-                                        senderAddress
-                                    )
-
-                                # If the index is in the Slave dictionary,
-                                # check its status and proceed accordingly:
-
-                                elif self.slaves[index].getStatus() in \
-                                    (sv.DISCONNECTED, sv.BOOTLOADER):
-                                    # If the Slave is DISCONNECTED but just res-
-                                    # ponded to a broadcast, update its status
-                                    # for automatic reconnection. (handled by
-                                    # their already existing Slave thread)
-
-                                    # Update status and networking information:
-                                    self.setSlaveStatus(
-                                        self.slaves[index],
-                                        sv.KNOWN,
-                                        lock = False,
-                                        netargs = (
-                                            senderAddress[0],
-                                            misoPort,
-                                            mosiPort,
-                                            version
-                                            )
-                                    )
-                                else:
-                                    # All other statuses should be ignored for
-                                    # now.
-                                    pass
+        # Verify passcode:
+        if messageSplitted[1] != self.passcode:
+            self.printw("Wrong passcode received (\"{}\") "\
+                "from {}".format(messageSplitted[1],
+                senderAddress[0]))
 
-                            else:
-                                # Newly met Slave
-                                index = len(self.slaves)
-                                # If the MAC address is not recorded, list it
-                                # AVAILABLE and move on. The user may choose
-                                # to add it later.
-                                name = rd.choice(nm.coolNames)
-                                fans = self.defaultSlave[ac.SV_maxFans]
-
-                                self.slaves.append(
-                                    sv.FCSlave(
-                                        name = name,
-                                        mac = mac,
-                                        fans = fans,
-                                        maxFans = self.maxFans,
-                                        status = sv.AVAILABLE,
-                                        routine = self._slaveRoutine,
-                                        routineArgs = (index, ),
-                                        version = version,
-                                        misoQueueSize = self.misoQueueSize,
-                                        ip = senderAddress[0],
-                                        misoP = misoPort,
-                                        mosiP = mosiPort,
-                                        index = index)
-                                )
-
-                                # Add new Slave's information to newSlaveQueue:
-                                self._sendSlaves()
-
-                                # Start Slave thread:
-                                self.slaves[index].start()
-
-                        elif messageSplitted[3] == 'E':
-                            # Error message
-
-                            self.printe("Error message from Slave {}: "\
-                                "\"{}\"".format(
-                                    messageSplitted[2], messageSplitted[3]))
-                        else:
-                            # Invalid code
-                            raise IndexError
+            #print "Wrong passcode"
 
-                    except IndexError:
-                        self.printw("Invalid message \"{}\" discarded; "\
-                            "sent by {}".format(
-                                messageReceived,senderAddress))
+            return
 
-                elif messageSplitted[0][0] == 'B':
-                    # This message comes from the Bootloader
+        # Ignore Slaves handled by other workers (see fc.backend.shards):
+        if len(messageSplitted) > 2 and not self._owns(messageSplitted[2]):
+            return
 
-                    try:
-                        # Check message type:
-                        if messageSplitted[3] == 'N':
-                            # Standard broadcast
+        # Check who's is sending the message
+        if messageSplitted[0][0] == 'A':
+            # This message comes from the MkII
 
-                            if not self.flashFlag:
-                                # No need to flash. Launch MkII:
-                                self.listenerSocket.sendto(
-                                    bytearray(launchMessage,'ascii'),
-                                    senderAddress)
+            try:
+                # Check message type:
+                if messageSplitted[3] == 'N':
+                    # Standard broadcast reply that does not match
+                    # MKII_REPLY (bad port numbers or MAC address):
+                    raise IndexError
+
+                elif messageSplitted[3] == 'E':
+                    # Error message
+
+                    self.printe("Error message from Slave {}: "\
+                        "\"{}\"".format(
+                            messageSplitted[2], messageSplitted[3]))
+                else:
+                    # Invalid code
+                    raise IndexError
 
-                            else:
-                                # Flashing in progress. Send flash message:
+            except IndexError:
+                self.printw("Invalid message \"{}\" discarded; "\
+                    "sent by {}".format(
+                        messageReceived,senderAddress))
 
-                                self.listenerSocket.sendto(
-                                    bytearray(self.flashMessage,'ascii'),
-                                    senderAddress)
+        elif messageSplitted[0][0] == 'B':
+            # This message comes from the Bootloader
 
-                            # Update Slave status:
+            try:
+                # Check message type:
+                if messageSplitted[3] == 'N':
+                    # Standard broadcast
 
-                            # Search for Slave in self.slaves
-                            index = None
-                            mac = messageSplitted[2]
+                    if not self.flashFlag:
+                        # No need to flash. Launch MkII:
+                        self.listenerSocket.sendto(
+                            bytearray(launchMessage,'ascii'),
+                            senderAddress)
 
-                            for slave in self.slaves:
-                                if slave.getMAC() == mac:
-                                    index = slave.getIndex()
-                                    break
+                    elif self.flashServer.admit(messageSplitted[2],
+                        senderAddress[0]):
+                        # Flashing in progress and this bootloader's turn
+                        # (see FCFlash). Send flash message:
 
-                            if index is not None:
-                                # Known Slave. Update status:
+                        self.listenerSocket.sendto(
+                            bytearray(self.flashMessage,'ascii'),
+                            senderAddress)
 
-                                # Try to get bootloader version:
-                                try:
-                                    version = messageSplitted[4]
-                                except IndexError:
-                                    version = "Bootloader(?)"
+                    # Otherwise, leave the bootloader waiting. It keeps
+                    # waiting while it receives broadcasts.
 
-                                self.slaves[index].setVersion(version)
-                                self.setSlaveStatus(
-                                    self.slaves[index],
-                                    sv.BOOTLOADER
-                                )
+                    # Update Slave status:
 
-                            else:
+                    # Search for Slave in self.slaves
+                    index = self.macIndices.get(messageSplitted[2])
 
-                                # Send launch message:
-                                self.listenerSocket.sendto(
-                                    bytearray(launchMessage,'ascii'),
-                                    senderAddress)
+                    if index is not None:
+                        # Known Slave. Update status:
 
+                        # Try to get bootloader version:
+                        try:
+                            version = messageSplitted[4]
+                        except IndexError:
+                            version = "Bootloader(?)"
 
-                        elif messageSplitted[3] == 'E':
-                            # Error message
+                        self.slaves[index].setVersion(version)
+                        self.setSlaveStatus(
+                            self.slaves[index],
+                            sv.BOOTLOADER
+                        )
 
-                            self.printe("Error message from {} "\
-                                "on Bootloader: \"{}\"".format(
-                                    messageSplitted[2],
-                                    messageSplitted[4]))
+                    else:
 
-                    except IndexError:
-                        self.printw("Invalid message \"{}\" discarded; "\
-                            "sent by {}".format(
-                                senderAddress[0], messageReceived))
-                else:
-                    # Invalid first character (discard message)
-                    self.printw("Warning: Message from {} w/ invalid first "\
-                        "character '{}' discarded".format(
-                            senderAddress[0], messageSplitted[0]))
+                        # Send launch message:
+                        self.listenerSocket.sendto(
+                            bytearray(launchMessage,'ascii'),
+                            senderAddress)
 
-            except Exception as e: # Print uncaught exceptions
-                self.printx(e, "Exception in listener thread")
-        # End _listenerRoutine =================================================
+
+                elif messageSplitted[3] == 'E':
+                    # Error message
+
+                    self.printe("Error message from {} "\
+                        "on Bootloader: \"{}\"".format(
+                            messageSplitted[2],
+                            messageSplitted[4]))
+
+            except IndexError:
+                self.printw("Invalid message \"{}\" discarded; "\
+                    "sent by {}".format(
+                        senderAddress[0], messageReceived))
+        else:
+            # Invalid first character (discard message)
+            self.printw("Warning: Message from {} w/ invalid first "\
+                "character '{}' discarded".format(
+                    senderAddress[0], messageSplitted[0]))
+
+        # End _processListener =================================================
+
+    def _onMkIIReply(self, mac, misoPort, mosiPort, version, senderAddress):
+        """ ABOUT: Act upon a standard MkII broadcast reply, as parsed by
+            MKII_REPLY from a message received by the listenerSocket.
+            - mac, misoPort, mosiPort, version := fields of the reply (str)
+            - senderAddress := (IP, port) of the sender
+        """
+        misoPort, mosiPort = int(misoPort), int(mosiPort)
+
+        # Verify converted values:
+        if not (0 < misoPort <= 65535 and 0 < mosiPort <= 65535):
+            self.printw("Bad SMISO/SMOSI ({}/{}) from {}. Need [1, 65535]".\
+                format(misoPort, mosiPort, senderAddress[0]))
+            return
+
+        # Check if the Slave is known:
+        index = self.macIndices.get(mac)
+        if index is not None:
+            # Slave already recorded
+            slave = self.slaves[index]
+
+            # Check flashing case:
+            if self.flashFlag and version != self.targetVersion:
+                # Version mismatch. Send reboot message
+                self.listenerSocket.sendto(
+                    bytearray("R|{}".format(self.passcode),'ascii'),
+                    senderAddress)
+
+            elif slave.getStatus() in (sv.DISCONNECTED, sv.BOOTLOADER):
+                # If the Slave is DISCONNECTED but just responded to a
+                # broadcast, update its status for automatic reconnection.
+                # (handled by their already existing Slave thread)
+
+                # Update status and networking information:
+                self.setSlaveStatus(slave, sv.KNOWN, lock = False,
+                    netargs = (senderAddress[0], misoPort, mosiPort, version))
+
+            # All other statuses should be ignored for now.
+
+        else:
+            # Newly met Slave. List it AVAILABLE and move on. The user may
+            # choose to add it later. (The output routine reports it to the
+            # front-end within one period.)
+            index = len(self.slaves)
+            slave = sv.FCSlave(
+                name = rd.choice(nm.coolNames),
+                mac = mac,
+                fans = self.defaultSlave[ac.SV_maxFans],
+                maxFans = self.maxFans,
+                status = sv.AVAILABLE,
+                routine = self._slaveRoutine,
+                routineArgs = (index, ),
+                version = version,
+                misoQueueSize = self.misoQueueSize,
+                ip = senderAddress[0],
+                misoP = misoPort,
+                mosiP = mosiPort,
+                index = index)
+            self._addSlave(slave)
+
+            # Start Slave handling:
+            self._startSlave(slave)
+
+        # End _onMkIIReply =====================================================
+
+    def _owns(self, mac):
+        """ ABOUT: Return whether the Slave with MAC address MAC is handled by
+            this back-end, rather than by another worker of a sharded back-end
+            (see fc.backend.shards).
+        """
+        return self.shard is None or \
+            sh.owner(mac, self.shard[1]) == self.shard[0]
+
+    def _addSlave(self, slave):
+        """ ABOUT: Append SLAVE, whose index must be len(self.slaves), to
+            self.slaves, and index it by MAC and IP address.
+        """
+        self.slaves.append(slave)
+        self.macIndices[slave.getMAC()] = slave.index
+        if slave.ip is not None:
+            self.ipIndices[slave.ip] = slave.index
 
     def _slaveRoutine(self, targetIndex, target): # # # # # # # # # # # # # # # #
         # ABOUT: This method is meant to run on a Slave's communication-handling
@@ -1051,21 +1223,7 @@ class FCCommunicator(pt.PrintClient):
             slave = target
 
             # Set up sockets ---------------------------------------------------
-            # MISO:
-            misoS = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            misoS.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            misoS.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-            misoS.settimeout(self.periodS*2)
-            misoS.bind(('', 0))
-
-            # MOSI:
-            mosiS = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            mosiS.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            mosiS.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-            mosiS.settimeout(self.periodS)
-            mosiS.bind(('', 0))
-
-            # Assign sockets:
+            misoS, mosiS = self._makeSockets()
             slave.setSockets(newMISOS = misoS, newMOSIS = mosiS)
 
             self.printr("[SV] ({:3d}) Slave sockets connected: "\
@@ -1076,38 +1234,19 @@ class FCCommunicator(pt.PrintClient):
                     slave.getIP()))
 
             # HSK message ------------------------------------------------------
-            def _makeHSK():
-                return  "H|{},{},{},{},{}|"\
-                    "{} {} {} {} {} {} {} {} {} {} {}".format(
-                        slave._misoSocket().getsockname()[1],
-                        slave._mosiSocket().getsockname()[1],
-                        self.periodMS,
-                        self.broadcastPeriodS*1000,
-                        self.maxTimeouts,
-                        # FIXME: Set values per slave, not globals
-                        self.fanMode,
-                        self.maxFans,
-                        self.fanFrequencyHZ,
-                        self.counterCounts,
-                        self.pulsesPerRotation,
-                        self.maxRPM,
-                        self.minRPM,
-                        self.minDC,
-                        self.chaserTolerance,
-                        self.maxFanTimeouts,
-                        self.pinout)
-
-            MHSK = _makeHSK()
+            MHSK = self._makeHSK(slave)
 
             # Set up placeholders and sentinels --------------------------------
             slave.resetIndices()
             periodS = self.periodS
             timeouts = 0
             totalTimeouts = 0
-            message = "P"
             tryBuffer = True
 
-            failedHSKs = 0
+            failedHSKs = 0 # Consecutive failed handshake rounds
+
+            # Deadlines for the states in which to wait periodically:
+            idle = self.schedule.task("slave", self.periodS)
 
 
             # Slave loop =======================================================
@@ -1118,104 +1257,63 @@ class FCCommunicator(pt.PrintClient):
 
                     status = slave.getStatus()
 
+                    if status in (sv.KNOWN, sv.CONNECTED):
+                        # Paced by the exchanges instead:
+                        idle.reset()
+
                     # Act according to Slave's state:
                     if status == sv.KNOWN: # = = = = = = = = = = = = = = = =
 
                         # If the Slave is known, try to secure a connection:
                         # print "Attempting handshake"
 
-                        # Check for signs of life w/ HSK message:
-                        self._send(MHSK, slave, 2, True)
-
-                        # Give time to process:
-                        #time.sleep(periodS)
-
-                        tries = 2
-                        while True:
-
-                            # Try to receive reply:
-                            reply = self._receive(slave)
-
-                            # Check reply:
-                            if reply is not None and reply[1] == "H":
-                                # print "Processed reply: {}".format(reply), "G"
-                                # print "Handshake confirmed"
+                        # Wait for this Slave's turn (see FCHandshake):
+                        time.sleep(self.handshakes.delay(failedHSKs))
+                        if slave.getStatus() != sv.KNOWN or \
+                            not self.handshakes.acquire(periodS):
+                            continue
 
-                                # Mark as CONNECTED and get to work:
-                                #slave.setStatus(sv.CONNECTED, lock = False)
-                                self.setSlaveStatus(slave,sv.CONNECTED,False)
-                                tryBuffer = True
-                                break
+                        try:
+                            # Check for signs of life w/ HSK message:
+                            self._send(MHSK, slave, 2, True)
 
-                                """
-                                self._saveTimeStamp(slave.getIndex(), "Connected")
-                                """
+                            tries = 2
+                            while True:
 
-                            elif reply is not None and reply[1] == "K":
-                                # HSK acknowledged, give Slave time
-                                continue
+                                # Try to receive reply:
+                                reply = self._receive(slave)
 
-                            elif tries > 0:
-                                # Try again:
-                                self._send(MHSK, slave, 1, True)
-                                tries -= 1
+                                # Check reply:
+                                if reply is not None and reply[1] == "H":
+                                    # Mark as CONNECTED and get to work:
+                                    self._negotiate(slave, reply)
+                                    self.setSlaveStatus(slave,sv.CONNECTED,
+                                        False)
+                                    tryBuffer = True
+                                    failedHSKs = 0
+                                    break
 
-                            elif failedHSKs is 0:
-                                # Disconnect Slave:
-                                self._send("X", slave, 2)
-                                #slave.setStatus(sv.DISCONNECTED, lock = False)
+                                elif reply is not None and reply[1] == "K":
+                                    # HSK acknowledged, give Slave time
+                                    continue
 
-                                self.setSlaveStatus(
-                                    slave,sv.DISCONNECTED,False)
-                                    # NOTE: This call also resets exchange
-                                    # index.
-                                break
+                                elif tries > 0:
+                                    # Try again (the sockets are kept, see
+                                    # FCHandshake):
+                                    self._send(MHSK, slave, 1, True)
+                                    tries -= 1
 
-                            else:
-                                # Something's wrong. Reset sockets.
-                                self.printw("Resetting sockets for {} ({})".\
-                                    format(slave.getMAC(), targetIndex + 1))
-
-                            # MISO:
-                            slave._misoSocket().close()
-
-                            misoS = socket.socket(
-                                socket.AF_INET, socket.SOCK_DGRAM)
-                            misoS.setsockopt(
-                                socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-                            misoS.setsockopt(
-                                socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-                            misoS.settimeout(self.periodS*2)
-                            misoS.bind(('', 0))
-
-                            # MOSI:
-                            slave._misoSocket().close()
-
-                            mosiS = socket.socket(
-                                socket.AF_INET, socket.SOCK_DGRAM)
-                            mosiS.setsockopt(
-                                socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-                            mosiS.setsockopt(
-                                socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-                            mosiS.settimeout(self.periodS)
-                            mosiS.bind(('', 0))
-
-                            # Assign sockets:
-                            slave.setSockets(newMISOS = misoS, newMOSIS = mosiS)
-
-                            self.printr("[SV] {:3d} Slave sockets "\
-                                "re-connected: MMISO: {} MMOSI:{}".format(
-                                    targetIndex + 1,
-                                    slave._misoSocket().getsockname()[1],
-                                    slave._mosiSocket().getsockname()[1]))
-
-                            # HSK message --------------------------------------
-                            MHSK = _makeHSK()
-
-                            # Reset counter:
-                            failedHSKs = 0
-
-                            continue
+                                else:
+                                    # Disconnect Slave:
+                                    self._send("X", slave, 2)
+                                    self.setSlaveStatus(
+                                        slave,sv.DISCONNECTED,False)
+                                        # NOTE: This call also resets
+                                        # exchange index.
+                                    failedHSKs += 1
+                                    break
+                        finally:
+                            self.handshakes.release()
 
                     elif status == sv.CONNECTED: # = = = = = = = = = = = = = = =
                         # If the Slave's state is positive, it is online and
@@ -1239,42 +1337,13 @@ class FCCommunicator(pt.PrintClient):
 
                             continue
 
-                        # Check queue for message:
-                        fetchedMessage = slave.getMOSI()
-
-                        if fetchedMessage is None:
-                            # Nothing to fetch. Send previous command
-
-                            # Send message:
-                            self._send(message, slave, 2)
-
-                        elif fetchedMessage[0] == MOSI_DC:
-                            # NOTE MkIV format:
-                            # (MOSI_DC, DC, SELECTION)
-                            # -> DC is already normalized
-                            # -> SELECTION is string of 1's and 0's
-
-                            message = "S|D:{}:{}".format(
-                                fetchedMessage[1], fetchedMessage[2])
-                            #   \---------------/  \---------------/
-                            #      Duty cycle         Selection
-
-                            self._send(message, slave, 2)
-
-                        elif fetchedMessage[0] == MOSI_DC_MULTI:
-                            # NOTE MkIV format:
-                            # (MOSI_DC_MULTI, "dc_0,dc_1,dc_2...dc_maxFans")
-                            # Here each dc is already normalized
-                            # NOTE: Notice here maxFans is assumed (should be
-                            # ignored by slave)
-                            message = "S|F:" + fetchedMessage[1]
-                            self._send(message, slave, 2)
-
-                        elif fetchedMessage[0] == MOSI_DISCONNECT:
-                            self._sendToListener("X", slave, 2)
-
-                        elif fetchedMessage[0] == MOSI_REBOOT:
-                            self._sendToListener("R", slave, 2)
+                        # Check slot for message and send (with the Slave
+                        # lock, see _burst):
+                        slave.acquire()
+                        try:
+                            self._sendMOSI(slave)
+                        finally:
+                            slave.release()
 
                         # DEBUG:
                         # print "Sent: {}".format(message)
@@ -1289,90 +1358,14 @@ class FCCommunicator(pt.PrintClient):
                             # Restore timeout counter after success:
                             timeouts = 0
 
-                            # Check message type:
-                            if reply[1] == 'T':
-                                # Standard update
-
-                                # Get data index:
-                                receivedDataIndex = int(reply[2])
-
-                                # Check for redundant data:
-                                if receivedDataIndex > slave.getDataIndex():
-                                    # If this data index is greater than the
-                                    # currently stored one, this data is new and
-                                    # should be updated:
-
-                                    # Update data index:
-                                    slave.setDataIndex(receivedDataIndex)
-
-                                    # Update RPMs and DCs:
-                                    try:
-                                        # Set up data placeholder as a tuple:
-                                        # FIXME performance
-
-                                        rpms =  list(map(
-                                            int,reply[-2].split(',')))
-                                        dcs = list(map(
-                                            float,reply[-1].split(',')))
-
-                                        rpms += [0]*(self.maxFans - len(rpms))
-                                        dcs += [0]*(self.maxFans - len(dcs))
-
-                                        # FIXME performance pls
-                                        # FIXME rem. fix on slave.getMISO()
-                                        # when this format is changed
-                                        slave.setMISO((rpms, dcs), False)
-                                            # FORM: (RPMs, DCs)
-                                    except queue.Full:
-                                        # If there is no room for this message,
-                                        # drop the packet and alert the user:
-                                        slave.incrementDropIndex()
-
-                            elif reply[1] == 'I':
-                                # Reset MISO index
-
-                                slave.setMISOIndex(0)
-                                self.printr("[SV] {} MISO Index reset".format(
-                                    slave.getMAC()))
-
-                            elif reply[1] == 'P':
-                                # Ping request
-
-                                self._send("P", slave)
-
-                            elif reply[1] == 'Y':
-                                # Reconnect reply
-
-                                pass
-
-                            elif reply[1] == 'M':
-                                # Maintain connection. Pass
-                                pass
-
-                            elif reply[1] == 'H':
-                                # Old HSK message. Pass
-                                pass
-
-                            elif reply[1] == 'E':
-                                # Error report
-
-                                self.printe("[SV] {:3d} ERROR: \"{}\"".format(
-                                    targetIndex + 1, reply[2]))
-
-                            elif reply[1] == 'Q':
-                                # Ping reply. Pass
-                                pass
-
-                            else:
-                                # Unrecognized command
-
-                                self.printw("[SV] {:3d} Warning, unrecognized "\
-                                    "message: \"{}\"".format(
-                                        targetIndex + 1, reply))
+                            self._processReply(slave, targetIndex, reply)
 
                         else:
                             timeouts += 1
                             totalTimeouts += 1
+                            slave.timeouts += 1
+                            slave.probeSentAt = None
+                            slave.probeAge = 0
 
                             """
                             if message is not None:
@@ -1434,10 +1427,10 @@ class FCCommunicator(pt.PrintClient):
                             # End check reply ---------------------------------
 
                     elif status == sv.BOOTLOADER:
-                        time.sleep(self.periodS)
+                        idle.wait()
 
                     else: # = = = = = = = = = = = = = = = = = = = = = = = = = =
-                        time.sleep(self.periodS)
+                        idle.wait()
                         """
                         # If this Slave is neither online nor waiting to be
                         # contacted, wait for its state to change.
@@ -1491,11 +1484,384 @@ class FCCommunicator(pt.PrintClient):
         # be accessed by the user of a Communicator instance, see INTERFACE ME-
         # THODS below.
 
+    def _setUpEngine(self, pqueue): # # # # # # # # # # # # # # # # # # # # # #
+        # ABOUT: Create the master threads (broadcast, listener, input and
+        # output) and the Slave engine selected in the profile. Called by the
+        # constructor once sockets and parameters are set up. Back-ends that
+        # do not use threads (see FCAsync) override this and _startEngine.
+        # PARAMETERS:
+        # - pqueue: mp Queue() instance for I-P printing
+
+        # INITIALIZE BROADCAST THREAD ------------------------------------------
+        # Configure sentinel value for broadcasts:
+        self.broadcastSwitch = True
+            # ABOUT: UDP broadcasts will be sent only when this is True
+        self.broadcastSwitchLock = mt.Lock() # thread-safe access
+
+        self.broadcastThread = mt.Thread(
+            name = "FCMkII_broadcast",
+            target = self._broadcastRoutine,
+            args = [bytearray("N|{}|{}".format(
+                        self.passcode,
+                        self.listenerPort),'ascii'),
+                    self.broadcastPeriodS]
+            )
+
+
+        # Set thread as daemon (background task for automatic closure):
+        self.broadcastThread.setDaemon(True)
+
+        # INITIALIZE LISTENER THREAD -------------------------------------------
+        self.listenerThread = mt.Thread(
+            name = "FCMkII_listener",
+            target = self._listenerRoutine)
+
+        # Set thread as daemon (background task for automatic closure):
+        self.listenerThread.setDaemon(True)
+
+        # INITIALIZE INPUT AND OUTPUT THREADS ----------------------------------
+        self.outputThread  = mt.Thread(
+            name = "FCMkII_output",
+            target = self._outputRoutine)
+        self.outputThread.setDaemon(True)
+
+        self.inputThread = mt.Thread(
+            name = "FCMkII_input",
+            target = self._inputRoutine)
+        self.inputThread.setDaemon(True)
+
+        self.diagnosticsThread = None
+        if self.diagnosticsPipeSend is not None:
+            self.diagnosticsThread = mt.Thread(
+                name = "FCMkII_diagnostics",
+                target = self._diagnosticsRoutine)
+            self.diagnosticsThread.setDaemon(True)
+
+        # INITIALIZE SLAVE ENGINE ----------------------------------------------
+        # NOTE: With the threaded engine each Slave runs _slaveRoutine in
+        # its own thread; with the selector engine a single FCSelector
+        # thread handles all of them.
+        self.selector = None
+        if self.engine == ac.ENGINE_SELECTOR:
+            self.selector = fs.FCSelector(self, pqueue)
+        elif self.engine != ac.ENGINE_THREADED:
+            raise ValueError("Invalid communications engine \"{}\"".format(
+                self.engine))
+
+        # End _setUpEngine # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def _startEngine(self): # # # # # # # # # # # # # # # # # # # # # # # # # #
+        # ABOUT: Start what _setUpEngine created and hand every listed Slave to
+        # the Slave engine.
+
+        # Start inter-process threads:
+        self.outputThread.start()
+        self.inputThread.start()
+        if self.diagnosticsThread is not None:
+            self.diagnosticsThread.start()
+
+        # Start Master threads:
+        self.listenerThread.start()
+        self.broadcastThread.start()
+
+        # Start Slave engine:
+        if self.selector is not None:
+            self.selector.start()
+        for slave in self.slaves:
+            self._startSlave(slave)
+
+        # End _startEngine # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def _startSlave(self, slave): # # # # # # # # # # # # # # # # # # # # # #
+        # ABOUT: Start handling a newly listed Slave with the engine selected
+        # in the profile.
+
+        if self.selector is not None:
+            self.selector.register(slave)
+        else:
+            slave.start()
+
+        # End _startSlave # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def _makeSockets(self, blocking = True): # # # # # # # # # # # # # # # # #
+        # ABOUT: Create and bind a new pair of MISO and MOSI sockets for a
+        # Slave.
+        # PARAMETERS:
+        # - blocking: bool, whether to give the sockets the timeouts used by
+        #   the threaded engine (True) or make them non-blocking (False).
+        # RETURNS:
+        # - tuple of sockets, (MISO, MOSI)
+
+        # NOTE: These sockets are bound to OS-assigned ports and must not be
+        # made "reusable"; with SO_REUSEADDR, Linux may give two of them the
+        # same port and Slave traffic gets crossed.
+
+        # MISO:
+        misoS = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        misoS.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        misoS.settimeout(self.periodS*2 if blocking else 0.0)
+        misoS.bind(('', 0))
+
+        # MOSI:
+        mosiS = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        mosiS.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        mosiS.settimeout(self.periodS if blocking else 0.0)
+        mosiS.bind(('', 0))
+
+        return misoS, mosiS
+
+        # End _makeSockets # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def _makeHSK(self, slave): # # # # # # # # # # # # # # # # # # # # # # # #
+        # ABOUT: Build the handshake message for the given Slave, which must
+        # already have its sockets assigned. Offers the binary wire format if
+        # so configured (see FCWire).
+
+        return  "H|{},{},{},{},{}|"\
+            "{} {} {} {} {} {} {} {} {} {} {}{}".format(
+                slave._misoSocket().getsockname()[1],
+                slave._mosiSocket().getsockname()[1],
+                self.periodMS,
+                self.broadcastPeriodS*1000,
+                self.maxTimeouts,
+                # FIXME: Set values per slave, not globals
+                self.fanMode,
+                self.maxFans,
+                self.fanFrequencyHZ,
+                self.counterCounts,
+                self.pulsesPerRotation,
+                self.maxRPM,
+                self.minRPM,
+                self.minDC,
+                self.chaserTolerance,
+                self.maxFanTimeouts,
+                self.pinout,
+                "|" + fw.TOKEN if self.wireFormat == ac.FORMAT_BINARY else "")
+
+        # End _makeHSK # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def _negotiate(self, slave, reply): # # # # # # # # # # # # # # # # # # # #
+        # ABOUT: Set the wire format of a Slave whose handshake was just
+        # confirmed, according to its reply.
+        # PARAMETERS:
+        # - slave: Slave that replied
+        # - reply: tuple, "H" reply as returned by _receive
+
+        slave.binary = self.wireFormat == ac.FORMAT_BINARY \
+            and len(reply) > 2 and reply[2] == fw.TOKEN
+
+        # Send the last command again, in the format just negotiated:
+        if slave.mosiCommand is not None:
+            self._encodeMOSI(slave, slave.mosiCommand)
+            slave.mosiPending = True
+
+        # End _negotiate # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def _sendMOSI(self, slave): # # # # # # # # # # # # # # # # # # # # # # # #
+        # ABOUT: Fetch the next command from a CONNECTED Slave's MOSI slot and
+        # send it, following the redundancy policy set by the profile:
+        # - A new command is encoded and sent mosiCopies times. A command equal
+        #   to the last one sent is not new.
+        # - The last command is sent again (mosiCopies times) if no reply was
+        #   received since it was sent, or after mosiRefresh periods without
+        #   being sent (0 for never).
+        # - Otherwise, only a ping is sent, so that the Slave does not time
+        #   out.
+        # The bytes this saves with respect to sending the last command twice
+        # every period are counted in slave.mosiSaved.
+        # NOTE: The MkII protocol has no MOSI acknowledgement; any reply
+        # received after a command was sent counts as one (see _processReply).
+        # Its only request with a matching reply is the ping request ("Q"),
+        # so one is sent every RTT_PROBE_PERIODS, unless one is outstanding,
+        # to measure the round trip time. It replaces the ping if there is
+        # one.
+        # PARAMETERS:
+        # - slave: Slave to contact
+
+        fetchedMessage = slave.getMOSI()
+
+        if fetchedMessage is None or fetchedMessage == slave.mosiCommand:
+            # Nothing new to send:
+            slave.mosiAge += 1
+            if slave.mosiMessage is not None and (slave.mosiPending or \
+                (self.mosiRefresh and slave.mosiAge >= self.mosiRefresh)):
+                # Unacknowledged or due for a refresh. Send previous command:
+                message, copies = slave.mosiMessage, self.mosiCopies
+            else:
+                message, copies = "P", 1
+
+        elif fetchedMessage[0] == MOSI_DC:
+            # NOTE MkIV format:
+            # (MOSI_DC, DC, SELECTION)
+            # -> DC is already normalized
+            # -> SELECTION is string of 1's and 0's
+            message, copies = self._encodeMOSI(slave, fetchedMessage), \
+                self.mosiCopies
+
+        elif fetchedMessage[0] == MOSI_DC_MULTI:
+            # NOTE MkIV format:
+            # (MOSI_DC_MULTI, (dc_0, dc_1, dc_2... dc_maxFans))
+            # Here each dc is already normalized
+            # NOTE: Notice here maxFans is assumed (should be
+            # ignored by slave)
+            message, copies = self._encodeMOSI(slave, fetchedMessage), \
+                self.mosiCopies
+
+        elif fetchedMessage[0] == MOSI_DISCONNECT:
+            self._sendToListener("X", slave, 2)
+            return
+
+        elif fetchedMessage[0] == MOSI_REBOOT:
+            self._sendToListener("R", slave, 2)
+            return
+
+        else:
+            return
+
+        if message != "P":
+            slave.mosiPending = True
+            slave.mosiAge = 0
+
+        # Check for a round trip probe:
+        slave.probeAge += 1
+        probe = slave.probeSentAt is None \
+            and slave.probeAge >= RTT_PROBE_PERIODS
+        if probe and message == "P":
+            message = "Q"
+            probe = False
+
+        # Send message:
+        self._send(message, slave, copies)
+        if probe:
+            self._send("Q", slave)
+        if probe or message == "Q":
+            slave.probeSentAt = time.monotonic()
+            slave.probeAge = 0
+
+        # Count traffic:
+        sent = len(message)*copies + (1 if probe else 0)
+        slave.mosiBytes += sent
+        slave.mosiSaved += 2*len(slave.mosiMessage or message) - sent
+
+        # End _sendMOSI # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def _encodeMOSI(self, slave, command): # # # # # # # # # # # # # # # # # # #
+        # ABOUT: Encode a DC command fetched from a Slave's MOSI slot in the
+        # Slave's wire format, and record it as the Slave's last command.
+        # PARAMETERS:
+        # - slave: Slave to which the command is to be sent
+        # - command: tuple, MOSI_DC or MOSI_DC_MULTI command
+        # RETURNS:
+        # - str or bytes, message to send (see _send)
+
+        if command[0] == MOSI_DC:
+            if slave.binary:
+                message = fw.packD(command[1], command[2])
+            else:
+                message = "S|D:{}:{}".format(command[1], command[2])
+                #   \---------------/  \---------------/
+                #      Duty cycle         Selection
+        else:
+            if slave.binary:
+                message = fw.packF(command[1])
+            else:
+                message = "S|F:" + self.dcTemplate.format(*command[1])
+
+        slave.mosiCommand = command
+        slave.mosiMessage = message
+        return message
+
+        # End _encodeMOSI # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def _processReply(self, slave, targetIndex, reply): # # # # # # # # # # # #
+        # ABOUT: Act upon a valid reply received from a CONNECTED Slave, as
+        # returned by _receive. Shared by all communications engines.
+        # PARAMETERS:
+        # - slave: Slave that sent the reply
+        # - targetIndex: int, index of the Slave (for printing)
+        # - reply: tuple, as returned by _receive
+
+        # Any reply acknowledges the last MOSI command (see _sendMOSI):
+        slave.mosiPending = False
+
+        # Check message type:
+        if reply[1] == 'T':
+            # Standard update
+
+            # Get data index:
+            receivedDataIndex = int(reply[2])
+
+            # Check for redundant data:
+            if receivedDataIndex > slave.getDataIndex():
+                # If this data index is greater than the
+                # currently stored one, this data is new and
+                # should be updated:
+
+                # Update data index:
+                slave.setDataIndex(receivedDataIndex)
+
+                # Update RPMs and DCs. Only the payloads are kept (or, for
+                # binary frames, the fan count and payload); those of all
+                # Slaves are decoded together by _sendFeedback:
+                slave.setMISO((reply[-2], reply[-1]), False)
+                    # FORM: (RPMs, DCs)
+
+        elif reply[1] == 'I':
+            # Reset MISO index
+
+            slave.setMISOIndex(0)
+            self.printr("[SV] {} MISO Index reset".format(
+                slave.getMAC()))
+
+        elif reply[1] == 'P':
+            # Ping request
+
+            self._send("P", slave)
+
+        elif reply[1] == 'Y':
+            # Reconnect reply
+
+            pass
+
+        elif reply[1] == 'M':
+            # Maintain connection. Pass
+            pass
+
+        elif reply[1] == 'H':
+            # Old HSK message. Pass
+            pass
+
+        elif reply[1] == 'E':
+            # Error report
+
+            self.printe("[SV] {:3d} ERROR: \"{}\"".format(
+                targetIndex + 1, reply[2]))
+
+        elif reply[1] == 'Q':
+            # Ping reply. Measure the round trip from the outstanding probe, if
+            # any (see _sendMOSI), smoothed as TCP does (RFC 6298). Further
+            # copies of the reply find no probe and are ignored:
+            if slave.probeSentAt is not None:
+                sample = time.monotonic() - slave.probeSentAt
+                slave.probeSentAt = None
+                slave.rtt = sample if slave.rtt is None else \
+                    slave.rtt + RTT_GAIN*(sample - slave.rtt)
+
+        else:
+            # Unrecognized command
+
+            self.printw("[SV] {:3d} Warning, unrecognized "\
+                "message: \"{}\"".format(
+                    targetIndex + 1, reply))
+
+        # End _processReply # # # # # # # # # # # # # # # # # # # # # # # # # #
+
     def _send(self, message, slave, repeat = 1, hsk = False): # # # # # # # # #
         # ABOUT: Send message to a KNOWN or CONNECTED sv. Automatically add
         # index.
         # PARAMETERS:
-        # - message: str, message to send (w/o "INDEX|")
+        # - message: str, message to send (w/o "INDEX|"), or bytes, binary
+        #   message to send (see FCWire)
         # - slave: Slave to contact (must be KNOWN or CONNECTED or behavior is
         #   undefined)
         # - repeat: How many times to send message.
@@ -1511,12 +1877,15 @@ class FCCommunicator(pt.PrintClient):
             slave.setMOSIIndex(0)
 
         # Prepare message:
-        outgoing = "{}|{}".format(slave.getMOSIIndex(), message)
+        if type(message) is bytes:
+            outgoing = fw.frame(message, slave.getMOSIIndex())
+        else:
+            outgoing = bytearray("{}|{}".format(
+                slave.getMOSIIndex(), message), 'ascii')
 
         # Send message:
         for i in range(repeat):
-            slave._mosiSocket().sendto(bytearray(outgoing,'ascii'),
-                (slave.ip, slave.getMOSIPort()))
+            self._sendRaw(slave, outgoing, (slave.ip, slave.getMOSIPort()))
 
         # Notify user:
         # print "Sent \"{}\" to {} {} time(s)".
@@ -1533,7 +1902,7 @@ class FCCommunicator(pt.PrintClient):
             # Prepare message:
             outgoing = "{}|{}".format(message, self.passcode)
             for i in range(repeat):
-                slave._mosiSocket().sendto(bytearray(outgoing,'ascii'),
+                self._sendRaw(slave, bytearray(outgoing,'ascii'),
                 (slave.ip, self.broadcastPort))
         else:
             # Send through broadcast:
@@ -1541,14 +1910,27 @@ class FCCommunicator(pt.PrintClient):
             outgoing = "J|{}|{}|{}".format(
                 self.passcode, slave.getMAC(), message)
             for i in range(repeat):
-                slave._mosiSocket().sendto(bytearray(outgoing,'ascii'),
+                self._sendRaw(slave, bytearray(outgoing,'ascii'),
                 (self.DEFAULT_BROADCAST_IP, self.broadcastPort))
 
         # End _sendToListener # # # # # # # # # # # # # # # # # # # # # # # # # #
 
+    def _sendRaw(self, slave, data, address): # # # # # # # # # # # # # # # # #
+        # ABOUT: Send bytes through a Slave's MOSI socket. Overridden by
+        # back-ends that wrap the socket (see FCAsync).
+
+        slave._mosiSocket().sendto(data, address)
+
+        # End _sendRaw # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
     def _receive(self, slave): # # # # # # # # # # # # # # # # # # # # # # # # #
         # ABOUT: Receive a message on the given Slave's sockets (assumed to be
         # CONNECTED, BUSY or KNOWN.
+        # Datagrams waiting on the MISO socket are drained into one of two
+        # preallocated buffers, and only the one with the greatest valid index
+        # is decoded. The others are stale (e.g. after a stall) and are only
+        # counted (see staleFrames). Only feedback is skipped this way: the
+        # drain stops at any other valid message, which is returned.
         # PARAMETERS:
         # - slave: Slave unit for which to listen.
         # RETURNS:
@@ -1559,113 +1941,143 @@ class FCCommunicator(pt.PrintClient):
         # - What exceptions may arise from passing an invalid argument.
         # WARNING: THIS METHOD ASSUMES THE SLAVE'S LOCK IS HELD BY ITS CALLER.
 
+        misoS = slave._misoSocket()
+        if slave.misoFrames is None:
+            slave.misoFrames = (bytearray(self.maxLength),
+                bytearray(self.maxLength))
+        newest, spare = slave.misoFrames
+        floor = slave.getMISOIndex()
+        size = 0
+        received = 0
+        superseded = -1
+        timeout = misoS.gettimeout()
+
         try:
-            # Keep searching for messages until a message with a matching index
+            # Keep searching for messages until a message with a valid index
             # is found or the socket times out (no more messages to retrieve)
-            index = -1
-            indexMatch = False
-            count = 0
-            while(True): # Receive loop = = = = = = = = = = = = = = = = = = = =
+            while not size: # Receive loop = = = = = = = = = = = = = = = = = =
 
-                # Increment counter: -------------------------------------------
-                count += 1
-                # DEBUG DEACTV
-                ## print "Receiving...({})".format(count), "D"
+                # Wait for a message as per the socket's timeout:
+                length = misoS.recv_into(spare)
 
-                # Receive message: ---------------------------------------------
-                message, sender = slave._misoSocket().recvfrom(
-                    self.maxLength)
+                # Then drain the socket without blocking, keeping the newest
+                # message in NEWEST:
+                if timeout != 0.0:
+                    misoS.settimeout(0.0)
+                try:
+                    while True:
+                        received += 1
+                        index, keyword = fw.peek(spare, length)
+                        if index > floor:
+                            floor, size = index, length
+                            newest, spare = spare, newest
+                            superseded += 1
+                            if keyword != fw.FEEDBACK:
+                                break
+                        length = misoS.recv_into(spare)
+                except BlockingIOError:
+                    pass
+                finally:
+                    if timeout != 0.0:
+                        misoS.settimeout(timeout)
 
-                # DEBUG DEACTV
-                """
-                print "Received: \"{}\" from {}".\
-                    format(message, sender)
-                """
+                # End receive loop = = = = = = = = = = = = = = = = = = = = = = =
 
-                try:
-                    # Split message: -------------------------------------------
-                    splitted = message.decode('ascii').split("|")
+        # Handle exceptions: ---------------------------------------------------
+        except (socket.timeout, BlockingIOError):
+            # print "Timed out.", "D"
+            # NOTE: Non-blocking sockets (see FCSelector) raise BlockingIOError
+            # once they have no more messages to retrieve.
+            pass
 
-                    # Verify index:
-                    index = int(splitted[0])
+        finally:
+            slave.misoFrames = (newest, spare)
+            slave.misoStale += received - (1 if size else 0)
+            if superseded > 0:
+                # These arrived, so their indices are not lost:
+                slave.misoReceived += superseded
+                slave.misoLost -= superseded
 
-                    if index <= slave.getMISOIndex():
-                        # Bad index. Discard message:
-                        # print "Bad index: ({})".
-                        #   format(index), "D"
+        return self._parseMISO(slave, newest[:size]) if size else None
 
-                        # Discard message:
-                        continue
+        # End _receive # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
-                    # Check for possible third element:
-                    # DEBUG PRINT:
-                    #print \
-                    #    "Got {} part(s) from split: {}".\
-                    #    format(len(splitted), str(splitted)), "D"
+    def _parseMISO(self, slave, message): # # # # # # # # # # # # # # # # # # #
+        # ABOUT: Parse a single MISO message received from the given Slave and
+        # update its MISO index. Used by _receive and by back-ends that are
+        # handed datagrams directly (see FCAsync).
+        # PARAMETERS:
+        # - slave: Slave that sent the message
+        # - message: bytes received
+        # RETURNS:
+        # - tuple as returned by _receive, or None if the message is stale
+        #   (index not greater than the last one) or malformed.
 
-                    output = None
+        # Discard stale messages before decoding them:
+        if fw.peek(message, len(message))[0] <= slave.getMISOIndex():
+            slave.misoStale += 1
+            return None
 
-                    if len(splitted) == 2:
-                        output = (index, splitted[1])
+        try:
+            if fw.isBinary(message):
+                # Binary feedback frame (see FCWire): --------------------------
+                index, dataIndex, fans, payload = fw.unpackT(message)
+                if index <= slave.getMISOIndex():
+                    return None
+                self._countMISO(slave, index)
+                return (index, 'T', dataIndex, fans, payload)
 
-                    elif len(splitted) == 3:
-                        output = (index, splitted[1], splitted[2])
+            # Split message: ---------------------------------------------------
+            splitted = message.decode('ascii').split("|")
 
-                    elif len(splitted) == 4:
-                        output = (index, splitted[1], splitted[2], splitted[3])
+            # Verify index:
+            index = int(splitted[0])
 
-                    elif len(splitted) == 5:
-                        output = (index, splitted[1], int(splitted[2]), splitted[3],
-                            splitted[4])
+            if index <= slave.getMISOIndex():
+                # Bad index. Discard message:
+                return None
 
-                    else:
-                        # print
-                        #"ERROR: Unrecognized split amount ({}) on: {}".\
-                        #format(len(splitted), str(splitted)), "E")
-                        return None
+            if len(splitted) == 2:
+                output = (index, splitted[1])
 
-                    # Update MISO index:
-                    slave.setMISOIndex(index)
+            elif len(splitted) == 3:
+                output = (index, splitted[1], splitted[2])
 
-                    # Return splitted message: ---------------------------------
-                    # DEBUG DEACTV
-                    ## print "Returning {}".format(output), "D"
-                    return output
+            elif len(splitted) == 4:
+                output = (index, splitted[1], splitted[2], splitted[3])
 
-                except (ValueError, IndexError, TypeError) as e:
-                    # Handle potential Exceptions from format mismatches:
+            elif len(splitted) == 5:
+                output = (index, splitted[1], int(splitted[2]), splitted[3],
+                    splitted[4])
 
-                    # print "Bad message: \"{}\"".
-                    #   format(e), "W")
+            else:
+                # Unrecognized split amount
+                return None
 
-                    if not indexMatch:
-                        # If the correct index has not yet been found, keep lo-
-                        # oking:
+            # Update MISO index:
+            self._countMISO(slave, index)
 
-                        # DEBUG DEACTV
-                        ## print "Retrying receive", "D"
+            return output
 
-                        continue;
-                    else:
-                        # If the matching message is broken, exit w/ error code
-                        # (None)
-                        # print
-                        #   "WARNING: Broken message with matching index: " +\
-                        #   "\n\t Raw: \"{}\"" +\
-                        #   "\n\t Splitted: {}" +\
-                        #   "\n\t Error: \"{}\"".\
-                        #   format(message, splitted, e), "E")
+        except (ValueError, IndexError, TypeError):
+            # Handle potential Exceptions from format mismatches:
+            return None
 
-                        return None
+        # End _parseMISO # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
-                # End receive loop = = = = = = = = = = = = = = = = = = = = = = =
+    def _countMISO(self, slave, index): # # # # # # # # # # # # # # # # # # # #
+        # ABOUT: Set the MISO index of a Slave to that of a new message, and
+        # count the indices skipped since the last one as lost.
+        # NOTE: Indices restart at zero with each connection; nothing is
+        # counted as lost before the first message of one.
 
-        # Handle exceptions: ---------------------------------------------------
-        except socket.timeout:
-            # print "Timed out.", "D"
-            return None
+        last = slave.getMISOIndex()
+        if last > 0:
+            slave.misoLost += index - last - 1
+        slave.misoReceived += 1
+        slave.setMISOIndex(index)
 
-        # End _receive # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+        # End _countMISO # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
     def getNewSlaves(self): # ==================================================
         # Get new Slaves, if any. Will return either a tuple of MAC addresses
@@ -1759,8 +2171,11 @@ class FCCommunicator(pt.PrintClient):
         if netargs is None:
             slave.setStatus(newStatus, lock = lock)
         else:
+            if self.ipIndices.get(slave.ip) == slave.index:
+                del self.ipIndices[slave.ip]
             slave.setStatus(newStatus, netargs[0], netargs[1], netargs[2],
                 netargs[3], lock = lock)
+            self.ipIndices[netargs[0]] = slave.index
 
         # Send update to handlers:
         self.slaveUpdateQueue.put_nowait(self.getSlaveStateVector(slave))
@@ -1771,8 +2186,7 @@ class FCCommunicator(pt.PrintClient):
         Generate and return a list to be appended to a slave state vector.
         - slave: slave object from which to generate the list.
         """
-        return [slave.index, slave.name, slave.mac, slave.getStatus(),
-            slave.fans, slave.version]
+        return list(slave.snapshot())
 
     def stop(self): # ==========================================================
         """
@@ -1781,13 +2195,52 @@ class FCCommunicator(pt.PrintClient):
         # NOTE: All threads are set as Daemon and all sockets as reusable.
 
         self.printw("Terminating back-end")
+        self.printr("MOSI traffic: {} B sent, {} B saved by redundancy "\
+            "policy".format(*self.mosiTraffic()))
+        self.printr("MISO: {} stale datagrams dropped".format(
+            self.staleFrames()))
+        latency = self.controlLatency()
+        if latency is not None:
+            self.printr("Control latency: p50 {:.2f} ms, p99 {:.2f} ms, max "\
+                "{:.2f} ms ({} vectors coalesced)".format(
+                    *(1000*value for value in latency), self.controlCoalesced))
+        spread = self.burstSpread()
+        if spread is not None:
+            self.printr("MOSI burst spread: p50 {:.2f} ms, p99 {:.2f} ms, max "\
+                "{:.2f} ms".format(*(1000*value for value in spread)))
+        T = self.schedule.vector()
+        for i in range(s.TM_I_OFFSET, len(T), s.TM_LEN):
+            self.printr("Task \"{}\": lateness p50 {:.2f} ms, p99 {:.2f} ms "\
+                "({} runs, {} overruns)".format(T[i + s.TM_I_NAME],
+                    1000*T[i + s.TM_I_P50], 1000*T[i + s.TM_I_P99],
+                    T[i + s.TM_I_RUNS], T[i + s.TM_I_OVERRUNS]))
+        self.printr("Handshakes: {} started, {} deferred, at most {} at "\
+            "once".format(*self.handshakes.stats()))
         # Send disconnect signal:
         self.sendDisconnect()
+        self.flashServer.close()
         self.stopped.set()
         self.printw("Terminated back-end")
         return
         # End shutdown =========================================================
 
+    def mosiTraffic(self):
+        """
+        Return a tuple (sent, saved) with the MOSI payload bytes sent to all
+        Slaves so far, and those saved by the redundancy policy with respect
+        to resending the last command twice every period (see _sendMOSI).
+        """
+        slaves = tuple(self.slaves)
+        return sum(slave.mosiBytes for slave in slaves), \
+            sum(slave.mosiSaved for slave in slaves)
+
+    def staleFrames(self):
+        """
+        Return the number of stale or malformed MISO datagrams dropped without
+        being decoded so far, across all Slaves (see _receive and _parseMISO).
+        """
+        return sum(slave.misoStale for slave in tuple(self.slaves))
+
     def join(self, timeout = None):
         """
         Block until the communicator terminates.
@@ -1795,22 +2248,101 @@ class FCCommunicator(pt.PrintClient):
         """
         self.stopped.wait(timeout)
 
-    def _sendNetwork(self):
+    def _sendNetwork(self, force = False):
         """
-        Send a network state vector to the front end.
+        Send a network state vector to the front end if it changed since the
+        last one sent, or if FORCE is True.
         """
-        self.networkPipeSend.send(
-            (s.NS_CONNECTED,
+        N = (s.NS_CONNECTED,
             self.listenerSocket.getsockname()[0], # FIXME (?)
             self.broadcastIP,
             self.broadcastPort,
-            self.listenerPort))
+            self.listenerPort)
+        if force or N != self.networkState:
+            self.networkState = N
+            with self.networkLock:
+                self.networkPipeSend.send(N)
 
-    def _sendSlaves(self):
-        S = []
-        for slave in self.slaves:
-            S += self.getSlaveStateVector(slave)
-        self.slavePipeSend.send(S)
+    def _sendTiming(self):
+        """
+        Send a timing vector with the statistics of the periodic tasks of
+        this back-end to the front end (see FCSchedule).
+        """
+        T = self.schedule.vector()
+        with self.networkLock:
+            self.networkPipeSend.send(T)
+
+    def diagnostics(self):
+        """
+        Return a diagnostics array with the link telemetry of each Slave (see
+        fc.standards), and start a new interval over which to measure losses.
+        """
+        slaves = tuple(self.slaves)
+        G = np.empty((len(slaves), s.DG_LEN))
+        for row, slave in zip(G, slaves):
+            received, lost = slave.misoReceived, slave.misoLost
+            mark, slave.misoMark = slave.misoMark, (received, lost)
+            received, lost = received - mark[0], max(lost - mark[1], 0)
+            row[:] = (slave.getIndex(),
+                s.DG_NONE if slave.rtt is None else slave.rtt,
+                lost/(received + lost) if received + lost else s.DG_NONE,
+                slave.timeouts, max(slave.links - 1, 0), slave.misoStale)
+        return G
+
+    def _sendDiagnostics(self):
+        """
+        Send a diagnostics array to the front end (see diagnostics).
+        """
+        self.diagnosticsPipeSend.send(self.diagnostics())
+
+    def _sendSlaves(self, snapshot = False):
+        """
+        Send the data of the slaves that changed since the last time to the
+        front end, or that of all of them if SNAPSHOT is True. See
+        fc.backend.states.
+        """
+        self.slaveStates.publish(map(self.getSlaveStateVector,
+            tuple(self.slaves)), snapshot)
+
+    def _sendFeedback(self):
+        """
+        Send a feedback vector to the front end.
+        """
+        slaves = tuple(self.slaves)
+        N, M = len(slaves), self.maxFans
+        shared = self.feedback is not None and self.feedback.fits(N)
+        if shared:
+            R, D = self.feedback.begin()
+            R, D = R[:N*M].reshape(N, M), D[:N*M].reshape(N, M)
+        else:
+            R, D = self.feedbackMatrix.rows(N)
+
+        rows, rpms, dcs, padded, lost = [], [], [], [], []
+        frames, fans, payloads = [], [], []
+        for index, slave in enumerate(slaves):
+            update = slave.getMISO()
+            if update is not None and type(update[1]) is bytes:
+                frames.append(index)
+                fans.append(update[0])
+                payloads.append(update[1])
+            elif update is not None:
+                rows.append(index)
+                rpms.append(update[0])
+                dcs.append(update[1])
+            elif slave.getStatus() == sv.CONNECTED:
+                padded.append(index)
+            else:
+                lost.append(index)
+        R[padded], D[padded] = s.PAD, s.PAD
+        R[lost], D[lost] = s.RIP, s.RIP
+        mm.decode(R, rows, rpms)
+        mm.decode(D, rows, dcs)
+        mm.decodeFrames(R, D, frames, fans, payloads)
+
+        if shared:
+            self.feedback.commit(N, self.feedbackPipeSend)
+        else:
+            self.feedbackPipeSend.send(R.ravel().tolist() + D.ravel().tolist())
 
 ## MODULE'S TEST SUITE #########################################################
 
@@ -0,0 +1,378 @@
+################################################################################
+##----------------------------------------------------------------------------##
+## CALIFORNIA INSTITUTE OF TECHNOLOGY ## GRADUATE AEROSPACE LABORATORY ##     ##
+## CENTER FOR AUTONOMOUS SYSTEMS AND TECHNOLOGIES                      ##     ##
+##----------------------------------------------------------------------------##
+##      ____      __      __  __      _____      __      __    __    ____     ##
+##     / __/|   _/ /|    / / / /|  _- __ __\    / /|    / /|  / /|  / _  \    ##
+##    / /_ |/  / /  /|  /  // /|/ / /|__| _|   / /|    / /|  / /|/ /   --||   ##
+##   / __/|/ _/    /|/ /   / /|/ / /|    __   / /|    / /|  / /|/ / _  \|/    ##
+##  / /|_|/ /  /  /|/ / // //|/ / /|__- / /  / /___  / -|_ - /|/ /     /|     ##
+## /_/|/   /_/ /_/|/ /_/ /_/|/ |\ ___--|_|  /_____/| |-___-_|/  /____-/|/     ##
+## |_|/    |_|/|_|/  |_|/|_|/   \|___|-    |_____|/   |___|     |____|/       ##
+##                   _ _    _    ___   _  _      __  __   __                  ##
+##                  | | |  | |  | T_| | || |    |  ||_ | | _|                 ##
+##                  | _ |  |T|  |  |  |  _|      ||   \\_//                   ##
+##                  || || |_ _| |_|_| |_| _|    |__|  |___|                   ##
+##                                                                            ##
+##----------------------------------------------------------------------------##
+## Alejandro A. Stefan Zavala ## <astefanz@berkeley.edu>   ##                 ##
+## Chris J. Dougherty         ## <cdougher@caltech.edu>    ##                 ##
+## Marcel Veismann            ## <mveisman@caltech.edu>    ##                 ##
+################################################################################
+
+""" ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+ + HTTP server from which bootloaders download firmware images during a
+ + firmware update (see CMD_FUPDATE_START in fc.standards).
+ +
+ + The image is opened once per update and sent with sendfile where the
+ + platform has it (read into memory once otherwise), so serving it does not
+ + copy it per download. Bootloaders are admitted in waves: the communicator
+ + asks admit whether to send each bootloader that replies to a broadcast the
+ + update message, and a new wave is only opened once every download of the
+ + current one ended (or timed out). Besides, no more than a set number of
+ + downloads are sent at once; further requests wait for a free slot.
+ +
+ + Downloads are told apart by the IP address of the bootloader, so that each
+ + can be matched to the MAC address admitted. Bootloaders that share an IP
+ + address (e.g. virtual ones, see fc.simulator) are matched in the order in
+ + which they were admitted.
+ +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
+
+## DEPENDENCIES ################################################################
+import os
+import time
+import threading as mt
+import collections
+import socketserver
+import http.server
+
+import fc.printer as pt
+
+## CONSTANTS ###################################################################
+SENDFILE = hasattr(os, "sendfile")  # Whether downloads can use sendfile
+CHUNK_B = 16*1024           # Bytes sent at a time (progress granularity)
+TIMEOUT_S = 30              # Time an admitted bootloader has to download
+SOCKET_TIMEOUT_S = 10       # Time a download may stall
+PROGRESS_PERIOD_S = 2       # Period of progress reports while updating
+
+## CLASSES #####################################################################
+class Image:
+    """
+    Firmware image being served.
+    """
+
+    def __init__(self, filename):
+        """
+        - filename := path of the binary file. It is served under its base
+            name.
+        """
+        self.name = os.path.basename(filename)
+        self.file = open(filename, 'rb')
+        self.size = os.fstat(self.file.fileno()).st_size
+        self.data = None if SENDFILE else memoryview(self.file.read())
+
+    def close(self):
+        self.file.close()
+
+class Transfer:
+    """
+    Download of the image by one bootloader.
+    """
+    __slots__ = ("mac", "ip", "wave", "admitted", "started", "finished",
+        "sent", "ok")
+
+    def __init__(self, mac, ip, wave):
+        self.mac = mac
+        self.ip = ip
+        self.wave = wave
+        self.admitted = time.monotonic()
+        self.started = None     # When the download began
+        self.finished = None    # When it ended (or timed out)
+        self.sent = 0           # Bytes sent so far
+        self.ok = False         # Whether the whole image was sent
+
+class FlashServer(pt.PrintClient):
+    """
+    Firmware server of a communications back-end. Serves one image at a time
+    (see load and unload).
+    """
+    SYMBOL = "[FS]"
+
+    def __init__(self, pqueue, waveSize, concurrency):
+        """
+        - pqueue := mp Queue() instance for I-P printing (see fc.printer)
+        - waveSize := most bootloaders to admit per wave (int)
+        - concurrency := most downloads to send at once (int)
+        """
+        pt.PrintClient.__init__(self, pqueue)
+        self.waveSize = waveSize
+        self.slots = mt.BoundedSemaphore(concurrency)
+        self.lock = mt.Lock()
+        self.image = None
+        self.done = mt.Event()
+        self._clear()
+
+        self.server = Server(("", 0), Handler)
+        self.server.flash = self
+        self.port = self.server.socket.getsockname()[1]
+
+    def start(self):
+        """
+        Start serving requests in a daemon thread.
+        """
+        mt.Thread(name = "FCMkII_flash", target = self.server.serve_forever,
+            daemon = True).start()
+
+    def close(self):
+        """
+        Stop serving requests and release the image, if any.
+        """
+        self.unload()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def load(self, filename):
+        """
+        Start serving the file at FILENAME to the bootloaders to be admitted.
+        Returns the Image. Raises OSError if the file cannot be opened.
+        """
+        image = Image(filename)
+        self.unload()
+        with self.lock:
+            self._clear()
+            self.image = image
+            self.begun = time.monotonic()
+        self.done.clear()
+        mt.Thread(name = "FCMkII_flash_progress", target = self._report,
+            daemon = True).start()
+        self.printr("Serving \"{}\" ({} B{}) in waves of {}".format(image.name,
+            image.size, ", sendfile" if SENDFILE else "", self.waveSize))
+        return image
+
+    def unload(self):
+        """
+        Stop admitting bootloaders and serving the current image, if any.
+        Downloads in progress are cut short.
+        """
+        with self.lock:
+            image, self.image = self.image, None
+        if image is None:
+            return
+        self.done.set()
+        self._summarize()
+        image.close()
+
+    def admit(self, mac, ip):
+        """
+        Return whether to send the update message to the bootloader of MAC
+        address MAC (str) and IP address IP (str), that just replied to a
+        broadcast. Bootloaders not admitted are to be left waiting (they
+        wait as long as broadcasts keep coming).
+        """
+        with self.lock:
+            if self.image is None:
+                return False
+            now = time.monotonic()
+            self._expire(now)
+            transfer = self.transfers.get(mac)
+            if transfer is not None and transfer.finished is None:
+                # Already admitted. Resend the update message if the download
+                # did not begin (e.g. it was lost):
+                return transfer.started is None
+
+            if self.wave and all(transfer.finished is not None
+                for transfer in self.wave):
+                self._closeWave(now)
+            if len(self.wave) >= self.waveSize:
+                return False
+
+            if not self.wave:
+                self.waves += 1
+                self.waveStart = now
+            transfer = Transfer(mac, ip, self.waves)
+            self.transfers[mac] = transfer
+            self.wave.append(transfer)
+            self.queued[ip].append(transfer)
+            return True
+
+    def progress(self):
+        """
+        Return a list with a tuple (MAC, SENT, SIZE, STATE) for each bootloader
+        admitted for the current image, where SENT is the number of bytes of
+        the image, of SIZE, sent to it so far, and STATE is one of "admitted",
+        "downloading", "done" and "failed".
+        """
+        with self.lock:
+            size = self.image.size if self.image is not None else 0
+            return [(transfer.mac, transfer.sent, size, self._state(transfer))
+                for transfer in self.transfers.values()]
+
+    def throughput(self):
+        """
+        Return the bytes sent so far for the current (or last) image, divided
+        by the seconds elapsed since it was loaded.
+        """
+        return self.bytes/max(time.monotonic() - self.begun, 1e-9)
+
+    # Internal methods .........................................................
+    def _clear(self):
+        self.transfers = {}         # MAC -> latest Transfer
+        self.queued = collections.defaultdict(collections.deque)
+            # IP -> Transfers admitted and not yet started
+        self.wave = []              # Transfers of the current wave
+        self.waves = 0
+        self.waveStart = 0.0
+        self.completed = 0
+        self.failed = 0
+        self.bytes = 0
+        self.begun = time.monotonic()
+
+    @staticmethod
+    def _state(transfer):
+        if transfer.finished is not None:
+            return "done" if transfer.ok else "failed"
+        return "admitted" if transfer.started is None else "downloading"
+
+    def _expire(self, now):
+        """
+        End the transfers of the current wave that ran out of time. Assumes
+        the lock is held.
+        """
+        for transfer in self.wave:
+            if transfer.finished is None and \
+                now - (transfer.started or transfer.admitted) > TIMEOUT_S:
+                transfer.finished = now
+                self.failed += 1
+                if transfer.started is None:
+                    self.queued[transfer.ip].remove(transfer)
+                self.printw("{} did not download the image in time".format(
+                    transfer.mac))
+
+    def _closeWave(self, now):
+        """
+        Report on the current wave, all of whose transfers ended, and clear
+        it. Assumes the lock is held.
+        """
+        sent = sum(transfer.sent for transfer in self.wave)
+        elapsed = max(now - self.waveStart, 1e-9)
+        self.printr("Wave {}: {}/{} downloads completed, {} B in {:.2f} s "\
+            "({:.1f} kB/s)".format(self.waves,
+                sum(transfer.ok for transfer in self.wave), len(self.wave),
+                sent, elapsed, sent/elapsed/1000))
+        self.wave = []
+
+    def _claim(self, ip):
+        """
+        Return the Transfer to which a download requested from IP corresponds,
+        marked as started, or a new untracked Transfer if there is none.
+        """
+        with self.lock:
+            queue = self.queued.get(ip)
+            if queue:
+                transfer = queue.popleft()
+            else:
+                transfer = Transfer(None, ip, 0)
+            transfer.started = time.monotonic()
+            return transfer
+
+    def _finish(self, transfer, ok):
+        with self.lock:
+            if transfer.finished is None:
+                transfer.finished = time.monotonic()
+                transfer.ok = ok
+                if ok:
+                    self.completed += 1
+                else:
+                    self.failed += 1
+            self.bytes += transfer.sent
+        if ok:
+            self.printd("{} downloaded the image in {:.2f} s".format(
+                transfer.mac, transfer.finished - transfer.started))
+        else:
+            self.printw("Download by {} ({}) failed after {} B".format(
+                transfer.mac, transfer.ip, transfer.sent))
+
+    def _serve(self, handler):
+        """
+        Answer the GET request received by HANDLER (Handler).
+        """
+        image = self.image
+        if image is None or handler.path.lstrip("/") != image.name:
+            handler.send_error(404)
+            return
+
+        transfer = self._claim(handler.client_address[0])
+        with self.slots:
+            handler.send_response(200)
+            handler.send_header("Content-Type", "application/octet-stream")
+            handler.send_header("Content-Length", str(image.size))
+            handler.end_headers()
+
+            connection = handler.connection
+            try:
+                while transfer.sent < image.size:
+                    count = min(CHUNK_B, image.size - transfer.sent)
+                    if image.data is None:
+                        sent = connection.sendfile(image.file, transfer.sent,
+                            count)
+                    else:
+                        connection.sendall(image.data[
+                            transfer.sent:transfer.sent + count])
+                        sent = count
+                    if not sent:
+                        break
+                    transfer.sent += sent
+            finally:
+                self._finish(transfer, transfer.sent == image.size)
+
+    def _report(self):
+        """
+        Print the progress of the update every PROGRESS_PERIOD_S until the
+        image is unloaded.
+        """
+        while not self.done.wait(PROGRESS_PERIOD_S):
+            with self.lock:
+                now = time.monotonic()
+                self._expire(now)
+                if self.wave and all(transfer.finished is not None
+                    for transfer in self.wave):
+                    self._closeWave(now)
+            states = collections.Counter(state
+                for _, _, _, state in self.progress())
+            if states["admitted"] or states["downloading"]:
+                self.printr("Wave {}: {} admitted, {} downloading, {} done, "\
+                    "{} failed ({:.1f} kB/s overall)".format(self.waves,
+                        states["admitted"], states["downloading"],
+                        states["done"], states["failed"],
+                        self.throughput()/1000))
+
+    def _summarize(self):
+        elapsed = time.monotonic() - self.begun
+        self.printr("Firmware update: {} downloads completed, {} failed in {} "\
+            "waves, {} B in {:.2f} s ({:.1f} kB/s)".format(self.completed,
+                self.failed, self.waves, self.bytes, elapsed,
+                self.bytes/max(elapsed, 1e-9)/1000))
+
+class Server(socketserver.ThreadingTCPServer):
+    """
+    TCP server of a FlashServer. Handles each request in a daemon thread.
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 128
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    """
+    Request handler of a FlashServer. Only GET requests for the current
+    image are answered.
+    """
+    protocol_version = "HTTP/1.0"
+    timeout = SOCKET_TIMEOUT_S
+
+    def do_GET(self):
+        self.server.flash._serve(self)
+
+    def log_message(self, format, *args):
+        # Downloads are reported by the FlashServer instead.
+        pass
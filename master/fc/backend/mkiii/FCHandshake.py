@@ -0,0 +1,122 @@
+################################################################################
+##----------------------------------------------------------------------------##
+## CALIFORNIA INSTITUTE OF TECHNOLOGY ## GRADUATE AEROSPACE LABORATORY ##     ##
+## CENTER FOR AUTONOMOUS SYSTEMS AND TECHNOLOGIES                      ##     ##
+##----------------------------------------------------------------------------##
+##      ____      __      __  __      _____      __      __    __    ____     ##
+##     / __/|   _/ /|    / / / /|  _- __ __\    / /|    / /|  / /|  / _  \    ##
+##    / /_ |/  / /  /|  /  // /|/ / /|__| _|   / /|    / /|  / /|/ /   --||   ##
+##   / __/|/ _/    /|/ /   / /|/ / /|    __   / /|    / /|  / /|/ / _  \|/    ##
+##  / /|_|/ /  /  /|/ / // //|/ / /|__- / /  / /___  / -|_ - /|/ /     /|     ##
+## /_/|/   /_/ /_/|/ /_/ /_/|/ |\ ___--|_|  /_____/| |-___-_|/  /____-/|/     ##
+## |_|/    |_|/|_|/  |_|/|_|/   \|___|-    |_____|/   |___|     |____|/       ##
+##                   _ _    _    ___   _  _      __  __   __                  ##
+##                  | | |  | |  | T_| | || |    |  ||_ | | _|                 ##
+##                  | _ |  |T|  |  |  |  _|      ||   \\_//                   ##
+##                  || || |_ _| |_|_| |_| _|    |__|  |___|                   ##
+##                                                                            ##
+##----------------------------------------------------------------------------##
+## Alejandro A. Stefan Zavala ## <astefanz@berkeley.edu>   ##                 ##
+## Chris J. Dougherty         ## <cdougher@caltech.edu>    ##                 ##
+## Marcel Veismann            ## <mveisman@caltech.edu>    ##                 ##
+################################################################################
+
+""" ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+ + Admission control for Slave handshakes.
+ +
+ + When the network blips, every Slave times out at about the same time and
+ + answers the next broadcast at once, so that each Slave routine (or state
+ + machine) goes KNOWN and sends its handshake in the same instant. Most of
+ + these are lost or answered late, and the Slaves are dropped and tried again
+ + in lockstep.
+ +
+ + Instead, the communicator keeps a Handshakes instance through which all
+ + engines go before sending a handshake: no more than LIMIT handshakes are
+ + in progress at once, and each handshake round of a Slave is preceded by a
+ + randomized wait ("full jitter") that doubles, up to a cap, with every
+ + failed round of that Slave. A Slave's sockets are kept throughout.
+ +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
+
+## DEPENDENCIES ################################################################
+import random
+import threading as mt
+
+## CONSTANTS ###################################################################
+BACKOFF_DOUBLINGS = 6   # Failed rounds after which the backoff stops growing
+
+## CLASSES #####################################################################
+class Handshakes:
+    """
+    Concurrency limit and backoff of the handshakes of a back-end. Thread-safe;
+    threads use acquire, event loops use admit. Each successful acquire or
+    admit must be followed by exactly one release.
+    """
+
+    def __init__(self, limit, backoffS):
+        """
+        - limit := most handshakes in progress at once (int)
+        - backoffS := longest wait before the first round of a Slave, in
+            seconds, which doubles with each failed round (float)
+        """
+        self.limit = limit
+        self.backoffS = backoffS
+        self.capS = backoffS*2**BACKOFF_DOUBLINGS
+        self.active = 0
+        self.peak = 0
+        self.admitted = 0
+        self.deferred = 0
+        self.freed = mt.Condition()
+
+    def delay(self, failures):
+        """
+        Return how long, in seconds, to wait before the next handshake round of
+        a Slave whose last FAILURES rounds failed.
+        """
+        return random.uniform(0,
+            min(self.capS, self.backoffS*2**min(failures, BACKOFF_DOUBLINGS)))
+
+    def admit(self):
+        """
+        Start a handshake if the limit allows it. Returns whether it did.
+        Does not block.
+        """
+        with self.freed:
+            return self._admit()
+
+    def acquire(self, timeout):
+        """
+        Start a handshake, waiting at most TIMEOUT seconds for the limit to
+        allow it. Returns whether it did.
+        """
+        with self.freed:
+            if self.freed.wait_for(lambda: self.active < self.limit, timeout):
+                return self._admit()
+            self.deferred += 1
+            return False
+
+    def release(self):
+        """
+        Finish a handshake started by admit or acquire.
+        """
+        with self.freed:
+            self.active -= 1
+            self.freed.notify()
+
+    def stats(self):
+        """
+        Return a tuple (admitted, deferred, peak) with the handshakes started
+        so far, the times a handshake had to be put off, and the most that were
+        in progress at once.
+        """
+        with self.freed:
+            return self.admitted, self.deferred, self.peak
+
+    def _admit(self):
+        # Call with the lock held.
+        if self.active >= self.limit:
+            self.deferred += 1
+            return False
+        self.active += 1
+        self.admitted += 1
+        self.peak = max(self.peak, self.active)
+        return True
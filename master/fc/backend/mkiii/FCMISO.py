@@ -0,0 +1,131 @@
+################################################################################
+##----------------------------------------------------------------------------##
+## CALIFORNIA INSTITUTE OF TECHNOLOGY ## GRADUATE AEROSPACE LABORATORY ##     ##
+## CENTER FOR AUTONOMOUS SYSTEMS AND TECHNOLOGIES                      ##     ##
+##----------------------------------------------------------------------------##
+##      ____      __      __  __      _____      __      __    __    ____     ##
+##     / __/|   _/ /|    / / / /|  _- __ __\    / /|    / /|  / /|  / _  \    ##
+##    / /_ |/  / /  /|  /  // /|/ / /|__| _|   / /|    / /|  / /|/ /   --||   ##
+##   / __/|/ _/    /|/ /   / /|/ / /|    __   / /|    / /|  / /|/ / _  \|/    ##
+##  / /|_|/ /  /  /|/ / // //|/ / /|__- / /  / /___  / -|_ - /|/ /     /|     ##
+## /_/|/   /_/ /_/|/ /_/ /_/|/ |\ ___--|_|  /_____/| |-___-_|/  /____-/|/     ##
+## |_|/    |_|/|_|/  |_|/|_|/   \|___|-    |_____|/   |___|     |____|/       ##
+##                   _ _    _    ___   _  _      __  __   __                  ##
+##                  | | |  | |  | T_| | || |    |  ||_ | | _|                 ##
+##                  | _ |  |T|  |  |  |  _|      ||   \\_//                   ##
+##                  || || |_ _| |_|_| |_| _|    |__|  |___|                   ##
+##                                                                            ##
+##----------------------------------------------------------------------------##
+## Alejandro A. Stefan Zavala ## <astefanz@berkeley.edu>   ##                 ##
+## Chris J. Dougherty         ## <cdougher@caltech.edu>    ##                 ##
+## Marcel Veismann            ## <mveisman@caltech.edu>    ##                 ##
+################################################################################
+
+""" ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+ + Batched decoding of MISO feedback for the MkIII back-end. Slaves keep the
+ + raw RPM and DC payloads of their latest update (see FCSlave.setMISO), and
+ + FCCommunicator decodes those of all Slaves once per period, straight into
+ + the rows of a NumPy feedback matrix, with one parsing pass per payload type
+ + instead of one int()/float() call per fan. Binary feedback frames (see
+ + FCWire) are decoded likewise, with a single np.frombuffer.
+ +
+ + NOTE: np.fromstring is used in its text mode (SEP given), which, unlike its
+ + binary mode, is not deprecated, and is much faster than str.split.
+ +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
+
+## DEPENDENCIES ################################################################
+import itertools as it
+
+import numpy as np
+
+import fc.standards as s
+import fc.backend.mkiii.FCWire as fw
+
+## FUNCTIONS ###################################################################
+def decode(out, rows, texts):
+    """
+    Decode the comma-separated payloads in TEXTS into the rows of the 2D array
+    OUT given by ROWS (one per payload). As in the MkII format, values missing
+    from a payload are set to 0 and values beyond the width of OUT are ignored.
+    Rows whose payload cannot be decoded are set to s.PAD.
+    """
+    if not rows:
+        return
+    width = out.shape[1]
+    joined = ','.join(texts)
+    try:
+        values = np.fromstring(joined, out.dtype, sep = ',')
+    except ValueError:
+        values = None
+    if values is None or values.size != joined.count(',') + 1:
+        # Malformed payload somewhere. Decode one by one:
+        for row, text in zip(rows, texts):
+            try:
+                decoded = np.array(text.split(','), out.dtype)[:width]
+                out[row, :decoded.size] = decoded
+                out[row, decoded.size:] = 0
+            except ValueError:
+                out[row] = s.PAD
+        return
+
+    counts = np.fromiter(map(str.count, texts, it.repeat(',')), np.intp,
+        len(texts)) + 1
+    if (counts == width).all():
+        out[rows] = values.reshape(-1, width)
+        return
+
+    # Payloads of varying length:
+    starts = np.repeat(np.cumsum(counts) - counts, counts)
+    columns = np.arange(values.size) - starts
+    keep = columns < width
+    out[rows] = 0
+    out.reshape(-1)[(np.repeat(rows, counts)*width + columns)[keep]] = \
+        values[keep]
+
+def decodeFrames(R, D, rows, fans, payloads):
+    """
+    Decode the payloads of binary feedback frames (see FCWire.unpackT) into
+    the rows ROWS of the RPM and DC arrays R and D. FANS holds the fan count of
+    each frame. Missing values are set to 0 and extra ones ignored, as in
+    decode.
+    """
+    if not rows:
+        return
+    width = R.shape[1]
+    if all(count == width for count in fans):
+        values = np.frombuffer(b''.join(payloads), fw.VALUE).reshape(
+            -1, 2*width)
+        R[rows] = values[:, :width]
+        D[rows] = values[:, width:]/fw.DC_SCALE
+        return
+
+    for row, count, payload in zip(rows, fans, payloads):
+        values = np.frombuffer(payload, fw.VALUE)
+        used = min(count, width)
+        R[row, :used] = values[:used]
+        R[row, used:] = 0
+        D[row, :used] = values[count:count + used]/fw.DC_SCALE
+        D[row, used:] = 0
+
+## CLASS DEFINITIONS ###########################################################
+class FeedbackMatrix:
+    """
+    Preallocated RPM and DC matrices, with one row of MAXFANS values per
+    Slave, reused from one period to the next.
+    """
+
+    def __init__(self, maxFans, slaves = 0):
+        self.maxFans = maxFans
+        self.R = np.zeros((slaves, maxFans), np.int32)
+        self.D = np.zeros((slaves, maxFans), np.float64)
+
+    def rows(self, slaves):
+        """
+        Return views of the first SLAVES rows of the RPM and DC matrices,
+        growing them if needed.
+        """
+        if slaves > len(self.R):
+            size = max(slaves, 2*len(self.R))
+            self.R = np.zeros((size, self.maxFans), np.int32)
+            self.D = np.zeros((size, self.maxFans), np.float64)
+        return self.R[:slaves], self.D[:slaves]
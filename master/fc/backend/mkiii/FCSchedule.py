@@ -0,0 +1,156 @@
+################################################################################
+##----------------------------------------------------------------------------##
+## CALIFORNIA INSTITUTE OF TECHNOLOGY ## GRADUATE AEROSPACE LABORATORY ##     ##
+## CENTER FOR AUTONOMOUS SYSTEMS AND TECHNOLOGIES                      ##     ##
+##----------------------------------------------------------------------------##
+##      ____      __      __  __      _____      __      __    __    ____     ##
+##     / __/|   _/ /|    / / / /|  _- __ __\    / /|    / /|  / /|  / _  \    ##
+##    / /_ |/  / /  /|  /  // /|/ / /|__| _|   / /|    / /|  / /|/ /   --||   ##
+##   / __/|/ _/    /|/ /   / /|/ / /|    __   / /|    / /|  / /|/ / _  \|/    ##
+##  / /|_|/ /  /  /|/ / // //|/ / /|__- / /  / /___  / -|_ - /|/ /     /|     ##
+## /_/|/   /_/ /_/|/ /_/ /_/|/ |\ ___--|_|  /_____/| |-___-_|/  /____-/|/     ##
+## |_|/    |_|/|_|/  |_|/|_|/   \|___|-    |_____|/   |___|     |____|/       ##
+##                   _ _    _    ___   _  _      __  __   __                  ##
+##                  | | |  | |  | T_| | || |    |  ||_ | | _|                 ##
+##                  | _ |  |T|  |  |  |  _|      ||   \\_//                   ##
+##                  || || |_ _| |_|_| |_| _|    |__|  |___|                   ##
+##                                                                            ##
+##----------------------------------------------------------------------------##
+## Alejandro A. Stefan Zavala ## <astefanz@berkeley.edu>   ##                 ##
+## Chris J. Dougherty         ## <cdougher@caltech.edu>    ##                 ##
+## Marcel Veismann            ## <mveisman@caltech.edu>    ##                 ##
+################################################################################
+
+""" ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+ + Drift-free scheduling of the back-end's periodic tasks.
+ +
+ + Each periodic loop (output, broadcast, idle Slave routines...) gets a Task
+ + from the communicator's Schedule and waits on it instead of sleeping for a
+ + whole period after doing its work. Deadlines are kept on the monotonic
+ + clock and advance by whole periods, so the time spent working does not add
+ + up, and the phase of each task stays put. A task that misses one or more
+ + deadlines skips them, and counts an overrun.
+ +
+ + Each task records how late it wakes up with respect to its deadline. The
+ + Schedule sums these up per task name for the front-end (see CMD_TIMING in
+ + fc.standards).
+ +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
+
+## DEPENDENCIES ################################################################
+import time
+import threading as mt
+import collections
+
+import fc.standards as s
+
+## CONSTANTS ###################################################################
+TIMING_SAMPLES = 256    # Lateness samples kept per task
+
+## FUNCTIONS ###################################################################
+def quantiles(samples):
+    """
+    Return a tuple (p50, p99, max) of the numbers in SAMPLES (iterable), or
+    None if there are none.
+    """
+    samples = sorted(samples)
+    if not samples:
+        return None
+    return tuple(samples[min(len(samples) - 1, int(p*len(samples)))]
+        for p in (0.5, 0.99)) + (samples[-1],)
+
+## CLASSES #####################################################################
+class Task:
+    """
+    Deadlines of a periodic task. Meant to be used by a single thread (or
+    event loop): either call wait once per period, or sleep for delay() by
+    other means and then call woke.
+    """
+
+    def __init__(self, name, periodS):
+        """
+        - name := name under which to report this task (str)
+        - periodS := period in seconds (float)
+        """
+        self.name = name
+        self.periodS = periodS
+        self.deadline = None
+        self.runs = 0
+        self.overruns = 0
+        self.lateness = collections.deque(maxlen = TIMING_SAMPLES)
+
+    def delay(self):
+        """
+        Advance to the next deadline and return the seconds left until then.
+        The first deadline is one period from now. If the next one already
+        passed, the deadlines missed are skipped and an overrun is counted.
+        """
+        now = time.monotonic()
+        if self.deadline is None:
+            self.deadline = now
+        self.deadline += self.periodS
+        if self.deadline <= now:
+            self.overruns += 1
+            self.deadline += ((now - self.deadline)//self.periodS + 1)\
+                *self.periodS
+        return self.deadline - now
+
+    def woke(self):
+        """
+        Record how late this task woke up with respect to its deadline.
+        """
+        self.runs += 1
+        self.lateness.append(time.monotonic() - self.deadline)
+
+    def wait(self):
+        """
+        Block until the next deadline (see delay).
+        """
+        time.sleep(self.delay())
+        self.woke()
+
+    def reset(self):
+        """
+        Forget the current deadline, so that the next one is set one period
+        from the next wait. For tasks that stop waiting periodically for a
+        while (e.g. the routine of a Slave that connected).
+        """
+        self.deadline = None
+
+class Schedule:
+    """
+    Registry of the periodic tasks of a back-end.
+    """
+
+    def __init__(self):
+        self.tasks = []
+        self.lock = mt.Lock()
+
+    def task(self, name, periodS):
+        """
+        Create, register and return a new Task (see Task.__init__). Tasks of
+        the same name are reported together.
+        """
+        task = Task(name, periodS)
+        with self.lock:
+            self.tasks.append(task)
+        return task
+
+    def vector(self):
+        """
+        Return a timing vector with the statistics of the registered tasks
+        (see fc.standards).
+        """
+        with self.lock:
+            tasks = tuple(self.tasks)
+        groups = collections.OrderedDict()
+        for task in tasks:
+            groups.setdefault(task.name, []).append(task)
+
+        T = [s.TM_CODE]
+        for name, group in groups.items():
+            lateness = quantiles(sample for task in group
+                for sample in tuple(task.lateness)) or (0.0, 0.0, 0.0)
+            T += [name, group[0].periodS, sum(task.runs for task in group),
+                sum(task.overruns for task in group), lateness[0],
+                lateness[1]]
+        return T
@@ -0,0 +1,399 @@
+################################################################################
+##----------------------------------------------------------------------------##
+## CALIFORNIA INSTITUTE OF TECHNOLOGY ## GRADUATE AEROSPACE LABORATORY ##     ##
+## CENTER FOR AUTONOMOUS SYSTEMS AND TECHNOLOGIES                      ##     ##
+##----------------------------------------------------------------------------##
+##      ____      __      __  __      _____      __      __    __    ____     ##
+##     / __/|   _/ /|    / / / /|  _- __ __\    / /|    / /|  / /|  / _  \    ##
+##    / /_ |/  / /  /|  /  // /|/ / /|__| _|   / /|    / /|  / /|/ /   --||   ##
+##   / __/|/ _/    /|/ /   / /|/ / /|    __   / /|    / /|  / /|/ / _  \|/    ##
+##  / /|_|/ /  /  /|/ / // //|/ / /|__- / /  / /___  / -|_ - /|/ /     /|     ##
+## /_/|/   /_/ /_/|/ /_/ /_/|/ |\ ___--|_|  /_____/| |-___-_|/  /____-/|/     ##
+## |_|/    |_|/|_|/  |_|/|_|/   \|___|-    |_____|/   |___|     |____|/       ##
+##                   _ _    _    ___   _  _      __  __   __                  ##
+##                  | | |  | |  | T_| | || |    |  ||_ | | _|                 ##
+##                  | _ |  |T|  |  |  |  _|      ||   \\_//                   ##
+##                  || || |_ _| |_|_| |_| _|    |__|  |___|                   ##
+##                                                                            ##
+##----------------------------------------------------------------------------##
+## Alejandro A. Stefan Zavala ## <astefanz@berkeley.edu>   ##                 ##
+## Chris J. Dougherty         ## <cdougher@caltech.edu>    ##                 ##
+## Marcel Veismann            ## <mveisman@caltech.edu>    ##                 ##
+################################################################################
+
+""" ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+ + Single-threaded Slave engine for the MkIII back-end. Drives the handshake,
+ + keep-alive, MOSI and MISO traffic of every Slave from one selectors event
+ + loop instead of one thread per Slave. See FCCommunicator._slaveRoutine for
+ + the threaded equivalent, whose KNOWN/CONNECTED/DISCONNECTED logic is ported
+ + here as a per-Slave state machine (SlaveEngine), shared with the asyncio
+ + back-end in FCAsync.
+ +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
+
+## DEPENDENCIES ################################################################
+import socket
+import selectors
+import threading as mt
+import queue
+import heapq
+import time
+
+import fc.backend.mkiii.FCSlave as sv
+import fc.printer as pt
+
+## CLASS DEFINITIONS ###########################################################
+class SlaveMachine:
+    """
+    Per-Slave state kept by the FCSelector event loop. Holds what would
+    otherwise be local variables of FCCommunicator._slaveRoutine.
+    """
+
+    def __init__(self, slave):
+        self.slave = slave
+        self.index = slave.getIndex()
+        self.deadline = 0.0         # When to act next if nothing is received
+        self.handshaking = False    # Whether a handshake is in progress
+        self.awaiting = False       # Whether a MOSI message awaits a reply
+        self.tries = 0              # Handshake retries left
+        self.failures = 0           # Consecutive failed handshake rounds
+        self.waited = False         # Whether the backoff before a round passed
+        self.timeouts = 0
+        self.totalTimeouts = 0
+        self.tryBuffer = True       # Whether to try a "Y" reconnect message
+        self.hsk = None             # Handshake message
+
+class SlaveEngine(pt.PrintClient):
+    """
+    Per-Slave state machine shared by the event-driven engines. Subclasses
+    decide how messages are received and how deadlines are kept, and call
+    _onReplies and _onDeadline accordingly.
+    """
+    SYMBOL = "[SE]"
+
+    def __init__(self, communicator, pqueue):
+        """
+        - communicator := FCCommunicator instance whose Slaves to handle.
+        - pqueue := mp Queue() instance for I-P printing (see fc.printer)
+        """
+        pt.PrintClient.__init__(self, pqueue)
+        self.comms = communicator
+        self.handshakes = communicator.handshakes
+        self.periodS = communicator.periodS
+        self.maxTimeouts = communicator.maxTimeouts
+
+    # To be implemented by subclasses ..........................................
+    def _schedule(self, machine, deadline):
+        """
+        Set the time at which MACHINE is to act next if nothing is received.
+        DEADLINE is given in the time base of _now.
+        """
+        raise NotImplementedError
+
+    def _now(self):
+        """
+        Return the current time in the time base used for deadlines.
+        """
+        return time.monotonic()
+
+    # State machine ............................................................
+    def _onReplies(self, machine, replies):
+        """
+        Process REPLIES (iterable of tuples as returned by
+        FCCommunicator._receive) received from MACHINE's Slave.
+        """
+        slave = machine.slave
+        status = slave.getStatus()
+        received = False
+        now = self._now()
+
+        for reply in replies:
+            if status == sv.KNOWN and machine.handshaking:
+                if reply[1] == "H":
+                    # Handshake confirmed. Mark as CONNECTED and get to work:
+                    self.comms._negotiate(slave, reply)
+                    self.comms.setSlaveStatus(slave, sv.CONNECTED, False)
+                    self._endHandshake(machine, True)
+                    machine.awaiting = False
+                    machine.tryBuffer = True
+                    status = sv.CONNECTED
+                elif reply[1] == "K":
+                    # HSK acknowledged, give Slave time:
+                    self._schedule(machine, now + self.periodS*2)
+
+            elif status == sv.CONNECTED:
+                machine.timeouts = 0
+                received = True
+                self.comms._processReply(slave, machine.index, reply)
+
+            # Messages received in other states are discarded.
+
+        if status == sv.CONNECTED and (received or not machine.awaiting):
+            self._exchange(machine, now)
+
+    def _onDeadline(self, machine, now):
+        """
+        Act upon MACHINE's Slave when nothing was received in time.
+        """
+        slave = machine.slave
+        status = slave.getStatus()
+
+        if status == sv.KNOWN: # = = = = = = = = = = = = = = = = = = = = = = =
+            if not machine.handshaking and not machine.waited:
+                # Wait for this Slave's turn (see FCHandshake):
+                machine.waited = True
+                self._schedule(machine,
+                    now + self.handshakes.delay(machine.failures))
+
+            elif not machine.handshaking and not self.handshakes.admit():
+                # Too many handshakes in progress. Try again shortly:
+                self._schedule(machine, now + self.handshakes.delay(0))
+
+            elif not machine.handshaking:
+                # Check for signs of life w/ HSK message:
+                machine.hsk = self.comms._makeHSK(slave)
+                self.comms._send(machine.hsk, slave, 2, True)
+                machine.handshaking = True
+                machine.tries = 2
+                self._schedule(machine, now + self.periodS*2)
+
+            elif machine.tries > 0:
+                # Try again:
+                self.comms._send(machine.hsk, slave, 1, True)
+                machine.tries -= 1
+                self._schedule(machine, now + self.periodS*2)
+
+            else:
+                # Disconnect Slave:
+                self.comms._send("X", slave, 2)
+                self.comms.setSlaveStatus(slave, sv.DISCONNECTED, False)
+                self._endHandshake(machine, False)
+                self._schedule(machine, now + self.periodS)
+
+        elif status == sv.CONNECTED: # = = = = = = = = = = = = = = = = = = = =
+            self._endHandshake(machine, True)
+            if machine.awaiting:
+                # Reply missed:
+                machine.awaiting = False
+                if not self._onTimeout(machine):
+                    self._schedule(machine, now + self.periodS)
+                    return
+            self._exchange(machine, now)
+
+        else: # = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = = =
+            # Wait for the status to change (e.g. by the listener thread):
+            self._endHandshake(machine, False)
+            machine.awaiting = False
+            self._schedule(machine, now + self.periodS)
+
+    def _endHandshake(self, machine, connected):
+        """
+        Finish the handshake of MACHINE's Slave, if one is in progress, and
+        count whether it CONNECTED (bool).
+        """
+        machine.waited = False
+        if machine.handshaking:
+            machine.handshaking = False
+            machine.failures = 0 if connected else machine.failures + 1
+            self.handshakes.release()
+
+    def _exchange(self, machine, now):
+        """
+        Send the next MOSI message to MACHINE's CONNECTED Slave and wait for
+        its reply.
+        """
+        slave = machine.slave
+
+        # Check flashing flag:
+        if self.comms.flashFlag and slave.getVersion() != \
+            self.comms.targetVersion:
+            # If the flashing flag is set and this Slave has the wrong
+            # version, reboot it:
+            self.comms._send("R", slave, 1)
+            self.comms.setSlaveStatus(slave, sv.DISCONNECTED, False)
+            machine.awaiting = False
+            self._schedule(machine, now + self.periodS)
+            return
+
+        self.comms._sendMOSI(slave)
+        machine.awaiting = True
+        self._schedule(machine, now + self.periodS*2)
+
+    def _onTimeout(self, machine):
+        """
+        Count a missed reply from MACHINE's Slave. Returns whether the Slave is
+        still CONNECTED.
+        """
+        slave = machine.slave
+        machine.timeouts += 1
+        machine.totalTimeouts += 1
+        slave.timeouts += 1
+        slave.probeSentAt = None
+        slave.probeAge = 0
+
+        if machine.timeouts == self.maxTimeouts - 1:
+            # If this Slave is about to time out, send a ping request
+            self.comms._send("Q", slave, 2)
+
+        elif machine.timeouts < self.maxTimeouts:
+            # Not enough timeouts to consider the connection compromised
+            pass
+
+        elif machine.tryBuffer:
+            self.comms._send("Y", slave, 2)
+            machine.tryBuffer = False
+
+        else:
+            self.printw("[SV] {} Slave timed out".format(machine.index + 1))
+
+            # Terminate connection:
+            self.comms._sendToListener("X", slave)
+            machine.timeouts = 0
+            machine.totalTimeouts = 0
+            self.comms.setSlaveStatus(slave, sv.DISCONNECTED, False)
+            return False
+
+        return True
+
+class FCSelector(SlaveEngine):
+    """
+    Event-loop alternative to the thread-per-Slave engine. Selected with the
+    ac.commsEngine profile attribute (ac.ENGINE_SELECTOR).
+
+    All Slave sockets are non-blocking and registered with a single selector.
+    Timeouts that the threaded engine gets from blocking socket calls are
+    kept here as per-Slave deadlines in a heap.
+    """
+
+    def __init__(self, communicator, pqueue):
+        """
+        - communicator := FCCommunicator instance whose Slaves to handle.
+        - pqueue := mp Queue() instance for I-P printing (see fc.printer)
+        """
+        SlaveEngine.__init__(self, communicator, pqueue)
+
+        self.selector = selectors.DefaultSelector()
+        self.machines = []
+        self.deadlines = []         # Heap of (deadline, count, machine)
+        self.count = 0              # Tie-breaker for heap entries
+        self.pending = queue.Queue()
+        self.bursting = False       # Whether a MOSI burst was requested
+
+        # Wake-up sockets, to interrupt select when Slaves are registered or a
+        # burst is requested:
+        self.wakeRecv, self.wakeSend = socket.socketpair()
+        self.wakeRecv.setblocking(False)
+        self.wakeSend.setblocking(False)
+        self.selector.register(self.wakeRecv, selectors.EVENT_READ, None)
+
+        self.thread = mt.Thread(name = "FCMkII_selector",
+            target = self._routine, daemon = True)
+
+    # API ......................................................................
+    def start(self):
+        """
+        Start the event loop thread.
+        """
+        self.thread.start()
+
+    def register(self, slave):
+        """
+        Hand SLAVE (FCSlave) to the event loop. Thread-safe. Meant to replace
+        FCSlave.start when this engine is in use.
+        """
+        self.pending.put_nowait(slave)
+        try:
+            self.wakeSend.send(b'\0')
+        except BlockingIOError:
+            # Wake-up already pending
+            pass
+
+    def burst(self):
+        """
+        Have the event loop send the new MOSI commands of all Slaves in one
+        burst (see FCCommunicator._burst). Thread-safe.
+        """
+        self.bursting = True
+        try:
+            self.wakeSend.send(b'\0')
+        except BlockingIOError:
+            # Wake-up already pending
+            pass
+
+    # Internal methods .........................................................
+    def _routine(self):
+        """
+        Event loop. To be run by this instance's thread.
+        """
+        self.prints("[SE] Selector engine started")
+        while True:
+            try:
+                now = time.monotonic()
+                timeout = self.periodS
+                if self.deadlines:
+                    timeout = max(0.0, min(timeout,
+                        self.deadlines[0][0] - now))
+
+                for key, _ in self.selector.select(timeout):
+                    if key.data is None:
+                        self._admit()
+                        if self.bursting:
+                            self.bursting = False
+                            self.comms._burst()
+                    else:
+                        self._onReadable(key.data)
+
+                now = time.monotonic()
+                while self.deadlines and self.deadlines[0][0] <= now:
+                    deadline, _, machine = heapq.heappop(self.deadlines)
+                    if deadline == machine.deadline:
+                        # Otherwise the entry is stale (deadline was moved)
+                        self._onDeadline(machine, now)
+
+            except Exception as e:
+                self.printx(e, "[SE] Exception in selector engine:")
+
+    def _admit(self):
+        """
+        Set up the Slaves registered since the last call.
+        """
+        try:
+            while True:
+                self.wakeRecv.recv(4096)
+        except BlockingIOError:
+            pass
+
+        while True:
+            try:
+                slave = self.pending.get_nowait()
+            except queue.Empty:
+                break
+
+            misoS, mosiS = self.comms._makeSockets(blocking = False)
+            slave.setSockets(newMISOS = misoS, newMOSIS = mosiS)
+            slave.resetIndices()
+
+            machine = SlaveMachine(slave)
+            self.machines.append(machine)
+            self.selector.register(misoS, selectors.EVENT_READ, machine)
+            self._schedule(machine, time.monotonic())
+
+            self.printr("[SV] ({:3d}) Slave sockets connected: "\
+             " MMISO: {} MMOSI:{} (IP: {})".format(machine.index + 1,
+                misoS.getsockname()[1], mosiS.getsockname()[1],
+                slave.getIP()))
+
+    def _schedule(self, machine, deadline):
+        """
+        Set the time at which MACHINE is to act next if nothing is received.
+        """
+        machine.deadline = deadline
+        self.count += 1
+        heapq.heappush(self.deadlines, (deadline, self.count, machine))
+
+    def _onReadable(self, machine):
+        """
+        Process the messages waiting on the MISO socket of MACHINE's Slave.
+        """
+        slave = machine.slave
+        self._onReplies(machine,
+            iter(lambda: self.comms._receive(slave), None))
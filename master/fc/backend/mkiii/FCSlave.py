@@ -36,6 +36,7 @@ import socket
 
 # Data:
 import queue      # Communication between threads
+import collections # Latest-value MOSI slot
 import threading   # Thread-safe access
 
 # MkIV:
@@ -100,6 +101,16 @@ def translate(statusCode, short = False): # ====================================
 class FCSlave:
     # ABOUT: Representation of connected Slave model, primarily a container with
     # no behavior besides that of its components, such as Locks.
+    # NOTE: Attributes are fixed (__slots__) to keep each record compact and
+    # attribute access cheap in the communications hot loop.
+
+    __slots__ = ("name", "mac", "fans", "maxFans", "index", "status",
+        "version", "record", "ip", "misoP", "mosiP", "misoS", "mosiS",
+        "socketLock", "mosiIndex", "misoIndex", "dataIndex", "dropIndex",
+        "lock", "misoQueue", "misoBuffer", "misoFrames", "misoStale",
+        "misoReceived", "misoLost", "misoMark", "probeSentAt", "probeAge",
+        "rtt", "timeouts", "links", "mosiSlot", "mosiCommand", "mosiMessage",
+        "mosiPending", "mosiAge", "mosiBytes", "mosiSaved", "binary", "thread")
 
     def __init__(self, name, mac, fans, maxFans, status, routine,
         routineArgs, misoQueueSize, index, version = "MkII(?)",
@@ -117,22 +128,29 @@ class FCSlave:
         #   Name                constant    None            Free (R.O)
         #   MAC Address         constant    None (R.O)      Free (R.O)
         #   Status              variable    LT & ST         Full lock on set
+        #   Version             variable    LT & ST         Full lock on set
         #   Fans                constant    None            Free (R.O)
+        #   Record              variable    LT & ST         Free (snapshot)
         #   ....................................................................
-        #   MOSI index          volatile    ST              Locked get/set
-        #   MISO index          volatile    ST (_receive)   Locked get/set
-        #   Data index          volatile    ST (_receive)   Locked get/set
+        #   MOSI index          volatile    ST              Single writer
+        #   MISO index          volatile    ST (_receive)   Single writer
+        #   Data index          volatile    ST (_receive)   Single writer
+        #   Drop index          volatile    ST (_receive)   Single writer
         #   IP Address          variable    LT              Set w/ status (F.L)
         #   MISO/MOSI Ports     variables   LT              Set w/ status (F.L)
-        #   MISO/MOSI Sockets   variables   ST              Full lock on set
+        #   MISO/MOSI Sockets   variables   ST              Socket lock
         #
         #   --------------------------------------------------------------------
         #   LEGEND:
         #   Here "constant" means an attribute will not change during execution
         #   and is therefore thread-safe to access (at least in Python!);
-        #   "variable" means it will change during execution and must use locks
-        #   for thread-safety; "volatile" means it is expected to change very
-        #   frequently and therefore deserves special measures for efficiency.
+        #   "variable" means it will change during execution and is only set
+        #   while holding the Slave lock ("full lock", F.L); "volatile" means
+        #   it is expected to change very frequently and is only ever set by
+        #   the thread or engine that handles this Slave, so it needs no lock.
+        #   Reading any single attribute is atomic. The "record" is an
+        #   immutable tuple (see snapshot) replaced whole on each change, so
+        #   that other threads get a consistent view without locking.
         # ----------------------------------------------------------------------
 
         # Validate parameters ..................................................
@@ -206,52 +224,35 @@ class FCSlave:
         # Fans:
         self.fans = fans
         self.maxFans = maxFans
-        self.padding_rpm_connected = [s.PAD]*maxFans
-        self.padding_rpm_disconnected = [s.RIP]*maxFans
-        self.padding_dc_connected = [s.PAD]*maxFans
-        self.padding_dc_disconnected = [s.RIP]*maxFans
 
         # Index:
         self.index = index
 
         # Initialize variable attributes .......................................
         self.status = status
-        self.statusLock = threading.Lock()
-
         self.version = version
-        self.versionLock = threading.Lock()
+        self.record = None
+        self._publish()
 
         # Communications-specific ..............................................
 
         # IP address:
         self.ip = ip
-        self.ipLock = threading.Lock()
 
         # Port numbers:
         self.misoP = misoP
         self.mosiP = mosiP
-        self.portLock = threading.Lock()
 
         # Sockets:
         self.misoS = misoS
         self.mosiS = mosiS
         self.socketLock = threading.Lock()
 
-        # MOSI index:
+        # Indices:
         self.mosiIndex = 0
-        self.mosiIndexLock = threading.Lock()
-
-        # MISO index:
         self.misoIndex = 0
-        self.misoIndexLock = threading.Lock()
-
-        # Data index:
         self.dataIndex = 0
-        self.dataIndexLock = threading.Lock()
-
-        # Drop index:
         self.dropIndex = 0
-        self.dropIndexLock = threading.Lock()
 
         # Initialize multithreading attributes .................................
 
@@ -259,12 +260,42 @@ class FCSlave:
         self.lock = threading.Lock()
 
         # Queues:
-        self.mosiQueue = queue.Queue(2)
         self.misoQueue = queue.Queue(misoQueueSize)
 
         # Buffers: FIXME
         self.misoBuffer = None
-        self.mosiBuffer = None
+
+        # Receive buffers for MISO datagrams (see FCCommunicator._receive),
+        # allocated by the communicator, and number of stale datagrams dropped:
+        self.misoFrames = None
+        self.misoStale = 0
+
+        # Link telemetry (see FCCommunicator._sendDiagnostics), only updated by
+        # the thread or engine that handles this Slave:
+        self.misoReceived = 0       # MISO datagrams received w/ a new index
+        self.misoLost = 0           # MISO indices skipped (datagrams lost)
+        self.misoMark = (0, 0)      # (received, lost) at the last publication
+        self.probeSentAt = None     # When the unanswered RTT probe was sent
+        self.probeAge = 0           # Periods since the last RTT probe
+        self.rtt = None             # Smoothed round trip time (s)
+        self.timeouts = 0           # Replies missed
+        self.links = 0              # Times CONNECTED
+
+        # Latest MOSI command. Appending replaces any command not yet fetched,
+        # and appending and popping are atomic, so no lock is needed:
+        self.mosiSlot = collections.deque(maxlen = 1)
+
+        # MOSI redundancy state (see FCCommunicator._sendMOSI), only used by
+        # the thread or engine that handles this Slave:
+        self.mosiCommand = None     # Last command sent (as fetched)
+        self.mosiMessage = None     # Last command sent (as encoded)
+        self.mosiPending = False    # Whether it is yet to be acknowledged
+        self.mosiAge = 0            # Periods since it was last sent
+        self.mosiBytes = 0          # Payload bytes sent
+        self.mosiSaved = 0          # Payload bytes saved w.r.t. resending
+
+        # Wire format (whether binary frames were negotiated, see FCWire):
+        self.binary = False
 
         # Handler thread:
         self.thread = threading.Thread(
@@ -310,21 +341,21 @@ class FCSlave:
         # End getFans ==========================================================
 
     def getStatus(self): # =====================================================
-        # ABOUT: Getter for status. (Uses locks for thread-safety.)
+        # ABOUT: Getter for status. (Atomic read, no lock needed.)
 
-        try:
-            self.statusLock.acquire()
+        return self.status
 
-            # Use placeholder to return value after releasing lock:
-            placeholder = self.status
+        # End getStatus ========================================================
 
-            # Notice lock will be released by finally clause
-            return placeholder
+    def snapshot(self): # ======================================================
+        # ABOUT: Get a consistent view of this Slave's state without locking.
+        # RETURNS:
+        # - tuple (index, name, mac, status, fans, version), laid out as an
+        #   entry of a slave state vector (see fc.standards).
 
-        finally:
-            self.statusLock.release()
+        return self.record
 
-        # End getStatus ========================================================
+        # End snapshot =========================================================
 
     def setStatus(self, # ======================================================
         newStatus,
@@ -378,6 +409,7 @@ class FCSlave:
                 #self._setIP(None)
                 self.resetIndices()
                 self._emptyMISOBuffer()
+                self.probeSentAt = None
 
             elif newStatus in (AVAILABLE, KNOWN):
                 # Reset indices and update IP address and port numbers:
@@ -408,7 +440,7 @@ class FCSlave:
 
             elif newStatus == CONNECTED:
                 # When CONNECTED, do not reset indices:
-                pass
+                self.links += 1
 
             elif newStatus == BOOTLOADER:
                 pass
@@ -419,6 +451,7 @@ class FCSlave:
 
             # Update status ----------------------------------------------------
             self.status = newStatus
+            self._publish()
 
         finally:
             if lock:
@@ -430,19 +463,9 @@ class FCSlave:
         # ABOUT: Get version of this Slave.
         # RETURNS:
         # - str, may be empty("").
-        # NOTE: Thread-safe (blocks)
-
-        try:
-            self.versionLock.acquire()
-
-            # Use placeholder to return value after releasing lock:
-            placeholder = self.version
+        # NOTE: Thread-safe (atomic read)
 
-            # Lock will be released by finally clause
-            return placeholder
-
-        finally:
-            self.versionLock.release()
+        return self.version
 
         # End getVersion =======================================================
 
@@ -450,7 +473,7 @@ class FCSlave:
         # ABOUT: Set version.
         # PARAMETERS:
         # - newVersion: str.
-        # NOTE: Thread-safe (blocks)
+        # NOTE: Thread-safe (blocks on the Slave lock)
 
         # Validate input:
         if type(newVersion) is not str:
@@ -458,12 +481,13 @@ class FCSlave:
                 "not {}".\
                 format(type(newVersion)))
         try:
-            self.versionLock.acquire()
+            self.lock.acquire()
 
             self.version = newVersion
+            self._publish()
 
         finally:
-            self.versionLock.release()
+            self.lock.release()
 
         # End setVersion =======================================================
 
@@ -547,36 +571,26 @@ class FCSlave:
 
         # End setSockets =======================================================
 
+    # NOTE: Indices are only modified by the thread or engine that handles
+    # this Slave (see attribute table), so the methods below take no locks.
+    # (The MOSI index is also modified by MOSI bursts, which hold the Slave
+    # lock, as does the threaded engine when it sends, see
+    # FCCommunicator._burst.)
+    # Setters do not validate their input, as they are called on every
+    # exchange; callers pass nonnegative ints.
+
     def getMISOIndex(self): # ==================================================
         # ABOUT: Get current MISO index value.
         # RETURNS: int, current MISO index value.
-        # NOTE: Thread-safe (blocks)
-
-        try:
-            self.misoIndexLock.acquire()
-
-            # Use placeholder to return value after releasing lock:
-            placeholder = self.misoIndex
 
-            # Notice finally clause will release lock
-            return placeholder
-
-        finally:
-            self.misoIndexLock.release()
+        return self.misoIndex
 
         # End getMISOIndex =====================================================
 
     def incrementMISOIndex(self): # ============================================
         # ABOUT: Increment MISO index value (by 1).
-        # NOTE: Blocks for thread-safety.
-
-        try:
-            self.misoIndexLock.acquire()
 
-            self.misoIndex += 1
-
-        finally:
-            self.misoIndexLock.release()
+        self.misoIndex += 1
 
         # End incrementMISOIndex ===============================================
 
@@ -584,53 +598,23 @@ class FCSlave:
         # ABOUT: Set MISO index to a given value.
         # PARAMETERS:
         # - newIndex: int, nonnegative new index value that may be zero.
-        # NOTE: Thread-safe (blocks)
-
-        # Validate input:
-        if type(newIndex) is not int:
-            raise TypeError("Argument 'newIndex' must be of type int, not {}".\
-                format(type(newIndex)))
 
-        try:
-            self.misoIndexLock.acquire()
-
-            self.misoIndex = newIndex
-
-        finally:
-            self.misoIndexLock.release()
+        self.misoIndex = newIndex
 
         # End setMISOIndex =====================================================
 
     def getDropIndex(self): # ==================================================
         # ABOUT: Get current Drop index value.
         # RETURNS: int, current Drop index value.
-        # NOTE: Thread-safe (blocks)
 
-        try:
-            self.dropIndexLock.acquire()
-
-            # Use placeholder to return value after releasing lock:
-            placeholder = self.dropIndex
-
-            # Notice finally clause will release lock
-            return placeholder
-
-        finally:
-            self.dropIndexLock.release()
+        return self.dropIndex
 
         # End getDropIndex =====================================================
 
     def incrementDropIndex(self): # ============================================
         # ABOUT: Increment Drop index value (by 1).
-        # NOTE: Blocks for thread-safety.
 
-        try:
-            self.dropIndexLock.acquire()
-
-            self.dropIndex += 1
-
-        finally:
-            self.dropIndexLock.release()
+        self.dropIndex += 1
 
         # End incrementDropIndex ===============================================
 
@@ -638,54 +622,23 @@ class FCSlave:
         # ABOUT: Set Drop index to a given value.
         # PARAMETERS:
         # - newIndex: int, nonnegative new index value that may be zero.
-        # NOTE: Thread-safe (blocks)
 
-        # Validate input:
-        if type(newIndex) is not int:
-            raise TypeError("Argument 'newIndex' must be of type int, not {}".\
-                format(type(newIndex)))
-
-        try:
-            self.dropIndexLock.acquire()
-
-            self.dropIndex = newIndex
-
-        finally:
-            self.dropIndexLock.release()
+        self.dropIndex = newIndex
 
         # End setDropIndex =====================================================
 
-
     def getDataIndex(self): # ==================================================
         # ABOUT: Get current data index value.
         # RETURNS: int, current data index value.
-        # NOTE: Thread-safe (blocks)
 
-        try:
-            self.dataIndexLock.acquire()
-
-            # Use placeholder to return value after releasing lock:
-            placeholder = self.dataIndex
-
-            # Notice finally clause will release lock
-            return placeholder
-
-        finally:
-            self.dataIndexLock.release()
+        return self.dataIndex
 
         # End getDataIndex =====================================================
 
     def incrementDataIndex(self): # ============================================
         # ABOUT: Increment data index value (by 1).
-        # NOTE: Blocks for thread-safety.
 
-        try:
-            self.misoDataLock.acquire()
-
-            self.dataIndex += 1
-
-        finally:
-            self.dataIndexLock.release()
+        self.dataIndex += 1
 
         # End incrementDataIndex ===============================================
 
@@ -693,38 +646,16 @@ class FCSlave:
         # ABOUT: Set data index to a given value.
         # PARAMETERS:
         # - newIndex: int, nonnegative new index value that may be zero.
-        # NOTE: Thread-safe (blocks)
 
-        # Validate input:
-        if type(newIndex) is not int:
-            raise TypeError("Argument 'newIndex' must be of type int, not {}"\
-                " ({})".format(type(newIndex), newIndex))
-
-        try:
-            self.dataIndexLock.acquire()
-
-            self.dataIndex = newIndex
-
-        finally:
-            self.dataIndexLock.release()
+        self.dataIndex = newIndex
 
         # End setDataIndex =====================================================
+
     def getMOSIIndex(self): # ==================================================
         # ABOUT: Get current MOSI index value.
         # RETURNS: int, current MOSI index value.
-        # NOTE: Thread-safe (blocks)
-
-        try:
-            self.mosiIndexLock.acquire()
-
-            # Use placeholder to return value after releasing lock:
-            placeholder = self.mosiIndex
 
-            # Notice finally clause will release lock
-            return placeholder
-
-        finally:
-            self.mosiIndexLock.release()
+        return self.mosiIndex
 
         # End getMOSIIndex =====================================================
 
@@ -732,93 +663,41 @@ class FCSlave:
         # ABOUT: Set MOSI index to a given value.
         # PARAMETERS:
         # - newIndex: int, nonnegative new index value that may be zero.
-        # NOTE: Thread-safe (blocks)
 
-        # Validate input:
-        if type(newIndex) is not int:
-            raise TypeError("Argument 'newIndex' must be of type int, not {}".\
-                format(type(newIndex)))
-
-        try:
-            self.mosiIndexLock.acquire()
-
-            self.mosiIndex = newIndex
-
-        finally:
-            self.mosiIndexLock.release()
+        self.mosiIndex = newIndex
 
         # End setMOSIIndex =====================================================
 
     def incrementMOSIIndex(self): # ============================================
         # ABOUT: Increment MOSI index value (by 1).
-        # NOTE: Blocks for thread-safety.
-
-        try:
-            self.mosiIndexLock.acquire()
-
-            self.mosiIndex += 1
 
-        finally:
-            self.mosiIndexLock.release()
+        self.mosiIndex += 1
 
         # End incrementMOSIIndex ===============================================
 
     def resetIndices(self): # ==================================================
-        # ABOUT: Reset both MOSIIndex and MISOIndex to 0.
-        # NOTE: Blocks for thread-safety.
-
-        try:
-            self.misoIndexLock.acquire()
-            self.mosiIndexLock.acquire()
-            self.dataIndexLock.acquire()
-            self.dropIndexLock.acquire()
-
-            self.misoIndex = 0
-            self.mosiIndex = 0
-            self.dataIndex = 0
-            self.dropIndex = 0
+        # ABOUT: Reset the MOSI, MISO, data and drop indices to 0.
 
-        finally:
-            self.misoIndexLock.release()
-            self.mosiIndexLock.release()
-            self.dataIndexLock.release()
-            self.dropIndexLock.release()
+        self.misoIndex = 0
+        self.mosiIndex = 0
+        self.dataIndex = 0
+        self.dropIndex = 0
 
         # End resetIndices =====================================================
 
     def getMOSIPort(self): # ===================================================
         # ABOUT: Get this Slave's MOSI port number.
-        # NOTE: Thread-safe (blocks)
-
-        try:
-            self.portLock.acquire()
-
-            # Use placeholder to return value after releasing lock:
-            placeholder = self.mosiP
+        # NOTE: Thread-safe (atomic read)
 
-            # Notice lock will be released in finally clause
-            return placeholder
-
-        finally:
-            self.portLock.release()
+        return self.mosiP
 
         # End getMOSIPort ======================================================
 
     def getMISOPort(self): # ===================================================
         # ABOUT: Get this Slave's MISO port number.
-        # NOTE: Thread-safe (blocks)
-
-        try:
-            self.portLock.acquire()
+        # NOTE: Thread-safe (atomic read)
 
-            # Use placeholder to return value after releasing lock:
-            placeholder = self.misoP
-
-            # Notice lock will be released in finally clause
-            return placeholder
-
-        finally:
-            self.portLock.release()
+        return self.misoP
 
         # End getMISOPort ======================================================
 
@@ -850,24 +729,22 @@ class FCSlave:
         # End release ==========================================================
 
     def setMOSI(self, command, block = True): # ================================
-        # ABOUT: Add a command (str) to this Slave's MOSI Queue.
-        if self.mosiBuffer is not None:
-            # TODO: count drop
-            pass
-        self.mosiBuffer = command
+        # ABOUT: Set the next command (tuple) to send to this Slave, replacing
+        # any previous one that was not fetched yet. Never blocks.
+        self.mosiSlot.append(command)
         # End setMOSI ==========================================================
 
     def getMOSI(self, block = False): # ========================================
-        # ABOUT: Try to get a command (as a string) from the Slave's MOSI Queue,
-        # if any is available.
+        # ABOUT: Fetch the latest command set for this Slave, if any.
         # PARAMETERS:
-        # - block: bool, whether to block while waiting for queue.
+        # - block: bool, ignored (kept for compatibility).
         # RETURNS:
-        # - str representing command to be sent or None if the Queue is empty
-        #   and parameter block is set to False.
-        value = self.mosiBuffer
-        self.mosiBuffer = None
-        return value
+        # - tuple representing command to be sent or None if there is no new
+        #   one.
+        try:
+            return self.mosiSlot.pop()
+        except IndexError:
+            return None
 
         # End getMOSI ==========================================================
 
@@ -875,19 +752,9 @@ class FCSlave:
         # ABOUT: Get Slave's IP address, if any.
         # RETURNS:
         # - str if IP address currently exists, None otherwise.
-        # NOTE: Blocks for thread-safety.
-
-        try:
-            self.ipLock.acquire()
-
-            # Use placeholder to return value after releasing lock:
-            placeholder = self.ip
+        # NOTE: Thread-safe (atomic read)
 
-            # Notice lock will be released by finally clause
-            return placeholder
-
-        finally:
-            self.ipLock.release()
+        return self.ip
 
         # End getIP ============================================================
 
@@ -902,20 +769,23 @@ class FCSlave:
 
 
     def getMISO(self, block = False): # ========================================
-        # ABOUT: Try to get an update from this Slave's misoQueue.
-        if self.misoBuffer is not None:
-            value = self.misoBuffer
-            misoBuffer = None
-            return value
-        else:
-            return (self.padding_rpm_connected, self.padding_dc_connected) if \
-                self.status is CONNECTED else \
-                    (self.padding_rpm_disconnected,
-                self.padding_dc_disconnected)
+        # ABOUT: Get the latest update set by setMISO, or None if there is none
+        # since this Slave was last disconnected. (Payloads are decoded by
+        # FCCommunicator, see FCMISO.)
+        return self.misoBuffer
         # End getUpdate ========================================================
 
     # PRIVATE AUXILIARY METHODS ################################################
 
+    def _publish(self): # ======================================================
+        # ABOUT: Replace the snapshot record after a change in status or
+        # version. (Called with the Slave lock held, see snapshot.)
+
+        self.record = (self.index, self.name, self.mac, self.status,
+            self.fans, self.version)
+
+        # End _publish =========================================================
+
     def _emptyMISOBuffer(self): # ==============================================
         # ABOUT: Empty the buffer of the MISO socket, if any, to prevent
         # obsolete messages. The MISO data buffer is also reset.
@@ -943,23 +813,16 @@ class FCSlave:
         # - newIP: str or None, new IP address to set.
         # NOTE: THIS METHOD IS MEANT AS AN AUXILIARY PRIVATE METHOD AND AS SUCH
         # IS NOT INHERENTLY THREAD-SAFE (BESIDES W/ getIP()).
-        try:
-            self.ipLock.acquire()
-            # Validate input:
-            if type(newIP) in (str, type(None)):
 
-                self.ip = newIP
-
-                # Done
-                return
+        # Validate input:
+        if type(newIP) in (str, type(None)):
 
-            else:
-                raise TypeError("Argument 'newIP' must be str or None, "\
-                    "not {}".\
-                    format(type(newIP)))
+            self.ip = newIP
 
-        finally:
-            self.ipLock.release()
+        else:
+            raise TypeError("Argument 'newIP' must be str or None, "\
+                "not {}".\
+                format(type(newIP)))
 
         # End _setIP ===========================================================
 
@@ -970,47 +833,42 @@ class FCSlave:
         # NOTE: THIS METHOD IS MEANT AS AN AUXILIARY PRIVATE METHOD AND AS SUCH
         # IS NOT INHERENTLY THREAD-SAFE.
 
-        try:
-            self.portLock.acquire()
-
-            # Validate input:
-            if type(newMISOP) in (int, type(None)) and \
-                type(newMISOP) == type(newMOSIP):
-                # Both arguments have valid and equal types. Now check values:
-
-                if newMISOP == None:
-                    # Both arguments are None (valid)
-                    pass
-                # If they are integers, check their values:
-                elif newMISOP <= 0:
-                    raise TypeError("Argument 'newMISOP' must be > 0 ({})"\
-                        "(MOSI: {})".\
-                        format(newMISOP, newMOSIP))
-                elif newMOSIP <= 0:
-                    raise TypeError("Argument 'newMOSIP' must be > 0 ({})"\
-                        "(MISO: {})".\
-                        format(newMOSIP, newMISOP))
-                else:
-                    pass
-
-                # Tests passed. Assign values:
-
-                self.misoP = newMISOP
-                self.mosiP = newMOSIP
-
-                # Done
-                return
+        # Validate input:
+        if type(newMISOP) in (int, type(None)) and \
+            type(newMISOP) == type(newMOSIP):
+            # Both arguments have valid and equal types. Now check values:
 
+            if newMISOP == None:
+                # Both arguments are None (valid)
+                pass
+            # If they are integers, check their values:
+            elif newMISOP <= 0:
+                raise TypeError("Argument 'newMISOP' must be > 0 ({})"\
+                    "(MOSI: {})".\
+                    format(newMISOP, newMOSIP))
+            elif newMOSIP <= 0:
+                raise TypeError("Argument 'newMOSIP' must be > 0 ({})"\
+                    "(MISO: {})".\
+                    format(newMOSIP, newMISOP))
             else:
-                # Bad types. Report to user:
-                raise TypeError("Bad types. Arguments 'newMISOP' and "\
-                    "'newMOSIP' "\
-                    "must have valid and equal types. "\
-                    "(Here MISO: {} and MOSI: {})".\
-                    format(type(newMISOP), type(newMOSIP)))
+                pass
+
+            # Tests passed. Assign values:
+
+            self.misoP = newMISOP
+            self.mosiP = newMOSIP
+
+            # Done
+            return
+
+        else:
+            # Bad types. Report to user:
+            raise TypeError("Bad types. Arguments 'newMISOP' and "\
+                "'newMOSIP' "\
+                "must have valid and equal types. "\
+                "(Here MISO: {} and MOSI: {})".\
+                format(type(newMISOP), type(newMOSIP)))
 
-        finally:
-            self.portLock.release()
         # End _setPorts ========================================================
 
 
@@ -0,0 +1,181 @@
+################################################################################
+##----------------------------------------------------------------------------##
+## CALIFORNIA INSTITUTE OF TECHNOLOGY ## GRADUATE AEROSPACE LABORATORY ##     ##
+## CENTER FOR AUTONOMOUS SYSTEMS AND TECHNOLOGIES                      ##     ##
+##----------------------------------------------------------------------------##
+##      ____      __      __  __      _____      __      __    __    ____     ##
+##     / __/|   _/ /|    / / / /|  _- __ __\    / /|    / /|  / /|  / _  \    ##
+##    / /_ |/  / /  /|  /  // /|/ / /|__| _|   / /|    / /|  / /|/ /   --||   ##
+##   / __/|/ _/    /|/ /   / /|/ / /|    __   / /|    / /|  / /|/ / _  \|/    ##
+##  / /|_|/ /  /  /|/ / // //|/ / /|__- / /  / /___  / -|_ - /|/ /     /|     ##
+## /_/|/   /_/ /_/|/ /_/ /_/|/ |\ ___--|_|  /_____/| |-___-_|/  /____-/|/     ##
+## |_|/    |_|/|_|/  |_|/|_|/   \|___|-    |_____|/   |___|     |____|/       ##
+##                   _ _    _    ___   _  _      __  __   __                  ##
+##                  | | |  | |  | T_| | || |    |  ||_ | | _|                 ##
+##                  | _ |  |T|  |  |  |  _|      ||   \\_//                   ##
+##                  || || |_ _| |_|_| |_| _|    |__|  |___|                   ##
+##                                                                            ##
+##----------------------------------------------------------------------------##
+## Alejandro A. Stefan Zavala ## <astefanz@berkeley.edu>   ##                 ##
+## Chris J. Dougherty         ## <cdougher@caltech.edu>    ##                 ##
+## Marcel Veismann            ## <mveisman@caltech.edu>    ##                 ##
+################################################################################
+
+""" ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+ + Binary wire format for the MkII protocol, and its codec.
+ +
+ + The binary format is negotiated per Slave during the handshake: the master
+ + offers it by appending "|" + TOKEN to its "H|..." message, and a Slave that
+ + speaks it acknowledges with "H|" + TOKEN instead of a plain "H". Firmware
+ + that does not know about it ignores the extra field and replies "H", in
+ + which case the ASCII format is used as before.
+ +
+ + Only the messages exchanged every period are binary. All others, as well as
+ + everything before the handshake completes, stay ASCII. Binary frames are
+ + told apart by their first byte, which has its high bit set (ASCII messages
+ + begin with a digit). All fields are little-endian:
+ +
+ +  - Feedback (MISO, replaces "T|DATA_INDEX|RPMS|DCS"):
+ +      u8 T_CODE, u32 MISO index, u32 data index, u8 fans,
+ +      u16 RPM x fans, u16 DC x fans
+ +  - DC vector (MOSI, replaces "S|F:DC_0,DC_1,..."):
+ +      u8 F_CODE, u32 MOSI index, u8 fans, u16 DC x fans
+ +  - Single DC (MOSI, replaces "S|D:DC:SELECTION"):
+ +      u8 D_CODE, u32 MOSI index, u16 DC, u8 fans, selection bitmask
+ +      (one bit per fan, least significant bit first)
+ +
+ + Duty cycles are sent in units of 1/DC_SCALE, which matches the four
+ + decimals of the ASCII feedback.
+ +
+ + Outgoing messages are built once, with their index left blank, and reused
+ + until the next command (see FCCommunicator._sendMOSI); the index is filled
+ + in on each send.
+ +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
+
+## DEPENDENCIES ################################################################
+import struct
+
+import numpy as np
+
+## CONSTANTS ###################################################################
+TOKEN = "B1"        # Handshake field that offers and accepts this format
+
+BINARY_BIT = 0x80
+T_CODE = BINARY_BIT | ord('T')
+F_CODE = BINARY_BIT | ord('F')
+D_CODE = BINARY_BIT | ord('D')
+
+FEEDBACK = ord('T')  # Keyword of feedback messages, in either format
+
+DC_SCALE = 10000
+VALUE = np.dtype("<u2")
+
+INDEX = struct.Struct("<I")             # At offset 1 of every frame
+MISO_T = struct.Struct("<BIIB")
+MOSI_F = struct.Struct("<BIB")
+MOSI_D = struct.Struct("<BIHB")
+
+## FUNCTIONS ###################################################################
+def isBinary(message):
+    """
+    Return whether the received MESSAGE (bytes) is a binary frame.
+    """
+    return len(message) > 0 and bool(message[0] & BINARY_BIT)
+
+def peek(buffer, length):
+    """
+    Return a tuple (MISO index, keyword) for the message held in the first
+    LENGTH bytes of BUFFER (bytes-like), binary or ASCII, without decoding the
+    rest of it. KEYWORD is the byte value of the message's keyword (FEEDBACK
+    for binary frames). Returns (-1, -1) if there is no valid index.
+    """
+    try:
+        if length > 0 and buffer[0] & BINARY_BIT:
+            return (INDEX.unpack_from(buffer, 1)[0], FEEDBACK) \
+                if length >= 5 else (-1, -1)
+        bar = buffer.find(b'|', 0, length)
+        if bar > 0:
+            return int(buffer[:bar]), \
+                buffer[bar + 1] if bar + 1 < length else -1
+    except ValueError:
+        pass
+    return -1, -1
+
+def quantize(dcs):
+    """
+    Return the sequence of duty cycles DCS (normalized, 0 to 1) as the bytes
+    of an array of u16 values.
+    """
+    return (np.asarray(dcs, np.float64)*DC_SCALE).round().clip(
+        0, DC_SCALE).astype(VALUE).tobytes()
+
+def packF(dcs):
+    """
+    Build a DC vector message for the sequence of duty cycles DCS.
+    """
+    return MOSI_F.pack(F_CODE, 0, len(dcs)) + quantize(dcs)
+
+def packD(dc, selection):
+    """
+    Build a single DC message that sets the duty cycle DC on the fans selected
+    in SELECTION (str of '1' and '0', as in the ASCII format).
+    """
+    mask = np.frombuffer(selection.encode('ascii'), np.uint8) == ord('1')
+    return MOSI_D.pack(D_CODE, 0, int(round(float(dc)*DC_SCALE)),
+        len(selection)) + np.packbits(mask, bitorder = 'little').tobytes()
+
+def frame(message, index):
+    """
+    Return a copy of the binary MESSAGE (as built by packF or packD) with its
+    index set to INDEX.
+    """
+    outgoing = bytearray(message)
+    INDEX.pack_into(outgoing, 1, index)
+    return outgoing
+
+def unpackT(message):
+    """
+    Decode the binary feedback frame MESSAGE. Returns a tuple
+    (MISO index, data index, fans, payload), where PAYLOAD holds the RPMs and
+    DCs (see FCMISO.decodeFrames). Raises ValueError if MESSAGE is malformed.
+    """
+    if len(message) < MISO_T.size:
+        raise ValueError("Truncated binary feedback frame")
+    code, index, dataIndex, fans = MISO_T.unpack_from(message)
+    if code != T_CODE or len(message) != MISO_T.size + 4*fans:
+        raise ValueError("Malformed binary feedback frame")
+    return index, dataIndex, fans, bytes(message[MISO_T.size:])
+
+def packT(index, dataIndex, rpms, dcs):
+    """
+    Build a binary feedback frame (used by Slaves, see fc.simulator).
+    """
+    return MISO_T.pack(T_CODE, index, dataIndex, len(rpms)) \
+        + np.asarray(rpms).clip(0, 0xffff).astype(VALUE).tobytes() \
+        + quantize(dcs)
+
+def unpackMOSI(message):
+    """
+    Decode a binary MOSI MESSAGE (used by Slaves, see fc.simulator). Returns a
+    tuple (code, MOSI index, DCS, SELECTION), where DCS is a list of duty
+    cycles and SELECTION a list of booleans (None for DC vectors). Raises
+    ValueError if MESSAGE is malformed.
+    """
+    if len(message) < MOSI_F.size:
+        raise ValueError("Truncated binary MOSI frame")
+    code = message[0]
+    if code == F_CODE:
+        _, index, fans = MOSI_F.unpack_from(message)
+        payload = message[MOSI_F.size:]
+        if len(payload) != 2*fans:
+            raise ValueError("Malformed binary DC vector")
+        dcs = (np.frombuffer(payload, VALUE)/DC_SCALE).tolist()
+        return code, index, dcs, None
+    if code == D_CODE and len(message) >= MOSI_D.size:
+        _, index, dc, fans = MOSI_D.unpack_from(message)
+        bits = np.frombuffer(message[MOSI_D.size:], np.uint8)
+        if 8*bits.size < fans:
+            raise ValueError("Malformed binary DC selection")
+        selection = np.unpackbits(bits, count = fans, bitorder = 'little')
+        return code, index, [dc/DC_SCALE]*fans, selection.astype(bool).tolist()
+    raise ValueError("Unrecognized binary MOSI frame")
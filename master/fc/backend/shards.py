@@ -0,0 +1,418 @@
+################################################################################
+##----------------------------------------------------------------------------##
+## CALIFORNIA INSTITUTE OF TECHNOLOGY ## GRADUATE AEROSPACE LABORATORY ##     ##
+## CENTER FOR AUTONOMOUS SYSTEMS AND TECHNOLOGIES                      ##     ##
+##----------------------------------------------------------------------------##
+##      ____      __      __  __      _____      __      __    __    ____     ##
+##     / __/|   _/ /|    / / / /|  _- __ __\    / /|    / /|  / /|  / _  \    ##
+##    / /_ |/  / /  /|  /  // /|/ / /|__| _|   / /|    / /|  / /|/ /   --||   ##
+##   / __/|/ _/    /|/ /   / /|/ / /|    __   / /|    / /|  / /|/ / _  \|/    ##
+##  / /|_|/ /  /  /|/ / // //|/ / /|__- / /  / /___  / -|_ - /|/ /     /|     ##
+## /_/|/   /_/ /_/|/ /_/ /_/|/ |\ ___--|_|  /_____/| |-___-_|/  /____-/|/     ##
+## |_|/    |_|/|_|/  |_|/|_|/   \|___|-    |_____|/   |___|     |____|/       ##
+##                   _ _    _    ___   _  _      __  __   __                  ##
+##                  | | |  | |  | T_| | || |    |  ||_ | | _|                 ##
+##                  | _ |  |T|  |  |  |  _|      ||   \\_//                   ##
+##                  || || |_ _| |_|_| |_| _|    |__|  |___|                   ##
+##                                                                            ##
+##----------------------------------------------------------------------------##
+## Alejandro A. Stefan Zavala ## <astefanz@berkeley.edu>   ##                 ##
+## Chris J. Dougherty         ## <cdougher@caltech.edu>    ##                 ##
+## Marcel Veismann            ## <mveisman@caltech.edu>    ##                 ##
+################################################################################
+
+""" ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+ + Sharded communications back-end for large arrays. The slaves are split among
+ + several worker processes, each of which runs a regular back-end for its
+ + share (see fc.backend.mkiii.FCCommunicator), while a coordinator process
+ + forwards front-end input to the workers and merges their output into the
+ + single network, slave and feedback vectors the front-end expects.
+ +
+ + Slaves are assigned to workers by a hash of their MAC address (see owner),
+ + so that each worker can tell on its own which broadcast replies to act on.
+ + Saved slaves keep their indices. Slaves found at run time are given the next
+ + free index in the order in which the coordinator first sees them.
+ +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
+
+## IMPORTS #####################################################################
+import zlib
+import time as tm
+import multiprocessing.connection as mpc
+
+import fc.archive as ac
+import fc.backend.feedback as fb
+import fc.backend.control as ct
+import fc.backend.states as st
+import fc.standards as s
+import fc.printer as pt
+
+## AUXILIARY FUNCTIONS #########################################################
+def owner(mac, workers):
+    """
+    Return the index of the worker, out of WORKERS, that handles the slave with
+    MAC address MAC (str). Stable across processes and runs.
+    """
+    return zlib.crc32(mac.encode('ascii')) % workers
+
+def split(profile, workers):
+    """
+    Split PROFILE among WORKERS workers. Returns a list with one tuple
+    (profile, indices) per worker, where PROFILE is the profile to give that
+    worker, with only its share of the saved slaves and of the firmware update
+    and handshake limits, and INDICES is the list of the indices of those
+    slaves in the original profile, in the worker's order.
+    """
+    saved = profile[ac.savedSlaves]
+    shares = [[] for _ in range(workers)]
+    for index, slave in enumerate(saved):
+        shares[owner(slave[ac.SV_mac], workers)].append(index)
+
+    result = []
+    for indices in shares:
+        P = dict(profile)
+        P[ac.savedSlaves] = tuple(saved[index] for index in indices)
+        # Firmware update and handshake limits hold for the whole back-end:
+        for key in (ac.flashWave, ac.flashConcurrency, ac.hskLimit):
+            P[key] = max(1, profile[key]//workers)
+        result.append((P, indices))
+    return result
+
+## CLASSES #####################################################################
+class Worker:
+    """
+    Coordinator-side pipe ends and index map of one worker process.
+    """
+
+    def __init__(self, number, indices, commandPipeSend, controlPipeSend,
+        feedbackPipeRecv, slavePipeRecv, networkPipeRecv, control = None,
+        diagnosticsPipeRecv = None):
+        """
+        - number := index of this worker.
+        - indices := list of global slave indices handled by this worker, in
+            the worker's (local) order. Grows as slaves are found.
+        - control := name of the worker's ControlBuffer, or None.
+        - diagnosticsPipeRecv := pipe end through which the worker sends
+            diagnostics arrays, or None if it does not.
+        - The rest are the pipe ends through which to talk to the worker.
+        """
+        self.number = number
+        self.indices = list(indices)
+        self.commandPipeSend = commandPipeSend
+        self.controlPipeSend = controlPipeSend
+        self.feedbackPipeRecv = feedbackPipeRecv
+        self.slavePipeRecv = slavePipeRecv
+        self.networkPipeRecv = networkPipeRecv
+        self.diagnosticsPipeRecv = diagnosticsPipeRecv
+        self.control = ct.ControlBuffer(name = control) \
+            if control is not None else None
+        self.F = None               # Latest feedback vector
+        self.fresh = False          # Whether F is newer than the last merge
+
+class FCShards(pt.PrintClient):
+    """
+    Coordinator of a sharded back-end. Runs in its own process, between the
+    front-end pipes (see fc.backend.communicator) and those of the workers.
+    """
+    SYMBOL = "[SH]"
+
+    def __init__(self, profile, commandPipeRecv, controlPipeRecv,
+        feedbackPipeSend, slavePipeSend, networkPipeSend, workers, pqueue,
+        feedback = None, control = None, diagnosticsPipeSend = None):
+        """
+        - profile := profile as loaded from FCArchive (not split)
+        - commandPipeRecv, controlPipeRecv := receive vectors from the FE
+        - feedbackPipeSend, slavePipeSend, networkPipeSend := send vectors to
+            the FE
+        - workers := list of Worker instances, one per worker process
+        - pqueue := mp Queue() instance for I-P printing (see fc.printer)
+        - feedback := name of the shared FeedbackBuffer to write merged
+            feedback vectors into, or None (see fc.backend.feedback)
+        - control := name of the shared ControlBuffer to read DC vectors from,
+            or None (see fc.backend.control). Changes are copied into the
+            ControlBuffers of the workers.
+        - diagnosticsPipeSend := send the diagnostics arrays of the workers to
+            the FE, or None
+        """
+        pt.PrintClient.__init__(self, pqueue)
+        self.commandPipeRecv = commandPipeRecv
+        self.controlPipeRecv = controlPipeRecv
+        self.feedbackPipeSend = feedbackPipeSend
+        self.feedback = fb.FeedbackBuffer(name = feedback) \
+            if feedback is not None else None
+        self.control = ct.ControlBuffer(name = control) \
+            if control is not None else None
+        self.slavePipeSend = slavePipeSend
+        self.slaveStates = st.Publisher(slavePipeSend)
+        self.networkPipeSend = networkPipeSend
+        self.diagnosticsPipeSend = diagnosticsPipeSend
+        self.workers = workers
+
+        self.maxFans = profile[ac.maxFans]
+        self.periodS = profile[ac.periodMS]/1000
+        self.stopped = False
+
+        # Global slave index -> (Worker, local index), and slave data:
+        saved = profile[ac.savedSlaves]
+        self.owners = [None]*len(saved)
+        for worker in workers:
+            for local, index in enumerate(worker.indices):
+                self.owners[index] = (worker, local)
+        self.S = [[index, slave[ac.SV_name], slave[ac.SV_mac],
+            s.SS_DISCONNECTED, slave[ac.SV_maxFans], "MkII(?)"]
+            for index, slave in enumerate(saved)]
+        self.slavesChanged = True
+        self.snapshot = False
+        self.lastMerge = 0.0
+        self.controlStamp = 0.0
+
+        self.commandHandlers = {
+            s.CMD_ADD : self._commandSelected,
+            s.CMD_DISCONNECT : self._commandSelected,
+            s.CMD_REBOOT : self._commandSelected,
+            s.CMD_STOP : self._commandStop,
+            s.CMD_S : self._commandSnapshot,
+        }
+        self.controlHandlers = {
+            s.CTL_DC_SINGLE : self._controlSingle,
+            s.CTL_DC_VECTOR : self._controlVector,
+            s.CTL_DC_SHARED : self._controlShared,
+        }
+
+        self.inputs = {
+            commandPipeRecv : self._onCommand,
+            controlPipeRecv : self._onControl,
+        }
+        for worker in workers:
+            self.inputs[worker.feedbackPipeRecv] = \
+                lambda c, w = worker: self._onFeedback(w, c.recv())
+            self.inputs[worker.slavePipeRecv] = \
+                lambda c, w = worker: self._onSlaves(w, c.recv())
+            self.inputs[worker.networkPipeRecv] = \
+                lambda c, w = worker: self._onNetwork(w, c.recv())
+            if worker.diagnosticsPipeRecv is not None:
+                self.inputs[worker.diagnosticsPipeRecv] = \
+                    lambda c, w = worker: self._onDiagnostics(w, c.recv())
+
+    # API ......................................................................
+    def run(self):
+        """
+        Forward and merge vectors until a stop command is received. Blocks.
+        """
+        self.prints("Coordinating {} workers".format(len(self.workers)))
+        while not self.stopped:
+            for connection in mpc.wait(tuple(self.inputs), self.periodS):
+                try:
+                    self.inputs[connection](connection)
+                except (EOFError, OSError):
+                    self.printe("Lost pipe to a back-end worker or the "\
+                        "front-end")
+                    del self.inputs[connection]
+                except Exception as e:
+                    self.printx(e, "Exception in shard coordinator:")
+
+            if self._due():
+                self._merge()
+
+    # Input ....................................................................
+    def _onCommand(self, connection):
+        D = connection.recv()
+        handler = self.commandHandlers.get(D[s.CMD_I_CODE])
+        if handler is None:
+            self._toAll(D, command = True)
+        else:
+            handler(D)
+
+    def _onControl(self, connection):
+        # Control vectors are forwarded with the front-end's time stamp, so
+        # that workers measure latency from the front-end (see fc.standards):
+        self.controlStamp, C = connection.recv()
+        self.controlHandlers[C[s.CTL_I_CODE]](C)
+
+    def _toAll(self, V, command):
+        for worker in self.workers:
+            if command:
+                worker.commandPipeSend.send(V)
+            else:
+                worker.controlPipeSend.send((self.controlStamp, V))
+
+    def _commandSelected(self, D):
+        """
+        Forward a command whose TGT_SELECTED targets are slave indices.
+        """
+        if D[s.CMD_I_TGT_CODE] != s.TGT_SELECTED:
+            self._toAll(D, True)
+            return
+        header = tuple(D[:s.CMD_I_TGT_OFFSET])
+        targets = {worker : [] for worker in self.workers}
+        for index in D[s.CMD_I_TGT_OFFSET:]:
+            worker, local = self.owners[index]
+            targets[worker].append(local)
+        for worker, selection in targets.items():
+            if selection:
+                worker.commandPipeSend.send(header + tuple(selection))
+
+    def _commandStop(self, D):
+        self.printw("Stopping back-end workers")
+        self._toAll(D, True)
+        self.stopped = True
+
+    def _commandSnapshot(self, D):
+        # Merged slave vectors are built here, so answer without the workers:
+        self.snapshot = True
+        self.slavesChanged = True
+
+    def _controlSingle(self, C):
+        if C[s.CTL_I_TGT_CODE] != s.TGT_SELECTED:
+            self._toAll(C, False)
+            return
+        header = tuple(C[:s.CTL_I_SINGLE_TGT_OFFSET])
+        targets = {worker : [] for worker in self.workers}
+        for i in range(s.CTL_I_SINGLE_TGT_OFFSET, len(C), 2):
+            worker, local = self.owners[C[i]]
+            targets[worker] += (local, C[i + 1])
+        for worker, selection in targets.items():
+            if selection:
+                worker.controlPipeSend.send(
+                    (self.controlStamp, header + tuple(selection)))
+
+    def _controlVector(self, C):
+        """
+        Split a DC vector into the slices of each worker, in local order.
+        """
+        header = tuple(C[:s.CTL_I_VECTOR_DC_OFFSET])
+        M = self.maxFans
+        offset = s.CTL_I_VECTOR_DC_OFFSET
+        L = len(C)
+        for worker in self.workers:
+            C_w = list(header)
+            for index in worker.indices:
+                start = offset + index*M
+                if start >= L:
+                    break
+                C_w += C[start:start + M]
+            worker.controlPipeSend.send((self.controlStamp, tuple(C_w)))
+
+    def _controlShared(self, C):
+        """
+        Copy the DCs that changed in the shared ControlBuffer into those of the
+        workers that handle the slaves concerned, and notify the workers.
+        """
+        changes = self.control.read(C[s.CTL_I_SHARED_SEQ]) \
+            if self.control is not None else None
+        if changes is None:
+            return
+        shares = {}
+        for index, dcs in zip(*changes):
+            owner = self.owners[index] if index < len(self.owners) else None
+            if owner is not None:
+                worker, local = owner
+                if worker.control is not None and \
+                    local < worker.control.slaves:
+                    locals_, rows = shares.setdefault(worker, ([], []))
+                    locals_.append(local)
+                    rows.append(dcs)
+        header = tuple(C[:s.CTL_I_SHARED_SEQ])
+        for worker, (locals_, rows) in shares.items():
+            notice = worker.control.update(locals_, rows, max(locals_) + 1)
+            if notice is not None:
+                worker.controlPipeSend.send((self.controlStamp,
+                    header + (notice,)))
+
+    # Output ...................................................................
+    def _onFeedback(self, worker, F):
+        worker.F = F
+        worker.fresh = True
+
+    def _onSlaves(self, worker, message):
+        """
+        Translate the local indices of a worker's slave vector message and
+        store the records in it. (Worker pipes do not lose messages, so their
+        generation counters need no checking.)
+        """
+        S = message[s.SV_I_VECTOR]
+        for i in range(0, len(S), s.SD_LEN):
+            local = S[i + s.SD_INDEX]
+            while local >= len(worker.indices):
+                # Slave found by this worker
+                index = len(self.owners)
+                worker.indices.append(index)
+                self.owners.append((worker, len(worker.indices) - 1))
+                self.S.append(None)
+            index = worker.indices[local]
+            record = list(S[i:i + s.SD_LEN])
+            record[s.SD_INDEX] = index
+            if self.S[index] != record:
+                self.S[index] = record
+                self.slavesChanged = True
+
+    def _onNetwork(self, worker, N):
+        if N and N[0] == s.TM_CODE:
+            # Timing vectors are per worker. Label their tasks with it:
+            T = list(N)
+            for i in range(s.TM_I_OFFSET, len(T), s.TM_LEN):
+                T[i + s.TM_I_NAME] = "{}:{}".format(worker.number,
+                    T[i + s.TM_I_NAME])
+            self.networkPipeSend.send(T)
+        elif worker.number == 0:
+            # All workers share the network settings. Report those of the
+            # first:
+            self.networkPipeSend.send(N)
+
+    def _onDiagnostics(self, worker, G):
+        """
+        Translate the local indices of a worker's diagnostics array and forward
+        it to the front-end. Arrays are not merged: each worker's covers only
+        its own slaves. Rows of slaves not yet listed are left out.
+        """
+        if self.diagnosticsPipeSend is None:
+            return
+        known = G[:, s.DG_I_INDEX] < len(worker.indices)
+        G = G[known]
+        G[:, s.DG_I_INDEX] = [worker.indices[int(local)]
+            for local in G[:, s.DG_I_INDEX]]
+        self.diagnosticsPipeSend.send(G)
+
+    def _due(self):
+        """
+        Return whether it is time to send merged vectors to the front-end:
+        once every worker has reported new feedback, or one period after the
+        last merge if any has (so that a stalled worker stalls nobody else).
+        """
+        fresh = [worker.fresh for worker in self.workers]
+        if all(fresh):
+            return True
+        return any(fresh) and tm.monotonic() - self.lastMerge >= self.periodS
+
+    def _merge(self):
+        """
+        Send the merged slave and feedback vectors to the front-end.
+        """
+        self.lastMerge = tm.monotonic()
+        if self.slavesChanged and None not in self.S:
+            self.slaveStates.publish(self.S, self.snapshot)
+            self.slavesChanged = False
+            self.snapshot = False
+
+        M = self.maxFans
+        G = len(self.owners)
+        shared = self.feedback is not None and self.feedback.fits(G)
+        if shared:
+            R, D = self.feedback.begin()
+            R[:M*G] = s.RIP
+            D[:M*G] = s.RIP
+        else:
+            R = [s.RIP]*(M*G)
+            D = [s.RIP]*(M*G)
+        for worker in self.workers:
+            worker.fresh = False
+            if worker.F is None:
+                continue
+            half = len(worker.F)//2
+            for local, index in enumerate(worker.indices[:half//M]):
+                R[index*M:(index + 1)*M] = worker.F[local*M:(local + 1)*M]
+                D[index*M:(index + 1)*M] = \
+                    worker.F[half + local*M:half + (local + 1)*M]
+        if shared:
+            self.feedback.commit(G, self.feedbackPipeSend)
+        else:
+            self.feedbackPipeSend.send(R + D)
@@ -0,0 +1,143 @@
+################################################################################
+##----------------------------------------------------------------------------##
+## CALIFORNIA INSTITUTE OF TECHNOLOGY ## GRADUATE AEROSPACE LABORATORY ##     ##
+## CENTER FOR AUTONOMOUS SYSTEMS AND TECHNOLOGIES                      ##     ##
+##----------------------------------------------------------------------------##
+##      ____      __      __  __      _____      __      __    __    ____     ##
+##     / __/|   _/ /|    / / / /|  _- __ __\    / /|    / /|  / /|  / _  \    ##
+##    / /_ |/  / /  /|  /  // /|/ / /|__| _|   / /|    / /|  / /|/ /   --||   ##
+##   / __/|/ _/    /|/ /   / /|/ / /|    __   / /|    / /|  / /|/ / _  \|/    ##
+##  / /|_|/ /  /  /|/ / // //|/ / /|__- / /  / /___  / -|_ - /|/ /     /|     ##
+## /_/|/   /_/ /_/|/ /_/ /_/|/ |\ ___--|_|  /_____/| |-___-_|/  /____-/|/     ##
+## |_|/    |_|/|_|/  |_|/|_|/   \|___|-    |_____|/   |___|     |____|/       ##
+##                   _ _    _    ___   _  _      __  __   __                  ##
+##                  | | |  | |  | T_| | || |    |  ||_ | | _|                 ##
+##                  | _ |  |T|  |  |  |  _|      ||   \\_//                   ##
+##                  || || |_ _| |_|_| |_| _|    |__|  |___|                   ##
+##                                                                            ##
+##----------------------------------------------------------------------------##
+## Alejandro A. Stefan Zavala ## <astefanz@berkeley.edu>   ##                 ##
+## Chris J. Dougherty         ## <cdougher@caltech.edu>    ##                 ##
+## Marcel Veismann            ## <mveisman@caltech.edu>    ##                 ##
+################################################################################
+
+""" ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+ + Change-driven slave data vectors between the communications back-end and
+ + the front-end.
+ +
+ + Slave data rarely changes once an array is up, so instead of sending every
+ + slave's record each period the back-end sends a snapshot of all of them
+ + when it starts (or when asked to with CMD_S) and, afterwards, only the
+ + records that changed, if any. Each message carries a generation counter so
+ + that receivers can tell when they missed one. See fc.standards for the form
+ + of these messages.
+ +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
+
+## IMPORTS #####################################################################
+import threading as mt
+
+import fc.standards as s
+
+## AUXILIARY FUNCTIONS #########################################################
+def records(S):
+    """
+    Return an iterator over the per-slave records (tuples) of the slave data
+    vector S.
+    """
+    return (tuple(S[i:i + s.SD_LEN]) for i in range(0, len(S), s.SD_LEN))
+
+def flatten(records):
+    """
+    Return the slave data vector (list) made of RECORDS, in order.
+    """
+    S = []
+    for record in records:
+        S.extend(record)
+    return S
+
+## CLASSES #####################################################################
+class Publisher:
+    """
+    Back-end side: sends slave records through a pipe when they change.
+    """
+
+    def __init__(self, pipe):
+        """
+        - pipe := multiprocessing Connection through which to send messages.
+        """
+        self.pipe = pipe
+        self.sent = {}
+        self.generation = 0
+        self.lock = mt.Lock()
+
+    def publish(self, records, snapshot = False):
+        """
+        Send the slave records (sequences in slave data vector form) among
+        RECORDS that changed since they were last sent. All of them are sent,
+        as a snapshot, if SNAPSHOT is True or nothing has been sent yet.
+        Returns whether a message was sent. Thread-safe.
+        """
+        with self.lock:
+            snapshot = snapshot or self.generation == 0
+            changed = []
+            for record in records:
+                record = tuple(record)
+                index = record[s.SD_INDEX]
+                if snapshot or self.sent.get(index) != record:
+                    self.sent[index] = record
+                    changed.append(record)
+            if not changed and not snapshot:
+                return False
+            self.generation += 1
+            self.pipe.send((s.SV_SNAPSHOT if snapshot else s.SV_DELTA,
+                self.generation, flatten(changed)))
+            return True
+
+class Table:
+    """
+    Receiving side: the latest record of every slave, kept up to date with the
+    messages sent by a Publisher.
+    """
+
+    def __init__(self):
+        self.records = {}
+        self.generation = None
+
+    def apply(self, message):
+        """
+        Update the table with MESSAGE, as sent by a Publisher. Returns a tuple
+        (S, gap), where S is the slave data vector of the records that actually
+        changed and GAP is whether a delta was missed before this message (in
+        which case a snapshot should be requested).
+        """
+        kind, generation, S = message
+        gap = kind == s.SV_DELTA and (self.generation is None
+            or generation != self.generation + 1)
+        self.generation = generation
+        return self.update(S), gap
+
+    def update(self, S):
+        """
+        Update the table with the records in the slave data vector S. Returns
+        the slave data vector of those records that actually changed.
+        """
+        changed = []
+        for record in records(S):
+            index = record[s.SD_INDEX]
+            if self.records.get(index) != record:
+                self.records[index] = record
+                changed.append(record)
+        return flatten(changed)
+
+    def vector(self):
+        """
+        Return the slave data vector of every slave in the table, by index.
+        """
+        return flatten(self.records[index] for index in sorted(self.records))
+
+    def count(self, status):
+        """
+        Return how many slaves in the table have status code STATUS.
+        """
+        return sum(record[s.SD_STATUS] == status
+            for record in self.records.values())
@@ -0,0 +1,194 @@
+################################################################################
+##----------------------------------------------------------------------------##
+## CALIFORNIA INSTITUTE OF TECHNOLOGY ## GRADUATE AEROSPACE LABORATORY ##     ##
+## CENTER FOR AUTONOMOUS SYSTEMS AND TECHNOLOGIES                      ##     ##
+##----------------------------------------------------------------------------##
+##      ____      __      __  __      _____      __      __    __    ____     ##
+##     / __/|   _/ /|    / / / /|  _- __ __\    / /|    / /|  / /|  / _  \    ##
+##    / /_ |/  / /  /|  /  // /|/ / /|__| _|   / /|    / /|  / /|/ /   --||   ##
+##   / __/|/ _/    /|/ /   / /|/ / /|    __   / /|    / /|  / /|/ / _  \|/    ##
+##  / /|_|/ /  /  /|/ / // //|/ / /|__- / /  / /___  / -|_ - /|/ /     /|     ##
+## /_/|/   /_/ /_/|/ /_/ /_/|/ |\ ___--|_|  /_____/| |-___-_|/  /____-/|/     ##
+## |_|/    |_|/|_|/  |_|/|_|/   \|___|-    |_____|/   |___|     |____|/       ##
+##                   _ _    _    ___   _  _      __  __   __                  ##
+##                  | | |  | |  | T_| | || |    |  ||_ | | _|                 ##
+##                  | _ |  |T|  |  |  |  _|      ||   \\_//                   ##
+##                  || || |_ _| |_|_| |_| _|    |__|  |___|                   ##
+##                                                                            ##
+##----------------------------------------------------------------------------##
+## Alejandro A. Stefan Zavala ## <astefanz@berkeley.edu>   ##                 ##
+## Chris J. Dougherty         ## <cdougher@caltech.edu>    ##                 ##
+## Marcel Veismann            ## <mveisman@caltech.edu>    ##                 ##
+################################################################################
+
+""" ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+ + Benchmark of the MkIII back-end's discovery listener: how long it takes to
+ + take in the burst of MkII replies that follows a broadcast.
+ +
+ + Run from the master directory:
+ +
+ +      python3 -m fc.benchmarks.discovery [-n 100 1000] [-s known new]
+ +
+ + For each array size and scenario, a back-end (SELECTOR engine) is built in a
+ + child process and N broadcast replies are sent to its listener socket over
+ + the loopback interface in one burst. In the "known" scenario every replying
+ + slave is saved in the profile; in the "new" scenario none is, so each reply
+ + adds a slave. The time from the first reply sent to the last one processed
+ + is reported, along with any replies that were dropped. Separately, the cost
+ + of looking up every slave by MAC address is compared between the listener's
+ + index and the linear scan over the slave list it replaced.
+ +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
+
+## IMPORTS #####################################################################
+import argparse
+import socket
+import threading as mt
+import multiprocessing as mp
+import multiprocessing.connection as mpc
+import time as tm
+import timeit
+
+from fc import archive as ac
+from fc.backend.mkiii import FCCommunicator as fcc
+from fc.benchmarks import engines as eb
+from fc.simulator import array as sa
+
+## CONSTANTS ###################################################################
+DEFAULT_SIZES = (100, 1000)
+SCENARIOS = ("known", "new")
+QUIET_S = 1.0
+TIMEOUT_S = 30
+REPEAT = 5
+
+## BENCHMARK ###################################################################
+def drain(connections, stopped):
+    """
+    Discard whatever arrives on CONNECTIONS until STOPPED is set.
+    """
+    while not stopped.is_set():
+        for connection in mpc.wait(connections, 0.1):
+            eb.drain(connection)
+
+def lookups(slaves, indices, macs):
+    """
+    Return the best times, in seconds, of looking up every MAC address in
+    MACS through the list SLAVES and through the dictionary INDICES.
+    """
+    def scan():
+        for mac in macs:
+            for slave in slaves:
+                if slave.getMAC() == mac:
+                    break
+
+    def index():
+        for mac in macs:
+            indices.get(mac)
+
+    return tuple(min(timeit.repeat(routine, number = 1, repeat = REPEAT))
+        for routine in (scan, index))
+
+def scenario(N, known, result):
+    """
+    Send a burst of N broadcast replies to a fresh back-end and send a
+    dictionary of results through the Connection RESULT. To be run in its own
+    process, as back-ends cannot be stopped cleanly otherwise.
+    """
+    sink = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sink.bind((sa.DEFAULT_IP, 0))
+    port = sink.getsockname()[1]
+
+    profile = eb.make_profile(N if known else 0, port, ac.ENGINE_SELECTOR)
+    ends = [mp.Pipe(False) for _ in range(5)]
+    pqueue = mp.Queue()
+    stopped = mt.Event()
+    mt.Thread(target = drain, daemon = True,
+        args = ([end[0] for end in ends[2:]] + [pqueue._reader], stopped)
+        ).start()
+
+    comms = fcc.FCCommunicator(profile, ends[0][0], ends[1][0], ends[2][1],
+        ends[3][1], ends[4][1], pqueue)
+
+    processed = [0, None]
+    done = mt.Event()
+    process = comms._processListener
+    def counted(message, sender):
+        process(message, sender)
+        processed[0] += 1
+        processed[1] = tm.perf_counter()
+        if processed[0] == N:
+            done.set()
+    comms._processListener = counted
+
+    macs = [sa.mac(index) for index in range(N)]
+    replies = [bytearray("A|{}|{}|N|{}|{}|{}".format(profile[ac.passcode],
+        mac, port, port, sa.DEFAULT_VERSION), 'ascii') for mac in macs]
+    target = (sa.DEFAULT_IP, comms.listenerPort)
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    start = tm.perf_counter()
+    for reply in replies:
+        sender.sendto(reply, target)
+    deadline = start + TIMEOUT_S
+    last = -1
+    while not done.wait(QUIET_S) and tm.perf_counter() < deadline \
+        and processed[0] != last:
+        last = processed[0]
+
+    count, end = processed
+    scan, index = lookups(comms.slaves, comms.macIndices, macs)
+    result.send({
+        "scenario" : "known" if known else "new",
+        "slaves" : N,
+        "burst_s" : (end - start) if end is not None else float("nan"),
+        "dropped" : N - count,
+        "total" : len(comms.slaves),
+        "scan_s" : scan,
+        "index_s" : index,
+    })
+    stopped.set()
+    comms.stop()
+
+def benchmark(N, name):
+    """
+    Run one benchmark configuration and return a dictionary of results.
+    """
+    recv, send = mp.Pipe(False)
+    process = mp.Process(target = scenario, args = (N, name == "known", send),
+        daemon = True)
+    process.start()
+    if not recv.poll(TIMEOUT_S + 60):
+        process.terminate()
+        raise RuntimeError("Scenario {} with {} slaves timed out".format(
+            name, N))
+    result = recv.recv()
+    process.join(5)
+    if process.is_alive():
+        process.terminate()
+    return result
+
+def report(result):
+    print("{:>6} {:>6} {:>10.2f} {:>10.1f} {:>8} {:>12.1f} {:>12.1f}".format(
+        result["scenario"], result["slaves"], result["burst_s"]*1e3,
+        result["burst_s"]*1e6/result["slaves"], result["dropped"],
+        result["scan_s"]*1e6, result["index_s"]*1e6))
+
+## MAIN ########################################################################
+def main(argv = None):
+    parser = argparse.ArgumentParser(description =
+        "Time the back-end's handling of a burst of broadcast replies")
+    parser.add_argument("-n", "--slaves", type = int, nargs = "+",
+        default = DEFAULT_SIZES, help = "Array sizes")
+    parser.add_argument("-s", "--scenarios", nargs = "+",
+        default = SCENARIOS, choices = SCENARIOS,
+        help = "Whether the replying slaves are saved in the profile")
+    args = parser.parse_args(argv)
+
+    print("{:>6} {:>6} {:>10} {:>10} {:>8} {:>12} {:>12}".format(
+        "SCENE", "SLAVES", "BURST_MS", "US/REPLY", "DROPPED", "SCAN_US",
+        "INDEX_US"))
+    for N in args.slaves:
+        for name in args.scenarios:
+            report(benchmark(N, name))
+
+if __name__ == "__main__":
+    main()
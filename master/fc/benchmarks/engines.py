@@ -0,0 +1,356 @@
+################################################################################
+##----------------------------------------------------------------------------##
+## CALIFORNIA INSTITUTE OF TECHNOLOGY ## GRADUATE AEROSPACE LABORATORY ##     ##
+## CENTER FOR AUTONOMOUS SYSTEMS AND TECHNOLOGIES                      ##     ##
+##----------------------------------------------------------------------------##
+##      ____      __      __  __      _____      __      __    __    ____     ##
+##     / __/|   _/ /|    / / / /|  _- __ __\    / /|    / /|  / /|  / _  \    ##
+##    / /_ |/  / /  /|  /  // /|/ / /|__| _|   / /|    / /|  / /|/ /   --||   ##
+##   / __/|/ _/    /|/ /   / /|/ / /|    __   / /|    / /|  / /|/ / _  \|/    ##
+##  / /|_|/ /  /  /|/ / // //|/ / /|__- / /  / /___  / -|_ - /|/ /     /|     ##
+## /_/|/   /_/ /_/|/ /_/ /_/|/ |\ ___--|_|  /_____/| |-___-_|/  /____-/|/     ##
+## |_|/    |_|/|_|/  |_|/|_|/   \|___|-    |_____|/   |___|     |____|/       ##
+##                   _ _    _    ___   _  _      __  __   __                  ##
+##                  | | |  | |  | T_| | || |    |  ||_ | | _|                 ##
+##                  | _ |  |T|  |  |  |  _|      ||   \\_//                   ##
+##                  || || |_ _| |_|_| |_| _|    |__|  |___|                   ##
+##                                                                            ##
+##----------------------------------------------------------------------------##
+## Alejandro A. Stefan Zavala ## <astefanz@berkeley.edu>   ##                 ##
+## Chris J. Dougherty         ## <cdougher@caltech.edu>    ##                 ##
+## Marcel Veismann            ## <mveisman@caltech.edu>    ##                 ##
+################################################################################
+
+""" ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+ + Compare the CPU use and feedback latency of the back-end's communications
+ + engines (see fc.archive.ENGINES) against arrays of virtual slaves.
+ +
+ + Run from the master directory:
+ +
+ +      python3 -m fc.benchmarks.engines [-n 10 100 500] [-e THREADED SELECTOR]
+ +          [--loss 0.01] [--latency 2]
+ +
+ + For each engine and array size, the real back-end is started, through
+ + fc.backend.communicator, against a fc.simulator VirtualArray. Once all
+ + slaves are connected, CPU use of the back-end processes is sampled over a
+ + steady-state window. Then the duty cycle of the whole array is stepped
+ + repeatedly, and the time until every slave reports the new duty cycle in
+ + the feedback vector is recorded. The median round trip time and MISO loss
+ + rate of the slaves are taken from the last diagnostics array received.
+ + Loss and latency may be added to the traffic of the virtual slaves (see
+ + fc.simulator.link).
+ +
+ + NOTE: CPU use is read from /proc and is therefore only reported on Linux.
+ +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
+
+## IMPORTS #####################################################################
+import os
+import sys
+import argparse
+import copy as cp
+import threading as mt
+import multiprocessing as mp
+import multiprocessing.connection as mpc
+import time as tm
+
+from fc import archive as ac, printer as pt, standards as s, utils as us
+from fc.backend import communicator as cm, states as st
+from fc.simulator import array as sa, cluster as sc, link as sl
+
+## CONSTANTS ###################################################################
+DEFAULT_SIZES = (10, 100, 500)
+DEFAULT_PERIOD_MS = 100
+DEFAULT_WINDOW_S = 5
+DEFAULT_STEPS = 10
+CONNECT_TIMEOUT_S = 120
+STEP_TIMEOUT_S = 5
+TOLERANCE = 1e-3
+
+## AUXILIARY FUNCTIONS #########################################################
+def cpu_seconds(pid):
+    """
+    Return the user plus system CPU time, in seconds, used so far by the
+    process PID, or None if it cannot be read on this platform.
+    """
+    try:
+        with open("/proc/{}/stat".format(pid)) as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12]))/os.sysconf("SC_CLK_TCK")
+    except (OSError, IndexError, ValueError):
+        return None
+
+def percentile(values, p):
+    """
+    Return the P-th percentile (0 <= P <= 100) of VALUES (nearest rank).
+    """
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(p/100*(len(ordered) - 1))))]
+
+def make_profile(N, port, engine, periodMS = DEFAULT_PERIOD_MS,
+    fans = sa.DEFAULT_FANS, workers = 1, wireFormat = ac.FORMAT_BINARY):
+    """
+    Build a profile in which the N virtual modules of a VirtualArray that
+    listens on PORT are saved slaves.
+    """
+    profile = cp.deepcopy(ac.FCArchive.DEFAULT)
+    profile[ac.platform] = us.platform()
+    profile[ac.name] = "Benchmark ({} virtual slaves)".format(N)
+    profile[ac.broadcastIP] = sa.DEFAULT_IP
+    profile[ac.broadcastPort] = port
+    profile[ac.broadcastPeriodMS] = 250
+    profile[ac.periodMS] = periodMS
+    profile[ac.maxFans] = fans
+    profile[ac.commsEngine] = engine
+    profile[ac.commsWorkers] = workers
+    profile[ac.commsFormat] = wireFormat
+    profile[ac.defaultSlave][ac.SV_maxFans] = fans
+    profile[ac.socketLimit] = max(1024, 4*N + 64)
+
+    saved = []
+    for index in range(N):
+        slave = cp.deepcopy(profile[ac.defaultSlave])
+        slave[ac.SV_name] = "Virtual {}".format(index + 1)
+        slave[ac.SV_mac] = sa.mac(index)
+        saved.append(slave)
+    profile[ac.savedSlaves] = tuple(saved)
+    return profile
+
+def drain(connection):
+    """
+    Discard whatever is waiting on the multiprocessing Connection CONNECTION.
+    """
+    try:
+        while connection.poll():
+            connection.recv()
+    except (EOFError, OSError):
+        pass
+
+## BENCHMARK ###################################################################
+class Run:
+    """
+    One back-end against one virtual array. SETTINGS, if given, is a
+    dictionary of profile attributes to override. SIMULATION, if given, is a
+    dictionary of arguments for the fc.simulator Cluster (e.g. processes,
+    link, dynamics).
+    """
+
+    def __init__(self, N, engine, periodMS, verbose = False, workers = 1,
+        wireFormat = ac.FORMAT_BINARY, settings = None, simulation = None):
+        self.N = N
+        self.engine = engine
+        self.periodMS = periodMS
+        self.verbose = verbose
+
+        self.array = sc.Cluster(N, **(simulation or {}))
+        self.array.start()
+        port = self.array.port
+
+        self.pqueue = mp.Queue()
+        self.printer = mt.Thread(target = self._printRoutine, daemon = True)
+        self.printer.start()
+
+        self.feedbackRecv, feedbackSend = mp.Pipe(False)
+        self.slaveRecv, slaveSend = mp.Pipe(False)
+        self.networkRecv, networkSend = mp.Pipe(False)
+        self.diagnosticsRecv, diagnosticsSend = mp.Pipe(False)
+
+        profile = make_profile(N, port, engine, periodMS, workers = workers,
+            wireFormat = wireFormat)
+        profile.update(settings or {})
+        self.archive = ac.FCArchive(self.pqueue, "Benchmark", profile)
+        self.comms = cm.FCCommunicator(feedbackSend, slaveSend, networkSend,
+            self.archive, self.pqueue, diagnosticsSend)
+        self.comms.start()
+
+        self.F = None
+        self.G = None
+        self.connected = 0
+        self.slaves = st.Table()
+
+    def _printRoutine(self):
+        while True:
+            message = self.pqueue.get()
+            if message == s.END:
+                break
+            if self.verbose:
+                for code, text in pt.messages(message):
+                    print(text)
+
+    def poll(self, timeout):
+        """
+        Receive whatever the back-end sends within TIMEOUT seconds. Returns
+        whether a new feedback vector was received.
+        """
+        fresh = False
+        for connection in mpc.wait((self.feedbackRecv, self.slaveRecv,
+            self.networkRecv, self.diagnosticsRecv), timeout):
+            if connection is self.feedbackRecv:
+                F = self.comms.readFeedback(connection.recv())
+                if F is not None:
+                    self.F = F
+                    fresh = True
+            elif connection is self.slaveRecv:
+                self.slaves.apply(connection.recv())
+                self.connected = self.slaves.count(s.SS_CONNECTED)
+            elif connection is self.diagnosticsRecv:
+                self.G = connection.recv()
+            else:
+                connection.recv()
+        return fresh
+
+    def connect(self):
+        """
+        Wait for all virtual slaves to connect. Returns the time it took.
+        """
+        start = tm.monotonic()
+        while self.connected < self.N:
+            if tm.monotonic() - start > CONNECT_TIMEOUT_S:
+                raise RuntimeError("Only {}/{} slaves connected".format(
+                    self.connected, self.N))
+            self.poll(0.1)
+        return tm.monotonic() - start
+
+    def cpuSeconds(self):
+        """
+        Return the CPU time used so far by all back-end processes, or None if
+        unavailable.
+        """
+        total = 0
+        for process in [self.comms.process] + self.comms.workers:
+            seconds = cpu_seconds(process.pid)
+            if seconds is None:
+                return None
+            total += seconds
+        return total
+
+    def cpu(self, window):
+        """
+        Return the back-end's CPU use, as a fraction of one core, over WINDOW
+        seconds, or None if unavailable.
+        """
+        before = self.cpuSeconds()
+        start = tm.monotonic()
+        while tm.monotonic() - start < window:
+            self.poll(0.1)
+        after = self.cpuSeconds()
+        if before is None or after is None:
+            return None
+        return (after - before)/(tm.monotonic() - start)
+
+    def latency(self, steps):
+        """
+        Step the duty cycle of the whole array STEPS times and return the list
+        of times, in seconds, until the feedback vector reflected each step.
+        """
+        results = []
+        fans = sa.DEFAULT_FANS
+        for step in range(steps):
+            dc = round(0.1 + 0.8*((step % 2) + step/steps)/2, 3)
+            self.comms.controlIn((dc,)*(fans*self.N))
+            start = tm.monotonic()
+            while tm.monotonic() - start < STEP_TIMEOUT_S:
+                if self.poll(0.05) and self._reached(dc):
+                    results.append(tm.monotonic() - start)
+                    break
+        return results
+
+    def link(self):
+        """
+        Return the median RTT, in seconds, and the median MISO loss rate of the
+        slaves in the last diagnostics array received (NaN where unknown).
+        """
+        if self.G is None:
+            return float("nan"), float("nan")
+        return tuple(percentile([value for value in self.G[:, column]
+            if value != s.DG_NONE], 50)
+            for column in (s.DG_I_RTT, s.DG_I_LOSS))
+
+    def _reached(self, dc):
+        D = self.F[len(self.F)//2:]
+        return all(abs(value - dc) < TOLERANCE for value in D)
+
+    def stop(self):
+        # Keep reading so that the back-end does not block on full pipes:
+        stopper = mt.Thread(target = self.comms.stop, daemon = True)
+        stopper.start()
+        while stopper.is_alive():
+            self.poll(0.1)
+        self.comms.release()
+        self.array.stop()
+        self.pqueue.put(s.END)
+
+def benchmark(N, engine, periodMS = DEFAULT_PERIOD_MS,
+    window = DEFAULT_WINDOW_S, steps = DEFAULT_STEPS, verbose = False,
+    wireFormat = ac.FORMAT_BINARY, loss = 0.0, latencyMS = 0.0):
+    """
+    Run one benchmark configuration and return a dictionary of results.
+    """
+    run = Run(N, engine, periodMS, verbose, wireFormat = wireFormat,
+        simulation = {"link" : sl.Link(loss, latencyMS/1000)})
+    try:
+        connect = run.connect()
+        cpu = run.cpu(window)
+        latencies = run.latency(steps)
+        rtt, loss = run.link()
+    finally:
+        run.stop()
+    return {
+        "engine" : engine,
+        "slaves" : N,
+        "periodMS" : periodMS,
+        "format" : wireFormat,
+        "connect_s" : connect,
+        "cpu" : cpu,
+        "latency_p50_s" : percentile(latencies, 50),
+        "latency_p95_s" : percentile(latencies, 95),
+        "missed_steps" : steps - len(latencies),
+        "rtt_p50_s" : rtt,
+        "loss_p50" : loss,
+    }
+
+def report(result):
+    cpu = result["cpu"]
+    print("{:>9} {:>6} {:>10.2f} {:>8} {:>10.1f} {:>10.1f} {:>7} {:>8.2f} "\
+        "{:>7.1%}".format(
+        result["engine"], result["slaves"], result["connect_s"],
+        "{:.1%}".format(cpu) if cpu is not None else "N/A",
+        result["latency_p50_s"]*1000, result["latency_p95_s"]*1000,
+        result["missed_steps"], result["rtt_p50_s"]*1000,
+        result["loss_p50"]))
+
+## MAIN ########################################################################
+def main(argv = None):
+    parser = argparse.ArgumentParser(description =
+        "Compare the CPU use and feedback latency of the back-end engines")
+    parser.add_argument("-n", "--slaves", type = int, nargs = "+",
+        default = DEFAULT_SIZES, help = "Array sizes to simulate")
+    parser.add_argument("-e", "--engines", nargs = "+", default = ac.ENGINES,
+        choices = ac.ENGINES, help = "Engines to compare")
+    parser.add_argument("-p", "--period", type = int,
+        default = DEFAULT_PERIOD_MS, help = "Communication period (ms)")
+    parser.add_argument("-w", "--window", type = float,
+        default = DEFAULT_WINDOW_S, help = "CPU sampling window (s)")
+    parser.add_argument("-f", "--format", default = ac.FORMAT_BINARY,
+        choices = ac.FORMATS, help = "Wire format to offer the slaves")
+    parser.add_argument("-s", "--steps", type = int, default = DEFAULT_STEPS,
+        help = "Duty cycle steps for latency measurement")
+    parser.add_argument("--loss", type = float, default = 0.0,
+        help = "Probability that a datagram to or from a slave is dropped")
+    parser.add_argument("--latency", type = float, default = 0.0,
+        help = "Delay added to each datagram to or from a slave (ms)")
+    parser.add_argument("-v", "--verbose", action = "store_true",
+        help = "Show back-end output")
+    args = parser.parse_args(argv)
+
+    print("{:>9} {:>6} {:>10} {:>8} {:>10} {:>10} {:>7} {:>8} {:>7}".format(
+        "ENGINE", "SLAVES", "CONNECT_S", "CPU", "P50_MS", "P95_MS", "MISSED",
+        "RTT_MS", "LOSS"))
+    for N in args.slaves:
+        for engine in args.engines:
+            report(benchmark(N, engine, args.period, args.window, args.steps,
+                args.verbose, args.format, args.loss, args.latency))
+
+if __name__ == "__main__":
+    main()
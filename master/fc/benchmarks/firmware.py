@@ -0,0 +1,137 @@
+################################################################################
+##----------------------------------------------------------------------------##
+## CALIFORNIA INSTITUTE OF TECHNOLOGY ## GRADUATE AEROSPACE LABORATORY ##     ##
+## CENTER FOR AUTONOMOUS SYSTEMS AND TECHNOLOGIES                      ##     ##
+##----------------------------------------------------------------------------##
+##      ____      __      __  __      _____      __      __    __    ____     ##
+##     / __/|   _/ /|    / / / /|  _- __ __\    / /|    / /|  / /|  / _  \    ##
+##    / /_ |/  / /  /|  /  // /|/ / /|__| _|   / /|    / /|  / /|/ /   --||   ##
+##   / __/|/ _/    /|/ /   / /|/ / /|    __   / /|    / /|  / /|/ / _  \|/    ##
+##  / /|_|/ /  /  /|/ / // //|/ / /|__- / /  / /___  / -|_ - /|/ /     /|     ##
+## /_/|/   /_/ /_/|/ /_/ /_/|/ |\ ___--|_|  /_____/| |-___-_|/  /____-/|/     ##
+## |_|/    |_|/|_|/  |_|/|_|/   \|___|-    |_____|/   |___|     |____|/       ##
+##                   _ _    _    ___   _  _      __  __   __                  ##
+##                  | | |  | |  | T_| | || |    |  ||_ | | _|                 ##
+##                  | _ |  |T|  |  |  |  _|      ||   \\_//                   ##
+##                  || || |_ _| |_|_| |_| _|    |__|  |___|                   ##
+##                                                                            ##
+##----------------------------------------------------------------------------##
+## Alejandro A. Stefan Zavala ## <astefanz@berkeley.edu>   ##                 ##
+## Chris J. Dougherty         ## <cdougher@caltech.edu>    ##                 ##
+## Marcel Veismann            ## <mveisman@caltech.edu>    ##                 ##
+################################################################################
+
+""" ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+ + Benchmark of firmware updates (see fc.backend.mkiii.FCFlash) against
+ + arrays of virtual slaves with virtual bootloaders.
+ +
+ + Run from the master directory:
+ +
+ +      python3 -m fc.benchmarks.firmware [-n 300] [-W 32 300] [-c 8]
+ +
+ + For each wave size, the real back-end (SELECTOR engine) is started against
+ + a fc.simulator VirtualArray and, once all slaves are connected, a firmware
+ + update is started with a random image. Every virtual slave is rebooted into
+ + its bootloader, downloads the image from the back-end's firmware server and
+ + reconnects with the new version. The time until all slaves are connected
+ + again with the new version is reported, along with the aggregate download
+ + throughput (image size times slaves over that time). A wave as large as the
+ + array admits every bootloader at once, as before waves were introduced.
+ +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
+
+## IMPORTS #####################################################################
+import os
+import argparse
+import tempfile
+import time as tm
+
+from fc import archive as ac, standards as s
+from fc.benchmarks import engines as be
+
+## CONSTANTS ###################################################################
+DEFAULT_SLAVES = 300
+DEFAULT_WAVES = (32, 300)
+DEFAULT_CONCURRENCY = 8
+DEFAULT_SIZE_KB = 256
+DEFAULT_PERIOD_MS = 100
+VERSION = "SIMV2"
+UPDATE_TIMEOUT_S = 300
+
+## BENCHMARK ###################################################################
+def updated(run):
+    """
+    Return how many of RUN's slaves are connected with the new version.
+    """
+    return sum(record[s.SD_STATUS] == s.SS_CONNECTED and \
+        record[s.SD_VERSION] == VERSION
+        for record in run.slaves.records.values())
+
+def benchmark(N, wave, concurrency, sizeKB = DEFAULT_SIZE_KB,
+    periodMS = DEFAULT_PERIOD_MS, verbose = False):
+    """
+    Run one benchmark configuration and return a dictionary of results.
+    """
+    run = be.Run(N, ac.ENGINE_SELECTOR, periodMS, verbose,
+        settings = {ac.flashWave : wave, ac.flashConcurrency : concurrency})
+    size = sizeKB*1024
+    with tempfile.TemporaryDirectory() as directory:
+        # Virtual bootloaders take the name of the image as the new version:
+        filename = os.path.join(directory, VERSION + ".bin")
+        with open(filename, 'wb') as image:
+            image.write(os.urandom(size))
+        try:
+            connect = run.connect()
+            start = tm.monotonic()
+            run.comms.startBootloader(filename, VERSION, size)
+            while updated(run) < N:
+                if tm.monotonic() - start > UPDATE_TIMEOUT_S:
+                    raise RuntimeError("Only {}/{} slaves updated".format(
+                        updated(run), N))
+                run.poll(0.1)
+            elapsed = tm.monotonic() - start
+            run.comms.stopBootloader()
+        finally:
+            run.stop()
+    return {
+        "slaves" : N,
+        "wave" : wave,
+        "concurrency" : concurrency,
+        "size_b" : size,
+        "connect_s" : connect,
+        "update_s" : elapsed,
+        "throughput_bps" : N*size/elapsed,
+    }
+
+def report(result):
+    print("{:>6} {:>6} {:>11} {:>8} {:>10.2f} {:>10.2f} {:>10.1f}".format(
+        result["slaves"], result["wave"], result["concurrency"],
+        result["size_b"]//1024, result["connect_s"], result["update_s"],
+        result["throughput_bps"]/1e6))
+
+## MAIN ########################################################################
+def main(argv = None):
+    parser = argparse.ArgumentParser(description =
+        "Measure how long a firmware update of a virtual array takes")
+    parser.add_argument("-n", "--slaves", type = int, default = DEFAULT_SLAVES,
+        help = "Array size to simulate")
+    parser.add_argument("-W", "--waves", type = int, nargs = "+",
+        default = DEFAULT_WAVES, help = "Wave sizes to compare")
+    parser.add_argument("-c", "--concurrency", type = int,
+        default = DEFAULT_CONCURRENCY, help = "Most downloads at once")
+    parser.add_argument("-s", "--size", type = int, default = DEFAULT_SIZE_KB,
+        help = "Image size (kB)")
+    parser.add_argument("-p", "--period", type = int,
+        default = DEFAULT_PERIOD_MS, help = "Communication period (ms)")
+    parser.add_argument("-v", "--verbose", action = "store_true",
+        help = "Show back-end output")
+    args = parser.parse_args(argv)
+
+    print("{:>6} {:>6} {:>11} {:>8} {:>10} {:>10} {:>10}".format(
+        "SLAVES", "WAVE", "CONCURRENCY", "IMAGE_KB", "CONNECT_S", "UPDATE_S",
+        "MB/S"))
+    for wave in args.waves:
+        report(benchmark(args.slaves, wave, args.concurrency, args.size,
+            args.period, args.verbose))
+
+if __name__ == "__main__":
+    main()
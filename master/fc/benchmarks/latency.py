@@ -0,0 +1,278 @@
+################################################################################
+##----------------------------------------------------------------------------##
+## CALIFORNIA INSTITUTE OF TECHNOLOGY ## GRADUATE AEROSPACE LABORATORY ##     ##
+## CENTER FOR AUTONOMOUS SYSTEMS AND TECHNOLOGIES                      ##     ##
+##----------------------------------------------------------------------------##
+##      ____      __      __  __      _____      __      __    __    ____     ##
+##     / __/|   _/ /|    / / / /|  _- __ __\    / /|    / /|  / /|  / _  \    ##
+##    / /_ |/  / /  /|  /  // /|/ / /|__| _|   / /|    / /|  / /|/ /   --||   ##
+##   / __/|/ _/    /|/ /   / /|/ / /|    __   / /|    / /|  / /|/ / _  \|/    ##
+##  / /|_|/ /  /  /|/ / // //|/ / /|__- / /  / /___  / -|_ - /|/ /     /|     ##
+## /_/|/   /_/ /_/|/ /_/ /_/|/ |\ ___--|_|  /_____/| |-___-_|/  /____-/|/     ##
+## |_|/    |_|/|_|/  |_|/|_|/   \|___|-    |_____|/   |___|     |____|/       ##
+##                   _ _    _    ___   _  _      __  __   __                  ##
+##                  | | |  | |  | T_| | || |    |  ||_ | | _|                 ##
+##                  | _ |  |T|  |  |  |  _|      ||   \\_//                   ##
+##                  || || |_ _| |_|_| |_| _|    |__|  |___|                   ##
+##                                                                            ##
+##----------------------------------------------------------------------------##
+## Alejandro A. Stefan Zavala ## <astefanz@berkeley.edu>   ##                 ##
+## Chris J. Dougherty         ## <cdougher@caltech.edu>    ##                 ##
+## Marcel Veismann            ## <mveisman@caltech.edu>    ##                 ##
+################################################################################
+
+""" ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+ + End-to-end control latency of the whole Fan Club stack against arrays of
+ + virtual slaves, for regression tracking.
+ +
+ + Run from the master directory:
+ +
+ +      python3 -m fc.benchmarks.latency [-n 10 100 500] [-p 20 50 100]
+ +          [-o results.json] [-b baseline.json]
+ +
+ + For each array size and communication period, a headless front-end (see
+ + Harness) runs the real back-end against a fc.simulator Cluster. Once all
+ + slaves are connected, the duty cycle of the whole array is stepped back to
+ + back, each step through FCCommunicator.controlIn as soon as the previous
+ + one is done. A step is done when a feedback client of the front-end gets a
+ + vector in which every slave reports the new duty cycle, so that each
+ + sample covers the full loop:
+ +
+ +      controlIn -> control pipe -> setMOSI -> UDP -> slave -> T reply ->
+ +      setMISO -> _outputRoutine -> feedback pipe -> _feedbackRoutine ->
+ +      mailbox -> client
+ +
+ + Reported are the p50, p95 and p99 step latencies, the steps completed per
+ + second and the feedback vectors delivered to the client per second. With
+ + -o, results are also written as JSON. With -b, they are compared against
+ + such a file, and the run fails if any p95 latency grew, or throughput fell,
+ + by more than the given tolerance.
+ +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
+
+## IMPORTS #####################################################################
+import sys
+import json
+import argparse
+import platform
+import threading as mt
+import multiprocessing as mp
+import time as tm
+
+import numpy as np
+
+from fc import archive as ac, standards as s
+from fc.backend import states as st
+from fc.frontend import frontend as fe
+from fc.simulator import cluster as sc
+from fc.benchmarks import engines as be
+
+## CONSTANTS ###################################################################
+DEFAULT_SIZES = (10, 100, 500)
+DEFAULT_PERIODS_MS = (20, 50, 100)
+DEFAULT_STEPS = 50
+DEFAULT_TOLERANCE = 0.2
+CONNECT_TIMEOUT_S = 120
+STEP_TIMEOUT_S = 5
+TOLERANCE = 1e-3
+
+## BENCHMARK ###################################################################
+class Harness(fe.FCFrontend):
+    """
+    Headless front-end whose main loop runs one benchmark configuration.
+    Results are left in the result attribute.
+    """
+    SYMBOL = "[LB]"
+
+    def __init__(self, archive, pqueue, N, steps, verbose = False):
+        fe.FCFrontend.__init__(self, archive, pqueue)
+        self.N = N
+        self.steps = steps
+        self.verbose = verbose
+        self.fans = archive[ac.maxFans]
+
+        self.slaves = st.Table()
+        self.connected = 0
+        self.changed = mt.Condition()
+        self.target = None
+        self.reached = mt.Event()
+        self.reachedAt = None
+        self.vectors = 0
+        self.result = None
+
+        self.addFeedbackClient(self)
+        self.addSlaveClient(self)
+
+    def print(self, code, text):
+        if self.verbose:
+            print(text)
+
+    def feedbackIn(self, F):
+        """
+        Feedback client. Called by the front-end's feedback routine.
+        """
+        self.vectors += 1
+        target = self.target
+        if target is None or self.reached.is_set():
+            return
+        D = np.asarray(F[len(F)//2:])
+        if np.all(np.abs(D - target) < TOLERANCE):
+            self.reachedAt = tm.monotonic()
+            self.reached.set()
+
+    def slavesIn(self, S):
+        """
+        Slave client. Called by the front-end's slave routine.
+        """
+        with self.changed:
+            self.slaves.update(S)
+            self.connected = self.slaves.count(s.SS_CONNECTED)
+            self.changed.notify_all()
+
+    def _mainloop(self):
+        self.network.connect()
+        try:
+            start = tm.monotonic()
+            with self.changed:
+                if not self.changed.wait_for(lambda: self.connected >= self.N,
+                    CONNECT_TIMEOUT_S):
+                    raise RuntimeError("Only {}/{} slaves connected".format(
+                        self.connected, self.N))
+            connect = tm.monotonic() - start
+            self.result = dict(self._step(), connect_s = connect)
+        finally:
+            self.target = None
+            self.network.disconnect()
+
+    def _step(self):
+        """
+        Step the duty cycle of the whole array and return a dictionary of
+        results.
+        """
+        latencies = []
+        vectors = self.vectors
+        start = tm.monotonic()
+        for step in range(self.steps):
+            dc = round(0.1 + 0.8*((step % 2) + step/self.steps)/2, 3)
+            self.reached.clear()
+            self.target = dc
+            sent = tm.monotonic()
+            self.network.controlIn((dc,)*(self.fans*self.N))
+            if self.reached.wait(STEP_TIMEOUT_S):
+                latencies.append(self.reachedAt - sent)
+        elapsed = tm.monotonic() - start
+        return {
+            "latency_p50_s" : be.percentile(latencies, 50),
+            "latency_p95_s" : be.percentile(latencies, 95),
+            "latency_p99_s" : be.percentile(latencies, 99),
+            "missed_steps" : self.steps - len(latencies),
+            "steps_per_s" : len(latencies)/elapsed,
+            "vectors_per_s" : (self.vectors - vectors)/elapsed,
+        }
+
+def benchmark(N, periodMS, engine, steps = DEFAULT_STEPS, processes = 1,
+    verbose = False):
+    """
+    Run one benchmark configuration and return a dictionary of results.
+    """
+    with sc.Cluster(N, processes) as cluster:
+        profile = be.make_profile(N, cluster.port, engine, periodMS)
+        pqueue = mp.Queue()
+        archive = ac.FCArchive(pqueue, "Benchmark", profile)
+        harness = Harness(archive, pqueue, N, steps, verbose)
+        harness.run()
+    if harness.result is None:
+        raise RuntimeError("Benchmark of {} slaves at {} ms failed".format(
+            N, periodMS))
+    return dict(harness.result, engine = engine, slaves = N,
+        periodMS = periodMS, steps = steps)
+
+def key(result):
+    return (result["engine"], result["slaves"], result["periodMS"])
+
+def compare(results, baseline, tolerance):
+    """
+    Return a list of strings describing the RESULTS that regressed by more than
+    TOLERANCE (fraction) with respect to BASELINE (list of results).
+    """
+    previous = {key(result) : result for result in baseline}
+    regressions = []
+    for result in results:
+        old = previous.get(key(result))
+        if old is None:
+            continue
+        name = "{} {} slaves @ {} ms".format(*key(result))
+        if result["latency_p95_s"] > old["latency_p95_s"]*(1 + tolerance):
+            regressions.append("{}: p95 {:.1f} ms -> {:.1f} ms".format(name,
+                1000*old["latency_p95_s"], 1000*result["latency_p95_s"]))
+        if result["steps_per_s"] < old["steps_per_s"]*(1 - tolerance):
+            regressions.append("{}: {:.2f} -> {:.2f} steps/s".format(name,
+                old["steps_per_s"], result["steps_per_s"]))
+    return regressions
+
+def report(result):
+    print("{:>9} {:>6} {:>6} {:>10.2f} {:>8.1f} {:>8.1f} {:>8.1f} {:>7} "\
+        "{:>8.2f} {:>7.1f}".format(
+        result["engine"], result["slaves"], result["periodMS"],
+        result["connect_s"], 1000*result["latency_p50_s"],
+        1000*result["latency_p95_s"], 1000*result["latency_p99_s"],
+        result["missed_steps"], result["steps_per_s"],
+        result["vectors_per_s"]))
+
+## MAIN ########################################################################
+def main(argv = None):
+    parser = argparse.ArgumentParser(description =
+        "Measure the end-to-end control latency of the whole stack")
+    parser.add_argument("-n", "--slaves", type = int, nargs = "+",
+        default = DEFAULT_SIZES, help = "Array sizes to simulate")
+    parser.add_argument("-p", "--periods", type = int, nargs = "+",
+        default = DEFAULT_PERIODS_MS, help = "Communication periods (ms)")
+    parser.add_argument("-e", "--engines", nargs = "+",
+        default = (ac.FCArchive.DEFAULT[ac.commsEngine],),
+        choices = ac.ENGINES, help = "Engines to compare")
+    parser.add_argument("-s", "--steps", type = int, default = DEFAULT_STEPS,
+        help = "Duty cycle steps per configuration")
+    parser.add_argument("-P", "--processes", type = int, default = 1,
+        help = "Processes among which to split the virtual array")
+    parser.add_argument("-o", "--output", default = None,
+        help = "File to which to write the results as JSON")
+    parser.add_argument("-b", "--baseline", default = None,
+        help = "JSON results against which to check for regressions")
+    parser.add_argument("-t", "--tolerance", type = float,
+        default = DEFAULT_TOLERANCE,
+        help = "Relative change allowed with respect to the baseline")
+    parser.add_argument("-v", "--verbose", action = "store_true",
+        help = "Show front-end and back-end output")
+    args = parser.parse_args(argv)
+
+    print("{:>9} {:>6} {:>6} {:>10} {:>8} {:>8} {:>8} {:>7} {:>8} {:>7}"\
+        .format("ENGINE", "SLAVES", "PERIOD", "CONNECT_S", "P50_MS",
+        "P95_MS", "P99_MS", "MISSED", "STEPS/S", "F/S"))
+    results = []
+    for engine in args.engines:
+        for N in args.slaves:
+            for periodMS in args.periods:
+                result = benchmark(N, periodMS, engine, args.steps,
+                    args.processes, args.verbose)
+                report(result)
+                results.append(result)
+
+    if args.output is not None:
+        with open(args.output, 'w') as f:
+            json.dump({
+                "date" : tm.strftime("%Y-%m-%dT%H:%M:%S"),
+                "host" : platform.node(),
+                "python" : platform.python_version(),
+                "results" : results,
+            }, f, indent = 4)
+
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f)["results"],
+                args.tolerance)
+        for regression in regressions:
+            print("REGRESSION", regression)
+        if regressions:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+################################################################################
+##----------------------------------------------------------------------------##
+## CALIFORNIA INSTITUTE OF TECHNOLOGY ## GRADUATE AEROSPACE LABORATORY ##     ##
+## CENTER FOR AUTONOMOUS SYSTEMS AND TECHNOLOGIES                      ##     ##
+##----------------------------------------------------------------------------##
+##      ____      __      __  __      _____      __      __    __    ____     ##
+##     / __/|   _/ /|    / / / /|  _- __ __\    / /|    / /|  / /|  / _  \    ##
+##    / /_ |/  / /  /|  /  // /|/ / /|__| _|   / /|    / /|  / /|/ /   --||   ##
+##   / __/|/ _/    /|/ /   / /|/ / /|    __   / /|    / /|  / /|/ / _  \|/    ##
+##  / /|_|/ /  /  /|/ / // //|/ / /|__- / /  / /___  / -|_ - /|/ /     /|     ##
+## /_/|/   /_/ /_/|/ /_/ /_/|/ |\ ___--|_|  /_____/| |-___-_|/  /____-/|/     ##
+## |_|/    |_|/|_|/  |_|/|_|/   \|___|-    |_____|/   |___|     |____|/       ##
+##                   _ _    _    ___   _  _      __  __   __                  ##
+##                  | | |  | |  | T_| | || |    |  ||_ | | _|                 ##
+##                  | _ |  |T|  |  |  |  _|      ||   \\_//                   ##
+##                  || || |_ _| |_|_| |_| _|    |__|  |___|                   ##
+##                                                                            ##
+##----------------------------------------------------------------------------##
+## Alejandro A. Stefan Zavala ## <astefanz@berkeley.edu>   ##                 ##
+## Chris J. Dougherty         ## <cdougher@caltech.edu>    ##                 ##
+## Marcel Veismann            ## <mveisman@caltech.edu>    ##                 ##
+################################################################################
+
+""" ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+ + Micro-benchmark of MISO feedback decoding in the MkIII back-end: the batched
+ + NumPy decoding of fc.backend.mkiii.FCMISO against the per-slave
+ + list(map(int, ...)) parsing it replaced.
+ +
+ + Run from the master directory:
+ +
+ +      python3 -m fc.benchmarks.miso [-f 18 21] [-n 10 100 1000]
+ +
+ + For each fan count and array size, one period's worth of "T" payloads (one
+ + per slave, formatted as the slave firmware does) is decoded repeatedly with
+ + each method, and the best time per period is reported. No sockets or
+ + processes are involved.
+ +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
+
+## IMPORTS #####################################################################
+import argparse
+import random as rd
+import timeit
+
+from fc.backend.mkiii import FCMISO as mm
+
+## CONSTANTS ###################################################################
+DEFAULT_FANS = (18, 21)
+DEFAULT_SIZES = (10, 100, 1000)
+REPEAT = 5
+MIN_TIME_S = 0.2
+
+## BENCHMARK ###################################################################
+def payloads(N, fans):
+    """
+    Return the lists of RPM and DC payloads of N slaves with FANS fans each.
+    """
+    rpms = [",".join(str(rd.randint(0, 12000)) for _ in range(fans))
+        for _ in range(N)]
+    dcs = [",".join("{:.4f}".format(rd.random()) for _ in range(fans))
+        for _ in range(N)]
+    return rpms, dcs
+
+def legacy(maxFans, rpms, dcs):
+    """
+    Build a feedback vector the way the back-end used to.
+    """
+    F_r = []
+    F_d = []
+    for rpm, dc in zip(rpms, dcs):
+        R = list(map(int, rpm.split(',')))
+        D = list(map(float, dc.split(',')))
+        R += [0]*(maxFans - len(R))
+        D += [0]*(maxFans - len(D))
+        F_r += R
+        F_d += D
+    return F_r + F_d
+
+def batched(matrix, rpms, dcs):
+    """
+    Decode the payloads into the rows of MATRIX (an FCMISO.FeedbackMatrix).
+    """
+    rows = list(range(len(rpms)))
+    R, D = matrix.rows(len(rows))
+    mm.decode(R, rows, rpms)
+    mm.decode(D, rows, dcs)
+    return R, D
+
+def best(routine):
+    """
+    Return the best time, in seconds, of one call to ROUTINE.
+    """
+    timer = timeit.Timer(routine)
+    number, _ = timer.autorange()
+    number = max(number, int(number*MIN_TIME_S/0.2))
+    return min(timer.repeat(REPEAT, number))/number
+
+def benchmark(N, fans):
+    """
+    Run one benchmark configuration and return a dictionary of results.
+    """
+    rpms, dcs = payloads(N, fans)
+    matrix = mm.FeedbackMatrix(fans, N)
+    F = legacy(fans, rpms, dcs)
+    R, D = batched(matrix, rpms, dcs)
+    if R.ravel().tolist() + D.ravel().tolist() != F:
+        raise RuntimeError("Decoded feedback does not match")
+
+    old = best(lambda: legacy(fans, rpms, dcs))
+    new = best(lambda: batched(matrix, rpms, dcs))
+    return {
+        "fans" : fans,
+        "slaves" : N,
+        "legacy_s" : old,
+        "batched_s" : new,
+        "speedup" : old/new,
+    }
+
+def report(result):
+    print("{:>4} {:>6} {:>12.1f} {:>12.1f} {:>8.2f}x".format(
+        result["fans"], result["slaves"], result["legacy_s"]*1e6,
+        result["batched_s"]*1e6, result["speedup"]))
+
+## MAIN ########################################################################
+def main(argv = None):
+    parser = argparse.ArgumentParser(description =
+        "Compare legacy and batched MISO feedback decoding")
+    parser.add_argument("-f", "--fans", type = int, nargs = "+",
+        default = DEFAULT_FANS, help = "Fans per slave")
+    parser.add_argument("-n", "--slaves", type = int, nargs = "+",
+        default = DEFAULT_SIZES, help = "Array sizes")
+    args = parser.parse_args(argv)
+
+    print("{:>4} {:>6} {:>12} {:>12} {:>9}".format(
+        "FANS", "SLAVES", "LEGACY_US", "BATCHED_US", "SPEEDUP"))
+    for fans in args.fans:
+        for N in args.slaves:
+            report(benchmark(N, fans))
+
+if __name__ == "__main__":
+    main()
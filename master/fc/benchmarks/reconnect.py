@@ -0,0 +1,126 @@
+################################################################################
+##----------------------------------------------------------------------------##
+## CALIFORNIA INSTITUTE OF TECHNOLOGY ## GRADUATE AEROSPACE LABORATORY ##     ##
+## CENTER FOR AUTONOMOUS SYSTEMS AND TECHNOLOGIES                      ##     ##
+##----------------------------------------------------------------------------##
+##      ____      __      __  __      _____      __      __    __    ____     ##
+##     / __/|   _/ /|    / / / /|  _- __ __\    / /|    / /|  / /|  / _  \    ##
+##    / /_ |/  / /  /|  /  // /|/ / /|__| _|   / /|    / /|  / /|/ /   --||   ##
+##   / __/|/ _/    /|/ /   / /|/ / /|    __   / /|    / /|  / /|/ / _  \|/    ##
+##  / /|_|/ /  /  /|/ / // //|/ / /|__- / /  / /___  / -|_ - /|/ /     /|     ##
+## /_/|/   /_/ /_/|/ /_/ /_/|/ |\ ___--|_|  /_____/| |-___-_|/  /____-/|/     ##
+## |_|/    |_|/|_|/  |_|/|_|/   \|___|-    |_____|/   |___|     |____|/       ##
+##                   _ _    _    ___   _  _      __  __   __                  ##
+##                  | | |  | |  | T_| | || |    |  ||_ | | _|                 ##
+##                  | _ |  |T|  |  |  |  _|      ||   \\_//                   ##
+##                  || || |_ _| |_|_| |_| _|    |__|  |___|                   ##
+##                                                                            ##
+##----------------------------------------------------------------------------##
+## Alejandro A. Stefan Zavala ## <astefanz@berkeley.edu>   ##                 ##
+## Chris J. Dougherty         ## <cdougher@caltech.edu>    ##                 ##
+## Marcel Veismann            ## <mveisman@caltech.edu>    ##                 ##
+################################################################################
+
+""" ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+ + Benchmark of reconnection after a network outage (see
+ + fc.backend.mkiii.FCHandshake) against arrays of virtual slaves.
+ +
+ + Run from the master directory:
+ +
+ +      python3 -m fc.benchmarks.reconnect [-n 500] [-H 32 500] [-e SELECTOR]
+ +
+ + For each engine and handshake limit, the real back-end is started against a
+ + fc.simulator VirtualArray and, once all slaves are connected, the array
+ + drops all traffic for a few seconds (see VirtualArray.blip), long enough
+ + for the back-end to time every slave out. The time from the end of the
+ + outage until every slave is connected again is reported. A limit as large
+ + as the array lets every slave handshake at once, as before admission
+ + control was introduced.
+ +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
+
+## IMPORTS #####################################################################
+import argparse
+import time as tm
+
+from fc import archive as ac
+from fc.benchmarks import engines as be
+
+## CONSTANTS ###################################################################
+DEFAULT_SLAVES = 500
+DEFAULT_LIMITS = (32, 500)
+DEFAULT_ENGINES = (ac.ENGINE_THREADED, ac.ENGINE_SELECTOR)
+DEFAULT_OUTAGE_S = 5
+DEFAULT_PERIOD_MS = 100
+RECONNECT_TIMEOUT_S = 120
+
+## BENCHMARK ###################################################################
+def benchmark(N, engine, limit, backoffMS = ac.FCArchive.DEFAULT[
+    ac.hskBackoffMS], outageS = DEFAULT_OUTAGE_S,
+    periodMS = DEFAULT_PERIOD_MS, verbose = False):
+    """
+    Run one benchmark configuration and return a dictionary of results.
+    """
+    run = be.Run(N, engine, periodMS, verbose,
+        settings = {ac.hskLimit : limit, ac.hskBackoffMS : backoffMS})
+    try:
+        connect = run.connect()
+        run.array.blip(outageS)
+        end = tm.monotonic() + outageS
+        lowest = N
+        while tm.monotonic() < end or run.connected < N:
+            if tm.monotonic() - end > RECONNECT_TIMEOUT_S:
+                raise RuntimeError("Only {}/{} slaves reconnected".format(
+                    run.connected, N))
+            run.poll(0.05)
+            lowest = min(lowest, run.connected)
+        reconnect = tm.monotonic() - end
+    finally:
+        run.stop()
+    return {
+        "engine" : engine,
+        "slaves" : N,
+        "limit" : limit,
+        "backoff_ms" : backoffMS,
+        "connect_s" : connect,
+        "lowest" : lowest,
+        "reconnect_s" : reconnect,
+    }
+
+def report(result):
+    print("{:>9} {:>6} {:>6} {:>10} {:>10.2f} {:>7} {:>12.2f}".format(
+        result["engine"], result["slaves"], result["limit"],
+        result["backoff_ms"], result["connect_s"], result["lowest"],
+        result["reconnect_s"]))
+
+## MAIN ########################################################################
+def main(argv = None):
+    parser = argparse.ArgumentParser(description =
+        "Measure how long a virtual array takes to reconnect after an outage")
+    parser.add_argument("-n", "--slaves", type = int, default = DEFAULT_SLAVES,
+        help = "Array size to simulate")
+    parser.add_argument("-e", "--engines", nargs = "+",
+        default = DEFAULT_ENGINES, choices = ac.ENGINES,
+        help = "Engines to compare")
+    parser.add_argument("-H", "--limits", type = int, nargs = "+",
+        default = DEFAULT_LIMITS, help = "Handshake limits to compare")
+    parser.add_argument("-b", "--backoff", type = int,
+        default = ac.FCArchive.DEFAULT[ac.hskBackoffMS],
+        help = "Handshake backoff (ms)")
+    parser.add_argument("-o", "--outage", type = float,
+        default = DEFAULT_OUTAGE_S, help = "Outage length (s)")
+    parser.add_argument("-p", "--period", type = int,
+        default = DEFAULT_PERIOD_MS, help = "Communication period (ms)")
+    parser.add_argument("-v", "--verbose", action = "store_true",
+        help = "Show back-end output")
+    args = parser.parse_args(argv)
+
+    print("{:>9} {:>6} {:>6} {:>10} {:>10} {:>7} {:>12}".format(
+        "ENGINE", "SLAVES", "LIMIT", "BACKOFF_MS", "CONNECT_S", "LOWEST",
+        "RECONNECT_S"))
+    for engine in args.engines:
+        for limit in args.limits:
+            report(benchmark(args.slaves, engine, limit, args.backoff,
+                args.outage, args.period, args.verbose))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+################################################################################
+##----------------------------------------------------------------------------##
+## CALIFORNIA INSTITUTE OF TECHNOLOGY ## GRADUATE AEROSPACE LABORATORY ##     ##
+## CENTER FOR AUTONOMOUS SYSTEMS AND TECHNOLOGIES                      ##     ##
+##----------------------------------------------------------------------------##
+##      ____      __      __  __      _____      __      __    __    ____     ##
+##     / __/|   _/ /|    / / / /|  _- __ __\    / /|    / /|  / /|  / _  \    ##
+##    / /_ |/  / /  /|  /  // /|/ / /|__| _|   / /|    / /|  / /|/ /   --||   ##
+##   / __/|/ _/    /|/ /   / /|/ / /|    __   / /|    / /|  / /|/ / _  \|/    ##
+##  / /|_|/ /  /  /|/ / // //|/ / /|__- / /  / /___  / -|_ - /|/ /     /|     ##
+## /_/|/   /_/ /_/|/ /_/ /_/|/ |\ ___--|_|  /_____/| |-___-_|/  /____-/|/     ##
+## |_|/    |_|/|_|/  |_|/|_|/   \|___|-    |_____|/   |___|     |____|/       ##
+##                   _ _    _    ___   _  _      __  __   __                  ##
+##                  | | |  | |  | T_| | || |    |  ||_ | | _|                 ##
+##                  | _ |  |T|  |  |  |  _|      ||   \\_//                   ##
+##                  || || |_ _| |_|_| |_| _|    |__|  |___|                   ##
+##                                                                            ##
+##----------------------------------------------------------------------------##
+## Alejandro A. Stefan Zavala ## <astefanz@berkeley.edu>   ##                 ##
+## Chris J. Dougherty         ## <cdougher@caltech.edu>    ##                 ##
+## Marcel Veismann            ## <mveisman@caltech.edu>    ##                 ##
+################################################################################
+
+""" ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+ + Measure how feedback throughput scales with the number of back-end worker
+ + processes (see fc.backend.shards and the ac.commsWorkers profile attribute).
+ +
+ + Run from the master directory:
+ +
+ +      python3 -m fc.benchmarks.shards [-n 1000] [-k 1 2 4] [-p 20] [-P 1]
+ +
+ + For each worker count, the back-end is started against a fc.simulator
+ + VirtualArray. Once all slaves are connected, the duty cycle of the whole
+ + array is stepped back to back for a fixed window, each step being sent as
+ + soon as the previous one shows up in the feedback vector. Reported are the
+ + completed steps per second, the slave feedback updates per second that this
+ + amounts to (steps times slaves), the feedback vectors received per second,
+ + and the CPU used by all back-end processes.
+ +
+ + NOTE: Scaling can only show on a multi-core Linux machine. By default, the
+ + VirtualArray runs in a single process of its own and may limit the largest
+ + arrays; -P splits it among more processes (see fc.simulator.cluster).
+ +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
+
+## IMPORTS #####################################################################
+import argparse
+import time as tm
+
+from fc import archive as ac
+from fc.benchmarks import engines as be
+from fc.simulator import array as sa
+
+## CONSTANTS ###################################################################
+DEFAULT_SLAVES = 1000
+DEFAULT_WORKERS = (1, 2, 4)
+DEFAULT_PERIOD_MS = 20
+DEFAULT_WINDOW_S = 10
+DC_LOW, DC_HIGH = 0.2, 0.6
+
+## BENCHMARK ###################################################################
+def throughput(run, window):
+    """
+    Step the duty cycle of RUN's array back to back for WINDOW seconds.
+    Returns (steps completed, feedback vectors received, CPU seconds used or
+    None, seconds elapsed).
+    """
+    fans = sa.DEFAULT_FANS
+    steps = vectors = 0
+    dc = DC_LOW
+    cpu = run.cpuSeconds()
+    start = tm.monotonic()
+    while tm.monotonic() - start < window:
+        dc = DC_HIGH if dc == DC_LOW else DC_LOW
+        run.comms.controlIn((dc,)*(fans*run.N))
+        sent = tm.monotonic()
+        while tm.monotonic() - sent < be.STEP_TIMEOUT_S:
+            if run.poll(0.05):
+                vectors += 1
+                if run._reached(dc):
+                    steps += 1
+                    break
+    elapsed = tm.monotonic() - start
+    after = run.cpuSeconds()
+    return steps, vectors, \
+        after - cpu if None not in (cpu, after) else None, elapsed
+
+def benchmark(N, workers, engine = ac.ENGINE_SELECTOR,
+    periodMS = DEFAULT_PERIOD_MS, window = DEFAULT_WINDOW_S, verbose = False,
+    processes = 1):
+    """
+    Run one benchmark configuration and return a dictionary of results.
+    """
+    run = be.Run(N, engine, periodMS, verbose, workers,
+        simulation = {"processes" : processes})
+    try:
+        connect = run.connect()
+        steps, vectors, cpu, elapsed = throughput(run, window)
+    finally:
+        run.stop()
+    return {
+        "workers" : workers,
+        "engine" : engine,
+        "slaves" : N,
+        "periodMS" : periodMS,
+        "connect_s" : connect,
+        "steps_per_s" : steps/elapsed,
+        "updates_per_s" : steps*N/elapsed,
+        "vectors_per_s" : vectors/elapsed,
+        "cpu" : cpu/elapsed if cpu is not None else None,
+    }
+
+def report(result):
+    cpu = result["cpu"]
+    print("{:>7} {:>6} {:>10.2f} {:>8.2f} {:>12.0f} {:>9.2f} {:>7}".format(
+        result["workers"], result["slaves"], result["connect_s"],
+        result["steps_per_s"], result["updates_per_s"],
+        result["vectors_per_s"],
+        "{:.2f}".format(cpu) if cpu is not None else "N/A"))
+
+## MAIN ########################################################################
+def main(argv = None):
+    parser = argparse.ArgumentParser(description =
+        "Measure feedback throughput against back-end worker count")
+    parser.add_argument("-n", "--slaves", type = int, default = DEFAULT_SLAVES,
+        help = "Array size to simulate")
+    parser.add_argument("-k", "--workers", type = int, nargs = "+",
+        default = DEFAULT_WORKERS, help = "Worker counts to compare")
+    parser.add_argument("-e", "--engine", default = ac.ENGINE_SELECTOR,
+        choices = ac.ENGINES, help = "Engine run by each worker")
+    parser.add_argument("-p", "--period", type = int,
+        default = DEFAULT_PERIOD_MS, help = "Communication period (ms)")
+    parser.add_argument("-w", "--window", type = float,
+        default = DEFAULT_WINDOW_S, help = "Measurement window (s)")
+    parser.add_argument("-P", "--processes", type = int, default = 1,
+        help = "Processes among which to split the virtual array")
+    parser.add_argument("-v", "--verbose", action = "store_true",
+        help = "Show back-end output")
+    args = parser.parse_args(argv)
+
+    print("{:>7} {:>6} {:>10} {:>8} {:>12} {:>9} {:>7}".format(
+        "WORKERS", "SLAVES", "CONNECT_S", "STEPS/S", "UPDATES/S", "F/S",
+        "CORES"))
+    for workers in args.workers:
+        report(benchmark(args.slaves, workers, args.engine, args.period,
+            args.window, args.verbose, args.processes))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+################################################################################
+##----------------------------------------------------------------------------##
+## CALIFORNIA INSTITUTE OF TECHNOLOGY ## GRADUATE AEROSPACE LABORATORY ##     ##
+## CENTER FOR AUTONOMOUS SYSTEMS AND TECHNOLOGIES                      ##     ##
+##----------------------------------------------------------------------------##
+##      ____      __      __  __      _____      __      __    __    ____     ##
+##     / __/|   _/ /|    / / / /|  _- __ __\    / /|    / /|  / /|  / _  \    ##
+##    / /_ |/  / /  /|  /  // /|/ / /|__| _|   / /|    / /|  / /|/ /   --||   ##
+##   / __/|/ _/    /|/ /   / /|/ / /|    __   / /|    / /|  / /|/ / _  \|/    ##
+##  / /|_|/ /  /  /|/ / // //|/ / /|__- / /  / /___  / -|_ - /|/ /     /|     ##
+## /_/|/   /_/ /_/|/ /_/ /_/|/ |\ ___--|_|  /_____/| |-___-_|/  /____-/|/     ##
+## |_|/    |_|/|_|/  |_|/|_|/   \|___|-    |_____|/   |___|     |____|/       ##
+##                   _ _    _    ___   _  _      __  __   __                  ##
+##                  | | |  | |  | T_| | || |    |  ||_ | | _|                 ##
+##                  | _ |  |T|  |  |  |  _|      ||   \\_//                   ##
+##                  || || |_ _| |_|_| |_| _|    |__|  |___|                   ##
+##                                                                            ##
+##----------------------------------------------------------------------------##
+## Alejandro A. Stefan Zavala ## <astefanz@berkeley.edu>   ##                 ##
+## Chris J. Dougherty         ## <cdougher@caltech.edu>    ##                 ##
+## Marcel Veismann            ## <mveisman@caltech.edu>    ##                 ##
+################################################################################
+
+""" ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+ + Micro-benchmark of the per-exchange bookkeeping overhead of
+ + fc.backend.mkiii.FCSlave: the compact, lock-free record against a reference
+ + model of the record it replaced, which took a lock and type-checked its
+ + argument in every getter and setter.
+ +
+ + Run from the master directory:
+ +
+ +      python3 -m fc.benchmarks.slaves [-n 1 100 1000] [-r 1]
+ +
+ + One "exchange" is the sequence of calls the back-end makes on a slave to
+ + send it a command and process its reply, plus the reads of the output
+ + routine. The best time per exchange is reported for N slaves exchanging in
+ + turn, optionally with R threads reading the slaves' state concurrently as
+ + front-end clients would.
+ +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
+
+## IMPORTS #####################################################################
+import argparse
+import threading as mt
+import timeit
+
+from fc.backend.mkiii import FCSlave as sv
+
+## CONSTANTS ###################################################################
+DEFAULT_SIZES = (1, 100, 1000)
+FANS = 21
+REPEAT = 5
+MIN_TIME_S = 0.2
+
+## BENCHMARK ###################################################################
+class Locked:
+    """
+    Reference model of the slave record used before: one lock per field and
+    type checks in every setter. Only the methods used in an exchange.
+    """
+
+    def __init__(self, index):
+        self.index = index
+        self.name = "Module {}".format(index)
+        self.mac = "00:00:00:00:{:02x}:{:02x}".format(index >> 8, index & 255)
+        self.fans = FANS
+        self.status = sv.CONNECTED
+        self.statusLock = mt.Lock()
+        self.version = "MkII"
+        self.versionLock = mt.Lock()
+        self.ip = "0.0.0.0"
+        self.ipLock = mt.Lock()
+        self.misoP = self.mosiP = 0
+        self.portLock = mt.Lock()
+        self.socketLock = mt.Lock()
+        self.mosiIndex = self.misoIndex = self.dataIndex = self.dropIndex = 0
+        self.mosiIndexLock = mt.Lock()
+        self.misoIndexLock = mt.Lock()
+        self.dataIndexLock = mt.Lock()
+        self.dropIndexLock = mt.Lock()
+        self.lock = mt.Lock()
+        self.mosiSlot = []
+        self.misoBuffer = None
+
+    def _get(self, lock, name):
+        with lock:
+            return getattr(self, name)
+
+    def _set(self, lock, name, value):
+        if type(value) is not int:
+            raise TypeError(name)
+        with lock:
+            setattr(self, name, value)
+
+    def getStatus(self):
+        return self._get(self.statusLock, "status")
+
+    def getMOSIIndex(self):
+        return self._get(self.mosiIndexLock, "mosiIndex")
+
+    def setMOSIIndex(self, value):
+        self._set(self.mosiIndexLock, "mosiIndex", value)
+
+    def incrementMOSIIndex(self):
+        with self.mosiIndexLock:
+            self.mosiIndex += 1
+
+    def getMISOIndex(self):
+        return self._get(self.misoIndexLock, "misoIndex")
+
+    def setMISOIndex(self, value):
+        self._set(self.misoIndexLock, "misoIndex", value)
+
+    def getDataIndex(self):
+        return self._get(self.dataIndexLock, "dataIndex")
+
+    def setDataIndex(self, value):
+        self._set(self.dataIndexLock, "dataIndex", value)
+
+    def getMOSIPort(self):
+        return self._get(self.portLock, "mosiP")
+
+    def getMOSI(self):
+        return self.mosiSlot.pop() if self.mosiSlot else None
+
+    def setMISO(self, update, block = True):
+        self.misoBuffer = update
+
+    def getMISO(self):
+        return self.misoBuffer
+
+    def snapshot(self):
+        return (self.index, self.name, self.mac, self.getStatus(), self.fans,
+            self._get(self.versionLock, "version"))
+
+class Routine:
+    """
+    Stand-in for the slave routine FCSlave expects (a bound method).
+    """
+    def run(self, slave):
+        pass
+
+def compact(index):
+    """
+    Return an FCSlave like the ones the back-end builds for saved slaves.
+    """
+    return sv.FCSlave(name = "Module {}".format(index),
+        mac = "00:00:00:00:{:02x}:{:02x}".format(index >> 8, index & 255),
+        fans = FANS, maxFans = FANS, status = sv.KNOWN,
+        routine = Routine().run, routineArgs = (), misoQueueSize = 1,
+        index = index, version = "MkII", ip = "0.0.0.0", misoP = 1, mosiP = 1)
+
+def exchange(slave, index):
+    """
+    Perform the slave calls of one exchange, with INDEX as the received index.
+    """
+    # Output:
+    if slave.getStatus() == sv.CONNECTED:
+        slave.getMOSI()
+        slave.incrementMOSIIndex()
+        if slave.getMOSIIndex() > 1000:
+            slave.setMOSIIndex(0)
+        slave.getMOSIIndex()
+        slave.getMOSIPort()
+    # Input:
+    if index > slave.getMISOIndex():
+        slave.setMISOIndex(index)
+        if index > slave.getDataIndex():
+            slave.setDataIndex(index)
+            slave.setMISO(("R", "D"), False)
+    # Output routine:
+    slave.getMISO()
+    slave.getStatus()
+
+def reader(slaves, stop):
+    """
+    Read the state of every slave until STOP is set.
+    """
+    while not stop.is_set():
+        for slave in slaves:
+            slave.snapshot()
+
+def best(slaves, readers):
+    """
+    Return the best time, in seconds, of one exchange among SLAVES while
+    READERS threads read their state.
+    """
+    state = {"index" : 0}
+    def period():
+        state["index"] += 1
+        index = state["index"]
+        for slave in slaves:
+            exchange(slave, index)
+
+    stop = mt.Event()
+    threads = [mt.Thread(target = reader, args = (slaves, stop), daemon = True)
+        for _ in range(readers)]
+    for thread in threads:
+        thread.start()
+    try:
+        timer = timeit.Timer(period)
+        number, _ = timer.autorange()
+        number = max(number, int(number*MIN_TIME_S/0.2))
+        return min(timer.repeat(REPEAT, number))/number/len(slaves)
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+def benchmark(N, readers):
+    """
+    Run one benchmark configuration and return a dictionary of results.
+    """
+    old = [Locked(index) for index in range(N)]
+    new = [compact(index) for index in range(N)]
+    for slave in new:
+        slave.setStatus(sv.CONNECTED)
+    if old[0].snapshot() != new[0].snapshot():
+        raise RuntimeError("Snapshots do not match")
+
+    before = best(old, readers)
+    after = best(new, readers)
+    return {
+        "slaves" : N,
+        "readers" : readers,
+        "locked_s" : before,
+        "compact_s" : after,
+        "speedup" : before/after,
+    }
+
+def report(result):
+    print("{:>6} {:>7} {:>10.2f} {:>10.2f} {:>8.2f}x".format(
+        result["slaves"], result["readers"], result["locked_s"]*1e6,
+        result["compact_s"]*1e6, result["speedup"]))
+
+## MAIN ########################################################################
+def main(argv = None):
+    parser = argparse.ArgumentParser(description =
+        "Compare the per-exchange overhead of locked and compact slave records")
+    parser.add_argument("-n", "--slaves", type = int, nargs = "+",
+        default = DEFAULT_SIZES, help = "Array sizes")
+    parser.add_argument("-r", "--readers", type = int, nargs = "+",
+        default = (0, 1), help = "Concurrent reader threads")
+    args = parser.parse_args(argv)
+
+    print("{:>6} {:>7} {:>10} {:>10} {:>9}".format(
+        "SLAVES", "READERS", "LOCKED_US", "COMPACT_US", "SPEEDUP"))
+    for readers in args.readers:
+        for N in args.slaves:
+            report(benchmark(N, readers))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+################################################################################
+##----------------------------------------------------------------------------##
+## CALIFORNIA INSTITUTE OF TECHNOLOGY ## GRADUATE AEROSPACE LABORATORY ##     ##
+## CENTER FOR AUTONOMOUS SYSTEMS AND TECHNOLOGIES                      ##     ##
+##----------------------------------------------------------------------------##
+##      ____      __      __  __      _____      __      __    __    ____     ##
+##     / __/|   _/ /|    / / / /|  _- __ __\    / /|    / /|  / /|  / _  \    ##
+##    / /_ |/  / /  /|  /  // /|/ / /|__| _|   / /|    / /|  / /|/ /   --||   ##
+##   / __/|/ _/    /|/ /   / /|/ / /|    __   / /|    / /|  / /|/ / _  \|/    ##
+##  / /|_|/ /  /  /|/ / // //|/ / /|__- / /  / /___  / -|_ - /|/ /     /|     ##
+## /_/|/   /_/ /_/|/ /_/ /_/|/ |\ ___--|_|  /_____/| |-___-_|/  /____-/|/     ##
+## |_|/    |_|/|_|/  |_|/|_|/   \|___|-    |_____|/   |___|     |____|/       ##
+##                   _ _    _    ___   _  _      __  __   __                  ##
+##                  | | |  | |  | T_| | || |    |  ||_ | | _|                 ##
+##                  | _ |  |T|  |  |  |  _|      ||   \\_//                   ##
+##                  || || |_ _| |_|_| |_| _|    |__|  |___|                   ##
+##                                                                            ##
+##----------------------------------------------------------------------------##
+## Alejandro A. Stefan Zavala ## <astefanz@berkeley.edu>   ##                 ##
+## Chris J. Dougherty         ## <cdougher@caltech.edu>    ##                 ##
+## Marcel Veismann            ## <mveisman@caltech.edu>    ##                 ##
+################################################################################
+
+""" ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+ + Startup time of Fan Club, for regression tracking.
+ +
+ + Run from the master directory:
+ +
+ +      python3 -m fc.benchmarks.startup [-n 20] [-r 5] [-o results.json]
+ +          [-b baseline.json]
+ +
+ + Two things are measured, each in fresh Python interpreters:
+ +
+ + - Import time of the main modules, both "warm" (with the bytecode cache,
+ +   as on every run but the first) and "cold" (with an empty one, as on the
+ +   first run after an install or update).
+ + - Time to first feedback: main.py --headless is run against a fc.simulator
+ +   Cluster of virtual slaves, and the time from launching it to its reports
+ +   of being ready and of getting its first feedback vector is taken.
+ +
+ + The median of the given number of runs is reported. With -o, results are
+ + also written as JSON. With -b, they are compared against such a file, and
+ + the run fails if any time grew by more than the given tolerance.
+ +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
+
+## IMPORTS #####################################################################
+import os
+import sys
+import json
+import pickle as pk
+import signal
+import argparse
+import platform
+import tempfile
+import subprocess as sp
+import statistics as sts
+import time as tm
+
+import fc
+from fc import archive as ac
+from fc.simulator import cluster as sc
+from fc.benchmarks import engines as be
+
+## CONSTANTS ###################################################################
+MODULES = ("fc.archive", "fc.builtin.profiles", "fc.backend.communicator",
+    "fc.frontend.frontend", "fc.frontend.headless", "fc.frontend.gui.tkgui")
+MAIN = os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(fc.__file__))), "main.py")
+DEFAULT_SLAVES = 20
+DEFAULT_RUNS = 5
+DEFAULT_TOLERANCE = 0.2
+FEEDBACK_TIMEOUT_S = 60
+READY = "Ready"
+FIRST_FEEDBACK = "First feedback vector"
+
+IMPORT_SCRIPT = """
+import time
+start = time.perf_counter()
+import {}
+print(time.perf_counter() - start)
+"""
+
+## BENCHMARK ###################################################################
+def import_time(module, cold = False):
+    """
+    Return the seconds it takes a fresh interpreter to import MODULE, with an
+    empty bytecode cache if COLD, or None if it cannot be imported.
+    """
+    env = dict(os.environ)
+    with tempfile.TemporaryDirectory() as cache:
+        if cold:
+            env["PYTHONPYCACHEPREFIX"] = cache
+        run = sp.run([sys.executable, "-c", IMPORT_SCRIPT.format(module)],
+            cwd = os.path.dirname(MAIN), env = env, stdout = sp.PIPE,
+            stderr = sp.DEVNULL, universal_newlines = True)
+    if run.returncode != 0:
+        return None
+    return float(run.stdout.split()[-1])
+
+def feedback_time(profile, verbose = False):
+    """
+    Run main.py --headless with the profile file PROFILE until it gets its first
+    feedback vector and return a tuple with the seconds from launching it to
+    it being ready and to its first feedback vector.
+    """
+    ready, first = None, None
+    start = tm.perf_counter()
+    process = sp.Popen([sys.executable, "-u", MAIN, "--headless", "-f", profile,
+        "-r", "0", "-d", str(FEEDBACK_TIMEOUT_S)], cwd = os.path.dirname(MAIN),
+        stdout = sp.PIPE, stderr = sp.STDOUT, universal_newlines = True)
+    try:
+        for line in process.stdout:
+            if verbose:
+                print(line, end = "")
+            if ready is None and READY in line:
+                ready = tm.perf_counter() - start
+            elif FIRST_FEEDBACK in line:
+                first = tm.perf_counter() - start
+                break
+    finally:
+        process.send_signal(signal.SIGINT)
+        for line in process.stdout:
+            if verbose:
+                print(line, end = "")
+        process.wait()
+    if first is None:
+        raise RuntimeError("No feedback vector received")
+    return ready, first
+
+def benchmark(N, runs = DEFAULT_RUNS, verbose = False):
+    """
+    Run the whole benchmark and return a dictionary of results (in seconds).
+    """
+    results = {}
+    for module in MODULES:
+        for cold in (False, True):
+            times = [import_time(module, cold) for _ in range(runs)]
+            key = "import_{}_{}_s".format(module, "cold" if cold else "warm")
+            results[key] = None if None in times else sts.median(times)
+
+    with sc.Cluster(N) as cluster, tempfile.TemporaryDirectory() as folder:
+        profile = os.path.join(folder, "benchmark.fcp")
+        with open(profile, 'wb') as f:
+            # Same format as FCArchive.save:
+            pk.dump(be.make_profile(N, cluster.port,
+                ac.FCArchive.DEFAULT[ac.commsEngine]), f)
+        times = [feedback_time(profile, verbose) for _ in range(runs)]
+    results["ready_s"] = sts.median(time[0] for time in times)
+    results["first_feedback_s"] = sts.median(time[1] for time in times)
+    return results
+
+def compare(results, baseline, tolerance):
+    """
+    Return a list of strings describing the RESULTS that regressed (grew) by
+    more than TOLERANCE (fraction) with respect to BASELINE.
+    """
+    regressions = []
+    for key, value in results.items():
+        old = baseline.get(key)
+        if value is not None and old and value > old*(1 + tolerance):
+            regressions.append("{}: {:.3f} s -> {:.3f} s".format(key, old,
+                value))
+    return regressions
+
+def report(results):
+    for key, value in results.items():
+        print("{:<50} {:>8}".format(key,
+            "N/A" if value is None else "{:.1f}".format(1000*value)))
+
+## MAIN ########################################################################
+def main(argv = None):
+    parser = argparse.ArgumentParser(description =
+        "Measure the import time and the time to first feedback of Fan Club")
+    parser.add_argument("-n", "--slaves", type = int, default = DEFAULT_SLAVES,
+        help = "Virtual slaves to simulate")
+    parser.add_argument("-r", "--runs", type = int, default = DEFAULT_RUNS,
+        help = "Runs of which to take the median")
+    parser.add_argument("-o", "--output", default = None,
+        help = "File to which to write the results as JSON")
+    parser.add_argument("-b", "--baseline", default = None,
+        help = "JSON results against which to check for regressions")
+    parser.add_argument("-t", "--tolerance", type = float,
+        default = DEFAULT_TOLERANCE,
+        help = "Relative change allowed with respect to the baseline")
+    parser.add_argument("-v", "--verbose", action = "store_true",
+        help = "Show front-end and back-end output")
+    args = parser.parse_args(argv)
+
+    results = benchmark(args.slaves, args.runs, args.verbose)
+    print("{:<50} {:>8}".format("MEASURE", "MS"))
+    report(results)
+
+    if args.output is not None:
+        with open(args.output, 'w') as f:
+            json.dump({
+                "date" : tm.strftime("%Y-%m-%dT%H:%M:%S"),
+                "host" : platform.node(),
+                "python" : platform.python_version(),
+                "slaves" : args.slaves,
+                "results" : results,
+            }, f, indent = 4)
+
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f)["results"],
+                args.tolerance)
+        for regression in regressions:
+            print("REGRESSION", regression)
+        if regressions:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
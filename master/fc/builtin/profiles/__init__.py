@@ -0,0 +1,74 @@
+################################################################################
+##----------------------------------------------------------------------------##
+## CALIFORNIA INSTITUTE OF TECHNOLOGY ## GRADUATE AEROSPACE LABORATORY ##     ##
+## CENTER FOR AUTONOMOUS SYSTEMS AND TECHNOLOGIES                      ##     ##
+##----------------------------------------------------------------------------##
+##      ____      __      __  __      _____      __      __    __    ____     ##
+##     / __/|   _/ /|    / / / /|  _- __ __\    / /|    / /|  / /|  / _  \    ##
+##    / /_ |/  / /  /|  /  // /|/ / /|__| _|   / /|    / /|  / /|/ /   --||   ##
+##   / __/|/ _/    /|/ /   / /|/ / /|    __   / /|    / /|  / /|/ / _  \|/    ##
+##  / /|_|/ /  /  /|/ / // //|/ / /|__- / /  / /___  / -|_ - /|/ /     /|     ##
+## /_/|/   /_/ /_/|/ /_/ /_/|/ |\ ___--|_|  /_____/| |-___-_|/  /____-/|/     ##
+## |_|/    |_|/|_|/  |_|/|_|/   \|___|-    |_____|/   |___|     |____|/       ##
+##                   _ _    _    ___   _  _      __  __   __                  ##
+##                  | | |  | |  | T_| | || |    |  ||_ | | _|                 ##
+##                  | _ |  |T|  |  |  |  _|      ||   \\_//                   ##
+##                  || || |_ _| |_|_| |_| _|    |__|  |___|                   ##
+##                                                                            ##
+##----------------------------------------------------------------------------##
+## Alejandro A. Stefan Zavala ## <astefanz@berkeley.edu>   ##                 ##
+## Chris J. Dougherty         ## <cdougher@caltech.edu>    ##                 ##
+## Marcel Veismann            ## <mveisman@caltech.edu>    ##                 ##
+################################################################################
+
+""" ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+ + Repository of built-in profiles.
+ +
+ + Each profile is defined in a module of its own within this package, and is
+ + only imported once it is first looked up in PROFILES (some of them run to
+ + thousands of lines). To add a profile, define it in a new module and add
+ + its name to MODULES.
+ +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
+
+## IMPORTS #####################################################################
+import importlib as il
+import collections.abc as abc
+
+## PROFILES ####################################################################
+# Name of each built-in profile -> (module in this package, variable in it):
+MODULES = {
+    "BASE" : ("base", "BASE"),
+    "SEVENSQ" : ("sevensq", "SEVENSQ"),
+    "CAST" : ("cast", "CAST"),
+    "MODULE" : ("module", "MODULE"),
+    "BOX" : ("box", "BOX"),
+    "SIDE" : ("cast_side", "CAST_SIDE"),
+    "DEV1" : ("dev1", "DEV1"),
+    "DEV2" : ("dev2", "DEV2"),
+    "DEV3" : ("dev3", "DEV3"),
+    "CANN" : ("cann", "CANN"),
+}
+
+class Profiles(abc.Mapping):
+    """
+    Read-only dictionary of built-in profiles by name, each of which is imported
+    when first looked up.
+    """
+
+    def __init__(self, modules):
+        """
+        - modules := dictionary of the form of MODULES.
+        """
+        self.modules = modules
+
+    def __getitem__(self, name):
+        module, variable = self.modules[name]
+        return getattr(il.import_module("." + module, __name__), variable)
+
+    def __iter__(self):
+        return iter(self.modules)
+
+    def __len__(self):
+        return len(self.modules)
+
+PROFILES = Profiles(MODULES)
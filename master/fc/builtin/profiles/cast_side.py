@@ -0,0 +1,3949 @@
+################################################################################
+##----------------------------------------------------------------------------##
+## CALIFORNIA INSTITUTE OF TECHNOLOGY ## GRADUATE AEROSPACE LABORATORY ##     ##
+## CENTER FOR AUTONOMOUS SYSTEMS AND TECHNOLOGIES                      ##     ##
+##----------------------------------------------------------------------------##
+##      ____      __      __  __      _____      __      __    __    ____     ##
+##     / __/|   _/ /|    / / / /|  _- __ __\    / /|    / /|  / /|  / _  \    ##
+##    / /_ |/  / /  /|  /  // /|/ / /|__| _|   / /|    / /|  / /|/ /   --||   ##
+##   / __/|/ _/    /|/ /   / /|/ / /|    __   / /|    / /|  / /|/ / _  \|/    ##
+##  / /|_|/ /  /  /|/ / // //|/ / /|__- / /  / /___  / -|_ - /|/ /     /|     ##
+## /_/|/   /_/ /_/|/ /_/ /_/|/ |\ ___--|_|  /_____/| |-___-_|/  /____-/|/     ##
+## |_|/    |_|/|_|/  |_|/|_|/   \|___|-    |_____|/   |___|     |____|/       ##
+##                   _ _    _    ___   _  _      __  __   __                  ##
+##                  | | |  | |  | T_| | || |    |  ||_ | | _|                 ##
+##                  | _ |  |T|  |  |  |  _|      ||   \\_//                   ##
+##                  || || |_ _| |_|_| |_| _|    |__|  |___|                   ##
+##                                                                            ##
+##----------------------------------------------------------------------------##
+## Alejandro A. Stefan Zavala ## <astefanz@berkeley.edu>   ##                 ##
+## Chris J. Dougherty         ## <cdougher@caltech.edu>    ##                 ##
+## Marcel Veismann            ## <mveisman@caltech.edu>    ##                 ##
+################################################################################
+
+""" ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+ + Built-in profile CAST_SIDE: Prov. CAST Tunnel + side arrays.
+ +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
+from fc import archive as ac
+
+CAST_SIDE = {
+    ac.name : "Prov. CAST Tunnel + side arrays",
+    ac.description : "Caltech's newest toy.",
+    ac.platform : ac.UNKNOWN,
+
+    ac.broadcastIP : "<broadcast>",
+    ac.broadcastPort  : 65000,
+    ac.broadcastPeriodMS : 1000,
+    ac.periodMS : 100,
+    ac.maxLength : 512,
+    ac.maxTimeouts : 10,
+
+    ac.mainQueueSize : 10,
+    ac.slaveQueueSize: 10,
+    ac.broadcastQueueSize : 2,
+    ac.listenerQueueSize : 3,
+    ac.misoQueueSize : 2,
+    ac.printerQueueSize : 3,
+    ac.passcode : "CT",
+    ac.socketLimit : 1024,
+
+    ac.defaultSlave :
+        {
+            ac.SV_name : "FAWT Module",
+            ac.SV_mac : "None",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 21,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : False,
+            ac.MD_row : -1,
+            ac.MD_column : -1,
+            ac.MD_rows : 0,
+            ac.MD_columns : 0,
+            ac.MD_mapping : ()
+        },
+    ac.savedSlaves : (
+        {
+
+            ac.SV_name : "Module 1",
+            ac.SV_mac : "00:80:e1:48:00:38",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 0,
+            ac.MD_column : 0,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 2",
+            ac.SV_mac : "00:80:e1:48:00:3e",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 0,
+            ac.MD_column : 3,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 3",
+            ac.SV_mac : "00:80:e1:43:00:1f",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 0,
+            ac.MD_column : 6,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 4",
+            ac.SV_mac : "00:80:e1:43:00:36",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 0,
+            ac.MD_column : 9,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 5",
+            ac.SV_mac : "00:80:e1:47:00:3a",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 0,
+            ac.MD_column : 12,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 6",
+            ac.SV_mac : "00:80:e1:41:00:36",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 0,
+            ac.MD_column : 15,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 7",
+            ac.SV_mac : "00:80:e1:47:00:25",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 0,
+            ac.MD_column : 18,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 8",
+            ac.SV_mac : "00:80:e1:40:00:3d",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 0,
+            ac.MD_column : 21,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 9",
+            ac.SV_mac : "00:80:e1:47:00:44",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 0,
+            ac.MD_column : 24,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 10",
+            ac.SV_mac : "00:80:e1:36:00:21",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 0,
+            ac.MD_column : 27,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 11",
+            ac.SV_mac : "00:80:e1:37:00:21",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 0,
+            ac.MD_column : 30,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 12",
+            ac.SV_mac : "00:80:e1:38:00:21",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 0,
+            ac.MD_column : 33,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 13",
+            ac.SV_mac : "00:80:e1:28:00:3f",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 3,
+            ac.MD_column : 0,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 14",
+            ac.SV_mac : "00:80:e1:1f:00:35",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 3,
+            ac.MD_column : 3,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 15",
+            ac.SV_mac : "00:80:e1:40:00:37",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 3,
+            ac.MD_column : 6,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 16",
+            ac.SV_mac : "00:80:e1:4b:00:2a",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 3,
+            ac.MD_column : 9,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 17",
+            ac.SV_mac : "00:80:e1:46:00:3a",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 3,
+            ac.MD_column : 12,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 18",
+            ac.SV_mac : "00:80:e1:2b:00:3b",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 3,
+            ac.MD_column : 15,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 19",
+            ac.SV_mac : "00:80:e1:37:00:37",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 3,
+            ac.MD_column : 18,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 20",
+            ac.SV_mac : "00:80:e1:4a:00:25",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 3,
+            ac.MD_column : 21,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 21",
+            ac.SV_mac : "00:80:e1:40:00:3f",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 3,
+            ac.MD_column : 24,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 22",
+            ac.SV_mac : "00:80:e1:53:00:3a",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 3,
+            ac.MD_column : 27,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 23",
+            ac.SV_mac : "00:80:e1:47:00:38",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 3,
+            ac.MD_column : 30,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 24",
+            ac.SV_mac : "00:80:e1:1e:00:24",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 3,
+            ac.MD_column : 33,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 25",
+            ac.SV_mac : "00:80:e1:36:00:1c",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 6,
+            ac.MD_column : 0,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 26",
+            ac.SV_mac : "00:80:e1:2f:00:2f",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 6,
+            ac.MD_column : 3,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 27",
+            ac.SV_mac : "00:80:e1:32:00:35",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 6,
+            ac.MD_column : 6,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 28",
+            ac.SV_mac : "00:80:e1:2b:00:28",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 6,
+            ac.MD_column : 9,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 29",
+            ac.SV_mac : "00:80:e1:1b:00:35",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 6,
+            ac.MD_column : 12,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 30",
+            ac.SV_mac : "00:80:e1:33:00:18",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 6,
+            ac.MD_column : 15,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 31",
+            ac.SV_mac : "00:80:e1:3c:00:28",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 6,
+            ac.MD_column : 18,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 32",
+            ac.SV_mac : "00:80:e1:50:00:2d",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 6,
+            ac.MD_column : 21,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 33",
+            ac.SV_mac : "00:80:e1:45:00:1f",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 6,
+            ac.MD_column : 24,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 34",
+            ac.SV_mac : "00:80:e1:35:00:37",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 6,
+            ac.MD_column : 27,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 35",
+            ac.SV_mac : "00:80:e1:32:00:21",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 6,
+            ac.MD_column : 30,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 36",
+            ac.SV_mac : "00:80:e1:2b:00:36",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 6,
+            ac.MD_column : 33,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 37",
+            ac.SV_mac : "00:80:e1:2e:00:46",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 9,
+            ac.MD_column : 0,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 38",
+            ac.SV_mac : "00:80:e1:31:00:47",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 9,
+            ac.MD_column : 3,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 39",
+            ac.SV_mac : "00:80:e1:45:00:3a",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 9,
+            ac.MD_column : 6,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 40",
+            ac.SV_mac : "00:80:e1:46:00:2c",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 9,
+            ac.MD_column : 9,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 41",
+            ac.SV_mac : "00:80:e1:40:00:1c",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 9,
+            ac.MD_column : 12,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 42",
+            ac.SV_mac : "00:80:e1:38:00:36",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 9,
+            ac.MD_column : 15,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 43",
+            ac.SV_mac : "00:80:e1:50:00:1f",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 9,
+            ac.MD_column : 18,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 44",
+            ac.SV_mac : "00:80:e1:39:00:24",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 9,
+            ac.MD_column : 21,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 45",
+            ac.SV_mac : "00:80:e1:41:00:37",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 9,
+            ac.MD_column : 24,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 46",
+            ac.SV_mac : "00:80:e1:35:00:3e",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 9,
+            ac.MD_column : 27,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 47",
+            ac.SV_mac : "00:80:e1:1e:00:3c",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 9,
+            ac.MD_column : 30,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 48",
+            ac.SV_mac : "00:80:e1:3b:00:25",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 9,
+            ac.MD_column : 33,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 49",
+            ac.SV_mac : "00:80:e1:32:00:47",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 12,
+            ac.MD_column : 0,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 50",
+            ac.SV_mac : "00:80:e1:45:00:45",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 12,
+            ac.MD_column : 3,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 51",
+            ac.SV_mac : "00:80:e1:4f:00:35",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 12,
+            ac.MD_column : 6,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 52",
+            ac.SV_mac : "00:80:e1:3a:00:1a",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 12,
+            ac.MD_column : 9,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 53",
+            ac.SV_mac : "00:80:e1:24:00:35",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 12,
+            ac.MD_column : 12,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 54",
+            ac.SV_mac : "00:80:e1:3d:00:33",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 12,
+            ac.MD_column : 15,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 55",
+            ac.SV_mac : "00:80:e1:49:00:3a",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 12,
+            ac.MD_column : 18,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 56",
+            ac.SV_mac : "00:80:e1:35:00:3b",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 12,
+            ac.MD_column : 21,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 57",
+            ac.SV_mac : "00:80:e1:44:00:1a",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 12,
+            ac.MD_column : 24,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 58",
+            ac.SV_mac : "00:80:e1:31:00:2a",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 12,
+            ac.MD_column : 27,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 59",
+            ac.SV_mac : "00:80:e1:47:00:45",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 12,
+            ac.MD_column : 30,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 60",
+            ac.SV_mac : "00:80:e1:46:00:37",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 12,
+            ac.MD_column : 33,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 61",
+            ac.SV_mac : "00:80:e1:1b:00:31",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 15,
+            ac.MD_column : 0,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 62",
+            ac.SV_mac : "00:80:e1:33:00:36",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 15,
+            ac.MD_column : 3,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 63",
+            ac.SV_mac : "00:80:e1:2e:00:2d",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 15,
+            ac.MD_column : 6,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 64",
+            ac.SV_mac : "00:80:e1:20:00:3b",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 15,
+            ac.MD_column : 9,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 65",
+            ac.SV_mac : "00:80:e1:3f:00:37",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 15,
+            ac.MD_column : 12,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 66",
+            ac.SV_mac : "00:80:e1:1d:00:35",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 15,
+            ac.MD_column : 15,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 67",
+            ac.SV_mac : "00:80:e1:1f:00:25",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 15,
+            ac.MD_column : 18,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 68",
+            ac.SV_mac : "00:80:e1:40:00:35",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 15,
+            ac.MD_column : 21,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 69",
+            ac.SV_mac : "00:80:e1:45:00:25",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 15,
+            ac.MD_column : 24,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 70",
+            ac.SV_mac : "00:80:e1:2d:00:19",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 15,
+            ac.MD_column : 27,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 71",
+            ac.SV_mac : "00:80:e1:29:00:1c",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 15,
+            ac.MD_column : 30,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 72",
+            ac.SV_mac : "00:80:e1:3d:00:32",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 15,
+            ac.MD_column : 33,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 73",
+            ac.SV_mac : "00:80:e1:44:00:43",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 18,
+            ac.MD_column : 0,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 74",
+            ac.SV_mac : "00:80:e1:26:00:35",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 18,
+            ac.MD_column : 3,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 75",
+            ac.SV_mac : "00:80:e1:22:00:32",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 18,
+            ac.MD_column : 6,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 76",
+            ac.SV_mac : "00:80:e1:34:00:37",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 18,
+            ac.MD_column : 9,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 77",
+            ac.SV_mac : "00:80:e1:2a:00:28",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 18,
+            ac.MD_column : 12,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 78",
+            ac.SV_mac : "00:80:e1:40:00:21",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 18,
+            ac.MD_column : 15,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 79",
+            ac.SV_mac : "00:80:e1:31:00:31",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 18,
+            ac.MD_column : 18,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 80",
+            ac.SV_mac : "00:80:e1:44:00:32",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 18,
+            ac.MD_column : 21,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 81",
+            ac.SV_mac : "00:80:e1:4a:00:30",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 18,
+            ac.MD_column : 24,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 82",
+            ac.SV_mac : "00:80:e1:4f:00:3b",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 18,
+            ac.MD_column : 27,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 83",
+            ac.SV_mac : "00:80:e1:44:00:45",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 18,
+            ac.MD_column : 30,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 84",
+            ac.SV_mac : "00:80:e1:25:00:35",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 18,
+            ac.MD_column : 33,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 85",
+            ac.SV_mac : "00:80:e1:1f:00:3c",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 21,
+            ac.MD_column : 0,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 86",
+            ac.SV_mac : "00:80:e1:48:00:27",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 21,
+            ac.MD_column : 3,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 87",
+            ac.SV_mac : "00:80:e1:1c:00:30",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 21,
+            ac.MD_column : 6,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 88",
+            ac.SV_mac : "00:80:e1:38:00:39",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 21,
+            ac.MD_column : 9,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 89",
+            ac.SV_mac : "00:80:e1:36:00:28",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 21,
+            ac.MD_column : 12,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 90",
+            ac.SV_mac : "00:80:e1:4a:00:1b",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 21,
+            ac.MD_column : 15,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 91",
+            ac.SV_mac : "00:80:e1:27:00:29",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 21,
+            ac.MD_column : 18,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 92",
+            ac.SV_mac : "00:80:e1:2b:00:1e",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 21,
+            ac.MD_column : 21,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 93",
+            ac.SV_mac : "00:80:e1:1b:00:30",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 21,
+            ac.MD_column : 24,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 94",
+            ac.SV_mac : "00:80:e1:51:00:22",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 21,
+            ac.MD_column : 27,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 95",
+            ac.SV_mac : "00:80:e1:4a:00:35",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 21,
+            ac.MD_column : 30,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 96",
+            ac.SV_mac : "00:80:e1:39:00:35",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 21,
+            ac.MD_column : 33,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 97",
+            ac.SV_mac : "00:80:e1:4f:00:1f",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 24,
+            ac.MD_column : 0,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 98",
+            ac.SV_mac : "00:80:e1:45:00:36",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 24,
+            ac.MD_column : 3,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 99",
+            ac.SV_mac : "00:80:e1:2b:00:3f",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 24,
+            ac.MD_column : 6,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 100",
+            ac.SV_mac : "00:80:e1:3e:00:1c",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 24,
+            ac.MD_column : 9,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 101",
+            ac.SV_mac : "00:80:e1:3e:00:28",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 24,
+            ac.MD_column : 12,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 102",
+            ac.SV_mac : "00:80:e1:2c:00:30",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 24,
+            ac.MD_column : 15,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 103",
+            ac.SV_mac : "00:80:e1:2e:00:47",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 24,
+            ac.MD_column : 18,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 104",
+            ac.SV_mac : "00:80:e1:45:00:32",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 24,
+            ac.MD_column : 21,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 105",
+            ac.SV_mac : "00:80:e1:1d:00:32",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 24,
+            ac.MD_column : 24,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 106",
+            ac.SV_mac : "00:80:e1:2e:00:1c",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 24,
+            ac.MD_column : 27,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 107",
+            ac.SV_mac : "00:80:e1:30:00:3e",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 24,
+            ac.MD_column : 30,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 108",
+            ac.SV_mac : "00:80:e1:33:00:28",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 24,
+            ac.MD_column : 33,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 109",
+            ac.SV_mac : "00:80:e1:31:00:1c",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 27,
+            ac.MD_column : 0,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 110",
+            ac.SV_mac : "00:80:e1:4f:00:2f",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 27,
+            ac.MD_column : 3,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 111",
+            ac.SV_mac : "00:80:e1:4f:00:2d",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 27,
+            ac.MD_column : 6,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 112",
+            ac.SV_mac : "00:80:e1:2c:00:35",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 27,
+            ac.MD_column : 9,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 113",
+            ac.SV_mac : "00:80:e1:30:00:28",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 27,
+            ac.MD_column : 12,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 114",
+            ac.SV_mac : "00:80:e1:46:00:46",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 27,
+            ac.MD_column : 15,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 115",
+            ac.SV_mac : "00:80:e1:35:00:32",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 27,
+            ac.MD_column : 18,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 116",
+            ac.SV_mac : "00:80:e1:42:00:3f",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 27,
+            ac.MD_column : 21,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 117",
+            ac.SV_mac : "00:80:e1:4b:00:25",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 27,
+            ac.MD_column : 24,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 118",
+            ac.SV_mac : "00:80:e1:40:00:36",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 27,
+            ac.MD_column : 27,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 119",
+            ac.SV_mac : "00:80:e1:30:00:3b",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 27,
+            ac.MD_column : 30,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 120",
+            ac.SV_mac : "00:80:e1:49:00:1d",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 27,
+            ac.MD_column : 33,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 121",
+            ac.SV_mac : "00:80:e1:22:00:30",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 30,
+            ac.MD_column : 0,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 122",
+            ac.SV_mac : "00:80:e1:41:00:28",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 30,
+            ac.MD_column : 3,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 123",
+            ac.SV_mac : "00:80:e1:51:00:2d",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 30,
+            ac.MD_column : 6,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 124",
+            ac.SV_mac : "00:80:e1:4a:00:36",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 30,
+            ac.MD_column : 9,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 125",
+            ac.SV_mac : "00:80:e1:44:00:3f",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 30,
+            ac.MD_column : 12,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 126",
+            ac.SV_mac : "00:80:e1:2a:00:1e",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 30,
+            ac.MD_column : 15,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 127",
+            ac.SV_mac : "00:80:e1:3c:00:31",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 30,
+            ac.MD_column : 18,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 128",
+            ac.SV_mac : "00:80:e1:44:00:3a",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 30,
+            ac.MD_column : 21,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 129",
+            ac.SV_mac : "00:80:e1:45:00:46",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 30,
+            ac.MD_column : 24,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 130",
+            ac.SV_mac : "00:80:e1:35:00:21",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 30,
+            ac.MD_column : 27,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 131",
+            ac.SV_mac : "00:80:e1:3c:00:47",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 30,
+            ac.MD_column : 30,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 132",
+            ac.SV_mac : "00:80:e1:47:00:1f",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 30,
+            ac.MD_column : 33,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 133",
+            ac.SV_mac : "00:80:e1:2d:00:2d",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 33,
+            ac.MD_column : 0,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 134",
+            ac.SV_mac : "00:80:e1:43:00:28",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 33,
+            ac.MD_column : 3,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 135",
+            ac.SV_mac : "00:80:e1:39:00:36",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 33,
+            ac.MD_column : 6,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 136",
+            ac.SV_mac : "00:80:e1:21:00:35",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 33,
+            ac.MD_column : 9,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 137",
+            ac.SV_mac : "00:80:e1:2d:00:46",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 33,
+            ac.MD_column : 12,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 138",
+            ac.SV_mac : "00:80:e1:4d:00:1f",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 33,
+            ac.MD_column : 15,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 139",
+            ac.SV_mac : "00:80:e1:4c:00:2a",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 33,
+            ac.MD_column : 18,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 140",
+            ac.SV_mac : "00:80:e1:46:00:21",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 33,
+            ac.MD_column : 21,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 141",
+            ac.SV_mac : "00:80:e1:46:00:43",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 33,
+            ac.MD_column : 24,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 142",
+            ac.SV_mac : "00:80:e1:4e:00:3b",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 33,
+            ac.MD_column : 27,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 143",
+            ac.SV_mac : "00:80:e1:33:00:3e",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 33,
+            ac.MD_column : 30,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+
+        },
+        {
+
+            ac.SV_name : "Module 144",
+            ac.SV_mac : "00:80:e1:3c:00:1b",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 33,
+            ac.MD_column : 33,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+	    },
+        {
+            ac.SV_name : "Side Array 1",
+            ac.SV_mac : "00:80:e1:XX:XX:X1",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 0,
+            ac.MD_column : 37,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+	    },
+        {
+            ac.SV_name : "Side Array 2",
+            ac.SV_mac : "00:80:e1:XX:XX:X2",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 3,
+            ac.MD_column : 37,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+	    },
+        {
+            ac.SV_name : "Side Array 3",
+            ac.SV_mac : "00:80:e1:XX:XX:X3",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 6,
+            ac.MD_column : 37,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+	    },
+        {
+            ac.SV_name : "Side Array 4",
+            ac.SV_mac : "00:80:e1:XX:XX:X4",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 9,
+            ac.MD_column : 37,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+	    },
+        {
+            ac.SV_name : "Side Array 5",
+            ac.SV_mac : "00:80:e1:XX:XX:X5",
+            ac.SV_index : -1,
+            ac.SV_fanModel : "Unknown",
+            ac.SV_fanMode : ac.DOUBLE,
+            ac.SV_targetRelation :(1.0, 0.0),
+            ac.SV_chaserTolerance : 0.02,
+            ac.SV_fanFrequencyHZ : 25000,
+            ac.SV_counterCounts : 2,
+            ac.SV_counterTimeoutMS : 30,
+            ac.SV_pulsesPerRotation : 2,
+            ac.SV_maxRPM : 16000,
+            ac.SV_minRPM : 1200,
+            ac.SV_minDC : 0.1,
+            ac.SV_maxFans : 18,
+            ac.SV_pinout : "CAST",
+            ac.MD_assigned : True,
+            ac.MD_row : 12,
+            ac.MD_column : 37,
+            ac.MD_rows : 3,
+            ac.MD_columns : 3,
+            ac.MD_mapping : ("0-1,2-3,4-5,6-7,8-9,10-11,12-13,14-15,16-17")
+	    },
+    ),
+    ac.pinouts : ac.PINOUTS.copy(),
+    ac.maxRPM : 16000,
+    ac.maxFans : 18,
+    ac.dcDecimals : 2,
+    ac.fanArray : {
+        ac.FA_rows : 36,
+        ac.FA_columns : 40,
+        ac.FA_layers : 2,
+    },
+}
@@ -0,0 +1,225 @@
+################################################################################
+##----------------------------------------------------------------------------##
+## CALIFORNIA INSTITUTE OF TECHNOLOGY ## GRADUATE AEROSPACE LABORATORY ##     ##
+## CENTER FOR AUTONOMOUS SYSTEMS AND TECHNOLOGIES                      ##     ##
+##----------------------------------------------------------------------------##
+##      ____      __      __  __      _____      __      __    __    ____     ##
+##     / __/|   _/ /|    / / / /|  _- __ __\    / /|    / /|  / /|  / _  \    ##
+##    / /_ |/  / /  /|  /  // /|/ / /|__| _|   / /|    / /|  / /|/ /   --||   ##
+##   / __/|/ _/    /|/ /   / /|/ / /|    __   / /|    / /|  / /|/ / _  \|/    ##
+##  / /|_|/ /  /  /|/ / // //|/ / /|__- / /  / /___  / -|_ - /|/ /     /|     ##
+## /_/|/   /_/ /_/|/ /_/ /_/|/ |\ ___--|_|  /_____/| |-___-_|/  /____-/|/     ##
+## |_|/    |_|/|_|/  |_|/|_|/   \|___|-    |_____|/   |___|     |____|/       ##
+##                   _ _    _    ___   _  _      __  __   __                  ##
+##                  | | |  | |  | T_| | || |    |  ||_ | | _|                 ##
+##                  | _ |  |T|  |  |  |  _|      ||   \\_//                   ##
+##                  || || |_ _| |_|_| |_| _|    |__|  |___|                   ##
+##                                                                            ##
+##----------------------------------------------------------------------------##
+## Alejandro A. Stefan Zavala ## <astefanz@berkeley.edu>   ##                 ##
+## Chris J. Dougherty         ## <cdougher@caltech.edu>    ##                 ##
+## Marcel Veismann            ## <mveisman@caltech.edu>    ##                 ##
+################################################################################
+
+""" ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+ + Feedback data logging to CSV files, apart from any GUI so that headless
+ + front-ends can use it too (see fc.frontend.headless).
+ +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
+
+## IMPORTS #####################################################################
+import time as tm
+import multiprocessing as mp
+
+from fc import archive as ac, printer as pt, standards as std
+
+## DATA LOGGER #################################################################
+class DataLogger(pt.PrintClient):
+    """
+    Print feedback vectors to CSV files.
+    """
+    SYMBOL = "[DL]"
+    STOP = -69
+    S_I_NAME, S_I_MAC = 0, 1
+
+
+    # NOTE:
+    # - you cannot add slaves mid-print, as the back-end process takes only F's
+    # NOTE: watchdog?
+
+    def __init__(self, archive, pqueue):
+        pt.PrintClient.__init__(self, pqueue)
+
+        self.pipeRecv, self.pipeSend = None, None
+        self._buildPipes()
+        self.archive = archive
+        self.process = None
+
+        self.slaves = {}
+
+    # API ----------------------------------------------------------------------
+
+    def start(self, filename, timeout = std.MP_STOP_TIMEOUT_S,
+        script = "[NONE]", mappings = ("[NONE]",)):
+        """
+        Begin data logging.
+        """
+        try:
+            if self.active():
+                self.stop(timeout)
+            self._buildPipes()
+            arr = self.archive[ac.fanArray]
+            self.process = mp.Process(
+                name = "FC_Log_Backend",
+                target = self._routine,
+                args = (
+                    filename, self.archive[ac.version], self.slaves,
+                    self.archive[ac.name], self.archive[ac.maxFans],
+                    (arr[ac.FA_rows], arr[ac.FA_columns], arr[ac.FA_layers]),
+                    self.pipeRecv, script, mappings, self.pqueue),
+                daemon = True,)
+            self.process.start()
+            self.prints("Data log started")
+        except Exception as e:
+            self.printx(e, "Exception activating data log:")
+            self._sendStop()
+
+    def stop(self, timeout = std.MP_STOP_TIMEOUT_S):
+        """
+        Stop data logging.
+        """
+        try:
+            if self.active():
+                self.printr("Stopping data log")
+                self._sendStop()
+                self.process.join(timeout)
+                if self.process.is_alive():
+                    self.process.terminate()
+                self.process = None
+                self.printr("Data log stopped")
+        except Exception as e:
+            self.printx(e, "Exception stopping data log:")
+            self._sendStop()
+
+    def active(self):
+        """
+        Return whether the printer back-end is active.
+        """
+        return self.process is not None and self.process.is_alive()
+
+    def feedbackIn(self, F, t = 0):
+        """
+        Process the feedback vector F with timestamp t.
+        """
+        # FIXME: optm. time stamping
+        if self.active():
+            self.pipeSend.send((F, t))
+
+    def slavesIn(self, S):
+        """
+        Process a slave data vector.
+        """
+        length = len(S)
+        i = 0
+        while i < length:
+            index, name, mac = \
+                S[i + std.SD_INDEX] + 1, S[i + std.SD_NAME], S[i + std.SD_MAC]
+            if index not in self.slaves:
+                self.slaves[index] = (name, mac)
+            i += std.SD_LEN
+
+    def networkIn(self, N):
+        """
+        Process a network state vector.
+        """
+        pass
+
+    # Internal methods ---------------------------------------------------------
+    def _sendStop(self):
+        """
+        Send the stop signal.
+        """
+        self.pipeSend.send(self.STOP)
+
+    def _buildPipes(self):
+        """
+        Reset the pipes. Do not use while the back-end is active.
+        """
+        self.pipeRecv, self.pipeSend = mp.Pipe(False)
+
+    @staticmethod
+    def _routine(filename, version, slaves, profileName, maxFans, dimensions,
+        pipeRecv, script, mappings, pqueue):
+        """
+        Routine executed by the back-end process.
+        """
+
+        # FIXME exception handling
+        # FIXME watch for thread death
+
+        # FIXME performance
+        P = pt.PrintClient(pqueue)
+        P.symbol = "[DR]"
+        P.printr("Setting up data log")
+        with open(filename, 'w') as f:
+            # (Header) Log basic data:
+            f.write("Fan Club MkIV ({}) data log started on {}  using "\
+                "profile \"{}\"\n".format(
+                    version,tm.strftime("%a %d %b %Y %H:%M:%S", tm.localtime()),
+                    profileName))
+
+            # (Header) filename:
+            f.write("Filename: \"{}\"\n".format(filename))
+
+            # (Header) Module breakdown:
+            f.write("Modules: |")
+            rpm_boilerplate = ""
+            dc_boilerplate = ""
+            for fan in range(maxFans):
+                rpm_boilerplate += "s{0}" + "rpm{},".format(fan + 1)
+                dc_boilerplate += "s{0}" + "dc{},".format(fan + 1)
+            rpm_headers = ""
+            dc_headers = ""
+            for index, data in slaves.items():
+                name, mac = data
+                f.write("\"{}\": {} - \"{}\" | ".format(index, name, mac))
+                rpm_headers += rpm_boilerplate.format(index)
+                dc_headers += dc_boilerplate.format(index)
+            f.write("\n")
+
+            # (Header) Dimensions:
+            f.write("Dimensions (rows, columns, layers): {}x{}x{}\n".format(
+                *dimensions))
+
+            # (Header) Max fans:
+            f.write("Max Fans: {}\n".format(maxFans))
+
+            # (Header) Mappings:
+            f.write("Fan Array Mapping(s):\n")
+            for i, mapping in enumerate(mappings):
+                f.write("\tMapping {}: {}\n".format(i + 1, mapping))
+
+            # (Header) Functions in use:
+            fn_temp = "Script (Flattened. Replace ; for newline):\n"
+            f.write(fn_temp + script + "\n")
+
+            # Header (3/4)
+            f.write("Column headers are of the form s[MODULE#][type][FAN#]"\
+                "with type being first \"rpm\" and then all \"dc\"\n")
+
+            # Header (4/4):
+            f.write("Time (s)," + rpm_headers + dc_headers + "\n")
+
+            P.prints("Data log online")
+            t_start = tm.time()
+            while True:
+                # FIXME performance
+                data = pipeRecv.recv()
+                if data == DataLogger.STOP:
+                    break
+                F, t = data
+                f.write("{},".format(t - t_start))
+                for item in F:
+                    f.write("{},".format(item if item != -666 else 'NaN'))
+                f.write("\n")
+        P.printr("Data logger back-end ending")
+
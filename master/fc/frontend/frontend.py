@@ -36,7 +36,9 @@ import fc.utils as us
 import fc.printer as pt
 import fc.backend.communicator as cm
 import fc.backend.external as ex
+import fc.backend.states as st
 import fc.backend.mapper as mr
+import fc.frontend.mailbox as mb
 import fc.standards as std
 
 ################################################################################
@@ -52,6 +54,9 @@ class FCFrontend(pt.PrintServer):
     Note that, by the current implementation, an FCCore instance is meant
     to be "run" (read: used) once.
 
+    Each client is given the vectors through a Mailbox of its own (see
+    fc.frontend.mailbox), so that a slow client does not hold up the others.
+
     -- ON PERFORMANCE AND INHERITANCE ------------------------------------------
     By inheriting from fc.utils.PrintServer, this class has a similar behavior:
     a sentinel thread runs in the background and checks for messages between
@@ -86,7 +91,7 @@ class FCFrontend(pt.PrintServer):
         self.mapper = mr.Mapper(self.archive)
 
         self.network = cm.FCCommunicator(self.feedback_send, self.slave_send,
-            self.network_send, archive, pqueue)
+            self.network_send, archive, pqueue, self.diagnostics_send)
         self.external = ex.ExternalControl(self.mapper, archive, pqueue)
         self.addFeedbackClient(self.external)
         self.addNetworkClient(self.external)
@@ -110,28 +115,79 @@ class FCFrontend(pt.PrintServer):
 
         # Clean up:
         self._stopThreads()
+        self.network.release()
+        for stats in self.mailboxStats():
+            self.printr("Mailbox {} ({}): {} delivered, {} dropped, at most "\
+                "{} waiting, {:.2f} ms mean and {:.2f} ms max in "\
+                "client".format(stats[0], stats[1], stats[4], stats[5],
+                    stats[3], 1000*stats[6], 1000*stats[7]))
         pt.PrintServer.stop(self)
 
-    def addFeedbackClient(self, client):
+    # NOTE: Each add*Client method takes the following optional arguments
+    # (see fc.frontend.mailbox):
+    # - policy := what to do when the client's mailbox is full (mb.LATEST or
+    #   mb.LOSSLESS).
+    # - depth := most vectors waiting in the mailbox (by default, as per
+    #   POLICY).
+    # - loop := whether the mailbox is emptied by the interface's main loop
+    #   (see _pump) instead of a thread of its own.
+
+    def addFeedbackClient(self, client, policy = mb.LATEST, depth = None,
+        loop = False):
         """
         Add CLIENT to the list of objects who's feedbackIn method is to be
         called to distribute incoming feedback vectors.
         """
-        self.feedback_clients.append(client.feedbackIn)
+        self.feedback_clients.append(self._mailbox(client, "feedbackIn",
+            policy, depth, loop))
 
-    def addNetworkClient(self, client):
+    def addNetworkClient(self, client, policy = mb.LATEST, depth = None,
+        loop = False):
         """
         Add CLIENT to the list of objects who's networkIn method is to be
         called to distribute incoming network vectors.
         """
-        self.network_clients.append(client.networkIn)
+        self.network_clients.append(self._mailbox(client, "networkIn",
+            policy, depth, loop))
+
+    def addTimingClient(self, client, policy = mb.LATEST, depth = None,
+        loop = False):
+        """
+        Add CLIENT to the list of objects who's timingIn method is to be
+        called to distribute incoming timing vectors (sent by the back-end in
+        reply to CMD_TIMING, see fc.standards).
+        """
+        self.timing_clients.append(self._mailbox(client, "timingIn",
+            policy, depth, loop))
 
-    def addSlaveClient(self, client):
+    def addDiagnosticsClient(self, client, policy = mb.LATEST, depth = None,
+        loop = False):
+        """
+        Add CLIENT to the list of objects who's diagnosticsIn method is to be
+        called to distribute incoming diagnostics arrays (see fc.standards).
+        """
+        self.diagnostics_clients.append(self._mailbox(client, "diagnosticsIn",
+            policy, depth, loop))
+
+    def addSlaveClient(self, client, depth = None, loop = False):
         """
         Add CLIENT to the list of objects who's slavesIn method is to be
-        called to distribute incoming slaves vectors.
+        called to distribute incoming slaves vectors. Only the records of slaves
+        whose data changed are distributed, so CLIENT is first given those of
+        all slaves known so far, if any, and its mailbox is always LOSSLESS.
+        """
+        mailbox = self._mailbox(client, "slavesIn", mb.LOSSLESS, depth, loop)
+        S = self.slave_table.vector()
+        if S:
+            mailbox.put(S)
+        self.slave_clients.append(mailbox)
+
+    def mailboxStats(self):
         """
-        self.slave_clients.append(client.slavesIn)
+        Return a list with the statistics of the mailbox of each client (see
+        fc.frontend.mailbox.Mailbox.stats).
+        """
+        return [mailbox.stats() for mailbox in self.mailboxes]
 
     def archiveClient(self, client):
         """
@@ -180,6 +236,26 @@ class FCFrontend(pt.PrintServer):
             self.S_alt = S
 
     # "PRIVATE" AUXILIARY METHODS ----------------------------------------------
+    def _mailbox(self, client, method, policy, depth, loop):
+        """
+        Build, register and start a Mailbox for the method named METHOD of
+        CLIENT.
+        """
+        mailbox = mb.Mailbox("{}.{}".format(type(client).__name__, method),
+            getattr(client, method), self.pqueue, policy, depth, loop)
+        self.mailboxes.append(mailbox)
+        mailbox.start()
+        return mailbox
+
+    def _pump(self):
+        """
+        Deliver what waits in the mailboxes emptied by the main loop. To be
+        called periodically from there by interfaces that have such clients.
+        """
+        for mailbox in self.mailboxes:
+            if mailbox.loop:
+                mailbox.pump()
+
     def _onProfileChange(self):
         """
         Handle a change in the loaded FC Profile.
@@ -187,6 +263,8 @@ class FCFrontend(pt.PrintServer):
         self.network.stop()
         self._pauseThreads()
         self.__flushPipes()
+        for mailbox in self.mailboxes:
+            mailbox.clear()
         self._resumeThreads()
 
         for client in self.archive_clients:
@@ -203,6 +281,8 @@ class FCFrontend(pt.PrintServer):
             self.network_send.send(std.PAD)
         while not self.slave_lock.acquire(False):
             self.slave_send.send(std.PAD)
+        while not self.diagnostics_lock.acquire(False):
+            self.diagnostics_send.send(std.PAD)
 
     def _resumeThreads(self):
         """
@@ -212,6 +292,7 @@ class FCFrontend(pt.PrintServer):
         self.feedback_lock.release()
         self.network_lock.release()
         self.slave_lock.release()
+        self.diagnostics_lock.release()
 
     def _getAltF(self):
         temp = self.F_alt
@@ -244,10 +325,11 @@ class FCFrontend(pt.PrintServer):
         self.feedback_recv, self.feedback_send = mp.Pipe(False)
         self.network_recv, self.network_send = mp.Pipe(False)
         self.slave_recv, self.slave_send = mp.Pipe(False)
-        self.send_pipes = (
-            self.feedback_send, self.network_send, self.slave_send)
-        self.recv_pipes = (
-            self.feedback_recv, self.network_recv, self.slave_recv)
+        self.diagnostics_recv, self.diagnostics_send = mp.Pipe(False)
+        self.send_pipes = (self.feedback_send, self.network_send,
+            self.slave_send, self.diagnostics_send)
+        self.recv_pipes = (self.feedback_recv, self.network_recv,
+            self.slave_recv, self.diagnostics_recv)
 
     def __buildLocks(self):
         """
@@ -256,6 +338,7 @@ class FCFrontend(pt.PrintServer):
         self.feedback_lock = mt.Lock()
         self.network_lock = mt.Lock()
         self.slave_lock = mt.Lock()
+        self.diagnostics_lock = mt.Lock()
 
     def __buildLists(self):
         """
@@ -264,8 +347,12 @@ class FCFrontend(pt.PrintServer):
         """
         self.feedback_clients = []
         self.network_clients = []
+        self.timing_clients = []
         self.slave_clients = []
+        self.diagnostics_clients = []
+        self.slave_table = st.Table()
         self.archive_clients = []
+        self.mailboxes = []
 
     def __buildThreads(self):
         """
@@ -275,7 +362,8 @@ class FCFrontend(pt.PrintServer):
         self.threads = (
             mt.Thread(target = self._feedbackRoutine, daemon = True),
             mt.Thread(target = self._slaveRoutine, daemon = True),
-            mt.Thread(target = self._networkRoutine, daemon = True))
+            mt.Thread(target = self._networkRoutine, daemon = True),
+            mt.Thread(target = self._diagnosticsRoutine, daemon = True))
 
     def _startThreads(self):
         """
@@ -291,6 +379,8 @@ class FCFrontend(pt.PrintServer):
         """
         for pipe in self.send_pipes:
             pipe.close()
+        for mailbox in self.mailboxes:
+            mailbox.close()
 
     def _feedbackRoutine(self):
         """
@@ -302,14 +392,17 @@ class FCFrontend(pt.PrintServer):
             try:
                 self.feedback_lock.acquire()
                 self.feedback_lock.release()
-                F = self.feedback_recv.recv()
+                F = self.network.readFeedback(self.feedback_recv.recv())
                 if F == std.END:
                     break
                 if not self.live:
                     F = self._getAltF()
                 if F != None and F != std.PAD:
-                    for client_method in self.feedback_clients:
-                        client_method(F)
+                    for mailbox in self.feedback_clients:
+                        mailbox.put(F)
+            except (EOFError, OSError):
+                # Pipe closed (see _stopThreads):
+                break
             except Exception as e:
                 self.printx(e, "Exception in FE feedback routine")
         self.printr("Feedback watchdog terminated.")
@@ -322,12 +415,20 @@ class FCFrontend(pt.PrintServer):
             try:
                 self.slave_lock.acquire()
                 self.slave_lock.release()
-                S = self.slave_recv.recv()
-                if S == std.END:
+                M = self.slave_recv.recv()
+                if M == std.END:
                     break
-                if S != None and S != std.PAD:
-                    for client_method in self.slave_clients:
-                        client_method(S)
+                if M != None and M != std.PAD:
+                    S, gap = self.slave_table.apply(M)
+                    if gap:
+                        self.printw("Missed a slave vector. Requesting all.")
+                        self.network.commandIn(std.CMD_S)
+                    if S:
+                        for mailbox in self.slave_clients:
+                            mailbox.put(S)
+            except (EOFError, OSError):
+                # Pipe closed (see _stopThreads):
+                break
             except Exception as e:
                 self.printx(e, "Exception in FE slave routine")
         self.printr("Slave state watchdog terminated.")
@@ -343,10 +444,36 @@ class FCFrontend(pt.PrintServer):
                 if N == std.END:
                     break
                 if N != None and N != std.PAD:
-                    for client_method in self.network_clients:
-                        client_method(N)
+                    clients = self.timing_clients \
+                        if N[0] == std.TM_CODE else self.network_clients
+                    for mailbox in clients:
+                        mailbox.put(N)
+            except (EOFError, OSError):
+                # Pipe closed (see _stopThreads):
+                break
             except Exception as e:
                 self.printx(e, "Exception in FE network routine")
         self.printr("Network state watchdog terminated.")
         print("Network state watchdog terminated.")
 
+    def _diagnosticsRoutine(self):
+        self.printr("Diagnostics watchdog started.")
+        while True:
+            try:
+                self.diagnostics_lock.acquire()
+                self.diagnostics_lock.release()
+                G = self.diagnostics_recv.recv()
+                if type(G) is int:
+                    # Sentinel value (END or PAD):
+                    if G == std.END:
+                        break
+                elif G is not None:
+                    for mailbox in self.diagnostics_clients:
+                        mailbox.put(G)
+            except (EOFError, OSError):
+                # Pipe closed (see _stopThreads):
+                break
+            except Exception as e:
+                self.printx(e, "Exception in FE diagnostics routine")
+        self.printr("Diagnostics watchdog terminated.")
+        print("Diagnostics watchdog terminated.")
@@ -0,0 +1,118 @@
+################################################################################
+## Project: Fanclub Mark IV "Master"  ## File: render.py                      ##
+##----------------------------------------------------------------------------##
+## CALIFORNIA INSTITUTE OF TECHNOLOGY ## GRADUATE AEROSPACE LABORATORY ##     ##
+## CENTER FOR AUTONOMOUS SYSTEMS AND TECHNOLOGIES                      ##     ##
+##----------------------------------------------------------------------------##
+##      ____      __      __  __      _____      __      __    __    ____     ##
+##     / __/|   _/ /|    / / / /|  _- __ __\    / /|    / /|  / /|  / _  \    ##
+##    / /_ |/  / /  /|  /  // /|/ / /|__| _|   / /|    / /|  / /|/ /   --||   ##
+##   / __/|/ _/    /|/ /   / /|/ / /|    __   / /|    / /|  / /|/ / _  \|/    ##
+##  / /|_|/ /  /  /|/ / // //|/ / /|__- / /  / /___  / -|_ - /|/ /     /|     ##
+## /_/|/   /_/ /_/|/ /_/ /_/|/ |\ ___--|_|  /_____/| |-___-_|/  /____-/|/     ##
+## |_|/    |_|/|_|/  |_|/|_|/   \|___|-    |_____|/   |___|     |____|/       ##
+##                   _ _    _    ___   _  _      __  __   __                  ##
+##                  | | |  | |  | T_| | || |    |  ||_ | | _|                 ##
+##                  | _ |  |T|  |  |  |  _|      ||   \\_//                   ##
+##                  || || |_ _| |_|_| |_| _|    |__|  |___|                   ##
+##                                                                            ##
+##----------------------------------------------------------------------------##
+## Alejandro A. Stefan Zavala ## <astefanz@berkeley.edu>   ##                 ##
+## Chris J. Dougherty         ## <cdougher@caltech.edu>    ##                 ##
+## Marcel Veismann            ## <mveisman@caltech.edu>    ##                 ##
+################################################################################
+
+""" ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+ + Frame scheduling for the Tk GUI.
+ +
+ + Widgets are not called by the front-end's sentinel threads. The vectors
+ + meant for them wait in mailboxes (see fc.frontend.mailbox), and a
+ + RenderScheduler empties these from the Tk main loop once per frame, so
+ + that widgets always draw the newest feedback, network and slave data and
+ + the display rate does not depend on the back-end's feedback rate.
+ +
+ + Frames are kept on deadlines of the monotonic clock. The frame time starts
+ + at the target (1/FPS) and grows, up to MAX_FRAME_S, while renders take
+ + more than a share of it, so that the main loop keeps time for user input.
+ + When a render overruns one or more deadlines, those frames are skipped
+ + and counted instead of being drawn late, back to back.
+ +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
+
+## IMPORTS #####################################################################
+import time as tm
+
+## GLOBALS #####################################################################
+DEFAULT_FPS = 30
+MAX_FRAME_S = 0.5   # Longest frame time allowed when renders are slow
+HEADROOM = 2        # Frame time as a multiple of the render time, at least
+GAIN = 1/8          # Weight of each new render time in the running average
+
+## CLASSES #####################################################################
+class RenderScheduler:
+    """
+    Call a render function once per frame from the Tk main loop of a widget.
+    """
+
+    def __init__(self, widget, render, fps = DEFAULT_FPS):
+        """
+        - widget := Tk widget whose main loop to use.
+        - render := function to call, without arguments, to draw a frame.
+        - fps := target frames per second.
+        """
+        self.widget = widget
+        self.render = render
+        self.targetS = 1/fps
+        self.frameS = self.targetS
+        self.renderS = 0.0
+        self.deadline = None
+        self.pending = None
+
+        self.frames = 0
+        self.skipped = 0
+
+    def start(self):
+        """
+        Schedule the first frame. Does nothing if already started.
+        """
+        if self.pending is None:
+            self.deadline = tm.monotonic() + self.frameS
+            self._schedule()
+
+    def stop(self):
+        """
+        Cancel the next frame.
+        """
+        if self.pending is not None:
+            self.widget.after_cancel(self.pending)
+            self.pending = None
+
+    def stats(self):
+        """
+        Return a tuple (frames drawn, frames skipped, current frame time in
+        seconds, average render time in seconds).
+        """
+        return self.frames, self.skipped, self.frameS, self.renderS
+
+    def _frame(self):
+        self.pending = None
+        start = tm.monotonic()
+        try:
+            self.render()
+        finally:
+            end = tm.monotonic()
+            self.frames += 1
+            self.renderS += GAIN*(end - start - self.renderS)
+            self.frameS = min(MAX_FRAME_S,
+                max(self.targetS, HEADROOM*self.renderS))
+
+            # Skip the frames whose deadlines passed meanwhile:
+            self.deadline += self.frameS
+            if self.deadline <= end:
+                missed = int((end - self.deadline)//self.frameS) + 1
+                self.skipped += missed
+                self.deadline += missed*self.frameS
+            self._schedule()
+
+    def _schedule(self):
+        delayMS = max(1, int(1000*(self.deadline - tm.monotonic())))
+        self.pending = self.widget.after(delayMS, self._frame)
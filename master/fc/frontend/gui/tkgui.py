@@ -29,15 +29,16 @@
 
 ## IMPORTS #####################################################################
 import tkinter as tk
+import functools as ft
 
 from fc import printer as pt, utils as us
 from fc.frontend import frontend as fe
+from fc.frontend.gui import render as rd
 from fc.frontend.gui.widgets import splash as spl, base as bas
-import fc.frontend.gui.embedded.icon as icn
 
 ## GLOBALS #####################################################################
 TITLE = "FC MkIV"
-SPLASH_SECONDS = 4
+FPS = rd.DEFAULT_FPS # Target display rate
 
 ################################################################################
 class FCGUI(fe.FCFrontend):
@@ -63,29 +64,48 @@ class FCGUI(fe.FCFrontend):
             windll.shcore.SetProcessDpiAwareness(1)
 
         # Build GUI ............................................................
-        # Splash:
-        splash = spl.SerialSplash(version = "0")
-        splash.run(SPLASH_SECONDS)
+        # Splash (shown while the GUI is built, see _mainloop):
+        self.root = tk.Tk()
+        self.splash = spl.Splash(self.root)
+        self.splash.show()
 
         # GUI:
-        self.root = tk.Tk()
         title = TITLE + " " + self.version
+        # NOTE: Widgets must be given vectors from the Tk main loop.
         base = bas.Base(self.root, self.network, self.external, self.mapper,
-            self.archive, title, self.version, self.addFeedbackClient,
-            self.addNetworkClient, self.addSlaveClient, self._onProfileChange,
+            self.archive, title, self.version,
+            ft.partial(self.addFeedbackClient, loop = True),
+            ft.partial(self.addNetworkClient, loop = True),
+            ft.partial(self.addSlaveClient, loop = True),
+            self._onProfileChange,
             setLive = self.setLive, setF = self.altFeedbackIn,
             pqueue = self.pqueue)
         base.pack(fill = tk.BOTH, expand = True)
         self._setPrintMethods(base)
         self.archiveClient(base)
+        self.base = base
         self.network.connect()
-        base.focusControl()
 
     def _mainloop(self):
         """
         Overriden. Build GUI and run main loop. See base class.
         """
+        # Draw the newest vectors once per frame (see FCFrontend._pump):
+        scheduler = rd.RenderScheduler(self.root, self._pump, FPS)
+        scheduler.start()
+        self.root.after_idle(self._ready)
         self.root.mainloop()
+        frames, skipped, frameS, renderS = scheduler.stats()
+        self.printr("Rendered {} frames, skipped {} (frame time {:.1f} ms, "\
+            "render time {:.1f} ms)".format(frames, skipped, 1000*frameS,
+                1000*renderS))
+
+    def _ready(self):
+        """
+        Replace the splash screen with the GUI once the latter is built.
+        """
+        self.splash.close()
+        self.base.focusControl()
 
     def print(self, code, text):
         """
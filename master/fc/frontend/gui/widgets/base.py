@@ -33,9 +33,10 @@ import tkinter.ttk as ttk
 
 from fc.frontend.gui import guiutils as gus
 from fc.frontend.gui.widgets import network as ntw, control as ctr, \
-    profile as pro, console as csl
+    console as csl
 from fc.frontend.gui.embedded import caltech_white as cte
-from fc import printer as pt, utils as us
+from fc.frontend import mailbox as mb
+from fc import printer as pt, utils as us, standards as std
 
 ## AUXILIARY GLOBALS ###########################################################
 BG_CT = "#ff6e1f"
@@ -83,6 +84,7 @@ class Base(tk.Frame, pt.PrintClient):
         self.feedbackAdd = feedbackAdd
         self.networkAdd = networkAdd
         self.slavesAdd = slavesAdd
+        self.profileCallback = profileCallback
 
         self.setLive, self.setF = setLive, setF
 
@@ -134,18 +136,9 @@ class Base(tk.Frame, pt.PrintClient):
         self.controlTab = tk.Frame(self.notebook)
         self.consoleTab = tk.Frame(self.notebook)
 
-        # Profile tab:
-        self.profileWidget = pro.ProfileDisplay(self.profileTab, archive,
-            profileCallback, pqueue)
-        self.profileWidget.pack(fill = tk.BOTH, expand = True, padx = 20,
-            pady = 20)
-
-        # Network tab:
-        self.networkWidget = ntw.NetworkWidget(self.networkTab,
-            network = network, archive = archive, networkAdd = self.networkAdd,
-            slavesAdd = self.slavesAdd, pqueue = pqueue)
-        self.networkWidget.pack(fill = tk.BOTH, expand = True, padx = 20,
-            pady = 20)
+        # Profile and network tabs (built once first shown, see _onTab):
+        self.profileWidget = None
+        self.networkWidget = None
 
         # Control tab:
         self.controlWidget = ctr.ControlWidget(self.controlTab,
@@ -160,6 +153,9 @@ class Base(tk.Frame, pt.PrintClient):
         self.controlWidget.pack(fill = tk.BOTH, expand = True, padx = 20,
             pady = 20)
         self.feedbackAdd(self.controlWidget)
+        # Data logs see every feedback vector, away from the Tk loop:
+        self.feedbackAdd(ctr.FeedbackLog(self.controlWidget),
+            policy = mb.LOSSLESS, loop = False)
         self.slavesAdd(self.controlWidget)
         self.networkAdd(self.controlWidget)
 
@@ -174,6 +170,9 @@ class Base(tk.Frame, pt.PrintClient):
         self.notebook.add(self.networkTab, text = "Network")
         self.notebook.add(self.controlTab, text = "Control")
         self.notebook.add(self.consoleTab, text = "Console")
+        # Start on the control tab, not the (lazy) profile tab:
+        self.notebook.select(self.controlTab)
+        self.notebook.bind("<<NotebookTabChanged>>", self._onTab)
 
         self.notebook.grid(row = 1, sticky = 'NWES')
 
@@ -207,11 +206,37 @@ class Base(tk.Frame, pt.PrintClient):
         return (c.printr, c.printw, c.printe, c.prints, c.printd, c.printx)
 
     def profileChange(self):
-        self.networkWidget.profileChange()
+        if self.networkWidget is not None:
+            self.networkWidget.profileChange()
         self.controlWidget.profileChange()
         self.bottomWidget.profileChange()
 
     # Internal methods ---------------------------------------------------------
+    def _onTab(self, *_):
+        """
+        To be called when another tab is selected. Builds the widget of the
+        profile and network tabs the first time they are shown, so that they
+        do not delay startup.
+        """
+        tab = self.notebook.index("current")
+        if tab == 0 and self.profileWidget is None:
+            # Imported only once needed, to start faster:
+            from fc.frontend.gui.widgets import profile as pro
+            self.profileWidget = pro.ProfileDisplay(self.profileTab,
+                self.archive, self.profileCallback, self.pqueue)
+            self.profileWidget.pack(fill = tk.BOTH, expand = True, padx = 20,
+                pady = 20)
+        elif tab == 1 and self.networkWidget is None:
+            self.networkWidget = ntw.NetworkWidget(self.networkTab,
+                network = self.network, archive = self.archive,
+                networkAdd = self.networkAdd, slavesAdd = self.slavesAdd,
+                pqueue = self.pqueue)
+            self.networkWidget.pack(fill = tk.BOTH, expand = True, padx = 20,
+                pady = 20)
+            # New slave clients are given all known slaves, but the network
+            # vector must be asked for:
+            self.network.commandIn(std.CMD_N)
+
     def _helpCallback(self):
         """
         To be called when the Help button is pressed.
@@ -24,11 +24,16 @@
 
 """ ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
  + Terminal output for the FC Tkinter GUI
+ +
+ + Messages may be printed from any thread. They wait in a bounded ring buffer
+ + and are inserted in batches by the Tk main loop, which keeps at most
+ + MAX_LINES of them on screen.
  +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
 
 ## IMPORTS #####################################################################
 import os
 import time as tm
+import collections as cl
 
 import tkinter as tk
 import tkinter.filedialog as fdg
@@ -64,6 +69,11 @@ BG_WARNING = BG_DEFAULT
 BG_ERROR = "#510000"
 BG_DEBUG = BG_DEFAULT
 
+# Output buffering:
+MAX_LINES = 5000 # Most lines kept on screen
+MAX_WAITING = 1000 # Most lines waiting to be shown (oldest are dropped)
+DRAIN_MS = 100 # Period with which waiting lines are shown
+
 
 ## WIDGET ######################################################################
 class ConsoleWidget(tk.Frame):
@@ -77,6 +87,9 @@ class ConsoleWidget(tk.Frame):
         tk.Frame.__init__(self, master)
         self.master = master
         self.warn = warnMethod
+        self.waiting = cl.deque(maxlen = MAX_WAITING)
+        self.dropped = 0
+        self.debug = False
 
         self.background = BG_DEFAULT
         self.grid_rowconfigure(0, weight = 1)
@@ -134,6 +147,8 @@ class ConsoleWidget(tk.Frame):
             text ="Autoscroll", variable = self.autoscrollVar, **gus.fontc)
         self.autoscrollButton.pack(side = tk.RIGHT)
 
+        self.after(DRAIN_MS, self._drain)
+
     # API ----------------------------------------------------------------------
     def printr(self, message):
         self._print(TAG_REGULAR, message)
@@ -148,7 +163,7 @@ class ConsoleWidget(tk.Frame):
         self._print(TAG_SUCCESS, message)
 
     def printd(self, message):
-        if self.debugVar.get():
+        if self.debug:
             self._print(TAG_DEBUG, message)
 
     def printx(self, message):
@@ -157,25 +172,50 @@ class ConsoleWidget(tk.Frame):
     # Internal methods ---------------------------------------------------------
     def _print(self, tag, text):
         """
-        Generic print method. To be used internally.
+        Generic print method. To be used internally. May be called from any
+        thread (see _drain).
         """
-        try:
-
-            # Switch focus to this tab in case of errors of warnings:
-            if tag is TAG_ERROR and not self.winfo_ismapped():
-                self.warn()
+        if len(self.waiting) == MAX_WAITING:
+            self.dropped += 1
+        self.waiting.append((tag, text))
 
-            self.screen.config(state = tk.NORMAL)
-            self.screen.insert(tk.END, text + "\n", tag)
-            self.screen.config(state = tk.DISABLED)
-
-            # Check for auto scroll:
-            if self.autoscrollVar.get() == 1:
-                self.screen.see("end")
+    def _drain(self):
+        """
+        Show the lines waiting to be printed, all at once, and schedule the next
+        call. To be called from the Tk main loop.
+        """
+        try:
+            batch = []
+            error = False
+            if self.dropped:
+                dropped, self.dropped = self.dropped, 0
+                batch += ["{} {} lines dropped\n".format(self.symbol,
+                    dropped), TAG_WARNING]
+            while self.waiting:
+                tag, text = self.waiting.popleft()
+                batch += [text + "\n", tag]
+                error = error or tag is TAG_ERROR
+
+            if batch:
+                # Switch focus to this tab in case of errors of warnings:
+                if error and not self.winfo_ismapped():
+                    self.warn()
+
+                self.screen.config(state = tk.NORMAL)
+                self.screen.insert(tk.END, *batch)
+                lines = int(self.screen.index("end-1c").split('.')[0])
+                if lines > MAX_LINES:
+                    self.screen.delete(1.0, "{}.0".format(lines - MAX_LINES))
+                self.screen.config(state = tk.DISABLED)
+
+                # Check for auto scroll:
+                if self.autoscrollVar.get() == 1:
+                    self.screen.see("end")
         except Exception as e:
             gus.popup_exception("FCMkIV Error", "Exception in console printer",
                 e)
-        return
+        finally:
+            self.after(DRAIN_MS, self._drain)
 
     def _save(self, *E):
         """
@@ -210,7 +250,5 @@ class ConsoleWidget(tk.Frame):
         self.printr(self.symbol + " Console cleared")
 
     def _debug(self, *E):
-        if self.debugVar.get() == 1:
-            pt.DEBUGP = True
-        else:
-            pt.DEBUGP = False
+        self.debug = self.debugVar.get() == 1
+        pt.DEBUGP = self.debug
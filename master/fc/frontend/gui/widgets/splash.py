@@ -38,8 +38,6 @@ import multiprocessing as mp
 import threading as mt
 import time as tm
 
-from fc.frontend.gui.embedded import splash3_bg as stp
-
 ## AUXILIARY GLOBALS ###########################################################
 DEFAULT_TIMEOUT = 3
 
@@ -76,6 +74,8 @@ class FCSplashWidget(tk.Frame):
     def __init__(self, master):
         tk.Frame.__init__(self, master)
 
+        # Embedded images are large, so import them only once shown:
+        from fc.frontend.gui.embedded import splash3_bg as stp
         self.image = tk.PhotoImage(data = stp.SPLASH)
         self.image = self.image.subsample(2)
         self.label = tk.Label(self, image = self.image, anchor = tk.CENTER,
@@ -106,6 +106,40 @@ class SerialSplash:
         root.after(1000*timeout, root.destroy)
         root.mainloop()
 
+class Splash:
+    """
+    Splash screen shown on a Toplevel of the GUI's own Tkinter root while the
+    GUI is being built, rather than before (see SerialSplash), so that it does
+    not delay startup. The root is hidden until the splash screen is closed.
+    """
+
+    def __init__(self, root, widget = FCSplashWidget, **kwargs):
+        self.root = root
+        self.widget = widget
+        self.kwargs = kwargs
+        self.top = None
+
+    def show(self):
+        """
+        Hide the root and display the splash screen. Returns immediately.
+        """
+        self.root.withdraw()
+        self.top = tk.Toplevel(self.root)
+        self.top.bind("<Button-1>", lambda e: self.close())
+        splash = SplashFrame(master = self.top, widget = self.widget,
+            **self.kwargs)
+        self.top.update()
+
+    def close(self):
+        """
+        Close the splash screen and show the root. Does nothing if the splash
+        screen is not shown.
+        """
+        if self.top is not None:
+            self.top.destroy()
+            self.top = None
+            self.root.deiconify()
+
 class ParallelSplash:
     """
     Splash window that is built as a separate process, allowing for other tasks
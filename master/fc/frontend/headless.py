@@ -0,0 +1,353 @@
+################################################################################
+##----------------------------------------------------------------------------##
+## CALIFORNIA INSTITUTE OF TECHNOLOGY ## GRADUATE AEROSPACE LABORATORY ##     ##
+## CENTER FOR AUTONOMOUS SYSTEMS AND TECHNOLOGIES                      ##     ##
+##----------------------------------------------------------------------------##
+##      ____      __      __  __      _____      __      __    __    ____     ##
+##     / __/|   _/ /|    / / / /|  _- __ __\    / /|    / /|  / /|  / _  \    ##
+##    / /_ |/  / /  /|  /  // /|/ / /|__| _|   / /|    / /|  / /|/ /   --||   ##
+##   / __/|/ _/    /|/ /   / /|/ / /|    __   / /|    / /|  / /|/ / _  \|/    ##
+##  / /|_|/ /  /  /|/ / // //|/ / /|__- / /  / /___  / -|_ - /|/ /     /|     ##
+## /_/|/   /_/ /_/|/ /_/ /_/|/ |\ ___--|_|  /_____/| |-___-_|/  /____-/|/     ##
+## |_|/    |_|/|_|/  |_|/|_|/   \|___|-    |_____|/   |___|     |____|/       ##
+##                   _ _    _    ___   _  _      __  __   __                  ##
+##                  | | |  | |  | T_| | || |    |  ||_ | | _|                 ##
+##                  | _ |  |T|  |  |  |  _|      ||   \\_//                   ##
+##                  || || |_ _| |_|_| |_| _|    |__|  |___|                   ##
+##                                                                            ##
+##----------------------------------------------------------------------------##
+## Alejandro A. Stefan Zavala ## <astefanz@berkeley.edu>   ##                 ##
+## Chris J. Dougherty         ## <cdougher@caltech.edu>    ##                 ##
+## Marcel Veismann            ## <mveisman@caltech.edu>    ##                 ##
+################################################################################
+
+""" ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+ + Headless Fan Club front-end, for unattended runs over external control.
+ +
+ + Run from the master directory:
+ +
+ +      python3 main.py --headless [-p PROFILE | -f FILE] [-l log.csv]
+ +          [-d SECONDS] [-r SECONDS]
+ +
+ + This is the recommended mode on servers and wherever nobody watches the
+ + GUI: no Tk is imported, no splash is shown and no widgets are kept up to
+ + date, so the whole front-end is the back-end, the Mapper, ExternalControl
+ + and, if asked for, a DataLogger. External control is driven through a
+ + Controller (below) in place of the GUI's control grid, and the listener is
+ + always started.
+ +
+ + The time it took to get the back-end going and to get the first feedback
+ + vector are reported once, and the memory in use by the front-end and its
+ + child processes (back-end, data log) periodically. Runs until interrupted
+ + (SIGINT or SIGTERM) or for the given duration.
+ +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
+
+## IMPORTS #####################################################################
+import os
+import sys
+import signal
+import argparse
+import threading as mt
+import multiprocessing as mp
+import time as tm
+
+from fc import archive as ac, printer as pt, standards as std
+from fc.frontend import frontend as fe, datalog as dl, mailbox as mb
+
+## GLOBALS #####################################################################
+STARTED = tm.perf_counter()
+DEFAULT_REPORT_S = 60
+DEFAULT_WAIT_S = 10
+POLL_S = 0.1
+MIB = 2**20
+
+## AUXILIARY FUNCTIONS #########################################################
+def rss(pid):
+    """
+    Return the resident memory, in bytes, of the process with the given PID, or
+    None if it cannot be read (only Linux /proc is supported).
+    """
+    try:
+        with open("/proc/{}/statm".format(pid)) as f:
+            return int(f.read().split()[1])*os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+def descendants(pid):
+    """
+    Return a list with the PIDs of all the child processes of the process with
+    the given PID, and of theirs, or an empty list if they cannot be read.
+    """
+    pids = []
+    try:
+        for task in os.listdir("/proc/{}/task".format(pid)):
+            with open("/proc/{}/task/{}/children".format(pid, task)) as f:
+                for child in map(int, f.read().split()):
+                    pids.append(child)
+                    pids += descendants(child)
+    except (OSError, ValueError):
+        pass
+    return pids
+
+def memory():
+    """
+    Return a tuple with the resident memory, in bytes, of this process and of
+    all its child processes together, or None if it cannot be read.
+    """
+    own = rss(os.getpid())
+    if own is None:
+        return None
+    return own, sum(filter(None, map(rss, descendants(os.getpid()))))
+
+## CONTROLLER ##################################################################
+class Controller:
+    """
+    Stand-in for the control grid of the GUI (see fc.frontend.gui.widgets.
+    control.GridWidget) that lets ExternalControl map functions to the whole
+    array without Tk. As there is no selection, every fan is set.
+    """
+
+    def __init__(self, archive, mapper, send):
+        """
+        - archive := FCArchive instance.
+        - mapper := FC Mapper instance (grid mapping).
+        - send := method to which to pass control vectors (e.g.
+            FCCommunicator.controlIn).
+        """
+        self.archive = archive
+        self.mapper = mapper
+        self.send = send
+        self.profileChange()
+
+    def map(self, func, t = 0, t_step = 0):
+        """
+        Map the given function to the entire array, calling it once for each
+        fan with the same arguments as GridWidget.map.
+        """
+        C = [0]*self.size_k
+        for k in range(self.size_k):
+            s, f = k // self.maxFans, k % self.maxFans
+            if self.mapper.index_KG(k) == std.PAD:
+                l, r, c = 0, 0, 0
+            else:
+                l, r, c = self.mapper.tuple_KG(s, f)
+            C[k] = func(r, c, l, s, f, self.F[self.size_k + k], self.F[k],
+                self.R, self.C, self.L, self.nslaves, self.maxFans,
+                self.maxRPM, t, t_step)
+        self.send(C)
+
+    def set(self, dc):
+        """
+        Map the given duty cycle.
+        """
+        self.send([dc]*self.size_k)
+
+    def feedbackIn(self, F):
+        """
+        Keep the latest feedback vector, from which map takes RPMs and duty
+        cycles.
+        """
+        if len(F) == 2*self.size_k:
+            self.F = F
+
+    def profileChange(self):
+        array = self.archive[ac.fanArray]
+        self.R, self.C = array[ac.FA_rows], array[ac.FA_columns]
+        self.L = array[ac.FA_layers]
+        self.nslaves = len(self.archive[ac.savedSlaves])
+        self.maxFans = self.archive[ac.maxFans]
+        self.maxRPM = self.archive[ac.maxRPM]
+        self.size_k = self.nslaves*self.maxFans
+        self.F = [0]*(2*self.size_k)
+
+## FRONT-END ###################################################################
+class FCHeadless(fe.FCFrontend):
+    """
+    Front-end with no GUI. Prints to the terminal and runs until ended (see
+    end and run).
+    """
+    SYMBOL = "[HL]"
+
+    def __init__(self, archive, pqueue, log = None, duration = None,
+        report = DEFAULT_REPORT_S, wait = DEFAULT_WAIT_S, started = STARTED):
+        """
+        - archive := FCArchive instance.
+        - pqueue := Queue instance to be used for printing.
+        - log := name of the file to which to log feedback vectors, if any.
+        - duration := seconds to run for, or None to run until stopped.
+        - report := seconds between memory reports, or 0 for none.
+        - wait := most seconds to wait for the slaves of the profile to connect
+            before the data log is started (so that they are listed in it).
+        - started := time.perf_counter value when execution started, from
+            which startup times are measured.
+        """
+        fe.FCFrontend.__init__(self, archive, pqueue)
+        self.log = log
+        self.duration = duration
+        self.report = report
+        self.wait = wait
+        self.since = started
+        self.ending = mt.Event()
+        self.firstF = None
+
+        self.controller = Controller(archive, self.mapper,
+            self.network.controlIn)
+        self.external.setController(self.controller)
+        self.addFeedbackClient(self.controller)
+        self.archiveClient(self.controller)
+
+        self.dataLogger = None
+        if log is not None:
+            self.dataLogger = dl.DataLogger(archive, pqueue)
+            self.addFeedbackClient(self, policy = mb.LOSSLESS)
+            self.addSlaveClient(self)
+        else:
+            self.addFeedbackClient(self)
+
+    def end(self, *_):
+        """
+        End the main loop. May be used as a signal handler.
+        """
+        self.ending.set()
+
+    def print(self, code, text):
+        """
+        Overriden. See fc.utils.PrintServer.
+        """
+        output = pt.ERR if code in (pt.E, pt.X) else pt.OUT
+        mark = pt.CODE_TO_STR.get(code, pt.EPREFIX)
+        if mark:
+            print(mark, text, file = output, flush = True)
+        else:
+            print(text, file = output, flush = True)
+
+    def feedbackIn(self, F):
+        if self.firstF is None:
+            self.firstF = tm.perf_counter()
+            self.prints("First feedback vector {:.2f} s after start".format(
+                self.firstF - self.since))
+        if self.dataLogger is not None:
+            self.dataLogger.feedbackIn(F, tm.time())
+
+    def slavesIn(self, S):
+        self.dataLogger.slavesIn(S)
+
+    def _mainloop(self):
+        """
+        Overriden. Run the back-end and external control until stopped. See
+        base class.
+        """
+        handlers = {number : signal.signal(number, self.end)
+            for number in (signal.SIGINT, signal.SIGTERM)}
+        try:
+            self.network.connect()
+            if not self.external.isListenerActive():
+                self.external.activateListener(
+                    self.archive[ac.externalDefaultListenerPort],
+                    self.archive[ac.externalDefaultRepeat])
+            self.prints("Ready {:.2f} s after start".format(
+                tm.perf_counter() - self.since))
+
+            if self.dataLogger is not None:
+                self._startLog()
+
+            peak = 0
+            end = None if self.duration is None \
+                else tm.monotonic() + self.duration
+            while not self.ending.is_set():
+                timeout = self.report or None
+                if end is not None:
+                    left = end - tm.monotonic()
+                    if left <= 0:
+                        break
+                    timeout = left if timeout is None else min(timeout, left)
+                if self.ending.wait(timeout):
+                    break
+                if self.report:
+                    peak = max(peak, self._reportMemory())
+            if peak:
+                self.printr("Peak memory {:.1f} MiB".format(peak/MIB))
+        finally:
+            self.printr("Shutting down")
+            for number, handler in handlers.items():
+                signal.signal(number, handler)
+            if self.dataLogger is not None:
+                self.dataLogger.stop()
+            self.external.deactivateListener()
+            self.external.deactivateBroadcast()
+            self.network.disconnect()
+
+    def _startLog(self):
+        """
+        Start the data log once all the slaves of the profile are connected or
+        once self.wait seconds have passed.
+        """
+        expected = len(self.archive[ac.savedSlaves])
+        deadline = tm.monotonic() + self.wait
+        while self.slave_table.count(std.SS_CONNECTED) < expected \
+            and tm.monotonic() < deadline and not self.ending.wait(POLL_S):
+            pass
+        self.dataLogger.start(self.log)
+
+    def _reportMemory(self):
+        """
+        Print the memory in use by this process and its child processes and
+        return their total, in bytes (0 if unknown).
+        """
+        used = memory()
+        if used is None:
+            return 0
+        own, children = used
+        self.printr("Memory: {:.1f} MiB front-end, {:.1f} MiB child "\
+            "processes".format(own/MIB, children/MIB))
+        return own + children
+
+## MAIN ########################################################################
+def main(argv = None, version = "", profile = None, started = STARTED):
+    """
+    Run a headless front-end with the command line arguments ARGV (sys.argv by
+    default), VERSION as the version string and PROFILE as the name of the
+    builtin profile to load unless given. Returns the exit code.
+    """
+    from fc.builtin import profiles as btp
+
+    parser = argparse.ArgumentParser(
+        description = "Run Fan Club with no GUI, over external control.")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("-p", "--profile", choices = sorted(btp.PROFILES),
+        default = profile, help = "Builtin profile to load")
+    source.add_argument("-f", "--file",
+        help = "Profile file to load (see FCArchive.save)")
+    parser.add_argument("-l", "--log",
+        help = "File to which to log feedback vectors (CSV)")
+    parser.add_argument("-w", "--wait", type = float, default = DEFAULT_WAIT_S,
+        help = "Most seconds to wait for slaves before logging")
+    parser.add_argument("-d", "--duration", type = float, default = None,
+        help = "Seconds to run for (until interrupted by default)")
+    parser.add_argument("-r", "--report", type = float,
+        default = DEFAULT_REPORT_S,
+        help = "Seconds between memory reports (0 for none)")
+    parser.add_argument("-q", "--quiet", action = "store_true",
+        help = "Print only warnings and errors")
+    args = parser.parse_args(argv)
+    if args.file is None and args.profile is None:
+        parser.error("no profile given")
+    if args.file is not None and not os.path.isfile(args.file):
+        parser.error("no such profile file: {}".format(args.file))
+
+    if args.quiet:
+        pt.setLevel(pt.W)
+
+    pqueue = mp.Queue()
+    if args.file is not None:
+        archive = ac.FCArchive(pqueue, version, ac.FCArchive.DEFAULT)
+        archive.load(args.file)
+    else:
+        archive = ac.FCArchive(pqueue, version, btp.PROFILES[args.profile])
+    interface = FCHeadless(archive, pqueue, args.log, args.duration,
+        args.report, args.wait, started)
+    interface.run()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
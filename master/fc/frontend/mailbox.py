@@ -0,0 +1,183 @@
+################################################################################
+##----------------------------------------------------------------------------##
+## CALIFORNIA INSTITUTE OF TECHNOLOGY ## GRADUATE AEROSPACE LABORATORY ##     ##
+## CENTER FOR AUTONOMOUS SYSTEMS AND TECHNOLOGIES                      ##     ##
+##----------------------------------------------------------------------------##
+##      ____      __      __  __      _____      __      __    __    ____     ##
+##     / __/|   _/ /|    / / / /|  _- __ __\    / /|    / /|  / /|  / _  \    ##
+##    / /_ |/  / /  /|  /  // /|/ / /|__| _|   / /|    / /|  / /|/ /   --||   ##
+##   / __/|/ _/    /|/ /   / /|/ / /|    __   / /|    / /|  / /|/ / _  \|/    ##
+##  / /|_|/ /  /  /|/ / // //|/ / /|__- / /  / /___  / -|_ - /|/ /     /|     ##
+## /_/|/   /_/ /_/|/ /_/ /_/|/ |\ ___--|_|  /_____/| |-___-_|/  /____-/|/     ##
+## |_|/    |_|/|_|/  |_|/|_|/   \|___|-    |_____|/   |___|     |____|/       ##
+##                   _ _    _    ___   _  _      __  __   __                  ##
+##                  | | |  | |  | T_| | || |    |  ||_ | | _|                 ##
+##                  | _ |  |T|  |  |  |  _|      ||   \\_//                   ##
+##                  || || |_ _| |_|_| |_| _|    |__|  |___|                   ##
+##                                                                            ##
+##----------------------------------------------------------------------------##
+## Alejandro A. Stefan Zavala ## <astefanz@berkeley.edu>   ##                 ##
+## Chris J. Dougherty         ## <cdougher@caltech.edu>    ##                 ##
+## Marcel Veismann            ## <mveisman@caltech.edu>    ##                 ##
+################################################################################
+
+""" ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+ + Per-client mailboxes for the front-end's fan-out of inter-process vectors.
+ +
+ + The sentinel threads of FCFrontend do not call the clients of each vector
+ + themselves. Instead, each client gets a bounded Mailbox into which the
+ + sentinel drops each vector and moves on, so that a slow client (e.g. a Tk
+ + display) delays no one but itself. A mailbox follows one of two policies:
+ +
+ +  - LATEST: when full, the oldest vector waiting is dropped. For displays,
+ +    which only care about the current state.
+ +  - LOSSLESS: when full, the sentinel waits for room. For clients that must
+ +    see every vector (data logs, slave vectors, which carry only changes).
+ +
+ + Each mailbox is emptied either by a worker thread of its own or, for clients
+ + that must run on a GUI's main loop, by periodic calls to pump from there.
+ + Mailboxes count the vectors delivered and dropped and the time spent in the
+ + client, for diagnostics (see stats).
+ +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
+
+## IMPORTS #####################################################################
+import collections
+import threading as mt
+import time as tm
+
+import fc.printer as pt
+
+## CONSTANTS ###################################################################
+LATEST = "LATEST"
+LOSSLESS = "LOSSLESS"
+POLICIES = (LATEST, LOSSLESS)
+
+DEPTHS = {LATEST : 1, LOSSLESS : 1024}   # Default depth of each policy
+
+## CLASSES #####################################################################
+class Mailbox(pt.PrintClient):
+    """
+    Bounded queue of vectors for a single client method. Thread-safe.
+    """
+    SYMBOL = "[MB]"
+
+    def __init__(self, name, method, pqueue, policy = LATEST, depth = None,
+        loop = False):
+        """
+        - name := name under which to report this mailbox (str).
+        - method := client method to which to deliver each vector.
+        - pqueue := mp Queue() instance for I-P printing (see fc.printer).
+        - policy := what to do when full, LATEST or LOSSLESS (see above).
+        - depth := most vectors waiting at once (DEPTHS[POLICY] by default).
+        - loop := whether the mailbox is emptied by calls to pump (True) or by
+            a thread of its own (False, see start).
+        """
+        if policy not in POLICIES:
+            raise ValueError("Invalid mailbox policy \"{}\"".format(policy))
+        pt.PrintClient.__init__(self, pqueue)
+        self.name = name
+        self.method = method
+        self.policy = policy
+        self.depth = depth if depth is not None else DEPTHS[policy]
+        self.loop = loop
+
+        self.items = collections.deque()
+        self.changed = mt.Condition()
+        self.closed = False
+        self.thread = None
+
+        self.delivered = 0
+        self.dropped = 0
+        self.peak = 0
+        self.busyS = 0.0
+        self.slowestS = 0.0
+
+    def put(self, item):
+        """
+        Drop ITEM into the mailbox, as per its policy. Waits for room if the
+        policy is LOSSLESS and the mailbox is full.
+        """
+        with self.changed:
+            if len(self.items) >= self.depth:
+                if self.policy == LATEST:
+                    self.items.popleft()
+                    self.dropped += 1
+                else:
+                    self.changed.wait_for(lambda: self.closed \
+                        or len(self.items) < self.depth)
+            if self.closed:
+                return
+            self.items.append(item)
+            self.peak = max(self.peak, len(self.items))
+            self.changed.notify_all()
+
+    def start(self):
+        """
+        Start the worker thread that empties this mailbox, unless it is
+        emptied by pump.
+        """
+        if not self.loop and self.thread is None:
+            self.thread = mt.Thread(name = "FC Mailbox " + self.name,
+                target = self._routine, daemon = True)
+            self.thread.start()
+
+    def pump(self):
+        """
+        Deliver the vectors waiting, if any. Returns immediately otherwise.
+        """
+        with self.changed:
+            items = list(self.items)
+            self.items.clear()
+            self.changed.notify_all()
+        for item in items:
+            self._deliver(item)
+
+    def clear(self):
+        """
+        Drop the vectors waiting, if any.
+        """
+        with self.changed:
+            self.items.clear()
+            self.changed.notify_all()
+
+    def close(self):
+        """
+        Stop accepting vectors and end the worker thread, if any.
+        """
+        with self.changed:
+            self.closed = True
+            self.items.clear()
+            self.changed.notify_all()
+
+    def stats(self):
+        """
+        Return a tuple (name, policy, waiting, peak, delivered, dropped, mean
+        seconds in client, most seconds in client) describing this mailbox.
+        """
+        with self.changed:
+            return (self.name, self.policy, len(self.items), self.peak,
+                self.delivered, self.dropped,
+                self.busyS/self.delivered if self.delivered else 0.0,
+                self.slowestS)
+
+    def _routine(self):
+        while True:
+            with self.changed:
+                self.changed.wait_for(lambda: self.closed or self.items)
+                if self.closed:
+                    break
+                item = self.items.popleft()
+                self.changed.notify_all()
+            self._deliver(item)
+
+    def _deliver(self, item):
+        start = tm.perf_counter()
+        try:
+            self.method(item)
+        except Exception as e:
+            self.printx(e, "Exception in client of mailbox " + self.name)
+        elapsed = tm.perf_counter() - start
+        with self.changed:
+            self.delivered += 1
+            self.busyS += elapsed
+            self.slowestS = max(self.slowestS, elapsed)
@@ -23,9 +23,18 @@
 
 """ ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
  + Streamlined inter-process text output.
+ +
+ + Messages are filtered by level where they are printed (see setLevel), and
+ + copies of the same message beyond a few per second are suppressed and
+ + summarized (see Outbox). The rest wait in an Outbox of the printing process
+ + and are put in the print queue in batches, so that printing costs the
+ + caller little more than appending to a list. An item in a print queue is
+ + either a batch (list) of messages or a control value such as END (see
+ + messages).
  +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
 
 ## IMPORTS #####################################################################
+import os
 import sys
 import traceback
 import io as io
@@ -33,6 +42,7 @@ import io as io
     # https://stackoverflow.com/questions/1218933/
     #   can-i-redirect-the-stdout-in-python-into-some-sort-of-string-buffer
 import multiprocessing as mp
+import multiprocessing.util as mpu
 import threading as mt
 import time as tm
 
@@ -97,6 +107,29 @@ CODE_TO_STR = {
 MI_CODE = 0
 MI_CONT = 1
 
+# Message code to level, below which messages are dropped where printed
+# (debug prints are governed by DEBUGP instead):
+LEVELS = {
+    D : 0,
+    R : 1,
+    S : 1,
+    W : 2,
+    E : 3,
+    X : 3,
+}
+LEVEL_ENV = "FC_PRINT_LEVEL" # Passes the level on to new processes
+LEVEL = LEVELS[int(os.environ.get(LEVEL_ENV, R))]
+
+# Batching and rate limiting (see Outbox):
+BATCH_SIZE = 64 # Most messages in a batch
+FLUSH_S = 0.05 # Most seconds a message waits in an Outbox
+LIMIT_WINDOW_S = 1.0 # Seconds over which copies of a message are counted
+LIMIT_BURST = 3 # Copies of a message let through per window
+LIMIT_SIZE = 256 # Most different messages counted at once
+
+# Most seconds PrintServer.stop waits for the print thread to finish:
+STOP_TIMEOUT_S = 2.0
+
 ## AUXILIARY FUNCTIONS #########################################################
 
 ## Printing utilities ----------------------------------------------------------
@@ -114,53 +147,202 @@ def printers(queue, symbol = "[--]"):
     specifies whether to append SYMBOL as a prefix.
 
     NOTE: Debug prints can be turned on (True) or off (False) by modifying the
-    global variable fc.utils.DEBUGP.
+    global variable fc.utils.DEBUGP. Other prints below the level set with
+    setLevel are dropped.
 
-    NOTE: the given queue will be used through its put_nowait method, and no
-    Exception checking is done within the print functions.
+    NOTE: messages are sent through the Outbox of this process for the given
+    queue (see outbox), and no Exception checking is done within the print
+    functions.
     """
     symbol += ' '
     funcs = {}
     def printr(message, prefix = True):
-        queue.put_nowait(
-            (R, tm.strftime("[%H:%M:%S]") + (symbol if prefix else '') \
-                + message))
+        if LEVELS[R] >= LEVEL:
+            text = (symbol if prefix else '') + message
+            outbox(queue).put(R, text)
     funcs[R] = printr
 
     def printe(message, prefix = True):
-        queue.put_nowait(
-            (E,  tm.strftime("[%H:%M:%S]") + (symbol if prefix else '') \
-                + message))
+        if LEVELS[E] >= LEVEL:
+            text = (symbol if prefix else '') + message
+            outbox(queue).put(E, text)
     funcs[E] = printe
 
     def printw(message, prefix = True):
-        queue.put_nowait(
-            (W,  tm.strftime("[%H:%M:%S]") + (symbol if prefix else '') \
-                + message))
+        if LEVELS[W] >= LEVEL:
+            text = (symbol if prefix else '') + message
+            outbox(queue).put(W, text)
     funcs[W] = printw
 
     def printd(message, prefix = True):
         if DEBUGP:
-            queue.put_nowait(
-                (D,  tm.strftime("[%H:%M:%S]") + (symbol if prefix else '') \
-                    + message))
+            text = (symbol if prefix else '') + message
+            outbox(queue).put(D, text)
     funcs[D] = printd
 
     def prints(message, prefix = True):
-        queue.put_nowait(
-            (S, ( tm.strftime("[%H:%M:%S]") + symbol if prefix else '') \
-                + message))
+        if LEVELS[S] >= LEVEL:
+            text = (symbol if prefix else '') + message
+            outbox(queue).put(S, text, prefix)
     funcs[S] = prints
 
     def printx(exception, message = ''):
-        queue.put_nowait(
-            (E, tm.strftime("[%H:%M:%S]") + symbol + message \
-                + ' "{}"'.format(exception) \
-                + '\nTraceback:\n' + traceback.format_exc()))
+        if LEVELS[X] >= LEVEL:
+            text = symbol + message + ' "{}"'.format(exception) \
+                + '\nTraceback:\n' + traceback.format_exc()
+            outbox(queue).put(E, text)
     funcs[X] = printx
 
     return funcs
 
+def setLevel(code):
+    """
+    Drop, where they are printed, the messages less severe than those with the
+    message code CODE (e.g W for only warnings and errors), in this process and
+    in those it starts from now on.
+    """
+    global LEVEL
+    LEVEL = LEVELS[code]
+    os.environ[LEVEL_ENV] = str(code)
+
+def messages(item):
+    """
+    Return a list with the (code, text) messages in ITEM, taken from a print
+    queue, which may be a batch of messages or a single one.
+    """
+    return item if type(item) is list else [item]
+
+## Batching and rate limiting --------------------------------------------------
+class Outbox:
+    """
+    Messages on their way from this process to a print queue. They are put in
+    the queue in batches of at most BATCH_SIZE, at least every FLUSH_S seconds,
+    by a daemon thread of their own.
+
+    Copies of a message beyond LIMIT_BURST within LIMIT_WINDOW_S seconds of the
+    first one are dropped and, once the window is over, summarized in a single
+    "N repeats suppressed" message.
+    """
+
+    def __init__(self, queue):
+        self.queue = queue
+        self.batch = []
+        self.seen = {} # (code, text) -> [window start, copies]
+        self.due = None # When the earliest window ends
+        self.lock = mt.Lock()
+        self.thread = mt.Thread(name = "FC Print Outbox",
+            target = self._routine, daemon = True)
+        self.thread.start()
+        # Send what is left when the process exits, before the queue closes:
+        mpu.Finalize(self, self.flush, exitpriority = 20)
+
+    def put(self, code, text, stamp = True):
+        """
+        Queue the message TEXT with code CODE, prefixed by a time stamp if
+        STAMP, unless it is a suppressed copy.
+        """
+        with self.lock:
+            if self._admit(code, text, tm.monotonic()):
+                self.batch.append((code,
+                    tm.strftime("[%H:%M:%S]") + text if stamp else text))
+                if len(self.batch) >= BATCH_SIZE:
+                    self._send()
+
+    def flush(self):
+        """
+        Send all waiting messages, including summaries of all suppressed ones.
+        """
+        with self.lock:
+            self._expire(float("inf"))
+            self._send()
+
+    def _admit(self, code, text, now):
+        """
+        Count a copy of the given message and return whether to let it through.
+        """
+        if self.due is not None and now >= self.due:
+            self._expire(now)
+        copies = self.seen.get((code, text))
+        if copies is None:
+            if len(self.seen) < LIMIT_SIZE:
+                self.seen[(code, text)] = [now, 1]
+                if self.due is None:
+                    self.due = now + LIMIT_WINDOW_S
+            return True
+        copies[1] += 1
+        return copies[1] <= LIMIT_BURST
+
+    def _expire(self, now):
+        """
+        Forget the messages whose window ended by NOW and queue a summary of
+        those with suppressed copies.
+        """
+        due = None
+        for (code, text), (start, copies) in list(self.seen.items()):
+            end = start + LIMIT_WINDOW_S
+            if end <= now:
+                del self.seen[(code, text)]
+                if copies > LIMIT_BURST:
+                    self.batch.append((code, "{}{} ({} repeats suppressed)"\
+                        .format(tm.strftime("[%H:%M:%S]"), text,
+                            copies - LIMIT_BURST)))
+            elif due is None or end < due:
+                due = end
+        self.due = due
+
+    def _send(self):
+        if self.batch:
+            batch, self.batch = self.batch, []
+            try:
+                self.queue.put_nowait(batch)
+            except (ValueError, OSError):
+                # Queue closed.
+                pass
+
+    def _routine(self):
+        while True:
+            tm.sleep(FLUSH_S)
+            with self.lock:
+                now = tm.monotonic()
+                if self.due is not None and now >= self.due:
+                    self._expire(now)
+                self._send()
+
+_OUTBOXES = {} # id(queue) -> Outbox of this process
+_OUTBOXES_LOCK = mt.Lock()
+
+def outbox(queue):
+    """
+    Return the Outbox of this process for QUEUE, creating it if needed.
+    """
+    box = _OUTBOXES.get(id(queue))
+    if box is None:
+        with _OUTBOXES_LOCK:
+            box = _OUTBOXES.get(id(queue))
+            if box is None:
+                box = _OUTBOXES[id(queue)] = Outbox(queue)
+    return box
+
+def flush(queue):
+    """
+    Send all messages waiting in the Outbox of this process for QUEUE, if any.
+    """
+    box = _OUTBOXES.get(id(queue))
+    if box is not None:
+        box.flush()
+
+def _forget():
+    """
+    Drop the Outboxes of the parent process (and their threads, which do not
+    survive a fork) in a forked child.
+    """
+    global _OUTBOXES_LOCK
+    _OUTBOXES.clear()
+    _OUTBOXES_LOCK = mt.Lock()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child = _forget)
+
 class PrintClient:
     """
     Simple class to be inherited from by classes that use the queued-printing
@@ -235,9 +417,13 @@ class PrintServer(PrintClient):
 
     def stop(self):
         """
-        Set the flag to end the print thread. Cannot be undone.
+        End the print thread once it prints the messages sent before, and wait
+        for it to finish (at most STOP_TIMEOUT_S seconds). Cannot be undone.
         """
+        flush(self.pqueue)
         self.pqueue.put_nowait(std.END)
+        if self.started:
+            self.thread.join(STOP_TIMEOUT_S)
 
     def _routine(self):
         """
@@ -248,10 +434,16 @@ class PrintServer(PrintClient):
         self.printr("Print thread started.")
         while True:
             try:
-                message = self.pqueue.get()
-                if message == std.END:
+                item = self.pqueue.get()
+                if item == std.END:
                     break
-                self.print(*message)
+                for message in messages(item):
+                    try:
+                        self.print(*message)
+                    except Exception as e:
+                        print("[ERROR] Exception in print thread:",
+                            traceback.format_exc())
+                        self.printx(e, "Exception in print thread:")
             except Exception as e:
                 print("[ERROR] Exception in print thread:",
                     traceback.format_exc())
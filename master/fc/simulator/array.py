@@ -0,0 +1,610 @@
+################################################################################
+##----------------------------------------------------------------------------##
+## CALIFORNIA INSTITUTE OF TECHNOLOGY ## GRADUATE AEROSPACE LABORATORY ##     ##
+## CENTER FOR AUTONOMOUS SYSTEMS AND TECHNOLOGIES                      ##     ##
+##----------------------------------------------------------------------------##
+##      ____      __      __  __      _____      __      __    __    ____     ##
+##     / __/|   _/ /|    / / / /|  _- __ __\    / /|    / /|  / /|  / _  \    ##
+##    / /_ |/  / /  /|  /  // /|/ / /|__| _|   / /|    / /|  / /|/ /   --||   ##
+##   / __/|/ _/    /|/ /   / /|/ / /|    __   / /|    / /|  / /|/ / _  \|/    ##
+##  / /|_|/ /  /  /|/ / // //|/ / /|__- / /  / /___  / -|_ - /|/ /     /|     ##
+## /_/|/   /_/ /_/|/ /_/ /_/|/ |\ ___--|_|  /_____/| |-___-_|/  /____-/|/     ##
+## |_|/    |_|/|_|/  |_|/|_|/   \|___|-    |_____|/   |___|     |____|/       ##
+##                   _ _    _    ___   _  _      __  __   __                  ##
+##                  | | |  | |  | T_| | || |    |  ||_ | | _|                 ##
+##                  | _ |  |T|  |  |  |  _|      ||   \\_//                   ##
+##                  || || |_ _| |_|_| |_| _|    |__|  |___|                   ##
+##                                                                            ##
+##----------------------------------------------------------------------------##
+## Alejandro A. Stefan Zavala ## <astefanz@berkeley.edu>   ##                 ##
+## Chris J. Dougherty         ## <cdougher@caltech.edu>    ##                 ##
+## Marcel Veismann            ## <mveisman@caltech.edu>    ##                 ##
+################################################################################
+
+""" ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+ + Virtual MkII slaves for testing and benchmarking the back-end without
+ + hardware. A VirtualArray runs any number of virtual modules from a single
+ + selectors event loop on localhost.
+ +
+ + The virtual modules speak the same UDP protocol as the MkII firmware (see
+ + slave/Communicator.cpp):
+ +
+ +  - Broadcast replies:    A|PCODE|MAC|N|SMISO|SMOSI|VERSION
+ +  - Handshake:            H|MMISO,MMOSI,PERIOD,BPERIOD,MAXT|CONFIG
+ +  - Commands:             S|D:DC:SELECTION and S|F:DC_0,DC_1,...
+ +  - Feedback:             T|DATA_INDEX|RPM_0,RPM_1,...|DC_0,DC_1,...
+ +
+ + Virtual modules also speak the binary format of fc.backend.mkiii.FCWire,
+ + and accept it when offered in the handshake, unless built otherwise (see
+ + VirtualArray), in which case they behave like firmware that predates it.
+ +
+ + Rebooted modules (R) run a virtual bootloader instead (see
+ + slave_bootloader/main.cpp):
+ +
+ +  - Broadcast replies:    B|PCODE|MAC|N|BOOTLOADER_VERSION
+ +  - Update:               U|PCODE|MLPORT|HTTPPORT|FILENAME|BYTES
+ +  - Launch:               L|PCODE
+ +
+ + Upon an update message, the bootloader downloads FILENAME over HTTP from
+ + the sender and, if it gets all BYTES, launches the new firmware, whose
+ + version is taken to be FILENAME without its extension.
+ +
+ + Traffic between the modules and the master goes through a Link (see
+ + fc.simulator.link), which may drop, delay and reorder it, and the RPMs they
+ + report follow their duty cycles as given by Dynamics (see
+ + fc.simulator.fans). Both are ideal unless given.
+ +
+ + To simulate more modules than one process can serve, see
+ + fc.simulator.cluster.
+ +
+ + NOTE: All virtual modules share one IP address, so listener messages that
+ + the master targets at a single module by IP (e.g "X|PCODE") reach all of
+ + them. Replies to broadcasts are sent from each module's own socket, though,
+ + so that the master's answers to them (e.g. "U|...") reach only that module.
+ +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
+
+## IMPORTS #####################################################################
+import os
+import socket as sk
+import selectors
+import heapq
+import threading as mt
+import time as tm
+
+from fc.backend.mkiii import FCWire as fw
+from fc.simulator import link as sl, fans as sf
+
+## CONSTANTS ###################################################################
+DEFAULT_IP = "127.0.0.1"
+DEFAULT_PASSCODE = "CT"
+DEFAULT_FANS = 21
+DEFAULT_MAX_RPM = 16000
+DEFAULT_VERSION = "SIM"
+BOOTLOADER_VERSION = "SIMB"
+RECV_SIZE = 1024
+DOWNLOAD_SIZE = 64*1024
+
+def mac(index):
+    """
+    Return the MAC address to be used by the virtual module of index INDEX.
+    """
+    return "00:00:5e:{:02x}:{:02x}:{:02x}".format(
+        (index >> 16) & 0xff, (index >> 8) & 0xff, index & 0xff)
+
+## CLASSES #####################################################################
+class VirtualModule:
+    """
+    State of a single virtual MkII slave. Uses one UDP socket as both its MOSI
+    and MISO socket.
+    """
+
+    def __init__(self, index, ip, fans, maxRPM, version, binary = True,
+        link = None, dynamics = None, number = None):
+        """
+        - index := index of the module in its array.
+        - link := Link through which to send (see fc.simulator.link).
+        - dynamics := Dynamics of the fans (see fc.simulator.fans).
+        - number := index of the module in the whole simulation, from which
+            its MAC address is taken (INDEX by default).
+        """
+        self.index = index
+        self.mac = mac(index if number is None else number)
+        self.fans = fans
+        self.maxRPM = maxRPM
+        self.version = version
+        self.speaksBinary = binary
+        self.link = link if link is not None else sl.Link()
+        self.dynamics = dynamics if dynamics is not None else sf.Dynamics()
+
+        # NOTE: No SO_REUSEADDR, or the OS may hand out duplicate ports.
+        self.socket = sk.socket(sk.AF_INET, sk.SOCK_DGRAM)
+        self.socket.bind((ip, 0))
+        self.socket.setblocking(False)
+        self.port = self.socket.getsockname()[1]
+
+        self.bootloader = False # Whether the bootloader is running
+        self.download = None    # Firmware download in progress, if any
+        self.reset()
+        self.dcs = [0.0]*fans
+        self.rpms = [0.0]*fans  # True RPMs (see Dynamics)
+        self.stepped = None     # When the RPMs were last advanced
+
+    def reboot(self):
+        """
+        Reboot into the bootloader.
+        """
+        self.reset()
+        self.bootloader = True
+
+    def launch(self, version = None):
+        """
+        Leave the bootloader and start the application, with the new firmware
+        VERSION if given.
+        """
+        if version is not None:
+            self.version = version
+        self.bootloader = False
+        self.download = None
+
+    def reset(self):
+        """
+        Return to the disconnected state.
+        """
+        self.connected = False
+        self.binary = False     # Whether binary frames were negotiated
+        self.master = None      # Master MISO address
+        self.periodS = 0.1
+        self.misoIndex = 0
+        self.mosiIndex = 0
+        self.dataIndex = 0
+        self.deadline = None    # Next feedback message
+
+    def send(self, message, times = 1):
+        """
+        Send MESSAGE to the master's MISO socket, prefixed by the MISO index.
+        """
+        if self.master is None:
+            return
+        self.misoIndex += 1
+        outgoing = "{}|{}".format(self.misoIndex, message).encode('ascii')
+        for _ in range(times):
+            self.link.send(self.socket, outgoing, self.master)
+
+    def feedback(self):
+        """
+        Send the current feedback ("T") message, in the negotiated format.
+        """
+        self.dataIndex += 1
+        now = tm.monotonic()
+        rpms = self.dynamics.step(self.rpms, self.dcs, self.maxRPM,
+            now - self.stepped if self.stepped is not None else 0.0)
+        self.stepped = now
+        if self.binary:
+            self.misoIndex += 1
+            self.link.send(self.socket, fw.packT(self.misoIndex,
+                self.dataIndex, rpms, self.dcs), self.master)
+        else:
+            self.send("T|{}|{}|{}".format(self.dataIndex,
+                ",".join(map(str, rpms)),
+                ",".join("{:.4f}".format(dc) for dc in self.dcs)))
+
+    def process(self, message, sender):
+        """
+        Process a MOSI message received from SENDER. Returns whether the
+        module's feedback timer needs to be (re)scheduled.
+        """
+        if fw.isBinary(message):
+            self.binaryCommand(message)
+            return False
+
+        splitted = message.decode('ascii').split("|", 2)
+        if len(splitted) < 2:
+            return False
+        index, code = int(splitted[0]), splitted[1][:1]
+        rest = splitted[2] if len(splitted) > 2 else ""
+
+        if index != 0 and index < self.mosiIndex:
+            # Outdated message
+            return False
+        if index == 0 and code != 'H':
+            return False
+        self.mosiIndex = index
+
+        if code == 'H':
+            if not self.connected:
+                sections = rest.split("|")
+                fields = sections[0].split(",")
+                self.master = (sender[0], int(fields[0]))
+                self.periodS = int(fields[2])/1000
+                self.binary = self.speaksBinary and fw.TOKEN in sections[2:]
+                self.send("K", 2)
+                self.connected = True
+            self.send("H|" + fw.TOKEN if self.binary else "H", 2)
+            return True
+
+        if not self.connected:
+            return False
+
+        if code == 'S':
+            self.command(rest)
+        elif code == 'Q':
+            self.send("Q", 2)
+        elif code == 'I':
+            self.mosiIndex = 0
+        elif code in ('X', 'Z'):
+            self.reset()
+        elif code == 'R':
+            self.reboot()
+        return False
+
+    def command(self, body):
+        """
+        Apply a standard ("S") command.
+        """
+        if body.startswith("F:"):
+            values = [float(dc) for dc in body[2:].split(",") if dc]
+            for fan in range(min(self.fans, len(values))):
+                self.dcs[fan] = values[fan]
+        elif body.startswith("D:"):
+            _, dc, selection = body.split(":")
+            dc = float(dc)
+            for fan, selected in enumerate(selection[:self.fans]):
+                if selected == '1':
+                    self.dcs[fan] = dc
+
+    def binaryCommand(self, message):
+        """
+        Apply a binary MOSI message (see FCWire).
+        """
+        if not self.connected or not self.binary:
+            return
+        code, index, dcs, selection = fw.unpackMOSI(message)
+        if index < self.mosiIndex:
+            # Outdated message
+            return
+        self.mosiIndex = index
+        for fan in range(min(self.fans, len(dcs))):
+            if selection is None or selection[fan]:
+                self.dcs[fan] = dcs[fan]
+
+class Download:
+    """
+    Firmware download of a virtual bootloader: a non-blocking HTTP/1.0 GET
+    request for the image, run by the VirtualArray's event loop.
+    """
+
+    def __init__(self, module, address, filename, size):
+        """
+        - module := VirtualModule whose bootloader requested the image.
+        - address := (IP, port) of the HTTP server.
+        - filename := name of the image (str).
+        - size := expected size of the image, in bytes.
+        """
+        self.module = module
+        self.filename = filename
+        self.size = size
+        self.request = "GET /{} HTTP/1.0\r\nHost: {}\r\n\r\n".format(
+            filename, address[0]).encode('ascii')
+        self.header = b""
+        self.received = -1      # Body bytes received (-1 before the header)
+        self.status = None
+        self.socket = sk.socket(sk.AF_INET, sk.SOCK_STREAM)
+        self.socket.setblocking(False)
+        self.socket.connect_ex(address)
+
+    def send(self):
+        """
+        Send the request once connected.
+        """
+        self.socket.send(self.request)
+
+    def recv(self):
+        """
+        Receive what the server sent. Returns False once the download ended.
+        """
+        data = self.socket.recv(DOWNLOAD_SIZE)
+        if not data:
+            return False
+        if self.received < 0:
+            self.header += data
+            if b"\r\n\r\n" not in self.header:
+                return True
+            self.header, data = self.header.split(b"\r\n\r\n", 1)
+            self.status = self.header.split(b" ", 2)[1]
+            self.received = 0
+        self.received += len(data)
+        return True
+
+    def version(self):
+        """
+        Return the version of the downloaded firmware, or None if the download
+        failed.
+        """
+        if self.status != b"200" or self.received != self.size:
+            return None
+        return os.path.splitext(self.filename)[0]
+
+class VirtualArray:
+    """
+    Run N virtual modules from one thread. Answers the master's broadcasts on
+    PORT for all of its modules. May be used as a context manager, which runs
+    the event loop in a thread (see start) for its duration.
+    """
+
+    def __init__(self, N, port = 0, ip = DEFAULT_IP,
+        passcode = DEFAULT_PASSCODE, fans = DEFAULT_FANS,
+        maxRPM = DEFAULT_MAX_RPM, version = DEFAULT_VERSION, binary = True,
+        link = None, dynamics = None, first = 0, relays = (), relayed = False):
+        """
+        - N := number of virtual modules.
+        - port := broadcast port on which to listen (0 to let the OS choose,
+            see the port attribute).
+        - ip := IP address to which to bind the module sockets.
+        - binary := whether modules accept the binary wire format.
+        - link := Link between the modules and the master (see
+            fc.simulator.link), ideal by default.
+        - dynamics := Dynamics of the fans (see fc.simulator.fans), ideal by
+            default.
+        - first := number of the first module in the whole simulation, from
+            which MAC addresses are numbered.
+        - relays := broadcast ports of other arrays on IP to which to relay
+            what is received on PORT (see fc.simulator.cluster).
+        - relayed := whether what is received on PORT is relayed by another
+            array instead of sent by the master.
+        """
+        self.ip = ip
+        self.link = link if link is not None else sl.Link()
+        self.relays = tuple(relays)
+        self.relayed = relayed
+        self.passcode = passcode
+        self.selector = selectors.DefaultSelector()
+        self.stopped = mt.Event()
+
+        self.listener = sk.socket(sk.AF_INET, sk.SOCK_DGRAM)
+        self.listener.setsockopt(sk.SOL_SOCKET, sk.SO_REUSEADDR, 1)
+        self.listener.setsockopt(sk.SOL_SOCKET, sk.SO_BROADCAST, 1)
+        self.listener.bind(("", port))
+        self.listener.setblocking(False)
+        self.port = self.listener.getsockname()[1]
+        self.selector.register(self.listener, selectors.EVENT_READ, None)
+
+        dynamics = dynamics if dynamics is not None else sf.Dynamics()
+        self.modules = [VirtualModule(index, ip, fans, maxRPM, version, binary,
+            self.link, dynamics, first + index) for index in range(N)]
+        self.macs = {module.mac : module for module in self.modules}
+        for module in self.modules:
+            self.selector.register(module.socket, selectors.EVENT_READ, module)
+
+        self.timers = [] # Heap of (deadline, index)
+        self.silence = 0.0 # End of the current outage, if any (see blip)
+
+    def run(self):
+        """
+        Run the event loop until stop is called. Blocks.
+        """
+        while not self.stopped.is_set():
+            now = tm.monotonic()
+            timeout = 0.1
+            if self.timers:
+                timeout = max(0.0, min(timeout, self.timers[0][0] - now))
+            due = self.link.due()
+            if due is not None:
+                timeout = max(0.0, min(timeout, due - now))
+
+            silent = now < self.silence
+            for key, events in self.selector.select(timeout):
+                if isinstance(key.data, Download):
+                    self._download(key.data, events)
+                    continue
+                try:
+                    message, sender = key.fileobj.recvfrom(RECV_SIZE)
+                except BlockingIOError:
+                    continue
+                if silent:
+                    continue
+                if key.data is None:
+                    message, sender = self._relay(message, sender)
+                self.link.call(self._receive, key.data, message, sender)
+
+            now = tm.monotonic()
+            self.link.flush(now)
+            if self.silence and now >= self.silence:
+                # The outage is over. Every module lost its master meanwhile:
+                self.silence = 0.0
+                for module in self.modules:
+                    module.reset()
+            while self.timers and self.timers[0][0] <= now:
+                deadline, index = heapq.heappop(self.timers)
+                module = self.modules[index]
+                if module.deadline != deadline or not module.connected:
+                    continue
+                if silent:
+                    continue
+                module.feedback()
+                self._schedule(module, deadline + module.periodS)
+
+        self.close()
+
+    def start(self):
+        """
+        Run the event loop in a daemon thread.
+        """
+        thread = mt.Thread(name = "FC_VirtualArray", target = self.run,
+            daemon = True)
+        thread.start()
+        return thread
+
+    def blip(self, seconds):
+        """
+        Simulate a network outage of SECONDS seconds: all traffic is dropped
+        and, once it ends, every module has returned to the disconnected state
+        and waits for the master's broadcasts, as it would after timing out.
+        """
+        self.silence = tm.monotonic() + seconds
+        self.link.clear()
+
+    def stop(self):
+        """
+        End the event loop.
+        """
+        self.stopped.set()
+
+    def close(self):
+        """
+        Close all sockets.
+        """
+        for key in tuple(self.selector.get_map().values()):
+            if isinstance(key.data, Download):
+                key.fileobj.close()
+        self.selector.close()
+        self.listener.close()
+        for module in self.modules:
+            module.socket.close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *_):
+        self.stop()
+
+    def _schedule(self, module, deadline):
+        module.deadline = deadline
+        heapq.heappush(self.timers, (deadline, module.index))
+
+    def _receive(self, module, message, sender):
+        """
+        Handle MESSAGE, received from SENDER by MODULE, or on the broadcast port
+        if MODULE is None.
+        """
+        try:
+            if module is None:
+                self._broadcast(message, sender)
+            elif not fw.isBinary(message) and message[:1].isalpha():
+                self._direct(module, message, sender)
+            elif module.process(message, sender):
+                self._schedule(module, tm.monotonic())
+        except (ValueError, IndexError, UnicodeDecodeError):
+            pass
+
+    def _relay(self, message, sender):
+        """
+        Pass MESSAGE, received from SENDER on the broadcast port, on to the
+        arrays that relay it. Returns the (message, sender) to handle here.
+        """
+        if self.relayed:
+            # Relayed as "IP|MESSAGE", IP being that of the original sender:
+            ip, message = message.split(b"|", 1)
+            sender = (ip.decode('ascii'), sender[1])
+        if self.relays:
+            relayed = sender[0].encode('ascii') + b"|" + message
+            for port in self.relays:
+                self.listener.sendto(relayed, (self.ip, port))
+        return message, sender
+
+    def _broadcast(self, message, sender):
+        """
+        Handle a message received on the broadcast port.
+        """
+        splitted = message.decode('ascii').split("|")
+        if len(splitted) < 2 or splitted[1] != self.passcode:
+            return
+        code = splitted[0]
+
+        if code == 'N':
+            # Standard broadcast. Reply for each disconnected module:
+            target = (sender[0], int(splitted[2]))
+            for module in self.modules:
+                if module.download is not None:
+                    continue
+                elif module.bootloader:
+                    self.link.send(module.socket, bytearray("B|{}|{}|N|{}"\
+                        .format(self.passcode, module.mac, BOOTLOADER_VERSION),
+                        'ascii'), target)
+                elif not module.connected:
+                    self.link.send(module.socket, bytearray(
+                        "A|{}|{}|N|{}|{}|{}".format(self.passcode, module.mac,
+                            module.port, module.port, module.version),
+                        'ascii'), target)
+
+        elif code == 'X':
+            for module in self.modules:
+                module.reset()
+
+        elif code == 'R':
+            for module in self.modules:
+                module.reboot()
+
+        elif code == 'r' and len(splitted) > 2 and splitted[2] in self.macs:
+            self.macs[splitted[2]].reboot()
+
+        elif code == 'J' and len(splitted) > 3 and splitted[2] in self.macs:
+            if splitted[3] == 'X':
+                self.macs[splitted[2]].reset()
+            elif splitted[3] == 'R':
+                self.macs[splitted[2]].reboot()
+
+    def _direct(self, module, message, sender):
+        """
+        Handle a listener message sent by the master to MODULE alone, in reply
+        to a broadcast reply of MODULE.
+        """
+        splitted = message.decode('ascii').split("|")
+        code = splitted[0]
+
+        if code == 'R':
+            module.reboot()
+
+        elif not module.bootloader or module.download is not None:
+            return
+
+        elif code == 'L':
+            module.launch()
+
+        elif code == 'U' and len(splitted) >= 6:
+            # U|PCODE|MLPORT|HTTPPORT|FILENAME|BYTES
+            module.download = Download(module, (sender[0], int(splitted[3])),
+                splitted[4], int(splitted[5]))
+            self.selector.register(module.download.socket,
+                selectors.EVENT_WRITE, module.download)
+
+    def _download(self, download, events):
+        """
+        Advance DOWNLOAD as per the selector EVENTS received for it.
+        """
+        try:
+            if events & selectors.EVENT_WRITE:
+                download.send()
+                self.selector.modify(download.socket, selectors.EVENT_READ,
+                    download)
+                return
+            if download.recv():
+                return
+        except OSError:
+            pass
+
+        # Download over. Launch the new firmware or stay in the bootloader:
+        self.selector.unregister(download.socket)
+        download.socket.close()
+        version = download.version()
+        if version is not None:
+            download.module.launch(version)
+        else:
+            download.module.download = None
+
+def serve(N, pipe, **kwargs):
+    """
+    Process target that runs a VirtualArray of N modules and sends its
+    broadcast port through the multiprocessing Connection PIPE. A number S
+    received through PIPE simulates an outage of S seconds (see
+    VirtualArray.blip); the array stops when anything else is received.
+    """
+    array = VirtualArray(N, **kwargs)
+    pipe.send(array.port)
+    array.start()
+    while True:
+        message = pipe.recv()
+        if type(message) not in (int, float):
+            break
+        array.blip(message)
+    array.stop()
@@ -0,0 +1,185 @@
+################################################################################
+##----------------------------------------------------------------------------##
+## CALIFORNIA INSTITUTE OF TECHNOLOGY ## GRADUATE AEROSPACE LABORATORY ##     ##
+## CENTER FOR AUTONOMOUS SYSTEMS AND TECHNOLOGIES                      ##     ##
+##----------------------------------------------------------------------------##
+##      ____      __      __  __      _____      __      __    __    ____     ##
+##     / __/|   _/ /|    / / / /|  _- __ __\    / /|    / /|  / /|  / _  \    ##
+##    / /_ |/  / /  /|  /  // /|/ / /|__| _|   / /|    / /|  / /|/ /   --||   ##
+##   / __/|/ _/    /|/ /   / /|/ / /|    __   / /|    / /|  / /|/ / _  \|/    ##
+##  / /|_|/ /  /  /|/ / // //|/ / /|__- / /  / /___  / -|_ - /|/ /     /|     ##
+## /_/|/   /_/ /_/|/ /_/ /_/|/ |\ ___--|_|  /_____/| |-___-_|/  /____-/|/     ##
+## |_|/    |_|/|_|/  |_|/|_|/   \|___|-    |_____|/   |___|     |____|/       ##
+##                   _ _    _    ___   _  _      __  __   __                  ##
+##                  | | |  | |  | T_| | || |    |  ||_ | | _|                 ##
+##                  | _ |  |T|  |  |  |  _|      ||   \\_//                   ##
+##                  || || |_ _| |_|_| |_| _|    |__|  |___|                   ##
+##                                                                            ##
+##----------------------------------------------------------------------------##
+## Alejandro A. Stefan Zavala ## <astefanz@berkeley.edu>   ##                 ##
+## Chris J. Dougherty         ## <cdougher@caltech.edu>    ##                 ##
+## Marcel Veismann            ## <mveisman@caltech.edu>    ##                 ##
+################################################################################
+
+""" ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+ + Virtual arrays spread over several processes, for simulations larger than
+ + one event loop (or one process' socket limit) can serve.
+ +
+ + A Cluster splits its modules among VirtualArrays (see fc.simulator.array),
+ + each run by its own process. Only the first array listens on the broadcast
+ + port; it relays what it receives there to the others, so the master sees a
+ + single array on a single port. MAC addresses are numbered across the whole
+ + cluster.
+ +
+ + Run from the master directory to serve a virtual array to a running
+ + back-end (e.g. the GUI) until interrupted:
+ +
+ +      python3 -m fc.simulator.cluster -n 2000 -P 4 [--loss 0.01] [...]
+ +
+ + NOTE: Each virtual module takes one socket. Keep the modules of each process
+ + below its socket limit (see ulimit -n).
+ +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
+
+## IMPORTS #####################################################################
+import copy
+import argparse
+import multiprocessing as mp
+
+from fc import archive as ac
+from fc.simulator import array as sa, link as sl, fans as sf
+
+## CLASSES #####################################################################
+class Cluster:
+    """
+    N virtual modules split among PROCESSES VirtualArray processes. May be
+    used as a context manager, which starts and stops it.
+    """
+
+    def __init__(self, N, processes = 1, port = 0, **kwargs):
+        """
+        - N := number of virtual modules.
+        - processes := number of processes among which to split them.
+        - port := broadcast port on which to listen (0 to let the OS choose,
+            see the port attribute once started).
+        - kwargs := other arguments for each VirtualArray (see
+            VirtualArray.__init__). Each process gets its own copy of the Link
+            and Dynamics, reseeded with its number (see Link.reseed), so that
+            processes do not draw the same random numbers.
+        """
+        self.N = N
+        self.processes = max(1, min(processes, N))
+        self.requested = port
+        self.kwargs = kwargs
+        self.port = None
+        self.pipes = []
+        self.workers = []
+
+    def start(self):
+        """
+        Start every process and wait until all of them are listening.
+        """
+        P = self.processes
+        sizes = [self.N//P + (number < self.N%P) for number in range(P)]
+        firsts = [sum(sizes[:number]) for number in range(P)]
+
+        relays = []
+        for number in reversed(range(P)):
+            kwargs = dict(self.kwargs, first = firsts[number])
+            for key in ("link", "dynamics"):
+                if kwargs.get(key) is not None:
+                    kwargs[key] = copy.deepcopy(kwargs[key])
+                    kwargs[key].reseed(number)
+            if number > 0:
+                kwargs["relayed"] = True
+            else:
+                kwargs.update(port = self.requested, relays = tuple(relays))
+            pipe, end = mp.Pipe()
+            worker = mp.Process(name = "FC_VirtualArray_{}".format(number),
+                target = sa.serve, args = (sizes[number], end), kwargs = kwargs,
+                daemon = True)
+            worker.start()
+            relays.append(pipe.recv())
+            self.pipes.append(pipe)
+            self.workers.append(worker)
+        self.port = relays[-1]
+
+    def blip(self, seconds):
+        """
+        Simulate a network outage of SECONDS seconds in every process (see
+        VirtualArray.blip).
+        """
+        for pipe in self.pipes:
+            pipe.send(seconds)
+
+    def stop(self, timeout = 5):
+        """
+        Stop every process, waiting at most TIMEOUT seconds for each.
+        """
+        for pipe in self.pipes:
+            try:
+                pipe.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for worker in self.workers:
+            worker.join(timeout)
+        self.pipes.clear()
+        self.workers.clear()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *_):
+        self.stop()
+
+## MAIN ########################################################################
+def main(argv = None):
+    default = ac.FCArchive.DEFAULT
+    parser = argparse.ArgumentParser(description =
+        "Serve an array of virtual MkII slaves until interrupted")
+    parser.add_argument("-n", "--modules", type = int, default = 100,
+        help = "Number of virtual modules")
+    parser.add_argument("-P", "--processes", type = int, default = 1,
+        help = "Processes among which to split them")
+    parser.add_argument("-p", "--port", type = int,
+        default = default[ac.broadcastPort], help = "Broadcast port")
+    parser.add_argument("-c", "--passcode", default = sa.DEFAULT_PASSCODE,
+        help = "Passcode expected in broadcasts")
+    parser.add_argument("-f", "--fans", type = int, default = sa.DEFAULT_FANS,
+        help = "Fans per module")
+    parser.add_argument("--text", action = "store_true",
+        help = "Reject the binary wire format, like older firmware")
+    parser.add_argument("--loss", type = float, default = 0.0,
+        help = "Probability that a datagram is dropped")
+    parser.add_argument("--latency", type = float, default = 0.0,
+        help = "Delay added to every datagram (ms)")
+    parser.add_argument("--jitter", type = float, default = 0.0,
+        help = "Most random delay added on top (ms)")
+    parser.add_argument("--reorder", type = float, default = 0.0,
+        help = "Probability that a datagram is held back")
+    parser.add_argument("--tau", type = float, default = 0.0,
+        help = "Time constant of the fans (s)")
+    parser.add_argument("--stall", type = float, default = 0.0,
+        help = "Duty cycle under which fans stop")
+    parser.add_argument("--noise", type = float, default = 0.0,
+        help = "Relative standard deviation of RPM readings")
+    parser.add_argument("--seed", type = int, default = None,
+        help = "Seed for repeatable runs")
+    args = parser.parse_args(argv)
+
+    cluster = Cluster(args.modules, args.processes, args.port,
+        passcode = args.passcode, fans = args.fans, binary = not args.text,
+        link = sl.Link(args.loss, args.latency/1000, args.jitter/1000,
+            args.reorder, seed = args.seed),
+        dynamics = sf.Dynamics(args.tau, args.stall, args.noise, args.seed))
+    with cluster:
+        print("Serving {} virtual modules in {} process(es) on port {}".format(
+            args.modules, cluster.processes, cluster.port))
+        try:
+            for worker in cluster.workers:
+                worker.join()
+        except KeyboardInterrupt:
+            pass
+
+if __name__ == "__main__":
+    main()
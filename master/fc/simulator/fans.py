@@ -0,0 +1,82 @@
+################################################################################
+##----------------------------------------------------------------------------##
+## CALIFORNIA INSTITUTE OF TECHNOLOGY ## GRADUATE AEROSPACE LABORATORY ##     ##
+## CENTER FOR AUTONOMOUS SYSTEMS AND TECHNOLOGIES                      ##     ##
+##----------------------------------------------------------------------------##
+##      ____      __      __  __      _____      __      __    __    ____     ##
+##     / __/|   _/ /|    / / / /|  _- __ __\    / /|    / /|  / /|  / _  \    ##
+##    / /_ |/  / /  /|  /  // /|/ / /|__| _|   / /|    / /|  / /|/ /   --||   ##
+##   / __/|/ _/    /|/ /   / /|/ / /|    __   / /|    / /|  / /|/ / _  \|/    ##
+##  / /|_|/ /  /  /|/ / // //|/ / /|__- / /  / /___  / -|_ - /|/ /     /|     ##
+## /_/|/   /_/ /_/|/ /_/ /_/|/ |\ ___--|_|  /_____/| |-___-_|/  /____-/|/     ##
+## |_|/    |_|/|_|/  |_|/|_|/   \|___|-    |_____|/   |___|     |____|/       ##
+##                   _ _    _    ___   _  _      __  __   __                  ##
+##                  | | |  | |  | T_| | || |    |  ||_ | | _|                 ##
+##                  | _ |  |T|  |  |  |  _|      ||   \\_//                   ##
+##                  || || |_ _| |_|_| |_| _|    |__|  |___|                   ##
+##                                                                            ##
+##----------------------------------------------------------------------------##
+## Alejandro A. Stefan Zavala ## <astefanz@berkeley.edu>   ##                 ##
+## Chris J. Dougherty         ## <cdougher@caltech.edu>    ##                 ##
+## Marcel Veismann            ## <mveisman@caltech.edu>    ##                 ##
+################################################################################
+
+""" ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+ + Fan dynamics for virtual modules (see fc.simulator.array).
+ +
+ + By default, the RPM reported by a virtual fan is its duty cycle times the
+ + module's maximum RPM, as soon as the duty cycle changes. Dynamics model
+ + real fans more closely instead: each RPM approaches its target with a
+ + first-order lag of time constant TAU, fans stall below a duty cycle of
+ + STALL, and readings carry relative gaussian NOISE.
+ +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
+
+## IMPORTS #####################################################################
+import math
+import random
+
+## CLASSES #####################################################################
+class Dynamics:
+    """
+    Response of virtual fans to their duty cycles. One instance may be shared
+    by all the modules of an array; the state of each fan is kept by its
+    module (see step).
+    """
+
+    def __init__(self, tauS = 0.0, stall = 0.0, noise = 0.0, seed = None):
+        """
+        - tauS := time constant of the fans, in seconds (0 for none).
+        - stall := duty cycle under which fans stop.
+        - noise := standard deviation of the RPM readings, relative to the
+            true RPM.
+        - seed := seed for the random generator, for repeatable runs.
+        """
+        self.tauS = tauS
+        self.stall = stall
+        self.noise = noise
+        self.seed = seed
+        self.random = random.Random(seed)
+
+    def reseed(self, number):
+        """
+        Reseed the random generator of this copy as copy NUMBER (see
+        fc.simulator.link.Link.reseed).
+        """
+        self.random.seed(None if self.seed is None \
+            else "{}/{}".format(self.seed, number))
+
+    def step(self, rpms, dcs, maxRPM, dtS):
+        """
+        Advance the true RPMs of a module's fans, RPMS (list of floats,
+        modified in place), by DTS seconds under duty cycles DCS. Returns the
+        list of RPM readings (ints).
+        """
+        decay = math.exp(-dtS/self.tauS) if self.tauS > 0 else 0.0
+        for fan, dc in enumerate(dcs):
+            target = dc*maxRPM if dc >= self.stall else 0.0
+            rpms[fan] = target + (rpms[fan] - target)*decay
+        if self.noise:
+            gauss = self.random.gauss
+            return [max(0, int(rpm*(1 + gauss(0, self.noise))))
+                for rpm in rpms]
+        return [int(rpm) for rpm in rpms]
@@ -0,0 +1,135 @@
+################################################################################
+##----------------------------------------------------------------------------##
+## CALIFORNIA INSTITUTE OF TECHNOLOGY ## GRADUATE AEROSPACE LABORATORY ##     ##
+## CENTER FOR AUTONOMOUS SYSTEMS AND TECHNOLOGIES                      ##     ##
+##----------------------------------------------------------------------------##
+##      ____      __      __  __      _____      __      __    __    ____     ##
+##     / __/|   _/ /|    / / / /|  _- __ __\    / /|    / /|  / /|  / _  \    ##
+##    / /_ |/  / /  /|  /  // /|/ / /|__| _|   / /|    / /|  / /|/ /   --||   ##
+##   / __/|/ _/    /|/ /   / /|/ / /|    __   / /|    / /|  / /|/ / _  \|/    ##
+##  / /|_|/ /  /  /|/ / // //|/ / /|__- / /  / /___  / -|_ - /|/ /     /|     ##
+## /_/|/   /_/ /_/|/ /_/ /_/|/ |\ ___--|_|  /_____/| |-___-_|/  /____-/|/     ##
+## |_|/    |_|/|_|/  |_|/|_|/   \|___|-    |_____|/   |___|     |____|/       ##
+##                   _ _    _    ___   _  _      __  __   __                  ##
+##                  | | |  | |  | T_| | || |    |  ||_ | | _|                 ##
+##                  | _ |  |T|  |  |  |  _|      ||   \\_//                   ##
+##                  || || |_ _| |_|_| |_| _|    |__|  |___|                   ##
+##                                                                            ##
+##----------------------------------------------------------------------------##
+## Alejandro A. Stefan Zavala ## <astefanz@berkeley.edu>   ##                 ##
+## Chris J. Dougherty         ## <cdougher@caltech.edu>    ##                 ##
+## Marcel Veismann            ## <mveisman@caltech.edu>    ##                 ##
+################################################################################
+
+""" ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+ + Network impairments for virtual modules (see fc.simulator.array).
+ +
+ + A Link stands between the virtual modules of a VirtualArray and the wire.
+ + Every datagram that goes through it, in either direction, may be dropped
+ + (LOSS), is delayed by LATENCY plus up to JITTER seconds, and may be held
+ + back by another HOLD seconds (REORDER) so that later datagrams overtake it.
+ + Delayed datagrams wait in a heap that the array's event loop flushes.
+ +
+ + A Link with no impairments (the default) hands every datagram through at
+ + once, at the cost of a function call.
+ +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
+
+## IMPORTS #####################################################################
+import heapq
+import random
+import time as tm
+
+## CONSTANTS ###################################################################
+DEFAULT_HOLD_S = 0.01
+
+## CLASSES #####################################################################
+class Link:
+    """
+    Loss, latency and reordering applied to the traffic of virtual modules.
+    Meant to be used by a single event loop.
+    """
+
+    def __init__(self, loss = 0.0, latencyS = 0.0, jitterS = 0.0,
+        reorder = 0.0, holdS = DEFAULT_HOLD_S, seed = None):
+        """
+        - loss := probability that a datagram is dropped.
+        - latencyS := delay added to every datagram, in seconds.
+        - jitterS := most random delay added on top of LATENCYS, in seconds.
+        - reorder := probability that a datagram is held back.
+        - holdS := how long held back datagrams wait on top of the rest.
+        - seed := seed for the random generator, for repeatable runs.
+        """
+        self.loss = loss
+        self.latencyS = latencyS
+        self.jitterS = jitterS
+        self.reorder = reorder
+        self.holdS = holdS
+        self.seed = seed
+        self.random = random.Random(seed)
+        self.ideal = not (loss or latencyS or jitterS or reorder)
+
+        self.pending = [] # Heap of (due, number, function, arguments)
+        self.number = 0
+        self.dropped = 0
+        self.delayed = 0
+
+    def reseed(self, number):
+        """
+        Give this copy's random generator a stream of its own, as copy NUMBER
+        (e.g. the process number, see fc.simulator.cluster). It is derived from
+        the seed if one was given, or drawn from the OS otherwise.
+        """
+        self.random.seed(None if self.seed is None \
+            else "{}/{}".format(self.seed, number))
+
+    def send(self, socket, data, address):
+        """
+        Send DATA to ADDRESS through SOCKET, impaired.
+        """
+        self.call(socket.sendto, data, address)
+
+    def call(self, function, *arguments):
+        """
+        Call FUNCTION with ARGUMENTS once the datagram it handles gets through,
+        if it does. For incoming datagrams, FUNCTION processes them.
+        """
+        if self.ideal:
+            function(*arguments)
+            return
+        if self.loss and self.random.random() < self.loss:
+            self.dropped += 1
+            return
+        delay = self.latencyS + self.random.uniform(0, self.jitterS)
+        if self.reorder and self.random.random() < self.reorder:
+            delay += self.holdS
+        if delay <= 0:
+            function(*arguments)
+            return
+        self.delayed += 1
+        self.number += 1
+        heapq.heappush(self.pending,
+            (tm.monotonic() + delay, self.number, function, arguments))
+
+    def due(self):
+        """
+        Return the monotonic time at which the next delayed datagram is due, or
+        None if there is none.
+        """
+        return self.pending[0][0] if self.pending else None
+
+    def flush(self, now):
+        """
+        Let through the delayed datagrams due by NOW (monotonic time).
+        """
+        while self.pending and self.pending[0][0] <= now:
+            _, _, function, arguments = heapq.heappop(self.pending)
+            try:
+                function(*arguments)
+            except (OSError, ValueError, IndexError, UnicodeDecodeError):
+                continue
+
+    def clear(self):
+        """
+        Drop all delayed datagrams.
+        """
+        self.pending.clear()
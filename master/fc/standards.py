@@ -41,28 +41,29 @@
        | FRONT-END |                                       |  BACK-END  |
        |           |                                       |            |
         -----------                                         ------------
-         ^ ^ ^ ^                                               V V V V
-         | | | |  ---- FEEDBACK PIPE ------------------------  | | | |
-         | | | +<- [feedback vector F (DC's and RPM's)] <------+ | | |
-         | | |    -------------------------------------------    | | |
-         | | |                                                   | | |
-         | | |    ---- SLAVE PIPE ---------------------------      | |
-         | | +<--- [slave vector S (slave i's, statuses...)] <-----+ |
-         | |      -------------------------------------------        |
-         | |                                                         |
-         | |      ---- NETWORK PIPE -------------------------        |
-         | +<----- [network vector N (global IP's and ports)] <------+
-         |        -------------------------------------------        |
-         |                                                           |
-         |        ==== PRINT QUEUE ==========================        |
-         +<------- [print messages] <--------------------------------+
-                  ===========================================
+        ^ ^ ^ ^ ^                                              V V V V V
+        | | | | |  ---- FEEDBACK PIPE -----------------------  | | | | |
+        | | | | +<- [feedback vector F (DC's and RPM's)] <-----+ | | | |
+        | | | |    ------------------------------------------    | | | |
+        | | | |                                                  | | | |
+        | | | |    ---- SLAVE PIPE --------------------------      | | |
+        | | | +<--- [slave vector S (slave i's, statuses...)] <----+ | |
+        | | |      ------------------------------------------        | |
+        | | |                                                        | |
+        | | |      ---- NETWORK PIPE ------------------------        | |
+        | | +<----- [network vector N (global IP's and ports)] <-----+ |
+        | |        ------------------------------------------          |
+        | |                                                            |
+        | |        ---- DIAGNOSTICS PIPE --------------------          |
+        | +<------- [diagnostics array G (RTT's, losses...)] <---------+
+        |          ------------------------------------------          |
+        |                                                              |
+        |          ==== PRINT QUEUE =========================          |
+        +<-------- [print messages] <----------------------------------+
+                   ==========================================
 
 ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
 
-# TODO: Network diagnostics data, such as MISO and MOSI indices and packet
-# loss counts, etc.
-
 # TODO: Confirm DC normalization and formats
 
 # TODO: Check performance w/ DC fan selections being Strings
@@ -135,6 +136,7 @@ CMD_BIP = 3040
 
 CMD_N = 3041 # .............................................. Get Network Vector
 CMD_S = 3042 # .............................................. Get Slave Vector
+CMD_TIMING = 3043 # ....................................... Get Timing Vector
 
 # Broadcast modes:
 BMODE_BROADCAST = 8391
@@ -164,11 +166,15 @@ COMMAND_CODES = {
     CMD_BMODE : "CMD_BMODE",
     CMD_BIP : "CMD_BIP",
     CMD_N : "CMD_N",
-    CMD_S : "CMD_S"
+    CMD_S : "CMD_S",
+    CMD_TIMING : "CMD_TIMING"
 }
 
 # Control vectors ##############################################################
 # NOTE: Sent through the same channel as command vectors
+# NOTE: Control vectors travel through the control pipe as tuples (STAMP, C),
+# where STAMP is the time.monotonic() at which the front-end sent C, so that the
+# back-end can measure how long it takes to apply them.
 # NOTE: Here each duty cycle is a float between 0.0 and 1.0, inclusive.
 # Form:
 #                                                           1st fan selected
@@ -206,10 +212,18 @@ COMMAND_CODES = {
 #  NOTE: TGT_SELECTED is ignored, as CTL_DC_VECTOR is meant to only use this
 #  NOTE: Here all slaves are assumed to have maxFans fans. Inactive fans are
 #  expected to be padded with zeros.
+#
+# [CTL_DC_SHARED, TGT_ALL, SEQ]
+#  |              |        |
+#  |              |        Sequence number of the latest write
+#  |              Ignored
+#  Control code: a DC vector was written to the shared control buffer
+#  NOTE: See fc.backend.control.
 
 # Control codes:
 CTL_DC_SINGLE = 5051
 CTL_DC_VECTOR = 5052
+CTL_DC_SHARED = 5053
 
 # Control indices:
 CTL_I_CODE = 0
@@ -222,9 +236,12 @@ CTL_I_SINGLE_TGT_OFFSET = 3
 CTL_I_VECTOR_TGT_OFFSET = 1
 CTL_I_VECTOR_DC_OFFSET = 2
 
+CTL_I_SHARED_SEQ = 2
+
 CONTROL_CODES = {
     CTL_DC_SINGLE : "CTL_DC_SINGLE",
-    CTL_DC_VECTOR : "CTL_DC_VECTOR"
+    CTL_DC_VECTOR : "CTL_DC_VECTOR",
+    CTL_DC_SHARED : "CTL_DC_SHARED"
 }
 
 
@@ -262,6 +279,50 @@ NETWORK_STATUSES = {
     NS_DISCONNECTING : "Disconnecting",
 }
 
+# Timing vectors ###############################################################
+# NOTE: Sent through the network pipe in reply to CMD_TIMING, and told apart
+# from network status vectors by their first element.
+# Form:
+#      T =    [TM_CODE, NAME_0, PERIOD_0, RUNS_0, OVERRUNS_0, P50_0, P99_0,
+#               NAME_1, ...]
+#                       |       |         |       |           |      |
+#                       |       |         |       |           |      p99 (s)
+#                       |       |         |       |           p50 lateness (s)
+#                       |       |         |       Deadlines missed (int)
+#                       |       |         Runs so far (int)
+#                       |       Period in seconds (float)
+#                       Name of a periodic back-end task (String)
+#
+# Lateness is the time, in seconds, from a task's deadline to the time it
+# actually ran. See fc.backend.mkiii.FCSchedule.
+
+TM_CODE = 20101
+TM_LEN = 6
+TM_I_OFFSET = 1
+TM_I_NAME, TM_I_PERIOD, TM_I_RUNS, TM_I_OVERRUNS, TM_I_P50, TM_I_P99 = \
+    range(TM_LEN)
+
+# Diagnostics arrays ###########################################################
+# NOTE: Sent through the diagnostics pipe every diagnosticsPeriodMS (see
+# fc.archive) as a float64 NumPy array G of shape (number of Slaves, DG_LEN),
+# with one row per Slave of the form:
+#      G[i] = [INDEX, RTT, LOSS, TIMEOUTS, RECONNECTS, STALE]
+#              |      |    |     |         |           |
+#              |      |    |     |         |           Stale MISO datagrams
+#              |      |    |     |         Times reconnected (int)
+#              |      |    |     Replies missed (int)
+#              |      |    Fraction of MISO datagrams lost since the last array
+#              |      Smoothed ping request round trip time in seconds
+#              Slave index
+#
+# Counts are totals since the back-end started. RTT is DG_NONE if no round trip
+# has been measured yet, and LOSS if nothing was received since the last array.
+
+DG_LEN = 6
+DG_I_INDEX, DG_I_RTT, DG_I_LOSS, DG_I_TIMEOUTS, DG_I_RECONNECTS, DG_I_STALE = \
+    range(DG_LEN)
+DG_NONE = -1.0
+
 # Slave status codes:
 SS_CONNECTED = 30001
 SS_KNOWN = 30002
@@ -334,6 +395,24 @@ SD_LEN = 6
 # Offsets of data per slave in the slave data vector:
 SD_INDEX, SD_NAME, SD_MAC, SD_STATUS, SD_FANS, SD_VERSION = range(SD_LEN)
 
+# Slave vector messages ########################################################
+# Form (as sent by the back-end through the slave pipe):
+#
+#            M = (KIND, GENERATION, S)
+#                 |     |           |
+#                 |     |           Slave data vector (see above)
+#                 |     Message count (int), one more than the previous message
+#                 SV_SNAPSHOT (S has every slave) or SV_DELTA (S has only the
+#                 slaves whose data changed since the previous message)
+#
+# NOTE: A receiver that finds a gap in GENERATION has missed a delta, and may
+# request a new snapshot with CMD_S. See fc.backend.states.
+SV_LEN = 3
+SV_I_KIND, SV_I_GENERATION, SV_I_VECTOR = range(SV_LEN)
+
+SV_SNAPSHOT = 50001
+SV_DELTA = 50002
+
 # Feedback vectors #############################################################
 # Form:
 #
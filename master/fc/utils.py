@@ -27,10 +27,6 @@
 
 ## IMPORTS #####################################################################
 
-import inspect
-    # Print line numbers. See:
-    #   http://code.activestate.com/recipes/
-    #       145297-grabbing-the-current-line-number-easily/
 import sys
 import traceback
 import platform as plt
@@ -66,7 +62,10 @@ def ln():
     Return the number of the line in source code in which this function is
     called.
     """
-    return inspect.currentframe().f_back.f_lineno
+    # NOTE: sys._getframe spares importing inspect (slow) at startup. See:
+    #   http://code.activestate.com/recipes/
+    #       145297-grabbing-the-current-line-number-easily/
+    return sys._getframe(1).f_lineno
 
 def l(message = "", prefix = '', postfix = '\n'):
     """
@@ -23,6 +23,10 @@
 
 """ ABOUT ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
  + FC execution starts here.
+ +
+ + Run with --headless (see fc.frontend.headless, or --headless --help) to
+ + run without a GUI, e.g. on servers; this is the recommended mode for
+ + unattended runs over external control.
  +++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++ """
 
 ## GLOBALS #####################################################################
@@ -35,7 +39,6 @@ REMINDERS = [
     " Look into control after profile switching ('return 1',",
     " Pass profiles, not archive, " +
         "when profile changes will cause reset",
-    " Change all watchdog threads to Tkinter 'after' scheduling",
     " Indexing by 1 in functional input",
     " Standardize notation (also: function argument consistency,",
     " period_ms abstraction barrier in FCInterface",
@@ -61,6 +64,17 @@ if __name__ == '__main__':
     # https://stackoverflow.com/questions/18204782
 
     ## IMPORTS #################################################################
+    import time as tm
+    started = tm.perf_counter()
+
+    import sys
+
+    # Headless runs must not import Tk (see fc.frontend.headless):
+    if "--headless" in sys.argv[1:]:
+        import fc.frontend.headless as hl
+        argv = [arg for arg in sys.argv[1:] if arg != "--headless"]
+        sys.exit(hl.main(argv, VERSION, INIT_PROFILE, started))
+
     import multiprocessing as mp
     import fc.frontend.gui.tkgui as tkg
     import fc.archive as ac
@@ -71,8 +85,6 @@ if __name__ == '__main__':
 
     import getopt # https://docs.python.org/3.1/library/getopt.html
 
-    import sys
-
 
     # FIXME use getopt and streamline this
     init_profile = INIT_PROFILE